@@ -13,7 +13,10 @@ from .core.hooks import (
     transform,
 )
 
-from hedra.core.engines.client import TracingConfig
+from hedra.core.engines.client import (
+    ConcurrencyControlConfig,
+    TracingConfig
+)
 from hedra.core.engines.types.tracing.trace import Trace
 from hedra.core.experiments import (
     Experiment,
@@ -61,6 +61,13 @@ def graph():
     default=3,
     help="Set the number of retries for connection validation."
 )
+@click.option(
+    '--persistent-workers',
+    is_flag=True,
+    show_default=True,
+    default=False,
+    help='Reuse worker processes across stages instead of starting new ones for each stage.'
+)
 @click.option(
     '--enable-latest',
     is_flag=True,
@@ -79,6 +86,7 @@ def run(
     log_directory: str,
     bypass_connection_validation: bool,
     connection_validation_retries: int,
+    persistent_workers: bool,
     enable_latest: bool,
 ):
     run_graph(
@@ -92,6 +100,7 @@ def run(
         log_directory,
         bypass_connection_validation,
         connection_validation_retries,
+        persistent_workers,
         enable_latest
     )
 
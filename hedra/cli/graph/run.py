@@ -36,6 +36,7 @@ def run_graph(
     logfiles_directory: str,
     bypass_connection_validation: bool,
     connection_validation_retries: int,
+    persistent_workers: bool,
     enable_latest: bool,
 ):
 
@@ -88,6 +89,9 @@ def run_graph(
 
     if connection_validation_retries:
         hedra_core_config['connection_validation_retries'] = connection_validation_retries
+
+    if persistent_workers:
+        hedra_core_config['persistent_workers'] = persistent_workers
     
     if path in hedra_graphs:
         path = hedra_graphs.get(path)
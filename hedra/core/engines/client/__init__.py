@@ -1,3 +1,4 @@
 from .client import Client
+from .concurrency_control_config import ConcurrencyControlConfig
 from .tracing_config import TracingConfig
 from .time_parser import TimeParser
\ No newline at end of file
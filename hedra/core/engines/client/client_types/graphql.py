@@ -5,8 +5,10 @@ from hedra.core.engines.types.graphql import (
     GraphQLAction,
     GraphQLResult
 )
+from hedra.core.engines.types.common.body_retention import BodyRetention
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common import Timeouts
+from hedra.core.engines.types.common.concurrency import ConcurrencyController
 from hedra.core.engines.client.store import ActionsStore
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
@@ -35,8 +37,15 @@ class GraphQLClient(BaseClient[MercuryGraphQLClient, GraphQLAction, GraphQLResul
                 total_timeout=config.request_timeout
             ),
             reset_connections=config.reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            prewarm_connections=config.prewarm_connections
         )
+
+        if config.concurrency_control:
+            self.session.concurrency_controller = ConcurrencyController(
+                **config.concurrency_control.to_dict()
+            )
+
         self.request_type = RequestTypes.GRAPHQL
         self.client_type = self.request_type.capitalize()
 
@@ -61,6 +70,7 @@ class GraphQLClient(BaseClient[MercuryGraphQLClient, GraphQLAction, GraphQLResul
         user: str = None, 
         tags: List[Dict[str, str]] = [],
         redirects: int = 3,
+        body_retention: Union[str, int, BodyRetention, None]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -80,7 +90,8 @@ class GraphQLClient(BaseClient[MercuryGraphQLClient, GraphQLAction, GraphQLResul
             },
             user=user,
             tags=tags,
-            redirects=redirects
+            redirects=redirects,
+            body_retention=body_retention
         )
 
         return await self._execute_action(request)
@@ -5,8 +5,10 @@ from hedra.core.engines.types.http import (
     HTTPAction,
     HTTPResult
 )
+from hedra.core.engines.types.common.body_retention import BodyRetention
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common import Timeouts
+from hedra.core.engines.types.common.concurrency import ConcurrencyController
 from hedra.core.engines.client.store import ActionsStore
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
@@ -35,8 +37,16 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
                 total_timeout=config.request_timeout
             ),
             reset_connections=config.reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            prewarm_connections=config.prewarm_connections,
+            pipeline_depth=config.pipeline_depth
         )
+
+        if config.concurrency_control:
+            self.session.concurrency_controller = ConcurrencyController(
+                **config.concurrency_control.to_dict()
+            )
+
         self.request_type = RequestTypes.HTTP
         self.client_type = self.request_type.capitalize()
 
@@ -61,6 +71,7 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
         user: str = None,
         tags: List[Dict[str, str]] = [],
         redirects: int=3,
+        body_retention: Union[str, int, BodyRetention, None]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -76,7 +87,8 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
             data=None,
             user=user,
             tags=tags,
-            redirects=redirects             
+            redirects=redirects,
+            body_retention=body_retention
         )
 
         return await self._execute_action(request)
@@ -89,6 +101,7 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
         user: str = None,
         tags: List[Dict[str, str]] = [],
         redirects: int=3,
+        body_retention: Union[str, int, BodyRetention, None]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -104,7 +117,8 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
             data=data,
             user=user,
             tags=tags,
-            redirects=redirects           
+            redirects=redirects,
+            body_retention=body_retention
         )
 
         return await self._execute_action(request)
@@ -117,6 +131,7 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
         user: str = None,
         tags: List[Dict[str, str]] = [],
         redirects: int=3,
+        body_retention: Union[str, int, BodyRetention, None]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -132,7 +147,8 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
             data=data,
             user=user,
             tags=tags,
-            redirects=redirects
+            redirects=redirects,
+            body_retention=body_retention
         )
 
         return await self._execute_action(request)
@@ -145,6 +161,7 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
         user: str = None,
         tags: List[Dict[str, str]] = [],
         redirects: int=3,
+        body_retention: Union[str, int, BodyRetention, None]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -160,7 +177,8 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
             data=data,
             user=user,
             tags=tags,
-            redirects=redirects
+            redirects=redirects,
+            body_retention=body_retention
         )
 
         return await self._execute_action(request)
@@ -172,6 +190,7 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
         user: str = None,
         tags: List[Dict[str, str]] = [],
         redirects: int=3,
+        body_retention: Union[str, int, BodyRetention, None]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -187,7 +206,8 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
             data=None,
             user=user,
             tags=tags,
-            redirects=redirects
+            redirects=redirects,
+            body_retention=body_retention
         )
 
         return await self._execute_action(request)
@@ -7,6 +7,7 @@ from hedra.core.engines.types.http2 import(
 )
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common import Timeouts
+from hedra.core.engines.types.common.concurrency import ConcurrencyController
 from hedra.core.engines.client.store import ActionsStore
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
@@ -36,8 +37,15 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
                 total_timeout=config.request_timeout
             ),
             reset_connections=config.reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            multiplexed_connections=config.multiplexed_connections
         )
+
+        if config.concurrency_control:
+            self.session.concurrency_controller = ConcurrencyController(
+                **config.concurrency_control.to_dict()
+            )
+
         self.request_type = RequestTypes.HTTP2
         self.client_type = self.request_type.capitalize()
 
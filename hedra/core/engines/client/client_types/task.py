@@ -9,6 +9,7 @@ from hedra.core.engines.client.config import Config
 from hedra.core.engines.types.task import MercuryTaskRunner, Task, TaskResult
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common import Timeouts
+from hedra.core.engines.types.common.concurrency import ConcurrencyController
 from hedra.core.engines.types.tracing.trace_session import TraceSession
 from hedra.logging import HedraLogger
 from .base_client import BaseClient
@@ -34,6 +35,12 @@ class TaskClient(BaseClient[MercuryTaskRunner, Task, TaskResult]):
             ),
             tracing_session=tracing_session
         )
+
+        if config.concurrency_control:
+            self.session.concurrency_controller = ConcurrencyController(
+                **config.concurrency_control.to_dict()
+            )
+
         self.request_type = RequestTypes.TASK
         self.client_type = self.request_type.capitalize()
         self.next_name = None
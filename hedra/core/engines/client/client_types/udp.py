@@ -4,6 +4,7 @@ from hedra.core.engines.client.config import Config
 from hedra.core.engines.types.udp import UDPAction, UDPResult, MercuryUDPClient
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common import Timeouts
+from hedra.core.engines.types.common.concurrency import ConcurrencyController
 from hedra.core.engines.client.store import ActionsStore
 from hedra.logging import HedraLogger
 from .base_client import BaseClient
@@ -21,6 +22,12 @@ class UDPClient(BaseClient[MercuryUDPClient, UDPAction, UDPResult]):
             ),
             reset_connections=config.reset_connections
         )
+
+        if config.concurrency_control:
+            self.session.concurrency_controller = ConcurrencyController(
+                **config.concurrency_control.to_dict()
+            )
+
         self.request_type = RequestTypes.UDP
         self.client_type = self.request_type.capitalize()
 
@@ -3,6 +3,7 @@ from types import FunctionType
 from typing import Any, Dict, List
 from hedra.core.engines.client.config import Config
 from hedra.core.engines.types.common import Timeouts
+from hedra.core.engines.types.common.concurrency import ConcurrencyController
 from hedra.core.engines.types.websocket import (
     MercuryWebsocketClient,
     WebsocketAction,
@@ -24,8 +25,15 @@ class WebsocketClient(BaseClient[MercuryWebsocketClient, WebsocketAction, Websoc
             timeouts=Timeouts(
                 total_timeout=config.request_timeout
             ),
-            reset_connections=config.reset_connections
+            reset_connections=config.reset_connections,
+            session_window=config.websocket_session_window
         )
+
+        if config.concurrency_control:
+            self.session.concurrency_controller = ConcurrencyController(
+                **config.concurrency_control.to_dict()
+            )
+
         self.request_type = RequestTypes.WEBSOCKET
         self.client_type = self.request_type.capitalize()
 
@@ -0,0 +1,42 @@
+from __future__ import annotations
+from typing import Optional, Dict, Union
+
+
+class ConcurrencyControlConfig:
+
+    def __init__(
+        self,
+        target_latency: Optional[float]=None,
+        min_concurrency: int=1,
+        max_concurrency: Optional[int]=None,
+        max_error_rate: float=0.05,
+        interval: float=1,
+        increase: int=1,
+        decrease: float=0.75,
+        latency_quantile: float=0.99
+    ) -> None:
+        self.target_latency = target_latency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_error_rate = max_error_rate
+        self.interval = interval
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_quantile = latency_quantile
+
+    def copy(self) -> ConcurrencyControlConfig:
+        return ConcurrencyControlConfig(
+            **self.to_dict()
+        )
+
+    def to_dict(self) -> Dict[str, Union[int, float, None]]:
+        return {
+            'target_latency': self.target_latency,
+            'min_concurrency': self.min_concurrency,
+            'max_concurrency': self.max_concurrency,
+            'max_error_rate': self.max_error_rate,
+            'interval': self.interval,
+            'increase': self.increase,
+            'decrease': self.decrease,
+            'latency_quantile': self.latency_quantile
+        }
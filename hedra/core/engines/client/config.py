@@ -1,6 +1,7 @@
 import psutil
 from typing import List, Union, Dict
 from hedra.core.experiments.mutations.types.base.mutation import Mutation
+from .concurrency_control_config import ConcurrencyControlConfig
 from .tracing_config import TracingConfig
 from .time_parser import TimeParser
 
@@ -30,7 +31,18 @@ class Config:
         self.connect_timeout = kwargs.get('connect_timeout', 15)
         self.request_timeout = kwargs.get('request_timeout', 60)
         self.reset_connections = kwargs.get('reset_connections')
+        self.prewarm_connections = kwargs.get('prewarm_connections', 1)
+        self.pipeline_depth = kwargs.get('pipeline_depth', 1)
+        self.multiplexed_connections = kwargs.get('multiplexed_connections', 0)
+        self.websocket_session_window = kwargs.get('websocket_session_window', 0)
+        self.dns_strategy = kwargs.get('dns_strategy', 'first')
+        self.quic_early_data = kwargs.get('quic_early_data', False)
         self.graceful_stop = kwargs.get('graceful_stop', 1)
+        self.columnar_results = kwargs.get('columnar_results', False)
+        self.shared_memory_results = kwargs.get('shared_memory_results', False)
+        self.stream_results = kwargs.get('stream_results', False)
+        self.timing_sketches = kwargs.get('timing_sketches', False)
+        self.aggregate_results = kwargs.get('aggregate_results', False)
         self.optimized = False
 
         if self.request_timeout > self.total_time:
@@ -46,6 +58,7 @@ class Config:
         self.playwright_options = kwargs.get('playwright_options', {})
         self.experiment: Dict[str, Union[str, int, List[float]]] = kwargs.get('experiment', {})
         self.tracing: Union[TracingConfig, None] = kwargs.get('tracing')
+        self.concurrency_control: Union[ConcurrencyControlConfig, None] = kwargs.get('concurrency_control')
         self.mutations: Union[List[Mutation], None] = kwargs.get('mutations', [])
         self.actions_filepaths: Union[Dict[str, str], None] = kwargs.get('actions_filepaths')
 
@@ -55,6 +68,10 @@ class Config:
         if self.tracing:
             trace = self.tracing.copy()
 
+        concurrency_control = None
+        if self.concurrency_control:
+            concurrency_control = self.concurrency_control.copy()
+
         return Config(**{
             'total_time': self.total_time_string,
             'log_level': self.log_level,
@@ -70,7 +87,18 @@ class Config:
             'connect_timeout': self.connect_timeout,
             'request_timeout': self.request_timeout,
             'reset_connections': self.reset_connections,
+            'prewarm_connections': self.prewarm_connections,
+            'pipeline_depth': self.pipeline_depth,
+            'multiplexed_connections': self.multiplexed_connections,
+            'websocket_session_window': self.websocket_session_window,
+            'dns_strategy': self.dns_strategy,
+            'quic_early_data': self.quic_early_data,
             'graceful_stop': self.graceful_stop,
+            'columnar_results': self.columnar_results,
+            'shared_memory_results': self.shared_memory_results,
+            'stream_results': self.stream_results,
+            'timing_sketches': self.timing_sketches,
+            'aggregate_results': self.aggregate_results,
             'optimized': self.optimized,
             'browser_type': self.browser_type,
             'device_type': self.device_type,
@@ -82,6 +110,7 @@ class Config:
             'playwright_options': self.playwright_options,
             'experiment': self.experiment,
             'trace': trace,
+            'concurrency_control': concurrency_control,
             'mutations': self.mutations,
             'actions_filepaths': self.actions_filepaths
         })
@@ -43,7 +43,12 @@ class TracingConfig:
         on_dns_cache_miss: Optional[TraceSignal]=None,
         on_task_start: Optional[TraceSignal]=None,
         on_task_end: Optional[TraceSignal]=None,
-        on_task_error: Optional[TraceSignal]=None
+        on_task_error: Optional[TraceSignal]=None,
+        sample_rate: float=1,
+        sample_every: int=0,
+        batch_size: int=512,
+        flush_interval: float=1,
+        max_queue_size: int=8192
     ) -> None:
 
         if url_filter is None:
@@ -76,6 +81,12 @@ class TracingConfig:
         self.on_task_end = on_task_end
         self.on_task_error = on_task_error
 
+        self.sample_rate = sample_rate
+        self.sample_every = sample_every
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+
     def copy(self) -> TracingConfig:
         return TracingConfig(
             url_filter=self.url_filter,
@@ -100,6 +111,11 @@ class TracingConfig:
             on_task_start=self.on_task_start,
             on_task_end=self.on_task_end,
             on_task_error=self.on_task_error,
+            sample_rate=self.sample_rate,
+            sample_every=self.sample_every,
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+            max_queue_size=self.max_queue_size
         )
     
     def to_dict(self) -> Dict[str, OpenTelemetryTracingConfig]:
@@ -126,4 +142,9 @@ class TracingConfig:
             'on_task_start': self.on_task_start,
             'on_task_end': self.on_task_end,
             'on_task_error': self.on_task_error,
+            'sample_rate': self.sample_rate,
+            'sample_every': self.sample_every,
+            'batch_size': self.batch_size,
+            'flush_interval': self.flush_interval,
+            'max_queue_size': self.max_queue_size
         }
@@ -5,8 +5,10 @@ from typing import (
     Dict, 
     Any, 
     Generic, 
-    Coroutine
+    Coroutine,
+    Optional
 )
+from .concurrency import ConcurrencyController
 
 
 A = TypeVar('A')
@@ -16,17 +18,47 @@ R = TypeVar('R')
 class BaseEngine(Generic[A, R]):
 
     __slots__ = (
-        'waiter'
+        'waiter',
+        'concurrency_controller'
     )
 
     def __init__(self) -> None:
         super().__init__()
 
         self.waiter: asyncio.Future = None
+        self.concurrency_controller: Optional[ConcurrencyController] = None
 
     def config_to_dict(self):
         raise NotImplementedError('Cannot call config_to_dict() on base Engine class.')
 
+    def update_concurrency(self, response: R):
+        controller = self.concurrency_controller
+
+        latency = 0
+        if response.start > 0:
+            latency = response.complete - response.start
+
+        controller.record(
+            latency,
+            response.error is not None,
+            self.active
+        )
+
+        concurrency = self.pool.size
+        next_concurrency = controller.update(concurrency)
+
+        if next_concurrency is not None:
+            self.resize_pool(next_concurrency)
+
+    def resize_pool(self, concurrency: int):
+        # Grows or trims the existing pool in place, so connections
+        # already established stay open across the change.
+        if concurrency > self.pool.size:
+            self.extend_pool(concurrency - self.pool.size)
+
+        elif concurrency < self.pool.size:
+            self.shrink_pool(self.pool.size - concurrency)
+
     async def wait_for_active_threshold(self):
         if self.waiter is None:
             self.waiter = asyncio.get_event_loop().create_future()
@@ -14,6 +14,7 @@ class BaseResult:
         'tags',
         'type',
         'time',
+        'intended_start',
         'wait_start',
         'start',
         'connect_end',
@@ -40,6 +41,7 @@ class BaseResult:
         self.type = type
 
         self.time = 0
+        self.intended_start = 0
         self.wait_start = 0
         self.start = 0
         self.connect_end = 0
@@ -0,0 +1,89 @@
+from __future__ import annotations
+import hashlib
+from typing import (
+    Dict,
+    Optional,
+    Union
+)
+
+
+class BodyRetentionPolicy:
+    KEEP='keep'
+    HEAD='head'
+    CHECKSUM='checksum'
+    DISCARD='discard'
+
+
+class BodyRetention:
+
+    __slots__ = (
+        'policy',
+        'max_size'
+    )
+
+    def __init__(
+        self,
+        policy: str=BodyRetentionPolicy.KEEP,
+        max_size: Optional[int]=None
+    ) -> None:
+
+        if policy not in (
+            BodyRetentionPolicy.KEEP,
+            BodyRetentionPolicy.HEAD,
+            BodyRetentionPolicy.CHECKSUM,
+            BodyRetentionPolicy.DISCARD
+        ):
+            raise ValueError(f'Err. - Unknown body retention policy - {policy}.')
+
+        if policy == BodyRetentionPolicy.HEAD and max_size is None:
+            raise ValueError('Err. - Head body retention requires a max size.')
+
+        self.policy = policy
+        self.max_size = max_size if policy == BodyRetentionPolicy.HEAD else None
+
+    @classmethod
+    def parse(
+        cls,
+        retention: Union[str, int, Dict[str, Union[str, int]], BodyRetention, None]
+    ) -> BodyRetention:
+
+        if isinstance(retention, BodyRetention):
+            return retention
+
+        elif retention is None:
+            return BodyRetention()
+
+        elif isinstance(retention, dict):
+            return BodyRetention(**retention)
+
+        # An integer keeps the first N bytes of the body.
+        elif isinstance(retention, int):
+            return BodyRetention(
+                policy=BodyRetentionPolicy.HEAD,
+                max_size=retention
+            )
+
+        return BodyRetention(policy=retention)
+
+    @property
+    def keeps_full_body(self) -> bool:
+        return self.policy == BodyRetentionPolicy.KEEP
+
+    @property
+    def discard_body(self) -> bool:
+        return self.policy in (
+            BodyRetentionPolicy.CHECKSUM,
+            BodyRetentionPolicy.DISCARD
+        )
+
+    def create_checksum(self):
+        if self.policy == BodyRetentionPolicy.CHECKSUM:
+            return hashlib.blake2b(digest_size=16)
+
+        return None
+
+    def to_dict(self) -> Dict[str, Union[str, int, None]]:
+        return {
+            'policy': self.policy,
+            'max_size': self.max_size
+        }
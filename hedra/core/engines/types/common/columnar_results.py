@@ -0,0 +1,403 @@
+from __future__ import annotations
+import json
+import struct
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from .base_result import BaseResult
+
+
+ActionMetadata = Dict[str, Union[str, List[Dict[str, str]]]]
+
+
+class ColumnarResult(BaseResult):
+
+    '''
+    A result read back out of columnar storage. Only the fields the
+    columns keep are set, alongside the action's status.
+    '''
+
+    __slots__ = (
+        'status',
+    )
+
+
+class ColumnarResults:
+
+    '''
+    Compact, array-backed store of execution results. Timings are held
+    as typed double arrays and the action name, status, and error of
+    each result are interned into lookup tables, so a batch of results
+    can be shipped between processes as a single buffer rather than as
+    one pickle per result.
+    '''
+
+    __slots__ = (
+        'actions',
+        'names',
+        'statuses',
+        'errors',
+        'name_idxs',
+        'status_idxs',
+        'error_idxs',
+        'intended_start',
+        'wait_start',
+        'start',
+        'connect_end',
+        'write_end',
+        'complete',
+        '_names_lookup',
+        '_statuses_lookup',
+        '_errors_lookup'
+    )
+
+    header = struct.Struct('<4sII')
+    magic = b'HCR2'
+    index_columns = (
+        'name_idxs',
+        'status_idxs',
+        'error_idxs'
+    )
+    timing_columns = (
+        'intended_start',
+        'wait_start',
+        'start',
+        'connect_end',
+        'write_end',
+        'complete'
+    )
+
+    def __init__(self) -> None:
+        self.actions: Dict[str, ActionMetadata] = {}
+
+        # Index zero of the status and error tables is reserved for
+        # results without a status or error.
+        self.names: List[str] = []
+        self.statuses: List[Union[int, str, None]] = [None]
+        self.errors: List[Union[str, None]] = [None]
+
+        self.name_idxs = array('i')
+        self.status_idxs = array('i')
+        self.error_idxs = array('i')
+
+        self.intended_start = array('d')
+        self.wait_start = array('d')
+        self.start = array('d')
+        self.connect_end = array('d')
+        self.write_end = array('d')
+        self.complete = array('d')
+
+        self._names_lookup: Dict[str, int] = {}
+        self._statuses_lookup: Dict[Union[int, str, None], int] = {None: 0}
+        self._errors_lookup: Dict[Union[str, None], int] = {None: 0}
+
+    def __len__(self) -> int:
+        return len(self.name_idxs)
+
+    def __reduce__(self):
+        return (
+            ColumnarResults.from_bytes,
+            (self.to_bytes(),)
+        )
+
+    def append(self, result: BaseResult):
+
+        name_idx = self._names_lookup.get(result.name)
+        if name_idx is None:
+            name_idx = self._intern_name(result.name)
+
+            self.actions[result.name] = {
+                'type': str(result.type),
+                'source': result.source,
+                'tags': list(result.tags or [])
+            }
+
+        status = getattr(result, 'status', None)
+        if status is not None and not isinstance(status, (int, str)):
+            status = str(status)
+
+        status_idx = self._statuses_lookup.get(status)
+        if status_idx is None:
+            status_idx = self._intern(
+                status,
+                self.statuses,
+                self._statuses_lookup
+            )
+
+        error = result.error
+        if error is not None:
+            error = str(error)
+
+        error_idx = self._errors_lookup.get(error)
+        if error_idx is None:
+            error_idx = self._intern(
+                error,
+                self.errors,
+                self._errors_lookup
+            )
+
+        self.name_idxs.append(name_idx)
+        self.status_idxs.append(status_idx)
+        self.error_idxs.append(error_idx)
+
+        self.intended_start.append(result.intended_start)
+        self.wait_start.append(result.wait_start)
+        self.start.append(result.start)
+        self.connect_end.append(result.connect_end)
+        self.write_end.append(result.write_end)
+        self.complete.append(result.complete)
+
+    def extend(self, results: Iterable[BaseResult]):
+        for result in results:
+            if isinstance(result, BaseResult):
+                self.append(result)
+
+    def name_index(self, name: str) -> int:
+        return self._names_lookup.get(name, -1)
+
+    def slice(self, start: int, end: int) -> ColumnarResults:
+        columns = self._copy_tables()
+
+        for column_name in (*self.index_columns, *self.timing_columns):
+            setattr(
+                columns,
+                column_name,
+                getattr(self, column_name)[start:end]
+            )
+
+        return columns
+
+    def partition(self, partitions_count: int) -> List[ColumnarResults]:
+
+        results_count = len(self)
+        batch_size = int(results_count/partitions_count)
+
+        partitions: List[ColumnarResults] = []
+        for partition_idx in range(partitions_count):
+            batch_marker = partition_idx * batch_size
+            batch_end = batch_marker + batch_size
+
+            if partition_idx == partitions_count - 1:
+                batch_end = results_count
+
+            partitions.append(
+                self.slice(batch_marker, batch_end)
+            )
+
+        return partitions
+
+    def select(self, name: str) -> ColumnarResults:
+        columns = self._copy_tables()
+        name_idx = self.name_index(name)
+
+        for row_idx, row_name_idx in enumerate(self.name_idxs):
+            if row_name_idx == name_idx:
+                for column_name in (*self.index_columns, *self.timing_columns):
+                    getattr(columns, column_name).append(
+                        getattr(self, column_name)[row_idx]
+                    )
+
+        return columns
+
+    def to_results(self, name: Optional[str]=None) -> List[ColumnarResult]:
+        name_idx = self.name_index(name) if name else None
+
+        results: List[ColumnarResult] = []
+        for row_idx, row_name_idx in enumerate(self.name_idxs):
+            if name_idx is not None and row_name_idx != name_idx:
+                continue
+
+            action_name = self.names[row_name_idx]
+            action_metadata = self.actions.get(action_name, {})
+
+            result = ColumnarResult(
+                None,
+                action_name,
+                action_metadata.get('source'),
+                None,
+                action_metadata.get('tags', []),
+                action_metadata.get('type'),
+                self.errors[self.error_idxs[row_idx]]
+            )
+
+            result.status = self.statuses[self.status_idxs[row_idx]]
+
+            for column_name in self.timing_columns:
+                setattr(
+                    result,
+                    column_name,
+                    getattr(self, column_name)[row_idx]
+                )
+
+            results.append(result)
+
+        return results
+
+    def merge(self, other: ColumnarResults):
+
+        names_map = [
+            self._names_lookup[name] if name in self._names_lookup else self._intern_name(
+                name
+            ) for name in other.names
+        ]
+
+        for action_name, action_metadata in other.actions.items():
+            if action_name not in self.actions:
+                self.actions[action_name] = action_metadata
+
+        statuses_map = [
+            self._statuses_lookup[status] if status in self._statuses_lookup else self._intern(
+                status,
+                self.statuses,
+                self._statuses_lookup
+            ) for status in other.statuses
+        ]
+
+        errors_map = [
+            self._errors_lookup[error] if error in self._errors_lookup else self._intern(
+                error,
+                self.errors,
+                self._errors_lookup
+            ) for error in other.errors
+        ]
+
+        self.name_idxs.extend([
+            names_map[name_idx] for name_idx in other.name_idxs
+        ])
+
+        self.status_idxs.extend([
+            statuses_map[status_idx] for status_idx in other.status_idxs
+        ])
+
+        self.error_idxs.extend([
+            errors_map[error_idx] for error_idx in other.error_idxs
+        ])
+
+        for column_name in self.timing_columns:
+            getattr(self, column_name).extend(
+                getattr(other, column_name)
+            )
+
+    def to_bytes(self) -> bytes:
+
+        metadata = json.dumps({
+            'actions': self.actions,
+            'names': self.names,
+            'statuses': self.statuses,
+            'errors': self.errors
+        }).encode()
+
+        return b''.join([
+            self.header.pack(
+                self.magic,
+                len(self),
+                len(metadata)
+            ),
+            metadata,
+            *[
+                getattr(self, column_name).tobytes() for column_name in (
+                    *self.index_columns,
+                    *self.timing_columns
+                )
+            ]
+        ])
+
+    @classmethod
+    def read_header(cls, buffer: Union[bytes, bytearray, memoryview]) -> Tuple[int, Dict[str, Any], int]:
+
+        view = memoryview(buffer)
+        magic, rows_count, metadata_size = cls.header.unpack_from(view, 0)
+
+        if magic != cls.magic:
+            raise ValueError('Err. - Buffer does not contain columnar results.')
+
+        offset = cls.header.size
+        metadata: Dict[str, Any] = json.loads(
+            bytes(view[offset:offset + metadata_size])
+        )
+
+        return rows_count, metadata, offset + metadata_size
+
+    @classmethod
+    def from_bytes(
+        cls,
+        buffer: Union[bytes, bytearray, memoryview],
+        start: int=0,
+        end: Optional[int]=None
+    ) -> ColumnarResults:
+
+        # Columns are stored one after another, so rows [start:end] of
+        # each column can be read without touching the rest of the buffer.
+        view = memoryview(buffer)
+        rows_count, metadata, offset = cls.read_header(view)
+
+        if end is None or end > rows_count:
+            end = rows_count
+
+        columns = ColumnarResults()
+        columns.actions = metadata.get('actions', {})
+        columns.names = metadata.get('names', [])
+        columns.statuses = metadata.get('statuses', [None])
+        columns.errors = metadata.get('errors', [None])
+        columns._rebuild_lookups()
+
+        for column_name in (*cls.index_columns, *cls.timing_columns):
+            column: array = getattr(columns, column_name)
+            itemsize = column.itemsize
+
+            column.frombytes(
+                view[offset + start * itemsize:offset + end * itemsize]
+            )
+
+            offset += rows_count * itemsize
+
+        return columns
+
+    def _intern_name(self, name: str) -> int:
+        return self._intern(
+            name,
+            self.names,
+            self._names_lookup
+        )
+
+    def _intern(
+        self,
+        value: Any,
+        table: List[Any],
+        lookup: Dict[Any, int]
+    ) -> int:
+        value_idx = len(table)
+        table.append(value)
+        lookup[value] = value_idx
+
+        return value_idx
+
+    def _copy_tables(self) -> ColumnarResults:
+        columns = ColumnarResults()
+        columns.actions = dict(self.actions)
+        columns.names = list(self.names)
+        columns.statuses = list(self.statuses)
+        columns.errors = list(self.errors)
+        columns._rebuild_lookups()
+
+        return columns
+
+    def _rebuild_lookups(self):
+        self._names_lookup = {
+            name: name_idx for name_idx, name in enumerate(self.names)
+        }
+
+        self._statuses_lookup = {
+            status: status_idx for status_idx, status in enumerate(self.statuses)
+        }
+
+        self._errors_lookup = {
+            error: error_idx for error_idx, error in enumerate(self.errors)
+        }
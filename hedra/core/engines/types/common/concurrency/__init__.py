@@ -1,3 +1,4 @@
 from .balancing_semaphore import BalancingSemaphore
+from .concurrency_controller import ConcurrencyController
 from .noop_semaphore import NoOpSemaphore
 from .semaphore import Semaphore
\ No newline at end of file
@@ -0,0 +1,201 @@
+import math
+import time
+from typing import Dict, List, Optional, Union
+
+
+class ConcurrencyController:
+
+    '''
+    Closed-loop concurrency control for an engine. Completed requests
+    are collected into windows of `interval` seconds. At the end of each
+    window the controller proposes a new concurrency for the engine.
+
+    With a `target_latency` the controller runs AIMD. It grows concurrency
+    additively while the window's latency quantile stays under the target,
+    and cuts it multiplicatively when the quantile exceeds the target.
+
+    Without a target it runs a gradient method. It compares each window's
+    median latency against the lowest median seen so far. It grows while
+    latency stays within `tolerance` of that baseline and backs off as
+    queueing inflates latency past it, which settles just beyond the
+    highest sustainable throughput.
+
+    Unless `max_concurrency` is set, concurrency never grows past the
+    engine's concurrency when the run starts.
+
+    Both modes cut concurrency when the error rate exceeds
+    `max_error_rate`. Neither grows concurrency while under half of the
+    current limit is in use, since those windows say nothing about the
+    target's capacity.
+    '''
+
+    __slots__ = (
+        'target_latency',
+        'min_concurrency',
+        'max_concurrency',
+        'max_error_rate',
+        'interval',
+        'increase',
+        'decrease',
+        'latency_quantile',
+        'latencies',
+        'completed',
+        'errors',
+        'peak_in_flight',
+        'window_start',
+        'baseline_latency'
+    )
+
+    min_samples = 10
+    tolerance = 1.5
+    smoothing = 0.2
+    baseline_drift = 0.02
+
+    def __init__(
+        self,
+        target_latency: Optional[float]=None,
+        min_concurrency: int=1,
+        max_concurrency: Optional[int]=None,
+        max_error_rate: float=0.05,
+        interval: float=1,
+        increase: int=1,
+        decrease: float=0.75,
+        latency_quantile: float=0.99
+    ) -> None:
+
+        self.target_latency = target_latency
+        self.min_concurrency = max(min_concurrency, 1)
+        self.max_concurrency = max_concurrency
+        self.max_error_rate = max_error_rate
+        self.interval = interval
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_quantile = latency_quantile
+
+        self.latencies: List[float] = []
+        self.completed = 0
+        self.errors = 0
+        self.peak_in_flight = 0
+        self.window_start = time.monotonic()
+        self.baseline_latency: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Union[int, float, None]]:
+        return {
+            'target_latency': self.target_latency,
+            'min_concurrency': self.min_concurrency,
+            'max_concurrency': self.max_concurrency,
+            'max_error_rate': self.max_error_rate,
+            'interval': self.interval,
+            'increase': self.increase,
+            'decrease': self.decrease,
+            'latency_quantile': self.latency_quantile
+        }
+
+    def record(self, latency: float, failed: bool, in_flight: int):
+        self.completed += 1
+
+        if failed:
+            self.errors += 1
+
+        elif latency > 0:
+            self.latencies.append(latency)
+
+        if in_flight > self.peak_in_flight:
+            self.peak_in_flight = in_flight
+
+    def update(self, concurrency: int) -> Optional[int]:
+
+        if self.completed < self.min_samples:
+            return None
+
+        now = time.monotonic()
+        if now - self.window_start < self.interval:
+            return None
+
+        if self.max_concurrency is None:
+            # Without an explicit ceiling the engine's concurrency when
+            # the run starts is the most the controller will allow.
+            self.max_concurrency = max(concurrency, self.min_concurrency)
+
+        latencies = self.latencies
+        error_rate = self.errors/self.completed
+        saturated = self.peak_in_flight * 2 >= concurrency
+
+        self.latencies = []
+        self.completed = 0
+        self.errors = 0
+        self.peak_in_flight = 0
+        self.window_start = now
+
+        if error_rate > self.max_error_rate:
+            next_concurrency = concurrency * self.decrease
+
+        elif len(latencies) == 0:
+            return None
+
+        elif self.target_latency:
+            next_concurrency = self._aimd(
+                concurrency,
+                self._quantile(latencies, self.latency_quantile),
+                saturated
+            )
+
+        else:
+            next_concurrency = self._gradient(
+                concurrency,
+                self._quantile(latencies, 0.5),
+                saturated
+            )
+
+        next_concurrency = min(
+            max(int(next_concurrency), self.min_concurrency),
+            self.max_concurrency
+        )
+
+        if next_concurrency == concurrency:
+            return None
+
+        return next_concurrency
+
+    def _aimd(self, concurrency: int, latency: float, saturated: bool) -> float:
+
+        if latency > self.target_latency:
+            return concurrency * self.decrease
+
+        if saturated:
+            return concurrency + self.increase
+
+        return concurrency
+
+    def _gradient(self, concurrency: int, latency: float, saturated: bool) -> float:
+
+        if self.baseline_latency is None or latency < self.baseline_latency:
+            self.baseline_latency = latency
+
+        else:
+            # The baseline drifts slowly upward so that a target which
+            # has become slower for good is not throttled indefinitely.
+            self.baseline_latency += (latency - self.baseline_latency) * self.baseline_drift
+
+        if saturated is False:
+            return concurrency
+
+        gradient = min(
+            max(self.tolerance * self.baseline_latency/latency, 0.5),
+            1
+        )
+
+        next_concurrency = concurrency * gradient + math.sqrt(concurrency)
+        next_concurrency = concurrency * (1 - self.smoothing) + next_concurrency * self.smoothing
+
+        if gradient >= 1:
+            return max(next_concurrency, concurrency + 1)
+
+        return next_concurrency
+
+    def _quantile(self, latencies: List[float], quantile: float) -> float:
+        latencies.sort()
+
+        return latencies[
+            min(int(len(latencies) * quantile), len(latencies) - 1)
+        ]
@@ -60,7 +60,7 @@ class Semaphore(_ContextManagerMixin, mixins._LoopBoundMixin):
 
     def locked(self):
         """Returns True if semaphore can not be acquired immediately."""
-        return self._value == 0
+        return self._value <= 0
 
     async def acquire(self):
         """Acquire a semaphore.
@@ -92,4 +92,20 @@ class Semaphore(_ContextManagerMixin, mixins._LoopBoundMixin):
         become larger than zero again, wake up that coroutine.
         """
         self._value += 1
-        self._wake_up_next()
\ No newline at end of file
+
+        # The value stays at or below zero while permits withdrawn by
+        # shrink() are still held, so nobody is woken until it recovers.
+        if self._value > 0:
+            self._wake_up_next()
+
+    def extend(self, count: int):
+        """Add count permits, waking up to count waiting coroutines."""
+        for _ in range(count):
+            self.release()
+
+    def shrink(self, count: int):
+        """Withdraw count permits. Permits already held stay valid, so
+        the counter may go negative and only recovers as they are
+        released.
+        """
+        self._value -= count
\ No newline at end of file
@@ -0,0 +1,260 @@
+import asyncio
+import socket
+import time
+import aiodns
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+from weakref import WeakKeyDictionary
+
+
+SocketConfig = Tuple[int, int, int, str, Tuple[Any, ...]]
+DNSKey = Tuple[str, int, int]
+
+
+class DNSStrategy:
+    FIRST='first'
+    ROUND_ROBIN='round_robin'
+    HASH='hash'
+
+
+class DNSEntry:
+
+    __slots__ = (
+        'addresses',
+        'socket_configs',
+        'expires',
+        'next_idx'
+    )
+
+    def __init__(
+        self,
+        socket_configs: Dict[str, List[SocketConfig]],
+        ttl: float
+    ) -> None:
+        self.addresses: List[str] = list(socket_configs.keys())
+        self.socket_configs = socket_configs
+        self.expires = time.monotonic() + ttl
+        self.next_idx = 0
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+    def next_address(self) -> str:
+        address = self.addresses[self.next_idx % len(self.addresses)]
+        self.next_idx += 1
+
+        return address
+
+
+class DNSCache:
+
+    '''
+    Process-wide cache of resolved addresses shared by every engine.
+    Entries live for the lowest TTL of their records, concurrent lookups
+    of the same host share one query, and expired entries keep serving
+    their addresses while a refresh runs in the background, so long
+    tests pick up DNS changes without stalling requests.
+    '''
+
+    __slots__ = (
+        'entries',
+        'pending',
+        'resolvers',
+        'strategy',
+        'min_ttl',
+        'default_ttl',
+        'connection_slots'
+    )
+
+    def __init__(
+        self,
+        strategy: str=DNSStrategy.FIRST,
+        min_ttl: float=1,
+        default_ttl: float=60
+    ) -> None:
+        self.entries: Dict[DNSKey, DNSEntry] = {}
+        self.pending: Dict[DNSKey, asyncio.Task] = {}
+        self.resolvers: WeakKeyDictionary[asyncio.AbstractEventLoop, aiodns.DNSResolver] = WeakKeyDictionary()
+        self.strategy = strategy
+        self.min_ttl = min_ttl
+        self.default_ttl = default_ttl
+
+        # Slots handed out in order to each connection the first time it
+        # picks an address, so the hash strategy spreads connections
+        # evenly and each keeps mapping to the same address.
+        self.connection_slots: Dict[int, int] = {}
+
+    def configure(self, strategy: str=DNSStrategy.FIRST):
+
+        if strategy not in (
+            DNSStrategy.FIRST,
+            DNSStrategy.ROUND_ROBIN,
+            DNSStrategy.HASH
+        ):
+            raise ValueError(f'Err. - Unknown DNS strategy - {strategy}.')
+
+        self.strategy = strategy
+
+    def connection_slot(self, connection: Any) -> int:
+        connection_id = id(connection)
+
+        slot = self.connection_slots.get(connection_id)
+        if slot is None:
+            slot = len(self.connection_slots)
+            self.connection_slots[connection_id] = slot
+
+        return slot
+
+    async def resolve(
+        self,
+        hostname: str,
+        port: int,
+        family: int
+    ) -> Dict[str, List[SocketConfig]]:
+        key = (hostname, port, family)
+
+        entry = self.entries.get(key)
+        if entry and not entry.expired:
+            return entry.socket_configs
+
+        loop = asyncio.get_event_loop()
+        lookup = self.pending.get(key)
+
+        if lookup is None or lookup.get_loop() is not loop:
+            lookup = loop.create_task(
+                self._refresh(key)
+            )
+
+            self.pending[key] = lookup
+
+        return await asyncio.shield(lookup)
+
+    def get_entry(
+        self,
+        hostname: str,
+        port: int,
+        family: int
+    ) -> Optional[DNSEntry]:
+        key = (hostname, port, family)
+
+        entry = self.entries.get(key)
+        if entry and entry.expired and key not in self.pending:
+
+            try:
+                self.pending[key] = asyncio.get_event_loop().create_task(
+                    self._refresh(key)
+                )
+
+            except RuntimeError:
+                pass
+
+        return entry
+
+    async def _refresh(self, key: DNSKey) -> Dict[str, List[SocketConfig]]:
+        try:
+            return await self._lookup(key)
+
+        except Exception as lookup_error:
+            # Keep serving the stale addresses and retry once the
+            # minimum TTL has passed.
+            entry = self.entries.get(key)
+            if entry is None:
+                raise lookup_error
+
+            entry.expires = time.monotonic() + self.min_ttl
+
+            return entry.socket_configs
+
+    async def _lookup(self, key: DNSKey) -> Dict[str, List[SocketConfig]]:
+        hostname, port, family = key
+        loop = asyncio.get_event_loop()
+
+        try:
+            addresses, ttl = await self._query(hostname, family)
+
+            lookups = await asyncio.gather(*[
+                loop.getaddrinfo(
+                    address,
+                    port,
+                    family=family,
+                    proto=0,
+                    flags=0
+                ) for address in addresses
+            ])
+
+            socket_configs: Dict[str, List[SocketConfig]] = {}
+            for address, infos in zip(addresses, lookups):
+                socket_configs[address] = [*infos]
+
+            entry = DNSEntry(socket_configs, ttl)
+
+            # Round-robin position carries over refreshes so connections
+            # keep spreading evenly.
+            previous = self.entries.get(key)
+            if previous:
+                entry.next_idx = previous.next_idx
+
+            self.entries[key] = entry
+
+            return socket_configs
+
+        finally:
+            self.pending.pop(key, None)
+
+    async def _query(self, hostname: str, family: int) -> Tuple[List[str], float]:
+        loop = asyncio.get_event_loop()
+
+        resolver = self.resolvers.get(loop)
+        if resolver is None:
+            resolver = aiodns.DNSResolver(loop=loop)
+            self.resolvers[loop] = resolver
+
+        query_type = 'AAAA' if family == socket.AF_INET6 else 'A'
+
+        addresses: List[str] = []
+        ttl = self.default_ttl
+
+        try:
+            result = await resolver.query_dns(hostname, query_type)
+
+            # Answers can include the CNAME chain, which has no address.
+            records = [
+                record for record in result.answer if hasattr(record.data, 'addr')
+            ]
+
+            for record in records:
+                if record.data.addr not in addresses:
+                    addresses.append(record.data.addr)
+
+            if records:
+                ttl = min([
+                    record.ttl for record in records
+                ])
+
+        except aiodns.error.DNSError:
+            pass
+
+        if len(addresses) < 1:
+            # Names only known to the hosts file don't resolve over
+            # DNS and have no TTL.
+            resolved = await resolver.getaddrinfo(hostname, family=family)
+
+            for node in resolved.nodes:
+                address = node.addr[0].decode()
+                if address not in addresses:
+                    addresses.append(address)
+
+        return addresses, max(ttl, self.min_ttl)
+
+    def clear(self):
+        self.entries.clear()
+        self.connection_slots.clear()
+
+
+dns_cache = DNSCache()
@@ -6,7 +6,11 @@ hpack/hpack
 Implements the HPACK header compression algorithm as detailed by the IETF.
 """
 
-from .hpack.table import HeaderTable, table_entry_size
+from .hpack.table import (
+    HeaderTable,
+    table_entry_size,
+    STATIC_TABLE_MAPPING
+)
 from .hpack.exceptions import (
     HPACKDecodingError, OversizedHeaderListError, InvalidTableSizeError
 )
@@ -245,6 +249,48 @@ class Encoder:
 
         return header_block
 
+    def encode_unindexed(self, headers, huffman=True):
+        """
+        Encodes headers without touching the dynamic table. Headers
+        matching the static table are indexed and all others are sent
+        as literals without indexing, so the resulting block decodes the
+        same on any connection regardless of its header table state.
+        """
+        header_block = []
+
+        for header in headers:
+            name = _to_bytes(header[0])
+            value = _to_bytes(header[1])
+
+            static_match = STATIC_TABLE_MAPPING.get(name)
+
+            if static_match is None:
+                header_block.append(
+                    self._encode_literal(name, value, INDEX_NONE, huffman)
+                )
+
+                continue
+
+            name_index, values = static_match
+            index = values.get(value)
+
+            if index is not None:
+                header_block.append(
+                    self._encode_indexed(index)
+                )
+
+            else:
+                header_block.append(
+                    self._encode_indexed_literal(
+                        name_index,
+                        value,
+                        INDEX_NONE,
+                        huffman
+                    )
+                )
+
+        return b''.join(header_block)
+
     def add(self, to_add, sensitive, huffman=False):
         """
         This function takes a header key-value tuple and serializes it.
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from typing import List, Tuple
+from hedra.core.engines.types.common.encoder import Encoder
+
+
+HeaderItems = Tuple[Tuple[str, str], ...]
+
+
+class HeaderBlockCache:
+
+    '''
+    LRU of encoded HTTP/2 header blocks keyed by header list and max
+    frame size. Blocks are encoded without dynamic table indexing, so a
+    cached block is valid on every connection and an action sending the
+    same headers repeatedly skips HPACK encoding after the first request.
+    '''
+
+    __slots__ = (
+        'encoder',
+        'blocks',
+        'max_size'
+    )
+
+    def __init__(self, max_size: int=1024) -> None:
+        self.encoder = Encoder()
+        self.blocks: OrderedDict[Tuple[HeaderItems, int], List[bytes]] = OrderedDict()
+        self.max_size = max_size
+
+    def get(self, headers: HeaderItems, max_frame_size: int) -> List[bytes]:
+        key = (headers, max_frame_size)
+
+        try:
+            header_blocks = self.blocks.get(key)
+
+        except TypeError:
+            # Unhashable header values are encoded but never cached.
+            return self.encode(headers, max_frame_size)
+
+        if header_blocks is None:
+            header_blocks = self.encode(headers, max_frame_size)
+            self.blocks[key] = header_blocks
+
+            if len(self.blocks) > self.max_size:
+                self.blocks.popitem(last=False)
+
+        else:
+            self.blocks.move_to_end(key)
+
+        return header_blocks
+
+    def encode(self, headers: HeaderItems, max_frame_size: int) -> List[bytes]:
+        encoded_headers = self.encoder.encode_unindexed(headers)
+
+        return [
+            encoded_headers[idx:idx + max_frame_size] for idx in range(
+                0,
+                len(encoded_headers),
+                max_frame_size
+            )
+        ]
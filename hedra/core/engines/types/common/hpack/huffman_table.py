@@ -69,7 +69,12 @@ This approach has relatively little indirection, and therefore performs
 relatively well, particularly on implementations like PyPy where the cost of
 loops at the Python-level is not too expensive. The total number of loop
 iterations is 4x the number of bytes passed to the decoder.
+
+``decode_huffman`` doesn't walk this table directly. At import, each pair of
+nibble transitions is composed into a single transition per (state, byte),
+so decoding takes one table lookup per input byte.
 """
+from functools import lru_cache
 from .exceptions import HPACKDecodingError
 
 
@@ -79,7 +84,55 @@ from .exceptions import HPACKDecodingError
 def decode_huffman(huffman_string):
     """
     Given a bytestring of Huffman-encoded data for HPACK, returns a bytestring
-    of the decompressed data.
+    of the decompressed data. Header values repeat heavily across responses,
+    so decoded values are cached.
+    """
+    if not huffman_string:
+        return b''
+
+    return _decode_huffman_cached(bytes(huffman_string))
+
+
+@lru_cache(maxsize=4096)
+def _decode_huffman_cached(huffman_string):
+    return decode_huffman_bytes(huffman_string)
+
+
+def decode_huffman_bytes(huffman_string):
+    """
+    Given a bytestring of Huffman-encoded data for HPACK, returns a bytestring
+    of the decompressed data, walking the state machine one whole byte at a
+    time using the byte table built from the nibble table below.
+    """
+    if not huffman_string:
+        return b''
+
+    state = 0
+    complete = False
+    decoded_bytes = bytearray()
+    byte_table = HUFFMAN_BYTE_TABLE
+
+    for input_byte in huffman_string:
+        transition = byte_table[(state << 8) | input_byte]
+
+        if transition is None:
+            raise HPACKDecodingError("Invalid Huffman String")
+
+        state, complete, output_bytes = transition
+
+        if output_bytes:
+            decoded_bytes += output_bytes
+
+    if not complete:
+        raise HPACKDecodingError("Incomplete Huffman string")
+
+    return bytes(decoded_bytes)
+
+
+def decode_huffman_nibbles(huffman_string):
+    """
+    Given a bytestring of Huffman-encoded data for HPACK, returns a bytestring
+    of the decompressed data, walking the state machine one nibble at a time.
     """
     if not huffman_string:
         return b''
@@ -4737,3 +4790,50 @@ HUFFMAN_TABLE = [
     (0, HUFFMAN_FAIL, 0),
     (0, HUFFMAN_FAIL, 0),
 ]
+
+
+def _build_byte_table():
+    """
+    Composes two nibble transitions of HUFFMAN_TABLE into one transition
+    per (state, byte) pair. Each entry is ``(state, complete, output)``,
+    where ``output`` holds the zero, one or two bytes emitted while
+    consuming the input byte, or ``None`` if the byte is invalid in that
+    state.
+    """
+    byte_table = []
+
+    for state in range(256):
+        for input_byte in range(256):
+            high_state, high_flags, high_output = HUFFMAN_TABLE[
+                (state * 16) + (input_byte >> 4)
+            ]
+
+            if high_flags & HUFFMAN_FAIL:
+                byte_table.append(None)
+                continue
+
+            low_state, low_flags, low_output = HUFFMAN_TABLE[
+                (high_state * 16) + (input_byte & 0x0F)
+            ]
+
+            if low_flags & HUFFMAN_FAIL:
+                byte_table.append(None)
+                continue
+
+            output_bytes = bytearray()
+            if high_flags & HUFFMAN_EMIT_SYMBOL:
+                output_bytes.append(high_output)
+
+            if low_flags & HUFFMAN_EMIT_SYMBOL:
+                output_bytes.append(low_output)
+
+            byte_table.append((
+                low_state,
+                bool(low_flags & HUFFMAN_COMPLETE),
+                bytes(output_bytes)
+            ))
+
+    return tuple(byte_table)
+
+
+HUFFMAN_BYTE_TABLE = _build_byte_table()
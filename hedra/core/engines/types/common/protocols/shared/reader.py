@@ -7,6 +7,13 @@ from asyncio import (
     AbstractEventLoop
 )
 from asyncio.exceptions import LimitOverrunError
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple
+)
 from .constants import _DEFAULT_LIMIT
 
 
@@ -143,6 +150,15 @@ class Reader:
         self._maybe_resume_transport()
         return data
     
+    async def read_exactly(self, n: int):
+        await self._fill(n)
+
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+
+        self._maybe_resume_transport()
+        return data
+
     async def readline_fast(self, sep=b'\n'):
         seplen = len(sep)
         if self._exception is not None:
@@ -172,6 +188,197 @@ class Reader:
         self._maybe_resume_transport()
         return bytes(chunk)
 
+    async def read_response(
+        self,
+        discard_body: bool=False,
+        max_body_size: Optional[int]=None,
+        checksum: Optional[Any]=None,
+        on_chunk: Optional[Callable[[], None]]=None
+    ) -> Tuple[bytes, Dict[bytes, bytes], bytearray, int]:
+        """Read a complete HTTP/1.1 response - status line, headers, and a
+        Content-Length or chunked body - in a single pass.
+        The buffer is scanned in place by offset and only compacted once
+        the whole response has been parsed, so no intermediate lines or
+        chunks are copied out of it. If ``discard_body`` is set, or the
+        body outgrows ``max_body_size``, the bytes not kept are consumed
+        as they arrive so large bodies are never held in full. Every body
+        byte is fed to ``checksum`` (any object with an ``update`` method)
+        when one is given. Returns the status line, headers, the kept body,
+        and the full body size.
+        """
+        buffer = self._buffer
+
+        line_end = await self._find_separator(b'\n', 0)
+        response_code = bytes(buffer[:line_end + 1])
+        offset = line_end + 1
+
+        headers: Dict[bytes, bytes] = {}
+
+        while True:
+            line_end = await self._find_separator(b'\n', offset)
+
+            with memoryview(buffer) as view:
+                colon = buffer.find(b':', offset, line_end)
+
+                if colon < 0:
+                    offset = line_end + 1
+                    break
+
+                headers[bytes(view[offset:colon]).strip().lower()] = bytes(
+                    view[colon + 1:line_end]
+                ).strip()
+
+            offset = line_end + 1
+
+        body = bytearray()
+        body_size = 0
+
+        keep_limit = max_body_size
+        if discard_body:
+            keep_limit = 0
+
+        content_length = headers.get(b'content-length')
+
+        if content_length:
+            body_size = int(content_length)
+
+            offset = await self._read_body_segment(
+                offset,
+                body_size,
+                body,
+                keep_limit,
+                checksum
+            )
+
+        elif headers.get(b'transfer-encoding'):
+
+            while True:
+                line_end = await self._find_separator(b'\n', offset)
+
+                chunk_size = int(
+                    buffer[offset:line_end].split(b';', 1)[0].strip(),
+                    16
+                )
+
+                offset = line_end + 1
+
+                if chunk_size == 0:
+                    # Skip any trailers through the final empty line.
+                    while True:
+                        line_end = await self._find_separator(b'\n', offset)
+                        trailer_empty = line_end - offset <= 1
+
+                        offset = line_end + 1
+                        if trailer_empty:
+                            break
+
+                    break
+
+                body_size += chunk_size
+
+                offset = await self._read_body_segment(
+                    offset,
+                    chunk_size,
+                    body,
+                    keep_limit,
+                    checksum
+                )
+
+                # Skip the CRLF closing the chunk.
+                await self._fill(offset + 2)
+                offset += 2
+
+                if on_chunk:
+                    on_chunk()
+
+        del buffer[:offset]
+        self._maybe_resume_transport()
+
+        return response_code, headers, body, body_size
+
+    async def _read_body_segment(
+        self,
+        offset: int,
+        size: int,
+        body: bytearray,
+        keep_limit: Optional[int],
+        checksum: Optional[Any]
+    ) -> int:
+        # Returns the offset just past the segment. Segments that are kept
+        # in full are read in place; otherwise the buffer is compacted as
+        # data arrives and the returned offset is relative to the
+        # compacted buffer.
+        keep = size
+        if keep_limit is not None:
+            keep = max(min(size, keep_limit - len(body)), 0)
+
+        if keep == size:
+            await self._fill(offset + size)
+
+            with memoryview(self._buffer) as view:
+                with view[offset:offset + size] as segment:
+                    body.extend(segment)
+
+                    if checksum:
+                        checksum.update(segment)
+
+            return offset + size
+
+        while True:
+            consumed = min(len(self._buffer) - offset, size)
+
+            with memoryview(self._buffer) as view:
+                with view[offset:offset + consumed] as segment:
+
+                    if keep > 0:
+                        body.extend(segment[:keep])
+                        keep -= min(keep, consumed)
+
+                    if checksum:
+                        checksum.update(segment)
+
+            size -= consumed
+            offset += consumed
+
+            if size == 0:
+                return offset
+
+            self._buffer.clear()
+            offset = 0
+
+            await self._wait_for_more('read_response')
+
+    async def _find_separator(self, separator: bytes, offset: int) -> int:
+        search_start = offset
+        seplen = len(separator)
+
+        while True:
+            isep = self._buffer.find(separator, search_start)
+            if isep >= 0:
+                return isep
+
+            search_start = max(len(self._buffer) + 1 - seplen, offset)
+            if search_start - offset > self._limit:
+                raise LimitOverrunError(
+                    'Separator is not found, and chunk exceed the limit',
+                    search_start - offset
+                )
+
+            await self._wait_for_more('read_response')
+
+    async def _fill(self, size: int):
+        while len(self._buffer) < size:
+            await self._wait_for_more('read_response')
+
+    async def _wait_for_more(self, func_name: str):
+        if self._exception is not None:
+            raise self._exception
+
+        if self._eof:
+            raise Exception('Connection closed.')
+
+        await self._wait_for_data(func_name)
+
     async def readuntil(self, separator=b'\n'):
         """Read data from the stream until ``separator`` is found.
         On success, the data and separator will be removed from the
@@ -6,6 +6,7 @@ from hedra.core.engines.types.common.protocols.shared.reader import Reader
 from hedra.core.engines.types.common.protocols.shared.writer import Writer
 from .protocol import UDPProtocol
 from .quic_protocol import QuicProtocol
+from .session_tickets import session_tickets
 
 try:
     from aioquic.h3.connection import H3_ALPN
@@ -67,6 +68,7 @@ class UDPConnection:
         configuration: Optional[QuicConfiguration] = None,
         stream_handler: Optional[QuicStreamHandler] = None,
         local_port: int = 0,
+        early_data: bool = False
     ):
         
         _, _, _, _, address = socket_config
@@ -79,17 +81,23 @@ class UDPConnection:
         if not hasattr(socket, "IPPROTO_IPV6"):
             socket.IPPROTO_IPV6 = 41
 
-        configuration = QuicConfiguration(
-            is_client=True, alpn_protocols=H3_ALPN
-        )
+        if configuration is None:
+            configuration = QuicConfiguration(
+                is_client=True, alpn_protocols=H3_ALPN
+            )
 
         # prepare QUIC connection
         if configuration.server_name is None:
             configuration.server_name = server_name
+
+        # Resume the last session with this server if we hold a ticket,
+        # and keep each new ticket for the next connection.
+        if configuration.session_ticket is None:
+            configuration.session_ticket = session_tickets.get(configuration.server_name)
             
         connection = QuicConnection(
             configuration=configuration, 
-            session_ticket_handler=lambda handler: None
+            session_ticket_handler=session_tickets.add
         )
 
         # explicitly enable IPv4/IPv6 dual stack
@@ -118,6 +126,14 @@ class UDPConnection:
         protocol.init_connection()
 
         protocol.connect(address)
+
+        # With a resumable ticket that permits early data, requests may be
+        # written immediately and are sent as 0-RTT while the handshake
+        # completes.
+        session_ticket = configuration.session_ticket
+        if early_data and session_ticket and session_ticket.max_early_data_size:
+            return protocol
+
         await protocol.wait_connected()
 
         return protocol
@@ -529,6 +529,39 @@ class QuicProtocol(asyncio.DatagramProtocol):
         if stream_id not in self._stream:
             self._stream[stream_id] = H3Stream(stream_id)
         return self._stream[stream_id]
+
+    def release_stream(self, stream_id: int) -> None:
+        """
+        Drop the state held for a finished request stream so a long-lived
+        connection doesn't accumulate it.
+        """
+        self._request_waiter.pop(stream_id, None)
+        self._request_events.pop(stream_id, None)
+        self.responses.pop(stream_id, None)
+        self._stream.pop(stream_id, None)
+
+    def cancel_stream(self, stream_id: int) -> None:
+        """
+        Abandon a request stream that is still open, leaving the rest of
+        the connection usable.
+        """
+        self._request_waiter.pop(stream_id, None)
+        self._request_events.pop(stream_id, None)
+        self.responses.pop(stream_id, None)
+
+        if self._is_closed is False:
+            try:
+                self._quic.reset_stream(stream_id, ErrorCode.H3_REQUEST_CANCELLED)
+                self._quic.stop_stream(stream_id, ErrorCode.H3_REQUEST_CANCELLED)
+
+            except Exception:
+                pass
+
+            self.transmit()
+
+    @property
+    def is_closed(self) -> bool:
+        return self._is_closed or self._closed.is_set()
     
 
     async def create_stream(
@@ -845,6 +878,11 @@ class QuicProtocol(asyncio.DatagramProtocol):
                     self.responses[http_event.stream_id] = ResponseFrameCollection()
 
                 self.responses[http_event.stream_id].headers_frame = http_event
+                request_waiter = self._request_waiter.get(http_event.stream_id)
+
+                # Responses without a body end on their HEADERS frame.
+                if http_event.stream_ended and request_waiter and request_waiter.done() is False:
+                    request_waiter.set_result(self.responses.pop(http_event.stream_id))
 
                 if http_event.push_id in self.pushes:
                     # push
@@ -860,7 +898,8 @@ class QuicProtocol(asyncio.DatagramProtocol):
                 request_waiter = self._request_waiter.get(http_event.stream_id)
 
                 if http_event.stream_ended and request_waiter is None:
-                    raise Exception('Err. - Stream failed')
+                    # Late response to a cancelled request.
+                    self.responses.pop(http_event.stream_id, None)
                 
                 elif http_event.stream_ended and request_waiter.done() is False:
                     request_waiter.set_result(self.responses.pop(http_event.stream_id))
@@ -1038,6 +1077,12 @@ class QuicProtocol(asyncio.DatagramProtocol):
                     waiter.set_exception(ConnectionError)
                 self._ping_waiters.clear()
 
+                # abort requests still waiting on a response
+                for waiter in self._request_waiter.values():
+                    if not waiter.done():
+                        waiter.set_exception(ConnectionError('Connection terminated.'))
+                self._request_waiter.clear()
+
                 self._closed.set()
             elif isinstance(event, HandshakeCompleted):
                 if self._connected_waiter is not None:
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+try:
+    from aioquic.tls import SessionTicket
+
+except ImportError:
+    SessionTicket = Any
+
+
+class SessionTicketStore:
+
+    '''
+    Process-wide store of the most recent TLS session ticket issued by
+    each QUIC server name. New connections to a server present its ticket
+    to resume the previous session instead of paying a full handshake,
+    and may send early (0-RTT) data when the ticket allows it.
+    '''
+
+    __slots__ = (
+        'tickets',
+    )
+
+    def __init__(self) -> None:
+        self.tickets: Dict[str, SessionTicket] = {}
+
+    def add(self, ticket: SessionTicket):
+        if ticket.server_name:
+            self.tickets[ticket.server_name] = ticket
+
+    def get(self, server_name: str) -> Optional[SessionTicket]:
+        ticket = self.tickets.get(server_name)
+
+        if ticket is None:
+            return None
+
+        not_valid_after = ticket.not_valid_after
+        now = datetime.now(timezone.utc)
+
+        if not_valid_after.tzinfo is None:
+            now = now.replace(tzinfo=None)
+
+        if now >= not_valid_after:
+            del self.tickets[server_name]
+            return None
+
+        return ticket
+
+    def clear(self):
+        self.tickets.clear()
+
+
+session_tickets = SessionTicketStore()
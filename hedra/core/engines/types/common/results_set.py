@@ -3,6 +3,8 @@ from collections import defaultdict
 from typing import Dict, List, Union, Any
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common.base_result import BaseResult
+from hedra.core.engines.types.common.columnar_results import ColumnarResults
+from hedra.core.engines.types.common.shared_columnar_results import SharedColumnarResults
 from hedra.core.engines.types.graphql import GraphQLResult
 from hedra.core.engines.types.graphql_http2 import GraphQLHTTP2Result
 from hedra.core.engines.types.grpc import GRPCResult
@@ -14,6 +16,7 @@ from hedra.core.engines.types.udp import UDPResult
 from hedra.core.engines.types.websocket import WebsocketResult
 from hedra.core.personas.streaming.stream_analytics import StreamAnalytics
 from hedra.data.serializers import Serializer
+from hedra.reporting.processed_result.results_aggregate import ResultsAggregate
 from hedra.monitoring import (
     CPUMonitor,
     MemoryMonitor
@@ -51,12 +54,15 @@ class ResultsSet:
         self.stage_batch_size = execution_results.get('stage_batch_size', 0)
         self.stage_optimized = execution_results.get('stage_optimized', False)
         self.stage_persona_type = execution_results.get('stage_persona_type', 'default')
+        self.stage_timing_sketches = execution_results.get('stage_timing_sketches', False)
         self.stage_workers = execution_results.get(
             'stage_workers',
             psutil.cpu_count(logical=False)
         )
 
         self.results: List[BaseResult] = execution_results.get('stage_results', [])
+        self.columnar_results: Union[ColumnarResults, SharedColumnarResults, None] = execution_results.get('stage_columnar_results')
+        self.aggregates: Union[ResultsAggregate, None] = execution_results.get('stage_aggregates')
 
         self.serialized_results: List[Dict[str, Any]] = execution_results.get('serialized_results', [])
         self.experiment = execution_results.get('experiment')
@@ -106,10 +112,13 @@ class ResultsSet:
             'streamed_analytics': list(self.stage_streamed_analytics),
             'stage_batch_size': self.stage_batch_size,
             'stage_persona_type': self.stage_persona_type,
+            'stage_timing_sketches': self.stage_timing_sketches,
             'stage_workers': self.stage_workers,
             'stage_optimized': self.stage_optimized,
             'total_elapsed': self.total_elapsed,
             'total_results': self.total_results,
             'stage_results': list(self.results),
+            'stage_columnar_results': self.columnar_results,
+            'stage_aggregates': self.aggregates,
             'serialized_results': list(self.serialized_results)
         })
\ No newline at end of file
@@ -0,0 +1,214 @@
+from __future__ import annotations
+from multiprocessing import shared_memory
+from typing import (
+    Dict,
+    List,
+    Set,
+    Tuple
+)
+from .columnar_results import ColumnarResults
+
+
+class SharedResultsBlock:
+
+    __slots__ = (
+        'segment_name',
+        'start',
+        'end'
+    )
+
+    def __init__(
+        self,
+        segment_name: str,
+        start: int,
+        end: int
+    ) -> None:
+        self.segment_name = segment_name
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+
+class SharedColumnarResults:
+
+    '''
+    Columnar results held in shared memory segments. Each execute worker
+    writes its results into one segment and returns only the segment
+    name, and the analyze stage partitions them into row ranges over
+    those segments, so results are never pickled between processes.
+    Segments are unlinked by the main process once the graph completes.
+    '''
+
+    __slots__ = (
+        'blocks',
+        '_metadata'
+    )
+
+    # Every segment this process has seen, so the main process can
+    # unlink them once the graph completes.
+    segments: Set[str] = set()
+
+    def __init__(self, blocks: List[SharedResultsBlock]=[]) -> None:
+        self.blocks: List[SharedResultsBlock] = list(blocks)
+        self._metadata: Dict[str, dict] = {}
+
+        for block in self.blocks:
+            SharedColumnarResults.segments.add(block.segment_name)
+
+    def __len__(self) -> int:
+        return sum([
+            len(block) for block in self.blocks
+        ])
+
+    def __reduce__(self):
+        return (
+            SharedColumnarResults.from_ranges,
+            ([
+                (
+                    block.segment_name,
+                    block.start,
+                    block.end
+                ) for block in self.blocks
+            ],)
+        )
+
+    @classmethod
+    def from_ranges(cls, ranges: List[Tuple[str, int, int]]) -> SharedColumnarResults:
+        return SharedColumnarResults([
+            SharedResultsBlock(
+                segment_name,
+                start,
+                end
+            ) for segment_name, start, end in ranges
+        ])
+
+    @classmethod
+    def create(cls, columnar_results: ColumnarResults) -> SharedColumnarResults:
+        buffer = columnar_results.to_bytes()
+
+        segment = shared_memory.SharedMemory(
+            create=True,
+            size=len(buffer)
+        )
+
+        segment.buf[:len(buffer)] = buffer
+        segment_name = segment.name
+
+        # The creating worker only closes its mapping. The segment stays
+        # alive until the main process unlinks it.
+        segment.close()
+
+        return SharedColumnarResults([
+            SharedResultsBlock(
+                segment_name,
+                0,
+                len(columnar_results)
+            )
+        ])
+
+    @property
+    def names(self) -> List[str]:
+        names: List[str] = []
+
+        for block in self.blocks:
+            for name in self._read_metadata(block.segment_name).get('names', []):
+                if name not in names:
+                    names.append(name)
+
+        return names
+
+    def merge(self, other: SharedColumnarResults):
+        self.blocks.extend(other.blocks)
+
+    def slice(self, start: int, end: int) -> SharedColumnarResults:
+        blocks: List[SharedResultsBlock] = []
+        block_start = 0
+
+        for block in self.blocks:
+            block_end = block_start + len(block)
+
+            if block_end > start and block_start < end:
+                blocks.append(
+                    SharedResultsBlock(
+                        block.segment_name,
+                        block.start + max(start - block_start, 0),
+                        block.start + min(end, block_end) - block_start
+                    )
+                )
+
+            block_start = block_end
+
+        return SharedColumnarResults(blocks)
+
+    def partition(self, partitions_count: int) -> List[SharedColumnarResults]:
+
+        results_count = len(self)
+        batch_size = int(results_count/partitions_count)
+
+        partitions: List[SharedColumnarResults] = []
+        for partition_idx in range(partitions_count):
+            batch_marker = partition_idx * batch_size
+            batch_end = batch_marker + batch_size
+
+            if partition_idx == partitions_count - 1:
+                batch_end = results_count
+
+            partitions.append(
+                self.slice(batch_marker, batch_end)
+            )
+
+        return partitions
+
+    def load(self) -> ColumnarResults:
+        columns = ColumnarResults()
+
+        for block in self.blocks:
+            segment = shared_memory.SharedMemory(name=block.segment_name)
+
+            try:
+                columns.merge(
+                    ColumnarResults.from_bytes(
+                        segment.buf,
+                        start=block.start,
+                        end=block.end
+                    )
+                )
+
+            finally:
+                segment.close()
+
+        return columns
+
+    def select(self, name: str) -> ColumnarResults:
+        return self.load().select(name)
+
+    def _read_metadata(self, segment_name: str) -> dict:
+        metadata = self._metadata.get(segment_name)
+
+        if metadata is None:
+            segment = shared_memory.SharedMemory(name=segment_name)
+
+            try:
+                _, metadata, _ = ColumnarResults.read_header(segment.buf)
+
+            finally:
+                segment.close()
+
+            self._metadata[segment_name] = metadata
+
+        return metadata
+
+    @classmethod
+    def unlink_all(cls):
+        for segment_name in cls.segments:
+            try:
+                segment = shared_memory.SharedMemory(name=segment_name)
+                segment.close()
+                segment.unlink()
+
+            except FileNotFoundError:
+                pass
+
+        cls.segments.clear()
@@ -1,17 +1,19 @@
-import aiodns
 import socket
 from collections import defaultdict
 from ipaddress import ip_address, IPv4Address
 from urllib.parse import urlparse
-from asyncio.events import get_event_loop
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
+from .dns_cache import (
+    dns_cache,
+    DNSStrategy,
+    SocketConfig
+)
 from .types import SocketProtocols, SocketTypes
 
 
 class URL:
 
     __slots__ = (
-        'resolver',
         'ip_addr',
         'parsed',
         'is_ssl',
@@ -20,12 +22,10 @@ class URL:
         'has_ip_addr',
         'socket_config',
         'family',
-        'protocol',
-        'loop'
+        'protocol'
     )
 
     def __init__(self, url: str, port: int=80, family: SocketTypes=SocketTypes.DEFAULT, protocol: SocketProtocols=SocketProtocols.DEFAULT) -> None:
-        self.resolver = aiodns.DNSResolver()
         self.ip_addr = None
         self.parsed = urlparse(url)
         self.is_ssl = 'https' in url or 'wss' in url   
@@ -39,16 +39,25 @@ class URL:
         self.socket_config = None
         self.family = family
         self.protocol = protocol
-        self.loop = None
 
     async def replace(self, url: str):
         self.full = url
-        self.params = urlparse(url)
+        self.parsed = urlparse(url)
+        self.is_ssl = 'https' in url or 'wss' in url
 
-    async def lookup(self):
+        if self.parsed.port:
+            self.port = self.parsed.port
+
+        elif self.is_ssl:
+            self.port = 443
+
+        else:
+            self.port = 80
+
+        self.socket_config = None
+        self.has_ip_addr = False
 
-        if self.loop is None:
-            self.loop = get_event_loop()
+    async def lookup(self):
 
         infos: Dict[str, List] = defaultdict(list)
 
@@ -84,31 +93,64 @@ class URL:
 
         else:
 
-            resolved = await self.resolver.gethostbyname(self.parsed.hostname, self.family)
-    
-            for address in resolved.addresses:
+            resolved = await dns_cache.resolve(
+                self.parsed.hostname,
+                self.port,
+                self.family
+            )
 
-                if isinstance(ip_address(address), IPv4Address):
-                    socket_type = socket.AF_INET
+            for address, configs in resolved.items():
+                infos[address] = list(configs)
 
-                else:
-                    socket_type = socket.AF_INET6
+        return infos
 
-                info = await self.loop.getaddrinfo(
-                    address, 
-                    self.port, 
-                    family=self.family, 
-                    proto=0, 
-                    flags=0
-                )
+    def select_address(self, connection: Any) -> Tuple[str, SocketConfig]:
+        '''
+        Picks the address a connection should use. Connected connections
+        keep their address while DNS still returns it, and new ones are
+        spread across every resolved address by the DNS cache strategy.
+        '''
+        entry = dns_cache.get_entry(
+            self.parsed.hostname,
+            self.port,
+            self.family
+        )
 
-                if infos.get(address) is None:
-                    infos[address] = [*info]
+        if entry is None or len(entry.addresses) == 0:
+            return self.ip_addr, self.socket_config
 
-                else:
-                    infos[address].extend(info)
+        current_address = connection.dns_address
 
-        return infos
+        if current_address in entry.socket_configs:
+            address = current_address
+
+        elif dns_cache.strategy == DNSStrategy.ROUND_ROBIN:
+            address = entry.next_address()
+
+        elif dns_cache.strategy == DNSStrategy.HASH:
+            address = entry.addresses[
+                dns_cache.connection_slot(connection) % len(entry.addresses)
+            ]
+
+        elif self.ip_addr in entry.socket_configs:
+            address = self.ip_addr
+
+        else:
+            address = entry.addresses[0]
+
+        if address == self.ip_addr:
+            return address, self.socket_config
+
+        socket_configs = entry.socket_configs[address]
+        for socket_config in socket_configs:
+            if self.socket_config is None or socket_config[1] == self.socket_config[1]:
+                return address, socket_config
+
+        return address, socket_configs[0]
+
+    @property
+    def host_key(self):
+        return f'{self.parsed.hostname}:{self.port}'
 
     @property
     def params(self):
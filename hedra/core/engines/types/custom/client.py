@@ -45,6 +45,10 @@ class MercuryCustomClient(BaseEngine[A, R]):
         timeouts: Timeouts = Timeouts(), 
         reset_connections: bool=False
     ) -> None:
+        super(
+            MercuryCustomClient,
+            self
+        ).__init__()
 
         self.session_id = str(uuid.uuid4())
         self.timeouts = timeouts
@@ -53,7 +57,7 @@ class MercuryCustomClient(BaseEngine[A, R]):
         self._hosts = {}
         self.closed = False
 
-        self.sem = asyncio.Semaphore(value=concurrency)
+        self.sem = Semaphore(value=concurrency)
         
         self.active = 0
         self.waiter: asyncio.Future = None
@@ -80,7 +84,7 @@ class MercuryCustomClient(BaseEngine[A, R]):
         self.pool.create_pool()
 
     async def set_pool(self, concurrency: int):
-        self.sem = asyncio.Semaphore(value=concurrency)
+        self.sem = Semaphore(value=concurrency)
         self.pool = CustomPool(
             self.custom_connection,
             concurrency, 
@@ -95,12 +99,12 @@ class MercuryCustomClient(BaseEngine[A, R]):
                 self.custom_connection(self.pool.reset_connections)
             )
         
-        self.sem = Semaphore(self.pool.size)
+        self.sem.extend(increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
         self.pool.size -= decrease_capacity
         self.pool.connections = self.pool.connections[:self.pool.size]
-        self.sem = Semaphore(self.pool.size)
+        self.sem.shrink(decrease_capacity)
 
     async def prepare(self, action: Action[A]) -> Coroutine[Any, Any, None]:
         try:
@@ -1,5 +1,6 @@
 import json
 from typing import Dict, Iterator, Union, List
+from hedra.core.engines.types.common.body_retention import BodyRetention
 from hedra.core.engines.types.common.hooks import Hooks
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.http.action import HTTPAction
@@ -24,7 +25,8 @@ class GraphQLAction(HTTPAction):
         data: Union[str, dict, Iterator, bytes, None] = None, 
         user: str=None, 
         tags: List[Dict[str, str]] = [],
-        redirects: int=3
+        redirects: int=3,
+        body_retention: Union[str, int, BodyRetention, None]=None
     ) -> None:
 
         super(
@@ -37,7 +39,8 @@ class GraphQLAction(HTTPAction):
             headers, 
             data, 
             user, 
-            tags
+            tags,
+            body_retention=body_retention
         )
 
         self.type = RequestTypes.GRAPHQL
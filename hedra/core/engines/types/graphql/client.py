@@ -12,7 +12,7 @@ from hedra.core.engines.types.http.connection import HTTPConnection
 from hedra.core.engines.types.common import Timeouts
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
-    Trace
+    SpanRecord
 )
 from .action import GraphQLAction
 from .result import GraphQLResult
@@ -25,7 +25,8 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
         concurrency: int = 10 ** 3, 
         timeouts: Timeouts = Timeouts(), 
         reset_connections: bool = False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        prewarm_connections: int=1
     ) -> None:
 
         super(
@@ -35,41 +36,35 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
             concurrency=concurrency, 
             timeouts=timeouts, 
             reset_connections=reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            prewarm_connections=prewarm_connections
         )
 
         self.session_id = str(uuid.uuid4())
 
     async def execute_prepared_request(self, action: GraphQLAction) -> Coroutine[Any, Any, GraphQLResult]:
 
-        trace: Union[Trace, None] = None
+        trace: Union[SpanRecord, None] = None
         if self.tracing_session:
-            trace = self.tracing_session.create_trace()
-            await trace.on_request_start(action)
+            trace = self.tracing_session.create_trace(action)
   
         response = GraphQLResult(action)
         response.wait_start = time.monotonic()
         self.active += 1
 
-        if trace and trace.on_connection_queued_start:
-            await trace.on_connection_queued_start(
-                trace.span,
-                action,
-                response
-            )
+        if trace:
+            trace.record('on_connection_queued_start')
  
         async with self.sem:
 
-            if trace and trace.on_connection_queued_end:
-                await trace.on_connection_queued_end(
-                    trace.span,
-                    action,
-                    response
-                )
+            if trace:
+                trace.record('on_connection_queued_end')
             
+            connection: Union[HTTPConnection, None] = None
+
             try:
                 
-                connection = self.pool.connections.pop()
+                connection = self.pool.acquire(action.url.host_key)
 
                 if action.hooks.listen:
                     event = asyncio.Event()
@@ -82,40 +77,31 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
 
                 response.start = time.monotonic()
 
-                if trace and trace.on_connection_create_start:
-                    await trace.on_connection_create_start(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_connection_create_start')
 
 
-                await connection.make_connection(
+                ip_addr, socket_config = action.url.select_address(connection)
+
+                if await connection.make_connection(
                     action.url.hostname,
-                    action.url.ip_addr,
+                    ip_addr,
                     action.url.port,
-                    action.url.socket_config,
+                    socket_config,
                     timeout=self.timeouts.connect_timeout,
                     ssl=action.ssl_context
-                )
+                ):
+                    self.pool.connects += 1
 
                 response.connect_end = time.monotonic()
 
-                if trace and trace.on_connection_create_end:
-                    await trace.on_connection_create_end(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_connection_create_end')
 
                 connection.write(action.encoded_headers)
 
-                if trace and trace.on_request_headers_sent:
-                    await trace.on_request_headers_sent(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_request_headers_sent')
                 
                 if action.encoded_data:
                     if action.is_stream:
@@ -129,40 +115,25 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
 
                 response.write_end = time.monotonic()
 
-                if action.encoded_data and trace and trace.on_request_data_sent:
-                        await trace.on_request_data_sent(
-                            trace.span,
-                            action,
-                            response
-                        )
+                if action.encoded_data and trace:
+                    trace.record('on_request_data_sent')
 
-                response.response_code = await asyncio.wait_for(
-                    connection.reader.readline_fast(),
-                    timeout=self.timeouts.socket_read_timeout
-                )
-
-                headers = await asyncio.wait_for(
-                    connection.read_headers(),
-                    timeout=self.timeouts.socket_read_timeout
+                headers, body = await self._read_response(
+                    connection,
+                    action,
+                    response,
+                    trace
                 )
 
-                if trace and trace.on_response_headers_received:
-                    await trace.on_response_headers_received(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_response_headers_received')
 
                 status = response.status
             
                 if status >= 300 and status < 400:
 
-                    if trace and trace.on_request_redirect:
-                        await trace.on_request_redirect(
-                            trace.span,
-                            action,
-                            response
-                        )
+                    if trace:
+                        trace.record('on_request_redirect')
 
                     elapsed_time = 0
                     redirect_time_start = time.time()
@@ -175,24 +146,38 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
                         
                         redirect_url = str(headers.get(b'location'))
                         if redirect_url.startswith('http') is False:
-                            action.url.path = redirect_url
-                            action.encoded_headers = None
-                            action.setup()
+                            action.set_path(redirect_url)
 
                         else:
+                            connection.update_keep_alive(
+                                response.response_code,
+                                headers
+                            )
+
+                            self.pool.release(
+                                connection,
+                                action.url.host_key
+                            )
+                            connection = None
+
                             await action.url.replace(redirect_url)
                             action.encoded_headers = None
                             action.is_setup = False
                             await self.prepare(action)
 
-                            await connection.make_connection(
+                            connection = self.pool.acquire(action.url.host_key)
+
+                            ip_addr, socket_config = action.url.select_address(connection)
+
+                            if await connection.make_connection(
                                 action.url.hostname,
-                                action.url.ip_addr,
+                                ip_addr,
                                 action.url.port,
-                                action.url.socket_config,
+                                socket_config,
                                 timeout=self.timeouts.connect_timeout,
                                 ssl=action.ssl_context
-                            )
+                            ):
+                                self.pool.connects += 1
 
                         response.connect_end = time.monotonic()
                             
@@ -207,14 +192,11 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
 
                         response.write_end = time.monotonic()
 
-                        response.response_code = await asyncio.wait_for(
-                            connection.reader.readline_fast(),
-                            timeout=self.timeouts.socket_read_timeout
-                        )
-
-                        headers = await asyncio.wait_for(
-                            connection.read_headers(),
-                            timeout=self.timeouts.socket_read_timeout
+                        headers, body = await self._read_response(
+                            connection,
+                            action,
+                            response,
+                            trace
                         )
 
                         status = response.status
@@ -224,68 +206,23 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
 
                         elapsed_time = time.time() - redirect_time_start
 
-                content_length = headers.get(b'content-length')
-                transfer_encoding = headers.get(b'transfer-encoding')
-
-                # We require Content-Length or Transfer-Encoding headers to read a
-                # request body, otherwise it's anyone's guess as to how big the body
-                # is, and we ain't playing that game.
-                body = bytearray()
-                if content_length:
-                    body = await asyncio.wait_for(
-                        connection.readexactly(int(content_length)),
-                        timeout=self.timeouts.socket_read_timeout
-                    )
-
-                elif transfer_encoding:
-                    
-                    all_chunks_read = False
-
-                    while True and not all_chunks_read:
-
-                        chunk_size = int((await connection.readuntil()).rstrip(), 16)
-    
-                        if not chunk_size:
-                            # read last CRLF
-                            body.extend(
-                                await asyncio.wait_for(
-                                    connection.readuntil(),
-                                    timeout=self.timeouts.socket_read_timeout
-                                )
-                            )
-                            
-                            break
-                        
-                        chunk = await asyncio.wait_for(
-                            connection.readexactly(chunk_size + 2),
-                            timeout=self.timeouts.socket_read_timeout
-                        )
-
-                        body.extend(
-                            chunk[:-2]
-                        )
-
-                        if trace and trace.on_response_chunk_received:
-                            await trace.on_response_chunk_received(
-                                trace.span,
-                                action,
-                                response
-                            )
-
-                    all_chunks_read = True
-         
                 response.complete = time.monotonic()
 
-                if trace and trace.on_response_data_received:
-                    await trace.on_response_data_received(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_response_data_received')
 
                 response.headers = headers
                 response.body = body
-                self.pool.connections.append(connection)
+
+                connection.update_keep_alive(
+                    response.response_code,
+                    headers
+                )
+
+                self.pool.release(
+                    connection,
+                    action.url.host_key
+                )
 
                 if action.hooks.after:
                     response = await self.execute_after(action, response)
@@ -312,12 +249,16 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
                 response.complete = time.monotonic()
                 response.error = str(e)
 
-                self.pool.connections.append(HTTPConnection(reset_connection=self.pool.reset_connections))
+                if connection:
+                    self.pool.replace(connection)
 
-                if trace and trace.on_request_exception:
-                    await trace.on_request_exception(response)
+                if trace:
+                    trace.on_request_exception(response)
 
             self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(response)
+
             if self.waiter and self.active <= self.pool.size:
 
                 try:
@@ -327,7 +268,7 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
                 except asyncio.InvalidStateError:
                     self.waiter = None
 
-            if trace and trace.on_request_end:
-                await trace.on_request_end(response)
+            if trace:
+                trace.on_request_end(response)
 
             return response
\ No newline at end of file
@@ -41,6 +41,7 @@ class GRPCAction(HTTP2Action):
             'TE': 'trailers'
         }
         self._headers.update(grpc_headers)
+        self._header_items = list(self._headers.items())
 
         super(
             GRPCAction,
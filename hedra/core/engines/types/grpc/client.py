@@ -6,7 +6,7 @@ from hedra.core.engines.types.http2 import MercuryHTTP2Client
 from hedra.core.engines.types.common import Timeouts
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
-    Trace
+    SpanRecord
 )
 
 from .action import GRPCAction
@@ -20,7 +20,8 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
         concurrency: int = 10 ** 3, 
         timeouts: Timeouts = None, 
         reset_connections: bool=False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        multiplexed_connections: int=0
     ) -> None:
         super(
             MercuryGRPCClient,
@@ -29,37 +30,34 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
             concurrency=concurrency, 
             timeouts=timeouts, 
             reset_connections=reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            multiplexed_connections=multiplexed_connections
         )
 
         self.session_id = str(uuid.uuid4())
 
     async def execute_prepared_request(self, action: GRPCAction) -> Coroutine[Any, Any, GRPCResult]:
+        if self.pool.is_multiplexed:
+            return await self.execute_multiplexed_request(
+                action,
+                GRPCResult(action)
+            )
 
-        trace: Union[Trace, None] = None
+        trace: Union[SpanRecord, None] = None
         if self.tracing_session:
-            trace = self.tracing_session.create_trace()
-            await trace.on_request_start(action)
+            trace = self.tracing_session.create_trace(action)
 
         response = GRPCResult(action)
         response.wait_start = time.monotonic()
         self.active += 1
 
-        if trace and trace.on_connection_queued_start:
-            await trace.on_connection_queued_start(
-                trace.span,
-                action,
-                response
-            )
+        if trace:
+            trace.record('on_connection_queued_start')
         
         async with self.sem:
 
-            if trace and trace.on_connection_queued_end:
-                await trace.on_connection_queued_end(
-                    trace.span,
-                    action,
-                    response
-                )
+            if trace:
+                trace.record('on_connection_queued_end')
 
             pipe = self.pool.pipes.pop()
             connection = self.pool.connections.pop()
@@ -77,18 +75,16 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
 
                 response.start = time.monotonic()
 
-                if trace and trace.on_connection_create_start:
-                    await trace.on_connection_create_start(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_connection_create_start')
+
+                ip_addr, socket_config = action.url.select_address(connection)
 
                 stream = await connection.connect(
                     action.url.hostname,
-                    action.url.ip_addr,
+                    ip_addr,
                     action.url.port,
-                    action.url.socket_config,
+                    socket_config,
                     ssl=action.ssl_context,
                     timeout=self.timeouts.connect_timeout
                 )
@@ -97,33 +93,21 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
      
                 response.connect_end = time.monotonic()
 
-                if trace and trace.on_connection_create_end:
-                    await trace.on_connection_create_end(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_connection_create_end')
 
                 pipe.send_request_headers(action, stream)
 
-                if trace and trace.on_request_headers_sent:
-                    await trace.on_request_headers_sent(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_request_headers_sent')
   
                 if action.encoded_data is not None:
                     await pipe.submit_request_body(action, stream)
 
                 response.write_end = time.monotonic()
 
-                if action.encoded_data and trace and trace.on_request_data_sent:
-                        await trace.on_request_data_sent(
-                            trace.span,
-                            action,
-                            response
-                        )
+                if action.encoded_data and trace:
+                    trace.record('on_request_data_sent')
 
                 await asyncio.wait_for(
                     pipe.receive_response(
@@ -165,10 +149,13 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
 
                 self.pool.reset()
 
-                if trace and trace.on_request_exception:
-                    await trace.on_request_exception(response)
+                if trace:
+                    trace.on_request_exception(response)
 
             self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(response)
+
             if self.waiter and self.active <= self.pool.size:
 
                 try:
@@ -178,7 +165,7 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
                 except asyncio.InvalidStateError:
                     self.waiter = None
 
-            if trace and trace.on_request_end:
-                await trace.on_request_end(response)
+            if trace:
+                trace.on_request_end(response)
 
             return response
@@ -10,10 +10,12 @@ from typing import (
 from urllib.parse import urlencode
 from hedra.core.engines.types.common.hooks import Hooks
 from hedra.core.engines.types.common.base_action import BaseAction
+from hedra.core.engines.types.common.body_retention import BodyRetention
 from hedra.core.engines.types.common.constants import NEW_LINE
 from hedra.core.engines.types.common.protocols.shared.writer import Writer
 from hedra.core.engines.types.common import URL
 from hedra.core.engines.types.common.types import RequestTypes
+from .request_template import RequestTemplate
 
 
 class HTTPAction(BaseAction):
@@ -32,9 +34,12 @@ class HTTPAction(BaseAction):
         'is_stream',
         'ssl_context',
         'redirects',
+        'body_retention',
         'action_args',
         'mutations',
-        '_header_items'
+        '_header_items',
+        'header_template',
+        'data_template'
     )
     
     def __init__(
@@ -46,7 +51,8 @@ class HTTPAction(BaseAction):
         data: Union[str, dict, Iterator, bytes, None] = None, 
         user: str=None, 
         tags: List[Dict[str, str]] = [],
-        redirects: int=3
+        redirects: int=3,
+        body_retention: Union[str, int, BodyRetention, None]=None
     ) -> None:
         super(HTTPAction, self).__init__(
             name,
@@ -66,9 +72,12 @@ class HTTPAction(BaseAction):
 
         self.encoded_data = None
         self.encoded_headers = None
+        self.header_template: Union[RequestTemplate, None] = None
+        self.data_template: Union[RequestTemplate, None] = None
         self.is_stream = False
         self.ssl_context = None
         self.redirects = redirects
+        self.body_retention = BodyRetention.parse(body_retention)
         self.hooks: Hooks[HTTPAction] = Hooks()
         self.action_args: Dict[str, Any] = {}
 
@@ -88,6 +97,7 @@ class HTTPAction(BaseAction):
     def data(self, value):
         self._data = value
         self.encoded_data = None
+        self.data_template = None
 
     @property
     def headers(self):
@@ -95,18 +105,104 @@ class HTTPAction(BaseAction):
 
     @headers.setter
     def headers(self, value: Dict[str, str]):
+        header_items: List[Tuple[str, str]] = list(value.items())
+
+        same_header_names = self.header_template and self.encoded_headers and [
+            key for key, _ in header_items
+        ] == [
+            key for key, _ in self._header_items
+        ]
+
         self._headers = value
-        self._header_items: List[Tuple[str, str]] = list(value.items())
-        self.encoded_headers = None
+        self._header_items = header_items
+
+        if same_header_names:
+            for key, header_value in header_items:
+                self.header_template.set(
+                    f'header:{key}', 
+                    f'{header_value}'.encode()
+                )
+
+            self.encoded_headers = self.header_template.render()
+
+        else:
+            self.encoded_headers = None
+
+    def set_header(self, name: str, value: str):
+        self._headers = {
+            **self._headers,
+            name: value
+        }
+
+        if self.header_template and self.encoded_headers and self.header_template.set(
+            f'header:{name}', 
+            f'{value}'.encode()
+        ):
+            for idx, (key, _) in enumerate(self._header_items):
+                if key == name:
+                    self._header_items[idx] = (name, value)
+
+            self.encoded_headers = self.header_template.render()
+
+        else:
+            self._header_items = list(self._headers.items())
+            self._setup_headers()
+
+    def set_path(self, path: str):
+        self.url.path = path
+
+        if self.header_template and self.encoded_headers:
+            self.header_template.set('path', self.url.path.encode())
+            self.encoded_headers = self.header_template.render()
+
+        else:
+            self._setup_headers()
+
+    def set_data_field(self, name: str, value: Any):
+
+        if self._data is not None and not isinstance(self._data, dict):
+            raise TypeError(
+                f'Err. - Cannot set field - {name} - on action - {self.name}. Data fields can only be set on dict data, not {type(self._data).__name__}.'
+            )
+
+        self._data = {
+            **(self._data or {}),
+            name: value
+        }
+
+        if self.data_template and self.encoded_data and self.data_template.set(
+            name, 
+            json.dumps(value).encode()
+        ):
+            self.encoded_data = self.data_template.render()
+            self._update_content_length()
+
+        else:
+            self.encoded_data = None
+
+        self.setup()
 
     def setup(self):
 
         if self.encoded_data is None:
             self._setup_data()
 
+            if self.encoded_headers:
+                self._update_content_length()
+
         if self.encoded_headers is None:
             self._setup_headers()
 
+    def _update_content_length(self):
+        content_length = f'{self.size}'.encode()
+
+        if self.header_template is None:
+            self.encoded_headers = None
+
+        elif self.header_template.get('content-length') != content_length:
+            self.header_template.set('content-length', content_length)
+            self.encoded_headers = self.header_template.render()
+
     def _setup_data(self):
         if self._data:
             if isinstance(self._data, Iterator):
@@ -123,9 +219,8 @@ class HTTPAction(BaseAction):
             else:
 
                 if isinstance(self._data, dict):
-                    self.encoded_data = json.dumps(
-                        self._data
-                    ).encode()
+                    self.data_template = self._create_data_template()
+                    self.encoded_data = self.data_template.render()
 
                 elif isinstance(self._data, tuple):
                     self.encoded_data = urlencode(
@@ -135,9 +230,34 @@ class HTTPAction(BaseAction):
                 elif isinstance(self._data, str):
                     self.encoded_data = self._data.encode()
 
+    def _create_data_template(self) -> RequestTemplate:
+        data_template = RequestTemplate()
+
+        # Only string keys encode the same as json.dumps() when each
+        # field is encoded separately.
+        if len(self._data) == 0 or not all([
+            isinstance(key, str) for key in self._data
+        ]):
+            data_template.append(
+                json.dumps(self._data).encode()
+            )
+
+            return data_template
+
+        data_template.append(b'{')
+
+        for idx, (key, value) in enumerate(self._data.items()):
+            if idx > 0:
+                data_template.append(b', ')
+
+            data_template.append(f'{json.dumps(key)}: '.encode())
+            data_template.add_slot(key, json.dumps(value).encode())
+
+        data_template.append(b'}')
+
+        return data_template
+
     def _setup_headers(self) -> Union[bytes, Dict[str, str]]:
-    
-        get_base = f"{self.method} {self.url.path} HTTP/1.1{NEW_LINE}"
 
         port = self.url.port or (443 if self.url.scheme == "https" else 80)
 
@@ -146,19 +266,31 @@ class HTTPAction(BaseAction):
         if port not in [80, 443]:
             hostname = f'{hostname}:{port}'
 
-        header_items = [
-            ("HOST", hostname),
-            ("User-Agent", "mercury-http"),
-            ("Keep-Alive", "timeout=60, max=100000"),
-            ("Content-Length", self.size)
-        ]
+        header_template = RequestTemplate()
+
+        header_template.append(f'{self.method} '.encode())
+        header_template.add_slot('path', self.url.path.encode())
+
+        header_template.append(''.join([
+            f' HTTP/1.1{NEW_LINE}',
+            f'HOST: {hostname}{NEW_LINE}',
+            f'User-Agent: mercury-http{NEW_LINE}',
+            f'Keep-Alive: timeout=60, max=100000{NEW_LINE}',
+            'Content-Length: '
+        ]).encode())
+
+        header_template.add_slot('content-length', f'{self.size}'.encode())
+        header_template.append(NEW_LINE.encode())
 
-        header_items.extend(self._header_items)
+        for key, value in self._header_items:
+            header_template.append(f'{key}: '.encode())
+            header_template.add_slot(f'header:{key}', f'{value}'.encode())
+            header_template.append(NEW_LINE.encode())
 
-        for key, value in header_items:
-            get_base += f"{key}: {value}{NEW_LINE}"
+        header_template.append(NEW_LINE.encode())
 
-        self.encoded_headers = (get_base + NEW_LINE).encode()
+        self.header_template = header_template
+        self.encoded_headers = header_template.render()
 
     def write_chunks(self, writer: Writer):
         for chunk in self.data:
@@ -2,13 +2,17 @@ import asyncio
 import time
 import traceback
 import uuid
+from collections import defaultdict
+from functools import partial
 from typing import (
     Dict, 
     Any, 
+    List, 
     Union, 
     Coroutine, 
     TypeVar, 
-    Optional
+    Optional,
+    Tuple
 )
 from hedra.core.engines.types.common.base_engine import BaseEngine
 from hedra.core.engines.types.common.ssl import get_default_ssl_context
@@ -16,13 +20,14 @@ from hedra.core.engines.types.common.timeouts import Timeouts
 from hedra.core.engines.types.common.concurrency import Semaphore
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
-    Trace
+    SpanRecord
 )
 
 from hedra.logging import HedraLogger
 from .connection import HTTPConnection
 from .action import HTTPAction
 from .result import HTTPResult
+from .pipeline import HTTPPipeline
 from .pool import Pool
 
 
@@ -44,7 +49,10 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
         'waiter',
         'ssl_context',
         'logger',
-        'tracing_session'
+        'tracing_session',
+        'prewarm_connections',
+        'pipeline_depth',
+        'pipelines'
     )
 
     def __init__(
@@ -52,7 +60,9 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
         concurrency: int=10**3, 
         timeouts: Timeouts = Timeouts(), 
         reset_connections: bool=False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        prewarm_connections: int=1,
+        pipeline_depth: int=1
     ) -> None:
         super(
             MercuryHTTPClient,
@@ -66,9 +76,12 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
         self._hosts = {}
         self.closed = False
 
-        self.sem = asyncio.Semaphore(value=concurrency)
+        self.sem = Semaphore(value=concurrency)
         self.pool = Pool(concurrency, reset_connections=reset_connections)
         self.tracing_session: Union[TraceSession, None] = tracing_session
+        self.prewarm_connections = min(prewarm_connections, concurrency)
+        self.pipeline_depth = max(pipeline_depth, 1)
+        self.pipelines: Dict[str, List[HTTPPipeline]] = defaultdict(list)
         self.logger = HedraLogger()
         self.logger.initialize()
         self.pool.create_pool()
@@ -86,12 +99,15 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                 'socket_read_timeout': self.timeouts.socket_read_timeout,
                 'total_timeout': self.timeouts.total_timeout
             },
-            'reset_connections': self.pool.reset_connections
+            'reset_connections': self.pool.reset_connections,
+            'prewarm_connections': self.prewarm_connections,
+            'pipeline_depth': self.pipeline_depth
         }
 
     async def set_pool(self, concurrency: int):
-        self.sem = asyncio.Semaphore(value=concurrency)
+        self.sem = Semaphore(value=concurrency)
         self.pool = Pool(concurrency, reset_connections=self.pool.reset_connections)
+        self.pipelines.clear()
         self.pool.create_pool()
 
     def extend_pool(self, increased_capacity: int):
@@ -101,12 +117,12 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                 HTTPConnection(self.pool.reset_connections)
             )
         
-        self.sem = Semaphore(self.pool.size)
+        self.sem.extend(increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
         self.pool.size -= decrease_capacity
-        self.pool.connections = self.pool.connections[:self.pool.size]
-        self.sem = Semaphore(self.pool.size)
+        self.pool.trim(decrease_capacity)
+        self.sem.shrink(decrease_capacity)
     
     async def prepare(self, action: HTTPAction) -> Coroutine[Any, Any, None]:
         try:
@@ -119,7 +135,7 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                 for ip_addr, configs in socket_configs.items():
                     for config in configs:
 
-                        connection = HTTPConnection()
+                        connection = HTTPConnection(self.pool.reset_connections)
                         
                         try:
                             await connection.make_connection(
@@ -134,6 +150,12 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                             action.url.socket_config = config
                             action.url.ip_addr = ip_addr
                             action.url.has_ip_addr = True
+
+                            self.pool.add_warm(
+                                connection,
+                                action.url.host_key
+                            )
+
                             break
 
                         except Exception as e:
@@ -150,6 +172,10 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                     'socket_config': action.url.socket_config
                 }
 
+                await asyncio.gather(*[
+                    self._prewarm_connection(action) for _ in range(self.prewarm_connections - 1)
+                ])
+
             else:
                 host_config = self._hosts[action.url.hostname]
                 action.url.ip_addr = host_config.get('ip_addr')
@@ -163,35 +189,56 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
         except Exception as e:       
             raise e
 
+    async def _prewarm_connection(self, action: HTTPAction):
+        connection = HTTPConnection(self.pool.reset_connections)
+
+        try:
+            ip_addr, socket_config = action.url.select_address(connection)
+
+            await connection.make_connection(
+                action.url.hostname,
+                ip_addr,
+                action.url.port,
+                socket_config,
+                ssl=action.ssl_context,
+                timeout=self.timeouts.connect_timeout
+            )
+
+            self.pool.add_warm(
+                connection,
+                action.url.host_key
+            )
+
+        except Exception as prewarm_error:
+            await self.logger.filesystem.aio['hedra.core'].debug(
+                f'Session - {self.session_id} - Failed to prewarm connection to - {action.url.hostname} - {prewarm_error}'
+            )
+
     async def execute_prepared_request(self, action: HTTPAction) -> Coroutine[Any, Any, HTTPResult]:
-        trace: Union[Trace, None] = None
+        if self.can_pipeline(action):
+            return await self.execute_pipelined_request(action)
+
+        trace: Union[SpanRecord, None] = None
         if self.tracing_session:
-            trace = self.tracing_session.create_trace()
-            await trace.on_request_start(action)
+            trace = self.tracing_session.create_trace(action)
   
         response = HTTPResult(action)
         response.wait_start = time.monotonic()
         self.active += 1
 
-        if trace and trace.on_connection_queued_start:
-            await trace.on_connection_queued_start(
-                trace.span,
-                action,
-                response
-            )
+        if trace:
+            trace.record('on_connection_queued_start')
  
         async with self.sem:
 
-            if trace and trace.on_connection_queued_end:
-                await trace.on_connection_queued_end(
-                    trace.span,
-                    action,
-                    response
-                )
+            if trace:
+                trace.record('on_connection_queued_end')
             
+            connection: Union[HTTPConnection, None] = None
+
             try:
                 
-                connection = self.pool.connections.pop()
+                connection = self.pool.acquire(action.url.host_key)
 
                 if action.hooks.listen:
                     event = asyncio.Event()
@@ -204,40 +251,31 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
 
                 response.start = time.monotonic()
 
-                if trace and trace.on_connection_create_start:
-                    await trace.on_connection_create_start(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_connection_create_start')
 
 
-                await connection.make_connection(
+                ip_addr, socket_config = action.url.select_address(connection)
+
+                if await connection.make_connection(
                     action.url.hostname,
-                    action.url.ip_addr,
+                    ip_addr,
                     action.url.port,
-                    action.url.socket_config,
+                    socket_config,
                     timeout=self.timeouts.connect_timeout,
                     ssl=action.ssl_context
-                )
+                ):
+                    self.pool.connects += 1
 
                 response.connect_end = time.monotonic()
 
-                if trace and trace.on_connection_create_end:
-                    await trace.on_connection_create_end(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_connection_create_end')
 
                 connection.write(action.encoded_headers)
 
-                if trace and trace.on_request_headers_sent:
-                    await trace.on_request_headers_sent(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_request_headers_sent')
                 
                 if action.encoded_data:
                     if action.is_stream:
@@ -251,40 +289,25 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
 
                 response.write_end = time.monotonic()
 
-                if action.encoded_data and trace and trace.on_request_data_sent:
-                        await trace.on_request_data_sent(
-                            trace.span,
-                            action,
-                            response
-                        )
-
-                response.response_code = await asyncio.wait_for(
-                    connection.reader.readline_fast(),
-                    timeout=self.timeouts.socket_read_timeout
-                )
+                if action.encoded_data and trace:
+                    trace.record('on_request_data_sent')
 
-                headers = await asyncio.wait_for(
-                    connection.read_headers(),
-                    timeout=self.timeouts.socket_read_timeout
+                headers, body = await self._read_response(
+                    connection,
+                    action,
+                    response,
+                    trace
                 )
 
-                if trace and trace.on_response_headers_received:
-                    await trace.on_response_headers_received(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_response_headers_received')
 
                 status = response.status
             
                 if status >= 300 and status < 400:
 
-                    if trace and trace.on_request_redirect:
-                        await trace.on_request_redirect(
-                            trace.span,
-                            action,
-                            response
-                        )
+                    if trace:
+                        trace.record('on_request_redirect')
 
                     elapsed_time = 0
                     redirect_time_start = time.time()
@@ -297,24 +320,38 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                         
                         redirect_url = str(headers.get(b'location'))
                         if redirect_url.startswith('http') is False:
-                            action.url.path = redirect_url
-                            action.encoded_headers = None
-                            action.setup()
+                            action.set_path(redirect_url)
 
                         else:
+                            connection.update_keep_alive(
+                                response.response_code,
+                                headers
+                            )
+
+                            self.pool.release(
+                                connection,
+                                action.url.host_key
+                            )
+                            connection = None
+
                             await action.url.replace(redirect_url)
                             action.encoded_headers = None
                             action.is_setup = False
                             await self.prepare(action)
 
-                            await connection.make_connection(
+                            connection = self.pool.acquire(action.url.host_key)
+
+                            ip_addr, socket_config = action.url.select_address(connection)
+
+                            if await connection.make_connection(
                                 action.url.hostname,
-                                action.url.ip_addr,
+                                ip_addr,
                                 action.url.port,
-                                action.url.socket_config,
+                                socket_config,
                                 timeout=self.timeouts.connect_timeout,
                                 ssl=action.ssl_context
-                            )
+                            ):
+                                self.pool.connects += 1
 
                         response.connect_end = time.monotonic()
                             
@@ -329,14 +366,11 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
 
                         response.write_end = time.monotonic()
 
-                        response.response_code = await asyncio.wait_for(
-                            connection.reader.readline_fast(),
-                            timeout=self.timeouts.socket_read_timeout
-                        )
-
-                        headers = await asyncio.wait_for(
-                            connection.read_headers(),
-                            timeout=self.timeouts.socket_read_timeout
+                        headers, body = await self._read_response(
+                            connection,
+                            action,
+                            response,
+                            trace
                         )
 
                         status = response.status
@@ -346,68 +380,23 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
 
                         elapsed_time = time.time() - redirect_time_start
 
-                content_length = headers.get(b'content-length')
-                transfer_encoding = headers.get(b'transfer-encoding')
-
-                # We require Content-Length or Transfer-Encoding headers to read a
-                # request body, otherwise it's anyone's guess as to how big the body
-                # is, and we ain't playing that game.
-                body = bytearray()
-                if content_length:
-                    body = await asyncio.wait_for(
-                        connection.readexactly(int(content_length)),
-                        timeout=self.timeouts.socket_read_timeout
-                    )
-
-                elif transfer_encoding:
-                    
-                    all_chunks_read = False
-
-                    while True and not all_chunks_read:
-
-                        chunk_size = int((await connection.readuntil()).rstrip(), 16)
-    
-                        if not chunk_size:
-                            # read last CRLF
-                            body.extend(
-                                await asyncio.wait_for(
-                                    connection.readuntil(),
-                                    timeout=self.timeouts.socket_read_timeout
-                                )
-                            )
-                            
-                            break
-                        
-                        chunk = await asyncio.wait_for(
-                            connection.readexactly(chunk_size + 2),
-                            timeout=self.timeouts.socket_read_timeout
-                        )
-
-                        body.extend(
-                            chunk[:-2]
-                        )
-
-                        if trace and trace.on_response_chunk_received:
-                            await trace.on_response_chunk_received(
-                                trace.span,
-                                action,
-                                response
-                            )
-
-                    all_chunks_read = True
-         
                 response.complete = time.monotonic()
 
-                if trace and trace.on_response_data_received:
-                    await trace.on_response_data_received(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_response_data_received')
 
                 response.headers = headers
                 response.body = body
-                self.pool.connections.append(connection)
+
+                connection.update_keep_alive(
+                    response.response_code,
+                    headers
+                )
+
+                self.pool.release(
+                    connection,
+                    action.url.host_key
+                )
 
                 if action.hooks.after:
                     response = await self.execute_after(action, response)
@@ -434,12 +423,16 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                 response.complete = time.monotonic()
                 response.error = str(e)
 
-                self.pool.connections.append(HTTPConnection(reset_connection=self.pool.reset_connections))
+                if connection:
+                    self.pool.replace(connection)
 
-                if trace and trace.on_request_exception:
-                    await trace.on_request_exception(response)
+                if trace:
+                    trace.on_request_exception(response)
 
             self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(response)
+
             if self.waiter and self.active <= self.pool.size:
 
                 try:
@@ -449,12 +442,216 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                 except asyncio.InvalidStateError:
                     self.waiter = None
 
-            if trace and trace.on_request_end:
-                await trace.on_request_end(response)
+            if trace:
+                trace.on_request_end(response)
+
+            return response
+
+    async def _read_response(
+        self,
+        connection: HTTPConnection,
+        action: HTTPAction,
+        response: HTTPResult,
+        trace: Union[SpanRecord, None]
+    ) -> Tuple[Dict[bytes, bytes], bytearray]:
+
+        on_chunk = None
+        if trace and self.tracing_session.trace.on_response_chunk_received:
+            on_chunk = partial(
+                trace.record,
+                'on_response_chunk_received'
+            )
+
+        body_retention = action.body_retention
+        checksum = body_retention.create_checksum()
+
+        # We require Content-Length or Transfer-Encoding headers to read a
+        # request body, otherwise it's anyone's guess as to how big the body
+        # is, and we ain't playing that game.
+        response.response_code, headers, body, response.body_size = await asyncio.wait_for(
+            connection.read_response(
+                discard_body=body_retention.discard_body,
+                max_body_size=body_retention.max_size,
+                checksum=checksum,
+                on_chunk=on_chunk
+            ),
+            timeout=self.timeouts.socket_read_timeout
+        )
+
+        if checksum:
+            response.body_checksum = checksum.hexdigest()
+
+        return headers, body
+
+    def can_pipeline(self, action: HTTPAction) -> bool:
+        # Pipelined responses are read in send order, so actions whose
+        # hooks can rewrite the request or block on other actions are
+        # sent one at a time.
+        return self.pipeline_depth > 1 and action.is_stream is False and not (
+            action.hooks.before or action.hooks.after or action.hooks.listen or action.hooks.notify
+        )
+
+    def _acquire_pipeline(self, host_key: str) -> HTTPPipeline:
+        host_pipelines = self.pipelines[host_key]
+
+        for pipeline in host_pipelines:
+            if pipeline.available:
+                self.pool.requests += 1
+                self.pool.reused += 1
+                return pipeline
+
+        pipeline = HTTPPipeline(
+            self.pool.acquire(host_key),
+            host_key,
+            self.pipeline_depth
+        )
+
+        host_pipelines.append(pipeline)
+
+        return pipeline
+
+    def _release_pipeline(self, pipeline: HTTPPipeline):
+        self.pipelines[pipeline.host_key].remove(pipeline)
+
+        if pipeline.failed:
+            self.pool.replace(pipeline.connection)
+
+        else:
+            self.pool.release(
+                pipeline.connection,
+                pipeline.host_key
+            )
+
+    async def execute_pipelined_request(self, action: HTTPAction) -> Coroutine[Any, Any, HTTPResult]:
+        trace: Union[SpanRecord, None] = None
+        if self.tracing_session:
+            trace = self.tracing_session.create_trace(action)
+  
+        response = HTTPResult(action)
+        response.wait_start = time.monotonic()
+        self.active += 1
+
+        async with self.sem:
+
+            pipeline = self._acquire_pipeline(action.url.host_key)
+            connection = pipeline.connection
+            previous, turn = pipeline.enqueue()
+            response_read = False
+
+            try:
+
+                response.start = time.monotonic()
+
+                # Requests are written under the connection lock so they go
+                # out on the socket in the same order they queued to read.
+                async with connection.lock:
+
+                    if pipeline.failed:
+                        raise Exception('Pipelined connection failed.')
+
+                    ip_addr, socket_config = action.url.select_address(connection)
+
+                    if await connection.make_connection(
+                        action.url.hostname,
+                        ip_addr,
+                        action.url.port,
+                        socket_config,
+                        timeout=self.timeouts.connect_timeout,
+                        ssl=action.ssl_context
+                    ):
+                        self.pool.connects += 1
+
+                    response.connect_end = time.monotonic()
+
+                    connection.write(action.encoded_headers)
+
+                    if action.encoded_data:
+                        connection.write(action.encoded_data)
+
+                    response.write_end = time.monotonic()
+
+                if previous:
+                    await previous
+
+                if pipeline.failed:
+                    raise Exception('Pipelined connection failed.')
+
+                headers, body = await self._read_response(
+                    connection,
+                    action,
+                    response,
+                    trace
+                )
+
+                if trace:
+                    trace.record('on_response_headers_received')
+
+                response.complete = time.monotonic()
+
+                if trace:
+                    trace.record('on_response_data_received')
+
+                response.headers = headers
+                response.body = body
+                response_read = True
+
+                connection.update_keep_alive(
+                    response.response_code,
+                    headers
+                )
+
+                # Requests written after the server asked to close will
+                # never be answered.
+                if connection.should_close:
+                    pipeline.failed = True
+
+                if action.hooks.checks:
+                    response = await self.execute_checks(action, response)
+
+            except Exception as e:
+                response.complete = time.monotonic()
+                response.error = str(e)
+
+                if trace:
+                    trace.on_request_exception(response)
+
+            finally:
+                # A request that did not read its own response leaves the
+                # connection out of step with the requests behind it.
+                if response_read is False:
+                    pipeline.failed = True
+
+                pipeline.complete(turn)
+                if pipeline.idle:
+                    self._release_pipeline(pipeline)
+
+            self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(response)
+
+            if self.waiter and self.active <= self.pool.size:
+
+                try:
+                    self.waiter.set_result(None)
+                    self.waiter = None
+
+                except asyncio.InvalidStateError:
+                    self.waiter = None
+
+            if trace:
+                trace.on_request_end(response)
 
             return response
 
     async def close(self):
         if self.closed is False:
+            for host_pipelines in self.pipelines.values():
+                for pipeline in host_pipelines:
+                    await pipeline.connection.close()
+
             await self.pool.close()
+
+            if self.tracing_session:
+                await self.tracing_session.close()
+
             self.closed = True
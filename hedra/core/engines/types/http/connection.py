@@ -1,7 +1,14 @@
 from __future__ import annotations
 import asyncio
+import time
 from ssl import SSLContext
-from typing import Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple
+)
 from hedra.core.engines.types.common.protocols import TCPConnection
 from hedra.core.engines.types.common.protocols.shared.reader import Reader
 from hedra.core.engines.types.common.protocols.shared.writer import Writer
@@ -21,6 +28,11 @@ class HTTPConnection:
         'connected',
         'reset_connection',
         'pending',
+        'requests_count',
+        'last_used',
+        'keep_alive_timeout',
+        'keep_alive_max',
+        'should_close',
         '_connection_factory'
     )
 
@@ -37,6 +49,11 @@ class HTTPConnection:
         self.connected = False
         self.reset_connection = reset_connection
         self.pending = 0
+        self.requests_count = 0
+        self.last_used = 0
+        self.keep_alive_timeout: Optional[float] = None
+        self.keep_alive_max: Optional[int] = None
+        self.should_close = False
         self._connection_factory = TCPConnection()
 
     async def make_connection(
@@ -47,7 +64,7 @@ class HTTPConnection:
         socket_config: Tuple[int, int, int, int, Tuple[int, int]],
         ssl: Optional[SSLContext]=None,
         timeout: Optional[float]=None
-    ) -> None:
+    ) -> bool:
         if self.connected is False or self.dns_address != dns_address or self.reset_connection:
             try:
                 reader, writer = await asyncio.wait_for(self._connection_factory.create(hostname, socket_config, ssl=ssl), timeout=timeout)
@@ -60,6 +77,13 @@ class HTTPConnection:
                 self.port = port
                 self.ssl = ssl
 
+                self.requests_count = 0
+                self.keep_alive_timeout = None
+                self.keep_alive_max = None
+                self.should_close = False
+
+                return True
+
             except asyncio.TimeoutError:
                 raise Exception('Connection timed out.')
 
@@ -69,6 +93,61 @@ class HTTPConnection:
             except Exception as e:
                 raise e
 
+        return False
+
+    def update_keep_alive(self, response_code: bytes, headers: Dict[bytes, bytes]):
+        self.requests_count += 1
+        self.last_used = time.monotonic()
+
+        connection_header = headers.get(b'connection', b'').lower()
+        if connection_header == b'close':
+            self.should_close = True
+
+        elif response_code.startswith(b'HTTP/1.0') and connection_header != b'keep-alive':
+            self.should_close = True
+
+        keep_alive = headers.get(b'keep-alive')
+        if keep_alive:
+            for directive in keep_alive.split(b','):
+                name, _, value = directive.strip().partition(b'=')
+
+                try:
+
+                    if name.lower() == b'timeout':
+                        self.keep_alive_timeout = float(value)
+
+                    elif name.lower() == b'max':
+                        self.keep_alive_max = int(value)
+
+                except ValueError:
+                    pass
+
+    def is_reusable(self, max_idle_time: float) -> bool:
+        if self.connected is False or self.should_close or self.reset_connection:
+            return False
+
+        if self.keep_alive_max is not None and self.requests_count >= self.keep_alive_max:
+            return False
+
+        idle_limit = max_idle_time
+        if self.keep_alive_timeout is not None and self.keep_alive_timeout < idle_limit:
+            idle_limit = self.keep_alive_timeout
+
+        return time.monotonic() - self.last_used < idle_limit
+
+    def disconnect(self):
+        self.connected = False
+
+        transport = self._connection_factory.transport
+        if transport:
+            try:
+                transport.close()
+
+            except Exception:
+                pass
+
+            self._connection_factory.transport = None
+
     @property
     def empty(self):
         return not self.reader._buffer
@@ -91,7 +170,23 @@ class HTTPConnection:
     def read_headers(self):
         return self.reader.read_headers()
 
+    def read_response(
+        self,
+        discard_body: bool=False,
+        max_body_size: Optional[int]=None,
+        checksum: Optional[Any]=None,
+        on_chunk: Optional[Callable[[], None]]=None
+    ):
+        return self.reader.read_response(
+            discard_body=discard_body,
+            max_body_size=max_body_size,
+            checksum=checksum,
+            on_chunk=on_chunk
+        )
+
     async def close(self):
+        self.connected = False
+
         try:
             await self._connection_factory.close()
         except Exception:
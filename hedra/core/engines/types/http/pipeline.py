@@ -0,0 +1,61 @@
+import asyncio
+from typing import Optional, Tuple
+from .connection import HTTPConnection
+
+
+class HTTPPipeline:
+
+    '''
+    A single keep-alive connection with up to `depth` requests in
+    flight. Requests are written as soon as they are submitted and each
+    waits on the request ahead of it before reading, so responses are
+    parsed in the order the requests were sent.
+    '''
+
+    __slots__ = (
+        'connection',
+        'host_key',
+        'depth',
+        'in_flight',
+        'tail',
+        'failed'
+    )
+
+    def __init__(
+        self,
+        connection: HTTPConnection,
+        host_key: str,
+        depth: int
+    ) -> None:
+        self.connection = connection
+        self.host_key = host_key
+        self.depth = depth
+        self.in_flight = 0
+        self.tail: Optional[asyncio.Future] = None
+        self.failed = False
+
+    @property
+    def available(self) -> bool:
+        return self.failed is False and self.connection.should_close is False and self.in_flight < self.depth
+
+    @property
+    def idle(self) -> bool:
+        return self.in_flight == 0
+
+    def enqueue(self) -> Tuple[Optional[asyncio.Future], asyncio.Future]:
+        self.in_flight += 1
+
+        previous = self.tail
+        turn = asyncio.get_event_loop().create_future()
+        self.tail = turn
+
+        return previous, turn
+
+    def complete(self, turn: asyncio.Future):
+        self.in_flight -= 1
+
+        if not turn.done():
+            turn.set_result(None)
+
+        if self.tail is turn:
+            self.tail = None
@@ -1,5 +1,6 @@
-
-from typing import List
+import time
+from collections import defaultdict
+from typing import Dict, List, Union
 from .connection import HTTPConnection
 
 
@@ -8,20 +9,171 @@ class Pool:
     __slots__ = (
         'size',
         'connections',
-        'reset_connections'
+        'reset_connections',
+        'max_idle_time',
+        'idle',
+        'checked_out',
+        'requests',
+        'reused',
+        'connects',
+        'expired',
+        'server_closed'
     )
 
-    def __init__(self, size: int, reset_connections: bool = False) -> None:
+    def __init__(
+        self,
+        size: int,
+        reset_connections: bool = False,
+        max_idle_time: float = 60
+    ) -> None:
         self.size = size
         self.connections: List[HTTPConnection] = []
         self.reset_connections = reset_connections
+        self.max_idle_time = max_idle_time
+
+        # Connections that completed a request and are still open,
+        # keyed by the host they are connected to.
+        self.idle: Dict[str, List[HTTPConnection]] = defaultdict(list)
+        self.checked_out = 0
+
+        self.requests = 0
+        self.reused = 0
+        self.connects = 0
+        self.expired = 0
+        self.server_closed = 0
+
+    @property
+    def metrics(self) -> Dict[str, Union[int, float]]:
+        reuse_ratio = 0
+        if self.requests > 0:
+            reuse_ratio = max(self.requests - self.connects, 0)/self.requests
+
+        return {
+            'requests': self.requests,
+            'reused': self.reused,
+            'connects': self.connects,
+            'expired': self.expired,
+            'server_closed': self.server_closed,
+            'reuse_ratio': reuse_ratio
+        }
 
     def create_pool(self) -> None:
+        self.idle.clear()
+
         for _ in range(self.size):
             self.connections.append(
                 HTTPConnection(self.reset_connections)
             )
 
+    @property
+    def held(self) -> int:
+        return len(self.connections) + self.checked_out + sum([
+            len(idle_connections) for idle_connections in self.idle.values()
+        ])
+
+    def acquire(self, host_key: str) -> HTTPConnection:
+        self.requests += 1
+        self.checked_out += 1
+
+        idle_connections = self.idle.get(host_key)
+        while idle_connections:
+            connection = idle_connections.pop()
+
+            if connection.is_reusable(self.max_idle_time):
+                self.reused += 1
+                return connection
+
+            self.expired += 1
+            connection.disconnect()
+            self.connections.append(connection)
+
+        if self.connections:
+            return self.connections.pop()
+
+        idle_hosts = [
+            idle_host for idle_host, idle_connections in self.idle.items() if idle_connections
+        ]
+
+        if len(idle_hosts) < 1:
+            # Every connection is checked out, which can happen while the
+            # pool is resized under load. The extra connection is dropped
+            # on release if the pool is still full.
+            return HTTPConnection(self.reset_connections)
+
+        # Every free connection is idle against some other host, so
+        # take one from the host holding the most.
+        busiest_host = max(
+            idle_hosts,
+            key=lambda idle_host: len(self.idle[idle_host])
+        )
+
+        connection = self.idle[busiest_host].pop()
+        connection.disconnect()
+
+        return connection
+
+    def release(self, connection: HTTPConnection, host_key: str):
+        self.checked_out = max(self.checked_out - 1, 0)
+
+        if connection.should_close:
+            self.server_closed += 1
+
+        if self.held >= self.size:
+            connection.disconnect()
+
+        elif connection.is_reusable(self.max_idle_time):
+            self.idle[host_key].append(connection)
+
+        else:
+            connection.disconnect()
+            self.connections.append(connection)
+
+    def replace(self, connection: HTTPConnection):
+        self.checked_out = max(self.checked_out - 1, 0)
+        connection.disconnect()
+
+        if self.held < self.size:
+            self.connections.append(
+                HTTPConnection(reset_connection=self.reset_connections)
+            )
+
+    def add_warm(self, connection: HTTPConnection, host_key: str):
+        # Warm connections take the place of an unconnected one so the
+        # pool never holds more than its size.
+        if self.connections:
+            self.connections.pop()
+
+            connection.last_used = time.monotonic()
+            self.idle[host_key].append(connection)
+
+        else:
+            connection.disconnect()
+
+    def trim(self, count: int):
+        # Checked out connections still count toward the pool, so only
+        # trim what is held beyond its size. Release drops the rest as
+        # they come back. Unconnected connections go first, then those
+        # idle the longest.
+        count = min(count, max(self.held - self.size, 0))
+
+        removed = min(count, len(self.connections))
+        del self.connections[len(self.connections) - removed:]
+
+        idle_connections = sorted(
+            [
+                (host_key, connection) for host_key, host_connections in self.idle.items() for connection in host_connections
+            ],
+            key=lambda idle_connection: idle_connection[1].last_used
+        )
+
+        for host_key, connection in idle_connections[:count - removed]:
+            self.idle[host_key].remove(connection)
+            connection.disconnect()
+
     async def close(self):
         for connection in self.connections:
             await connection.close()
+
+        for idle_connections in self.idle.values():
+            for connection in idle_connections:
+                await connection.close()
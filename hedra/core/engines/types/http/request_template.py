@@ -0,0 +1,45 @@
+from typing import Dict, List, Optional
+
+
+class RequestTemplate:
+
+    '''
+    An encoded request split into static segments and named slots. The
+    static bytes are encoded once. Changing a slot replaces a single
+    segment, so a request that differs only in its path, a header value
+    or a body field is re-rendered with one join rather than re-encoded.
+    '''
+
+    __slots__ = (
+        'segments',
+        'slots'
+    )
+
+    def __init__(self) -> None:
+        self.segments: List[bytes] = []
+        self.slots: Dict[str, int] = {}
+
+    def append(self, segment: bytes):
+        self.segments.append(segment)
+
+    def add_slot(self, name: str, value: bytes):
+        self.slots[name] = len(self.segments)
+        self.segments.append(value)
+
+    def get(self, name: str) -> Optional[bytes]:
+        slot_idx = self.slots.get(name)
+        if slot_idx is None:
+            return None
+
+        return self.segments[slot_idx]
+
+    def set(self, name: str, value: bytes) -> bool:
+        slot_idx = self.slots.get(name)
+        if slot_idx is None:
+            return False
+
+        self.segments[slot_idx] = value
+        return True
+
+    def render(self) -> bytes:
+        return b''.join(self.segments)
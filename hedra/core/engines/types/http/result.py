@@ -3,6 +3,7 @@ import json
 from gzip import decompress as gzip_decompress
 from typing import List, Union, Dict
 from zlib import decompress as zlib_decompress
+from hedra.core.engines.types.common.body_retention import BodyRetentionPolicy
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common.base_result import BaseResult
 from .action import HTTPAction
@@ -20,6 +21,9 @@ class HTTPResult(BaseResult):
         'hostname',
         'headers',
         'body',
+        'body_size',
+        'body_checksum',
+        'body_retention',
         'response_code',
         '_version',
         '_reason',
@@ -52,6 +56,9 @@ class HTTPResult(BaseResult):
         self.headers: Dict[bytes, bytes] = {}
 
         self.body = bytearray()
+        self.body_size = 0
+        self.body_checksum: Union[str, None] = None
+        self.body_retention = action.body_retention.policy
         self.response_code = None
         self._version = None
         self._reason = None
@@ -67,7 +74,10 @@ class HTTPResult(BaseResult):
 
     @property
     def size(self):
-        if self.headers.get(b'content-length'):
+        if self.body_size:
+            return self.body_size
+
+        elif self.headers.get(b'content-length'):
             return int(self.headers.get(b'content-length'))
         
         elif self.body:
@@ -78,6 +88,18 @@ class HTTPResult(BaseResult):
 
     @property
     def data(self) -> Union[str, dict, None]:
+
+        if self.body_retention in (
+            BodyRetentionPolicy.CHECKSUM,
+            BodyRetentionPolicy.DISCARD
+        ):
+            return None
+
+        # A truncated body can't be decompressed or parsed and may end
+        # mid-character.
+        elif self.body_retention == BodyRetentionPolicy.HEAD and len(self.body) < self.body_size:
+            return bytes(self.body).decode(errors='ignore')
+
         data = self.body
         try:
             if self.compression == b"gzip":
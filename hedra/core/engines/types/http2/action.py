@@ -13,6 +13,7 @@ from hedra.core.engines.types.common.constants import NEW_LINE
 from hedra.core.engines.types.common.hooks import Hooks
 from hedra.core.engines.types.common import URL
 from hedra.core.engines.types.common.encoder import Encoder
+from hedra.core.engines.types.common.hpack.header_block_cache import HeaderBlockCache
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.http2.streams.stream_settings import Settings
 
@@ -38,6 +39,10 @@ class HTTP2Action(BaseAction):
         '_header_items',
         'mutations'
     )
+
+    # Shared by every HTTP/2 action in the process, since the cached
+    # blocks don't depend on any connection's header table.
+    header_blocks = HeaderBlockCache()
     
     def __init__(
         self,
@@ -161,11 +166,8 @@ class HTTP2Action(BaseAction):
                 b"transfer-encoding",
             )
         ])
-        
-        encoded_headers = self.hpack_encoder.encode(encoded_headers)
-        self.encoded_headers = [
-            encoded_headers[i:i+self._remote_settings.max_frame_size]
-            for i in range(
-                0, len(encoded_headers), self._remote_settings.max_frame_size
-            )
-        ]
+
+        self.encoded_headers = self.header_blocks.get(
+            tuple(encoded_headers),
+            self._remote_settings.max_frame_size
+        )
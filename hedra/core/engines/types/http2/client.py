@@ -16,7 +16,7 @@ from hedra.core.engines.types.common.ssl import get_http2_ssl_context
 from hedra.core.engines.types.common.concurrency import Semaphore
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
-    Trace
+    SpanRecord
 )
 
 from .pool import HTTP2Pool
@@ -49,7 +49,8 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
         concurrency: int = 10**3, 
         timeouts: Timeouts = Timeouts(), 
         reset_connections: bool=False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        multiplexed_connections: int=0
     ) -> None:
         super(
             MercuryHTTP2Client,
@@ -67,7 +68,8 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
         self.pool: HTTP2Pool = HTTP2Pool(
             concurrency, 
             self.timeouts, 
-            reset_connections=reset_connections
+            reset_connections=reset_connections,
+            multiplexed_connections=multiplexed_connections
         )
         self.tracing_session: Union[TraceSession, None] = tracing_session
 
@@ -85,7 +87,8 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
                 'socket_read_timeout': self.timeouts.socket_read_timeout,
                 'total_timeout': self.timeouts.total_timeout
             },
-            'reset_connections': self.pool.reset_connections
+            'reset_connections': self.pool.reset_connections,
+            'multiplexed_connections': self.pool.multiplexed_connections
         }
 
     
@@ -94,22 +97,27 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
         self.pool = HTTP2Pool(
             concurrency, 
             self.timeouts,
-            reset_connections=self.pool.reset_connections
+            reset_connections=self.pool.reset_connections,
+            multiplexed_connections=self.pool.multiplexed_connections
         )
 
         self.pool.create_pool()
 
     def extend_pool(self, increased_capacity: int):
         self.pool.size += increased_capacity
-        self.pool.create_pool()
+
+        if self.pool.is_multiplexed is False:
+            for _ in range(increased_capacity):
+                self.pool.reset()
     
-        self.sem = Semaphore(self.pool.size)
+        self.sem.extend(increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
         self.pool.size -= decrease_capacity
-        self.pool.create_pool()
+        self.pool.connections = self.pool.connections[:self.pool.size]
+        self.pool.pipes = self.pool.pipes[:self.pool.size]
 
-        self.sem = Semaphore(self.pool.size)
+        self.sem.shrink(decrease_capacity)
 
     async def prepare(self, request: HTTP2Action) -> Coroutine[Any, Any, None]:
         try:
@@ -166,31 +174,27 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
             raise e
 
     async def execute_prepared_request(self, action: HTTP2Action) -> Coroutine[Any, Any, HTTP2Result]:
+        if self.pool.is_multiplexed:
+            return await self.execute_multiplexed_request(
+                action,
+                HTTP2Result(action)
+            )
 
-        trace: Union[Trace, None] = None
+        trace: Union[SpanRecord, None] = None
         if self.tracing_session:
-            trace = self.tracing_session.create_trace()
-            await trace.on_request_start(action)
+            trace = self.tracing_session.create_trace(action)
 
         response = HTTP2Result(action)
         response.wait_start = time.monotonic()
         self.active += 1
 
-        if trace and trace.on_connection_queued_start:
-            await trace.on_connection_queued_start(
-                trace.span,
-                action,
-                response
-            )
+        if trace:
+            trace.record('on_connection_queued_start')
         
         async with self.sem:
 
-            if trace and trace.on_connection_queued_end:
-                await trace.on_connection_queued_end(
-                    trace.span,
-                    action,
-                    response
-                )
+            if trace:
+                trace.record('on_connection_queued_end')
 
             pipe = self.pool.pipes.pop()
             connection = self.pool.connections.pop()
@@ -208,18 +212,16 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
 
                 response.start = time.monotonic()
 
-                if trace and trace.on_connection_create_start:
-                    await trace.on_connection_create_start(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_connection_create_start')
+
+                ip_addr, socket_config = action.url.select_address(connection)
 
                 stream = await connection.connect(
                     action.url.hostname,
-                    action.url.ip_addr,
+                    ip_addr,
                     action.url.port,
-                    action.url.socket_config,
+                    socket_config,
                     ssl=action.ssl_context,
                     timeout=self.timeouts.connect_timeout
                 )
@@ -228,33 +230,21 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
      
                 response.connect_end = time.monotonic()
 
-                if trace and trace.on_connection_create_end:
-                    await trace.on_connection_create_end(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_connection_create_end')
 
                 pipe.send_request_headers(action, stream)
 
-                if trace and trace.on_request_headers_sent:
-                    await trace.on_request_headers_sent(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_request_headers_sent')
   
                 if action.encoded_data is not None:
                     await pipe.submit_request_body(action, stream)
 
                 response.write_end = time.monotonic()
 
-                if action.encoded_data and trace and trace.on_request_data_sent:
-                        await trace.on_request_data_sent(
-                            trace.span,
-                            action,
-                            response
-                        )
+                if action.encoded_data and trace:
+                    trace.record('on_request_data_sent')
 
                 await asyncio.wait_for(
                     pipe.receive_response(
@@ -296,10 +286,147 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
 
                 self.pool.reset()
 
-                if trace and trace.on_request_exception:
-                    await trace.on_request_exception(response)
+                if trace:
+                    trace.on_request_exception(response)
+
+            self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(response)
+
+            if self.waiter and self.active <= self.pool.size:
+
+                try:
+                    self.waiter.set_result(None)
+                    self.waiter = None
+
+                except asyncio.InvalidStateError:
+                    self.waiter = None
+
+            if trace:
+                trace.on_request_end(response)
+
+            return response
+
+    async def execute_multiplexed_request(
+        self, 
+        action: HTTP2Action,
+        response: HTTP2Result
+    ) -> Coroutine[Any, Any, HTTP2Result]:
+
+        trace: Union[SpanRecord, None] = None
+        if self.tracing_session:
+            trace = self.tracing_session.create_trace(action)
+
+        response.wait_start = time.monotonic()
+        self.active += 1
+
+        if trace:
+            trace.record('on_connection_queued_start')
+
+        async with self.sem:
+
+            if trace:
+                trace.record('on_connection_queued_end')
+
+            connection = self.pool.acquire_multiplexed(action.url.host_key)
+            multiplexed_stream = None
+
+            try:
+
+                if action.hooks.listen:
+                    event = asyncio.Event()
+                    action.hooks.channel_events.append(event)
+                    await event.wait()
+
+                if action.hooks.before:
+                    action: HTTP2Action = await self.execute_before(action)
+                    action.setup()
+
+                response.start = time.monotonic()
+
+                if trace:
+                    trace.record('on_connection_create_start')
+
+                await connection.connect(
+                    action,
+                    timeout=self.timeouts.connect_timeout
+                )
+
+                if connection.failed:
+                    raise Exception('Multiplexed connection failed.')
+
+                response.connect_end = time.monotonic()
+
+                if trace:
+                    trace.record('on_connection_create_end')
+
+                multiplexed_stream = connection.send_request(action, response)
+
+                if trace:
+                    trace.record('on_request_headers_sent')
+
+                if action.encoded_data is not None:
+                    await connection.send_body(action, multiplexed_stream)
+
+                response.write_end = time.monotonic()
+
+                if action.encoded_data and trace:
+                    trace.record('on_request_data_sent')
+
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(multiplexed_stream.completed),
+                        timeout=self.timeouts.total_timeout
+                    )
+
+                except asyncio.TimeoutError:
+                    connection.cancel_stream(multiplexed_stream)
+                    raise Exception('Request timed out.')
+
+                response.complete = time.monotonic()
+
+                if trace:
+                    trace.record('on_response_headers_received')
+
+                if trace:
+                    trace.record('on_response_data_received')
+
+                if action.hooks.after:
+                    response: HTTP2Result = await self.execute_after(action, response)
+                    action.setup()
+
+                if action.hooks.notify:
+                    await asyncio.gather(*[
+                        asyncio.create_task(
+                            channel.call(response, action.hooks.listeners)
+                        ) for channel in action.hooks.channels
+                    ])
+
+                    for listener in action.hooks.listeners: 
+                        if len(listener.hooks.channel_events) > 0:
+                            listener.setup()
+                            event = listener.hooks.channel_events.pop()
+                            if not event.is_set():
+                                event.set()
+
+            except Exception as e:
+                response.complete = time.monotonic()
+                response._status = 400
+                response.error = str(e)
+
+                if trace:
+                    trace.on_request_exception(response)
+
+            finally:
+                if multiplexed_stream:
+                    connection.release_stream(multiplexed_stream)
+
+                await self.pool.release_multiplexed(connection)
 
             self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(response)
+
             if self.waiter and self.active <= self.pool.size:
 
                 try:
@@ -309,12 +436,16 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
                 except asyncio.InvalidStateError:
                     self.waiter = None
 
-            if trace and trace.on_request_end:
-                await trace.on_request_end(response)
+            if trace:
+                trace.on_request_end(response)
 
             return response
 
     async def close(self):
         if self.closed is False:
             await self.pool.close()
+
+            if self.tracing_session:
+                await self.tracing_session.close()
+
             self.closed = True
@@ -133,7 +133,10 @@ class FrameBuffer:
 
                 data_length = len(body_data)
                 frame.body_len = data_length
-                frame.data = body_data[padding_data_offset:data_length-frame.pad_length]
+
+                # HPACK hashes literal names and values as it indexes them,
+                # which needs a read-only buffer.
+                frame.data = bytes(body_data[padding_data_offset:data_length-frame.pad_length])
 
             elif frame.type == 0x06:
                 # PING
@@ -226,9 +229,9 @@ class FrameBuffer:
 
                     frame_data = bytearray()
                     for header_frame in self._headers_buffer:
-                        frame_data.extend(header_frame)
+                        frame_data.extend(header_frame.data)
 
-                    frame.data = frame_data
+                    frame.data = bytes(frame_data)
                     self._headers_buffer = []
 
                 else:
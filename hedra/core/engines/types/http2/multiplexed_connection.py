@@ -0,0 +1,447 @@
+import asyncio
+from typing import Dict, Optional, Union
+from hedra.core.engines.types.common.decoder import Decoder
+from hedra.core.engines.types.common.hpack.table import HeaderTable
+from hedra.core.engines.types.common.timeouts import Timeouts
+from hedra.core.engines.types.common.types import RequestTypes
+from hedra.core.engines.types.http2.errors.types import ErrorCodes
+from hedra.core.engines.types.http2.streams.stream_settings_codes import SettingCodes
+from .action import HTTP2Action
+from .connection import HTTP2Connection
+from .events.deferred_headers_event import DeferredHeaders
+from .frames import FrameBuffer
+from .frames.types.base_frame import Frame
+from .result import HTTP2Result
+from .stream import Stream
+from .windows import WindowManager
+
+
+class MultiplexedStream:
+
+    __slots__ = (
+        'stream_id',
+        'response',
+        'completed',
+        'inbound',
+        'outbound_window'
+    )
+
+    def __init__(
+        self,
+        stream_id: int,
+        response: HTTP2Result,
+        inbound_window_size: int,
+        outbound_window_size: int
+    ) -> None:
+        self.stream_id = stream_id
+        self.response = response
+        self.completed = asyncio.get_event_loop().create_future()
+        self.inbound = WindowManager(inbound_window_size)
+        self.outbound_window = outbound_window_size
+
+    def finish(self, error: Optional[Exception]=None):
+        if self.completed.done():
+            return
+
+        if error:
+            self.completed.set_exception(error)
+
+        else:
+            self.completed.set_result(self.response)
+
+
+class HTTP2MultiplexedConnection:
+
+    '''
+    A single HTTP/2 connection carrying up to `max_streams` concurrent
+    requests. Each request is written on the next odd stream ID as soon
+    as it is submitted, and one reader task demultiplexes incoming frames
+    by stream ID to the request waiting on that stream.
+    '''
+
+    __slots__ = (
+        'connection',
+        'stream',
+        'host_key',
+        'max_streams',
+        'remote_max_streams',
+        'next_stream_id',
+        'streams',
+        'pending',
+        'reader_task',
+        'failed',
+        'lock',
+        'decoder',
+        'inbound',
+        'outbound_window',
+        'initial_window_size',
+        'max_frame_size',
+        'window_updated'
+    )
+
+    connection_window_increment = 2**24
+    max_stream_id = 2**31 - 1
+
+    def __init__(
+        self,
+        host_key: str,
+        timeouts: Timeouts,
+        max_streams: int,
+        stream_type: RequestTypes=RequestTypes.HTTP2
+    ) -> None:
+        self.connection = HTTP2Connection(
+            1,
+            timeouts,
+            max_streams,
+            False,
+            stream_type
+        )
+
+        self.stream: Union[Stream, None] = None
+        self.host_key = host_key
+        self.max_streams = max_streams
+        self.remote_max_streams = max_streams
+        self.next_stream_id = 1
+        self.streams: Dict[int, MultiplexedStream] = {}
+
+        # Requests holding a slot on this connection, counted from the
+        # pool handing the connection out rather than from the stream
+        # opening, so requests still waiting to connect are balanced too.
+        self.pending = 0
+        self.reader_task: Union[asyncio.Task, None] = None
+        self.failed = False
+        self.lock = asyncio.Lock()
+
+        # Response header blocks share the server's HPACK state, so they
+        # are decoded on arrival, in the order the server sent them.
+        self.decoder = Decoder()
+        self.decoder.header_table = HeaderTable()
+
+        self.inbound = WindowManager(
+            65535 + self.connection_window_increment
+        )
+
+        self.outbound_window = 65535
+        self.initial_window_size = 65535
+        self.max_frame_size = 16384
+        self.window_updated = asyncio.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self.stream is not None
+
+    @property
+    def active(self) -> int:
+        return len(self.streams)
+
+    @property
+    def available(self) -> bool:
+        return self.failed is False and self.next_stream_id < self.max_stream_id and self.pending < min(
+            self.max_streams,
+            self.remote_max_streams
+        )
+
+    async def connect(
+        self,
+        action: HTTP2Action,
+        timeout: Optional[float]=None
+    ) -> bool:
+
+        async with self.lock:
+
+            if self.connected:
+                return False
+
+            try:
+                ip_addr, socket_config = action.url.select_address(self.connection)
+
+                stream = await self.connection.connect(
+                    action.url.hostname,
+                    ip_addr,
+                    action.url.port,
+                    socket_config,
+                    ssl=action.ssl_context,
+                    timeout=timeout
+                )
+
+            except Exception as connection_error:
+                self.failed = True
+                raise connection_error
+
+            stream.frame_buffer = FrameBuffer()
+            stream.max_outbound_frame_size = self.max_frame_size
+
+            stream.write(bytes(stream.connection_data))
+            stream.write_window_update_frame(0, self.connection_window_increment)
+
+            self.stream = stream
+            self.reader_task = asyncio.create_task(self._read_frames())
+
+            return True
+
+    def send_request(self, action: HTTP2Action, response: HTTP2Result) -> MultiplexedStream:
+
+        stream_id = self.next_stream_id
+        self.next_stream_id += 2
+
+        multiplexed_stream = MultiplexedStream(
+            stream_id,
+            response,
+            65535,
+            self.initial_window_size
+        )
+
+        self.streams[stream_id] = multiplexed_stream
+
+        end_stream = action.encoded_data is None
+        header_blocks = action.encoded_headers
+        last_block_idx = len(header_blocks) - 1
+
+        headers_data = bytearray()
+        for block_idx, header_block in enumerate(header_blocks):
+
+            if block_idx == 0:
+                frame = Frame(stream_id, 0x01)
+                frame.data = header_block
+
+                if end_stream:
+                    frame.flags.add('END_STREAM')
+
+            else:
+                frame = Frame(stream_id, 0x09)
+                frame.data = header_block
+
+            if block_idx == last_block_idx:
+                frame.flags.add('END_HEADERS')
+
+            headers_data.extend(frame.serialize())
+
+        self.stream.write(headers_data)
+
+        return multiplexed_stream
+
+    async def send_body(self, action: HTTP2Action, multiplexed_stream: MultiplexedStream):
+        data = action.encoded_data
+        if isinstance(data, list):
+            data = b''.join(data)
+
+        data = memoryview(data)
+
+        while True:
+            flow = min(
+                self.outbound_window,
+                multiplexed_stream.outbound_window,
+                self.max_frame_size
+            )
+
+            if flow <= 0 and len(data) > 0:
+                self.window_updated.clear()
+                await self.window_updated.wait()
+
+                if self.failed:
+                    raise Exception('Multiplexed connection failed.')
+
+                continue
+
+            chunk, data = data[:flow], data[flow:]
+
+            frame = Frame(multiplexed_stream.stream_id, 0x0)
+            frame.data = bytes(chunk)
+
+            if len(data) == 0:
+                frame.flags.add('END_STREAM')
+
+            self.outbound_window -= len(chunk)
+            multiplexed_stream.outbound_window -= len(chunk)
+
+            self.stream.write(frame.serialize())
+
+            if len(data) == 0:
+                break
+
+    def cancel_stream(self, multiplexed_stream: MultiplexedStream):
+        if self.streams.pop(multiplexed_stream.stream_id, None) and self.failed is False:
+            frame = Frame(multiplexed_stream.stream_id, 0x03)
+            frame.error_code = ErrorCodes.CANCEL
+
+            self.stream.write(frame.serialize())
+
+    def release_stream(self, multiplexed_stream: MultiplexedStream):
+        self.streams.pop(multiplexed_stream.stream_id, None)
+
+    async def _read_frames(self):
+        stream = self.stream
+        frame_buffer = stream.frame_buffer
+
+        try:
+            while True:
+                data = await stream.read()
+
+                if len(data) == 0:
+                    raise Exception('Connection closed by server.')
+
+                frame_buffer.data.extend(data)
+                frame_buffer.max_frame_size = self.max_frame_size
+
+                write_data = bytearray()
+                for frame in frame_buffer:
+                    self._process_frame(frame, write_data)
+
+                if write_data:
+                    stream.write(write_data)
+
+        except asyncio.CancelledError:
+            self._fail(Exception('Multiplexed connection closed.'))
+
+        except Exception as error:
+            self._fail(error)
+
+    def _process_frame(self, frame: Frame, write_data: bytearray):
+
+        if frame.type == 0x0:
+            # DATA
+            flow_controlled_length = frame.flow_controlled_length
+
+            self.inbound.window_consumed(flow_controlled_length)
+            connection_increment = self.inbound.process_bytes(flow_controlled_length)
+
+            if connection_increment:
+                write_data.extend(
+                    Frame(0, 0x08, window_increment=connection_increment).serialize()
+                )
+
+            multiplexed_stream = self.streams.get(frame.stream_id)
+            if multiplexed_stream is None:
+                return
+
+            multiplexed_stream.response.body.extend(frame.data)
+
+            if 'END_STREAM' in frame.flags:
+                multiplexed_stream.finish()
+                return
+
+            multiplexed_stream.inbound.window_consumed(flow_controlled_length)
+            stream_increment = multiplexed_stream.inbound.process_bytes(flow_controlled_length)
+
+            if stream_increment:
+                write_data.extend(
+                    Frame(frame.stream_id, 0x08, window_increment=stream_increment).serialize()
+                )
+
+        elif frame.type == 0x01:
+            # HEADERS - the frame buffer holds a block's fragments until
+            # the CONTINUATION frame with END_HEADERS, so the whole block
+            # is decoded once against the shared HPACK table.
+            deferred_headers = DeferredHeaders(
+                self.decoder,
+                frame,
+                None
+            )
+
+            status, headers = deferred_headers.parse()
+
+            multiplexed_stream = self.streams.get(frame.stream_id)
+            if multiplexed_stream is None:
+                return
+
+            response = multiplexed_stream.response
+
+            # Interim (1xx) responses and trailers don't replace the
+            # response's headers.
+            if status and status >= 200 and response._status is None:
+                headers['status'] = status
+                response.headers = headers
+                response.deferred_headers = deferred_headers
+                response._status = status
+
+            if deferred_headers.end_stream:
+                multiplexed_stream.finish()
+
+        elif frame.type == 0x03:
+            # RESET
+            multiplexed_stream = self.streams.get(frame.stream_id)
+            if multiplexed_stream:
+                multiplexed_stream.finish(
+                    Exception(f'Stream - {frame.stream_id} reset - error code {frame.error_code}')
+                )
+
+        elif frame.type == 0x04:
+            # SETTINGS
+            if 'ACK' in frame.flags:
+                return
+
+            for setting, value in frame.settings.items():
+
+                if setting == SettingCodes.MAX_CONCURRENT_STREAMS:
+                    self.remote_max_streams = value
+
+                elif setting == SettingCodes.MAX_FRAME_SIZE:
+                    self.max_frame_size = value
+
+                elif setting == SettingCodes.INITIAL_WINDOW_SIZE:
+                    window_delta = value - self.initial_window_size
+                    self.initial_window_size = value
+
+                    for multiplexed_stream in self.streams.values():
+                        multiplexed_stream.outbound_window += window_delta
+
+                    self.window_updated.set()
+
+            ack_frame = Frame(0, 0x04)
+            ack_frame.flags.add('ACK')
+
+            write_data.extend(ack_frame.serialize())
+
+        elif frame.type == 0x06:
+            # PING
+            if 'ACK' not in frame.flags:
+                ping_frame = Frame(0, 0x06, opaque_data=frame.opaque_data)
+                ping_frame.flags.add('ACK')
+
+                write_data.extend(ping_frame.serialize())
+
+        elif frame.type == 0x07:
+            # GOAWAY
+            self.failed = True
+
+            # Streams above the last stream ID were never processed.
+            for stream_id, multiplexed_stream in list(self.streams.items()):
+                if stream_id > frame.last_stream_id:
+                    multiplexed_stream.finish(
+                        Exception(f'Connection closed by server - error code {frame.error_code}')
+                    )
+
+        elif frame.type == 0x08:
+            # WINDOW UPDATE
+            if frame.stream_id == 0:
+                self.outbound_window += frame.window_increment
+
+            else:
+                multiplexed_stream = self.streams.get(frame.stream_id)
+                if multiplexed_stream:
+                    multiplexed_stream.outbound_window += frame.window_increment
+
+            self.window_updated.set()
+
+    def _fail(self, error: Exception):
+        self.failed = True
+
+        for multiplexed_stream in self.streams.values():
+            multiplexed_stream.finish(error)
+
+        self.streams.clear()
+        self.window_updated.set()
+
+    async def close(self):
+        self.failed = True
+
+        if self.reader_task and not self.reader_task.done():
+            self.reader_task.cancel()
+
+            try:
+                await self.reader_task
+
+            except asyncio.CancelledError:
+                pass
+
+        await self.connection.close()
@@ -15,7 +15,7 @@ from hedra.core.engines.types.http2.stream import Stream
 from hedra.core.engines.types.http2.streams.stream_closed_by import StreamClosedBy
 from hedra.core.engines.types.http2.streams.stream_settings import Settings
 from hedra.core.engines.types.http2.streams.stream_settings_codes import SettingCodes
-from hedra.core.engines.types.tracing.trace_session import Trace
+from hedra.core.engines.types.tracing.trace_session import SpanRecord
 
 from .action import HTTP2Action
 from .result import HTTP2Result
@@ -126,10 +126,6 @@ class HTTP2Pipe:
         end_stream = request.encoded_data is None
         encoded_headers = request.encoded_headers
 
-        if request.hpack_encoder.header_table.maxsize != self._encoder.header_table.maxsize:
-            request.hpack_encoder.header_table_size = self._encoder.header_table.maxsize
-            request._setup_headers()
-    
         stream.headers_frame.data = encoded_headers[0]
         headers_frame = stream.headers_frame
         if end_stream:
@@ -145,7 +141,7 @@ class HTTP2Pipe:
         action: HTTP2Action,
         response: HTTP2Result, 
         stream: Stream,
-        trace: Trace
+        trace: SpanRecord
     ):
 
         done = False
@@ -208,12 +204,8 @@ class HTTP2Pipe:
                             stream_events[0].data = frame_data
                             stream_events[0].flow_controlled_length = flow_controlled_length
 
-                            if trace and trace.on_response_data_received:
-                                await trace.on_response_data_received(
-                                    trace.span,
-                                    action,
-                                    response
-                                )
+                            if trace:
+                                trace.record('on_response_data_received')
 
                         except StreamClosedError as e:
                             raise Exception(f'Connection - {stream.stream_id} err: {str(e._events[0])}')
@@ -246,12 +238,8 @@ class HTTP2Pipe:
                         frames = []
                         response.deferred_headers = deferred_headers
 
-                        if trace and trace.on_response_headers_received:
-                            await trace.on_response_headers_received(
-                                trace.span,
-                                action,
-                                response
-                            )
+                        if trace:
+                            trace.record('on_response_headers_received')
 
                     elif frame.type == 0x03:
                         # RESET
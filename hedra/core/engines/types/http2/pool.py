@@ -1,9 +1,12 @@
+import math
+from collections import defaultdict
 from random import randrange
-from typing import List
+from typing import Dict, List
 from hedra.core.engines.types.common.timeouts import Timeouts
 from hedra.core.engines.types.common.types import RequestTypes
 from .pipe import HTTP2Pipe
 from .connection import HTTP2Connection
+from .multiplexed_connection import HTTP2MultiplexedConnection
 
 
 class HTTP2Pool:
@@ -14,10 +17,18 @@ class HTTP2Pool:
         'pipes',
         'timeouts',
         'reset_connections',
-        'pool_type'
+        'pool_type',
+        'multiplexed_connections',
+        'multiplexed'
     )
 
-    def __init__(self, size: int, timeouts: Timeouts, reset_connections: bool=False) -> None:
+    def __init__(
+        self, 
+        size: int, 
+        timeouts: Timeouts, 
+        reset_connections: bool=False,
+        multiplexed_connections: int=0
+    ) -> None:
         self.size = size
         self.connections: List[HTTP2Connection] = []
         self.pipes: List[HTTP2Pipe] = []
@@ -25,8 +36,29 @@ class HTTP2Pool:
         self.reset_connections = reset_connections
         self.pool_type: RequestTypes = RequestTypes.HTTP2
 
+        # When set, requests to each host share this many connections
+        # with many concurrent streams each, instead of one connection
+        # per concurrency slot.
+        self.multiplexed_connections = multiplexed_connections
+        self.multiplexed: Dict[str, List[HTTP2MultiplexedConnection]] = defaultdict(list)
+
+    @property
+    def is_multiplexed(self) -> bool:
+        return self.multiplexed_connections > 0
+
+    @property
+    def streams_per_connection(self) -> int:
+        return max(
+            math.ceil(self.size/self.multiplexed_connections),
+            1
+        )
+
     def create_pool(self) -> None:
 
+        if self.is_multiplexed:
+            # Multiplexed connections are opened on first use per host.
+            return
+
         self.pipes = [ HTTP2Pipe(self.size) for _ in range(self.size) ]
         
         self.connections = [
@@ -53,6 +85,50 @@ class HTTP2Pool:
             )
         )
 
+    def acquire_multiplexed(self, host_key: str) -> HTTP2MultiplexedConnection:
+        host_connections = self.multiplexed[host_key]
+
+        available = [
+            connection for connection in host_connections if connection.available
+        ]
+
+        if len(available) > 0 and (
+            len(host_connections) >= self.multiplexed_connections or min(
+                connection.pending for connection in available
+            ) == 0
+        ):
+            connection = min(
+                available,
+                key=lambda connection: connection.pending
+            )
+
+        else:
+            connection = HTTP2MultiplexedConnection(
+                host_key,
+                self.timeouts,
+                self.streams_per_connection,
+                stream_type=self.pool_type
+            )
+
+            host_connections.append(connection)
+
+        connection.pending += 1
+
+        return connection
+
+    async def release_multiplexed(self, connection: HTTP2MultiplexedConnection):
+        connection.pending -= 1
+
+        host_connections = self.multiplexed[connection.host_key]
+
+        if connection.failed and connection.pending == 0 and connection in host_connections:
+            host_connections.remove(connection)
+            await connection.close()
+
     async def close(self):
         for connection in self.connections:
             await connection.close()
+
+        for host_connections in self.multiplexed.values():
+            for multiplexed_connection in host_connections:
+                await multiplexed_connection.close()
@@ -15,7 +15,7 @@ from hedra.core.engines.types.common.protocols.udp.quic_protocol import (
 )
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
-    Trace
+    SpanRecord
 )
 
 from hedra.logging import HedraLogger
@@ -53,7 +53,9 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
         concurrency: int=10**3, 
         timeouts: Timeouts = Timeouts(), 
         reset_connections: bool=False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        early_data: bool=False,
+        multiplexed_connections: int=0
     ) -> None:
         super().__init__()
 
@@ -64,8 +66,13 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
         self._hosts = {}
         self.closed = False
 
-        self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = Pool(concurrency, reset_connections=reset_connections)
+        self.sem = Semaphore(value=concurrency)
+        self.pool = Pool(
+            concurrency, 
+            reset_connections=reset_connections,
+            early_data=early_data,
+            multiplexed_connections=multiplexed_connections
+        )
         self.tracing_session: Union[TraceSession, None] = tracing_session
         self.logger = HedraLogger()
         self.logger.initialize()
@@ -83,28 +90,38 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                 'socket_read_timeout': self.timeouts.socket_read_timeout,
                 'total_timeout': self.timeouts.total_timeout
             },
-            'reset_connections': self.pool.reset_connections
+            'reset_connections': self.pool.reset_connections,
+            'early_data': self.pool.early_data,
+            'multiplexed_connections': self.pool.multiplexed_connections
         }
 
 
     async def set_pool(self, concurrency: int):
-        self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = Pool(concurrency, reset_connections=self.pool.reset_connections)
+        self.sem = Semaphore(value=concurrency)
+        self.pool = Pool(
+            concurrency, 
+            reset_connections=self.pool.reset_connections,
+            early_data=self.pool.early_data,
+            multiplexed_connections=self.pool.multiplexed_connections
+        )
         self.pool.create_pool()
 
     def extend_pool(self, increased_capacity: int):
         self.pool.size += increased_capacity
         for _ in range(increased_capacity):
             self.pool.connections.append(
-                HTTP3Connection(self.pool.reset_connections)
+                HTTP3Connection(
+                    self.pool.reset_connections,
+                    early_data=self.pool.early_data
+                )
             )
         
-        self.sem = Semaphore(self.pool.size)
+        self.sem.extend(increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
         self.pool.size -= decrease_capacity
         self.pool.connections = self.pool.connections[:self.pool.size]
-        self.sem = Semaphore(self.pool.size)
+        self.sem.shrink(decrease_capacity)
     
     async def prepare(self, action: HTTP3Action) -> Coroutine[Any, Any, None]:
         try:
@@ -160,34 +177,28 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
 
     async def execute_prepared_request(self, action: HTTP3Action) -> Coroutine[Any, Any, HTTP3Result]:
 
-        trace: Union[Trace, None] = None
+        trace: Union[SpanRecord, None] = None
         if self.tracing_session:
-            trace = self.tracing_session.create_trace()
-            await trace.on_request_start(action)
+            trace = self.tracing_session.create_trace(action)
   
         response = HTTP3Result(action)
         response.wait_start = time.monotonic()
         self.active += 1
 
-        if trace and trace.on_connection_queued_start:
-            await trace.on_connection_queued_start(
-                trace.span,
-                action,
-                response
-            )
+        if trace:
+            trace.record('on_connection_queued_start')
  
         async with self.sem:
 
-            if trace and trace.on_connection_queued_end:
-                await trace.on_connection_queued_end(
-                    trace.span,
-                    action,
-                    response
-                )
+            if trace:
+                trace.record('on_connection_queued_end')
             
+            host_key = action.url.host_key
+            connection: Union[HTTP3Connection, None] = None
+
             try:
 
-                connection = self.pool.connections.pop()
+                connection = self.pool.acquire(host_key)
                 
                 if action.hooks.listen:
                     event = asyncio.Event()
@@ -200,29 +211,23 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
 
                 response.start = time.monotonic()
 
-                if trace and trace.on_connection_create_start:
-                    await trace.on_connection_create_start(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_connection_create_start')
+
+                ip_addr, socket_config = action.url.select_address(connection)
 
                 await connection.make_connection(
-                    action.url.ip_addr,
+                    ip_addr,
                     action.url.port,
-                    action.url.socket_config,
+                    socket_config,
                     server_name=action.url.hostname,
                     timeout=self.timeouts.connect_timeout
                 )
 
                 response.connect_end = time.monotonic()
 
-                if trace and trace.on_connection_create_end:
-                    await trace.on_connection_create_end(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_connection_create_end')
 
                 stream_id = connection.protocol._quic.get_next_available_stream_id()
                 
@@ -255,12 +260,8 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                     not action.encoded_data
                 )
 
-                if trace and trace.on_request_headers_sent:
-                    await trace.on_request_headers_sent(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_request_headers_sent')
 
                 if action.encoded_data:
                     stream = connection.protocol._get_or_create_stream(stream_id)
@@ -283,40 +284,29 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
 
                 response.write_end = time.monotonic()
 
-                if action.encoded_data and trace and trace.on_request_data_sent:
-                        await trace.on_request_data_sent(
-                            trace.span,
-                            action,
-                            response
-                        )
+                if action.encoded_data and trace:
+                    trace.record('on_request_data_sent')
 
-                response_frames: ResponseFrameCollection = await asyncio.wait_for(
-                    waiter,
-                    timeout=self.timeouts.total_timeout
+                response_frames: ResponseFrameCollection = await self._wait_for_response(
+                    connection,
+                    stream_id,
+                    waiter
                 )
 
                 headers: Dict[str, Union[bytes, int]] = {}
                 for header_key, header_value in response_frames.headers_frame.headers:
                     headers[header_key] = header_value
 
-                if trace and trace.on_response_headers_received:
-                    await trace.on_response_headers_received(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_response_headers_received')
                 
                 response.headers = headers
                 status = response.status
 
                 if status >= 300 and status < 400:
 
-                    if trace and trace.on_request_redirect:
-                        await trace.on_request_redirect(
-                            trace.span,
-                            action,
-                            response
-                        )
+                    if trace:
+                        trace.record('on_request_redirect')
                     
                     elapsed_time = 0
                     redirect_time_start = time.time()
@@ -339,10 +329,20 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                             action.is_setup = False
                             await self.prepare(action)
 
+                            if self.pool.is_multiplexed:
+                                # Leave the shared connection to the original
+                                # host and take one for the redirect target.
+                                await self.pool.release(host_key, connection)
+
+                                host_key = action.url.host_key
+                                connection = self.pool.acquire(host_key)
+
+                            ip_addr, socket_config = action.url.select_address(connection)
+
                             await connection.make_connection(
-                                action.url.ip_addr,
+                                ip_addr,
                                 action.url.port,
-                                action.url.socket_config,
+                                socket_config,
                                 server_name=action.url.hostname,
                                 timeout=self.timeouts.connect_timeout
                             )
@@ -400,9 +400,10 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
 
                         response.write_end = time.monotonic()
 
-                        response_frames: ResponseFrameCollection = await asyncio.wait_for(
-                            waiter,
-                            timeout=self.timeouts.total_timeout
+                        response_frames: ResponseFrameCollection = await self._wait_for_response(
+                            connection,
+                            stream_id,
+                            waiter
                         )
 
                         for header_key, header_value in response_frames.headers_frame.headers:
@@ -418,15 +419,13 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
 
                 response.complete = time.monotonic()
 
-                if trace and trace.on_response_data_received:
-                    await trace.on_response_data_received(
-                        trace.span,
-                        action,
-                        response
-                    )
+                if trace:
+                    trace.record('on_response_data_received')
 
                 response.headers = headers
-                self.pool.connections.append(connection)
+
+                await self.pool.release(host_key, connection)
+                connection = None
 
                 if action.hooks.after:
                     response = await self.execute_after(action, response)
@@ -453,12 +452,16 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                 response.complete = time.monotonic()
                 response.error = str(e)
 
-                self.pool.connections.append(HTTP3Connection(reset_connection=self.pool.reset_connections))
+                if connection:
+                    await self.pool.release(host_key, connection, failed=True)
 
-                if trace and trace.on_request_exception:
-                    await trace.on_request_exception(response)
+                if trace:
+                    trace.on_request_exception(response)
 
             self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(response)
+
             if self.waiter and self.active <= self.pool.size:
 
                 try:
@@ -468,12 +471,36 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                 except asyncio.InvalidStateError:
                     self.waiter = None
 
-            if trace and trace.on_request_end:
-                await trace.on_request_end(response)
+            if trace:
+                trace.on_request_end(response)
 
             return response
 
+    async def _wait_for_response(
+        self,
+        connection: HTTP3Connection,
+        stream_id: int,
+        waiter: asyncio.Future
+    ) -> ResponseFrameCollection:
+        try:
+            response_frames: ResponseFrameCollection = await asyncio.wait_for(
+                waiter,
+                timeout=self.timeouts.total_timeout
+            )
+
+        except asyncio.TimeoutError:
+            connection.protocol.cancel_stream(stream_id)
+            raise Exception('Request timed out.')
+
+        connection.protocol.release_stream(stream_id)
+
+        return response_frames
+
     async def close(self):
         if self.closed is False:
             await self.pool.close()
+
+            if self.tracing_session:
+                await self.tracing_session.close()
+
             self.closed = True
@@ -15,11 +15,16 @@ class HTTP3Connection:
         'protocol',
         'connected',
         'reset_connection',
+        'early_data',
         'pending',
         '_connection_factory'
     )
 
-    def __init__(self, reset_connection: bool=False) -> None:
+    def __init__(
+        self, 
+        reset_connection: bool=False,
+        early_data: bool=False
+    ) -> None:
         self.dns_address: str = None
         self.port: int = None
         self.ip_addr = None
@@ -28,6 +33,7 @@ class HTTP3Connection:
         self.protocol: QuicProtocol = None
         self.connected = False
         self.reset_connection = reset_connection
+        self.early_data = early_data
         self.pending = 0
         self._connection_factory = UDPConnection()
 
@@ -40,30 +46,48 @@ class HTTP3Connection:
         timeout: Optional[float]=None
     ) -> None:
     
+        if self.connected and self.protocol.is_closed:
+            self.connected = False
+
         if self.connected is False or self.dns_address != dns_address or self.reset_connection:
-            try:
-                self.protocol = await asyncio.wait_for(
-                    self._connection_factory.create_http3(
-                        socket_config=socket_config,
-                        server_name=server_name
-                    ),
-                     
-                    timeout=timeout
-                )
-                    
-                self.connected = True
-
-                self.dns_address = dns_address
-                self.port = port
-
-            except asyncio.TimeoutError:
-                raise Exception('Connection timed out.')
-
-            except ConnectionResetError:
-                raise Exception('Connection reset.')
-
-            except Exception as e:
-                raise e
+            # Shared connections are opened by whichever request arrives
+            # first; the rest wait for it rather than racing a handshake.
+            async with self.lock:
+
+                if self.connected and self.dns_address == dns_address and self.reset_connection is False:
+                    return
+
+                if self.protocol:
+                    self.protocol.close()
+
+                try:
+                    self.protocol = await asyncio.wait_for(
+                        self._connection_factory.create_http3(
+                            socket_config=socket_config,
+                            server_name=server_name,
+                            early_data=self.early_data
+                        ),
+                        
+                        timeout=timeout
+                    )
+                        
+                    self.connected = True
+
+                    self.dns_address = dns_address
+                    self.port = port
+
+                except asyncio.TimeoutError:
+                    raise Exception('Connection timed out.')
+
+                except ConnectionResetError:
+                    raise Exception('Connection reset.')
+
+                except Exception as e:
+                    raise e
+
+    @property
+    def failed(self) -> bool:
+        return self.protocol is not None and self.protocol.is_closed
 
     async def close(self):
         if self.protocol:
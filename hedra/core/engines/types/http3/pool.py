@@ -1,5 +1,6 @@
-
-from typing import List
+import math
+from collections import defaultdict
+from typing import Dict, List
 from .connection import HTTP3Connection
 
 
@@ -8,20 +9,110 @@ class Pool:
     __slots__ = (
         'size',
         'connections',
-        'reset_connections'
+        'reset_connections',
+        'early_data',
+        'multiplexed_connections',
+        'multiplexed'
     )
 
-    def __init__(self, size: int, reset_connections: bool = False) -> None:
+    def __init__(
+        self,
+        size: int,
+        reset_connections: bool = False,
+        early_data: bool = False,
+        multiplexed_connections: int = 0
+    ) -> None:
         self.size = size
         self.connections: List[HTTP3Connection] = []
         self.reset_connections = reset_connections
+        self.early_data = early_data
+
+        # When set, requests to each host share this many QUIC connections
+        # with many concurrent streams each, instead of one connection
+        # per concurrency slot.
+        self.multiplexed_connections = multiplexed_connections
+        self.multiplexed: Dict[str, List[HTTP3Connection]] = defaultdict(list)
+
+    @property
+    def is_multiplexed(self) -> bool:
+        return self.multiplexed_connections > 0
+
+    @property
+    def streams_per_connection(self) -> int:
+        return max(
+            math.ceil(self.size/self.multiplexed_connections),
+            1
+        )
 
     def create_pool(self) -> None:
+
+        if self.is_multiplexed:
+            # Multiplexed connections are opened on first use per host.
+            return
+
         for _ in range(self.size):
             self.connections.append(
-                HTTP3Connection(self.reset_connections)
+                HTTP3Connection(
+                    self.reset_connections,
+                    early_data=self.early_data
+                )
+            )
+
+    def acquire(self, host_key: str) -> HTTP3Connection:
+
+        if self.is_multiplexed is False:
+            return self.connections.pop()
+
+        host_connections = self.multiplexed[host_key]
+
+        available = [
+            connection for connection in host_connections if connection.failed is False and (
+                connection.pending < self.streams_per_connection
+            )
+        ]
+
+        if len(available) > 0 and (
+            len(host_connections) >= self.multiplexed_connections or min(
+                connection.pending for connection in available
+            ) == 0
+        ):
+            connection = min(
+                available,
+                key=lambda connection: connection.pending
             )
 
+        else:
+            connection = HTTP3Connection(early_data=self.early_data)
+            host_connections.append(connection)
+
+        connection.pending += 1
+
+        return connection
+
+    async def release(self, host_key: str, connection: HTTP3Connection, failed: bool=False):
+
+        if self.is_multiplexed is False:
+            if failed:
+                connection = HTTP3Connection(
+                    reset_connection=self.reset_connections,
+                    early_data=self.early_data
+                )
+
+            self.connections.append(connection)
+            return
+
+        connection.pending -= 1
+
+        host_connections = self.multiplexed[host_key]
+
+        if connection.failed and connection.pending == 0 and connection in host_connections:
+            host_connections.remove(connection)
+            await connection.close()
+
     async def close(self):
         for connection in self.connections:
             await connection.close()
+
+        for host_connections in self.multiplexed.values():
+            for connection in host_connections:
+                await connection.close()
@@ -9,6 +9,7 @@ from typing import (
 )
 from hedra.core.engines.types.common import Timeouts
 from hedra.core.engines.types.common.base_engine import BaseEngine
+from hedra.core.engines.types.common.concurrency import Semaphore
 from hedra.core.engines.types.common.types import RequestTypes
 from .context_config import ContextConfig
 from .context_group import ContextGroup
@@ -49,7 +50,7 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
         self.closed = False
         self.config: Union[ContextConfig, None] = None
 
-        self.sem = asyncio.Semaphore(value=concurrency)
+        self.sem = Semaphore(value=concurrency)
         self.active = 0
         self.waiter = None
 
@@ -70,7 +71,7 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
         }
 
     async def set_pool(self, concurrency: int):
-        self.sem = asyncio.Semaphore(value=concurrency)
+        self.sem = Semaphore(value=concurrency)
         self.pool = ContextPool(concurrency, reset_connections=self.pool.reset_connections)
 
     async def setup(self, config: ContextConfig=None):
@@ -107,7 +108,7 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
 
             self.pool.contexts.append(context_group)
         
-        self.sem = asyncio.Semaphore(self.pool.size)
+        self.sem.extend(increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
         self.pool.size -= decrease_capacity
@@ -126,7 +127,7 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
             context_group.contexts = context_group.contexts[:group_size]
             context_group.librarians = context_group.librarians[:group_size]
 
-        self.sem = asyncio.Semaphore(self.pool.size)
+        self.sem.shrink(decrease_capacity)
 
 
     async def execute_prepared_command(self, command: PlaywrightCommand) -> Coroutine[Any, Any, PlaywrightResult]:
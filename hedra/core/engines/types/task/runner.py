@@ -15,7 +15,7 @@ from hedra.core.engines.types.common.base_result import BaseResult
 from hedra.core.hooks.types.base.simple_context import SimpleContext
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
-    Trace
+    SpanRecord
 )
 
 from .task import Task
@@ -60,7 +60,7 @@ class MercuryTaskRunner(BaseEngine[Task, Union[BaseResult, TaskResult]]):
         self.pool.reset_connections = False
         self.pool.create_pool = lambda: None
 
-        self.sem = asyncio.Semaphore(value=concurrency)
+        self.sem = Semaphore(value=concurrency)
         self.active = 0
         self.waiter = None
         self.tracing_session: TraceSession = tracing_session
@@ -71,44 +71,38 @@ class MercuryTaskRunner(BaseEngine[Task, Union[BaseResult, TaskResult]]):
         self.pool.reset_connections = False
         self.pool.create_pool = lambda: None
 
-        self.sem = asyncio.Semaphore(value=concurrency)
+        self.concurrency = concurrency
+        self.sem = Semaphore(value=concurrency)
 
     def extend_pool(self, increased_capacity: int):
         self.concurrency += increased_capacity
-        self.sem = Semaphore(self.concurrency)
+        self.pool.size = self.concurrency
+        self.sem.extend(increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
         self.concurrency -= decrease_capacity
-        self.sem = Semaphore(self.concurrency)
+        self.pool.size = self.concurrency
+        self.sem.shrink(decrease_capacity)
 
     async def execute_prepared_request(self, task: Task) -> Coroutine[Any, Any, Union[BaseResult, TaskResult]]:
 
-        trace: Union[Trace, None] = None
+        trace: Union[SpanRecord, None] = None
         if self.tracing_session:
-            trace = self.tracing_session.create_trace()
-            await trace.on_request_start(task)
+            trace = self.tracing_session.create_trace(task)
 
         result = None
         wait_start = time.monotonic()
         self.active += 1
 
-        if trace and trace.on_connection_queued_start:
-            await trace.on_connection_queued_start(
-                trace.span,
-                task,
-                result
-            )
+        if trace:
+            trace.record('on_connection_queued_start')
 
         start = 0
  
         async with self.sem:
 
-            if trace and trace.on_connection_queued_end:
-                await trace.on_connection_queued_end(
-                    trace.span,
-                    task,
-                    result
-                )
+            if trace:
+                trace.record('on_connection_queued_end')
             
             try:
 
@@ -122,12 +116,8 @@ class MercuryTaskRunner(BaseEngine[Task, Union[BaseResult, TaskResult]]):
 
                 start = time.monotonic()
 
-                if trace and trace.on_task_start:
-                    await trace.on_task_start(
-                        trace.span,
-                        task,
-                        result
-                    )
+                if trace:
+                    trace.record('on_task_start')
 
                 result: BaseResult = await task.execute(**{
                     name: value for name, value in task.task_args.items() if name in task.params
@@ -160,14 +150,13 @@ class MercuryTaskRunner(BaseEngine[Task, Union[BaseResult, TaskResult]]):
                 result.complete = time.monotonic()
                 result.error = str(e)
 
-                if trace and trace.on_task_error:
-                    await trace.on_task_error(
-                        trace.span,
-                        task,
-                        result
-                    )
+                if trace:
+                    trace.record('on_task_error')
 
             self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(result)
+
             if self.waiter and self.active <= self.concurrency:
 
                 try:
@@ -177,14 +166,12 @@ class MercuryTaskRunner(BaseEngine[Task, Union[BaseResult, TaskResult]]):
                 except asyncio.InvalidStateError:
                     self.waiter = None
 
-            if trace and trace.on_task_end:
-                await trace.on_task_end(
-                    trace.span,
-                    task,
-                    result
-                )
+            if trace:
+                trace.record('on_task_end')
+                trace.on_request_end(result)
 
             return result
 
     async def close(self):
-        pass
+        if self.tracing_session:
+            await self.tracing_session.close()
@@ -0,0 +1,111 @@
+import asyncio
+from collections import deque
+from typing import Deque, Union
+from .span_record import SpanRecord
+from .trace import Trace
+
+
+class SpanExporter:
+
+    '''
+    Buffers finished span records and builds their spans in batches on
+    a background task, off the request path. Once the buffer holds
+    `max_queue_size` records, new records are dropped and counted rather
+    than slowing requests down.
+    '''
+
+    __slots__ = (
+        'trace',
+        'batch_size',
+        'flush_interval',
+        'max_queue_size',
+        'records',
+        'dropped',
+        'exported',
+        'batch_ready',
+        'export_task'
+    )
+
+    def __init__(
+        self,
+        trace: Trace,
+        batch_size: int=512,
+        flush_interval: float=1,
+        max_queue_size: int=8192
+    ) -> None:
+        self.trace = trace
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.records: Deque[SpanRecord] = deque()
+        self.dropped = 0
+        self.exported = 0
+        self.batch_ready: Union[asyncio.Event, None] = None
+        self.export_task: Union[asyncio.Task, None] = None
+
+    def submit(self, span_record: SpanRecord):
+
+        if len(self.records) >= self.max_queue_size:
+            self.dropped += 1
+            return
+
+        self.records.append(span_record)
+
+        if self.export_task is None:
+            self.batch_ready = asyncio.Event()
+            self.export_task = asyncio.create_task(
+                self._run_exports()
+            )
+
+        elif len(self.records) >= self.batch_size:
+            self.batch_ready.set()
+
+    async def _run_exports(self):
+        while True:
+
+            try:
+                await asyncio.wait_for(
+                    self.batch_ready.wait(),
+                    timeout=self.flush_interval
+                )
+
+            except asyncio.TimeoutError:
+                pass
+
+            self.batch_ready.clear()
+            await self.flush()
+
+    async def flush(self):
+        while self.records:
+            batch_size = min(
+                self.batch_size,
+                len(self.records)
+            )
+
+            for _ in range(batch_size):
+                span_record = self.records.popleft()
+
+                try:
+                    await self.trace.export(span_record)
+                    self.exported += 1
+
+                except Exception:
+                    # A failing signal or exporter loses its span, not
+                    # the request it traced.
+                    self.dropped += 1
+
+            # Give requests the loop back between batches.
+            await asyncio.sleep(0)
+
+    async def close(self):
+        if self.export_task and not self.export_task.done():
+            self.export_task.cancel()
+
+            try:
+                await self.export_task
+
+            except asyncio.CancelledError:
+                pass
+
+        self.export_task = None
+        await self.flush()
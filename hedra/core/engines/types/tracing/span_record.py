@@ -0,0 +1,59 @@
+from __future__ import annotations
+import time
+from typing import (
+    Any, 
+    List, 
+    Tuple, 
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:
+    from .span_exporter import SpanExporter
+
+
+class SpanRecord:
+
+    '''
+    Timestamps captured for one sampled request. Recording is a list
+    append so it stays cheap on the request path. The span itself is
+    built later by the session's exporter.
+    '''
+
+    __slots__ = (
+        'request',
+        'response',
+        'start',
+        'end',
+        'events',
+        'exporter'
+    )
+
+    def __init__(
+        self,
+        request: Any,
+        exporter: SpanExporter
+    ) -> None:
+        self.request = request
+        self.response: Any = None
+        self.start = time.time_ns()
+        self.end: int = None
+        self.events: List[Tuple[str, int]] = []
+        self.exporter = exporter
+
+    def record(self, event_name: str) -> None:
+        self.events.append((
+            event_name,
+            time.time_ns()
+        ))
+
+    def on_request_exception(self, response: Any) -> None:
+        self.response = response
+        self.record('on_request_exception')
+
+    def on_request_end(self, response: Any) -> None:
+        if self.end is not None:
+            return
+
+        self.response = response
+        self.end = time.time_ns()
+        self.exporter.submit(self)
@@ -1,14 +1,14 @@
 from __future__ import annotations
+from hedra.core.engines.types.common.types import RequestTypes
 from hedra.versioning.flags.types.unstable.flag import unstable
 from typing import Optional, Dict, Union
 from .tracing_types import (
-    Request,
-    Response,
     RequestHook,
     ResponseHook,
     TraceSignal,
     UrlFilter
 )
+from .span_record import SpanRecord
 from .url_filters import default_params_strip_filter
 
 
@@ -17,12 +17,10 @@ def skip_import(*args, **kwargs):
 
 try:
     from opentelemetry import context as context_api
-    from opentelemetry import trace
     from opentelemetry.instrumentation.utils import (
         _SUPPRESS_INSTRUMENTATION_KEY,
         http_status_to_status_code
     )
-    from opentelemetry.propagate import inject
     from opentelemetry.semconv.trace import SpanAttributes
     from opentelemetry.trace import SpanKind,  get_tracer, Span
     from opentelemetry.trace.status import Status, StatusCode
@@ -30,10 +28,8 @@ try:
 
 except ImportError:
     context_api = object
-    trace = object
     _SUPPRESS_INSTRUMENTATION_KEY=None
     http_status_to_status_code = skip_import
-    inject = skip_import
     SpanAttributes = object
     SpanKind = object
     get_tracer = skip_import
@@ -60,8 +56,6 @@ class Trace:
 
     __slots__ = (
         'tracer',
-        'span',
-        'token',
         'allowed_traces',
         'url_filter',
         'request_hook',
@@ -84,8 +78,7 @@ class Trace:
         'on_dns_cache_miss',
         'on_task_start',
         'on_task_end',
-        'on_task_error',
-        '_context_active'
+        'on_task_error'
     )
 
     def __init__(
@@ -170,9 +163,6 @@ class Trace:
         self.on_task_error = on_task_error
 
         self.tracer = get_tracer(__name__, __version__, None)
-        self.span: Span = None
-        self.token: object = None
-        self._context_active = False
 
     def trace_config_ctx(
         self,
@@ -241,100 +231,83 @@ class Trace:
                 trace_signal
             )
 
-    async def on_request_start(
-        self,
-        request: Request,
-    ):
+    async def export(self, span_record: SpanRecord) -> None:
         if context_api.get_value(_SUPPRESS_INSTRUMENTATION_KEY):
-            self.span = None
             return
 
-        http_method = request.method.upper()
-        request_span_name = f"HTTP {http_method}"
+        request = span_record.request
+        response = span_record.response
 
-        request_url = request.url.full
+        span_attributes = {}
+
+        if request.type == RequestTypes.TASK:
+            request_span_name = f"TASK {request.name}"
 
-        if callable(self.url_filter):
-            request_url = (
-                remove_url_credentials(
-                    self.url_filter(request.url)
-                )
-            )
-        
         else:
-            remove_url_credentials(request.url.full)
+            http_method = request.method.upper()
+            request_span_name = f"HTTP {http_method}"
 
-        span_attributes = {
-            SpanAttributes.HTTP_METHOD: http_method,
-            SpanAttributes.HTTP_URL: request_url,
-        }
+            request_url = request.url.full
 
-        self.span = self.tracer.start_span(
-            request_span_name, kind=SpanKind.CLIENT, attributes=span_attributes
+            if callable(self.url_filter):
+                request_url = (
+                    remove_url_credentials(
+                        self.url_filter(request.url)
+                    )
+                )
+            
+            else:
+                request_url = remove_url_credentials(request.url.full)
+
+            span_attributes = {
+                SpanAttributes.HTTP_METHOD: http_method,
+                SpanAttributes.HTTP_URL: request_url,
+            }
+
+        span: Span = self.tracer.start_span(
+            request_span_name, 
+            kind=SpanKind.CLIENT, 
+            attributes=span_attributes,
+            start_time=span_record.start
         )
 
         if callable(self.request_hook):
-            self.request_hook(self.span, request)
+            self.request_hook(span, request)
 
-        self.token = context_api.attach(
-            trace.set_span_in_context(self.span)
-        )
+        # Phases were timestamped on the request path. Signals run here,
+        # after the request completed, against the final response.
+        for event_name, timestamp in span_record.events:
+            span.add_event(event_name, timestamp=timestamp)
 
-        self._context_active = True
+            trace_signal: Union[TraceSignal, None] = getattr(self, event_name, None)
+            if trace_signal:
+                await trace_signal(span, request, response)
 
-        inject(request.headers)
+        status = getattr(response, 'status', None)
 
-    async def on_request_end(
-        self,
-        response: Response,
-    ):
-        if self.span is None:
-            return
-
-        if callable(self.response_hook):
-            self.response_hook(self.span, response)
+        if span.is_recording() and response.error:
 
-        if self.span.is_recording() and response.status:
-            self.span.set_status(
-                Status(
-                    http_status_to_status_code(response.status)
+            if status:
+                span.set_status(
+                    Status(StatusCode.ERROR)
                 )
-            )
 
-            self.span.set_attribute(
-                SpanAttributes.HTTP_STATUS_CODE, response.status
+            span.record_exception(
+                str(response.error)
             )
 
-        self._end_trace()
-
-    async def on_request_exception(
-        self,
-        response: Response,
-    ) -> None:
-        if self.span is None:
-            return
-
-        if self.span.is_recording() and response.error:
-
-            if response.status:
-                self.span.set_status(
-                    Status(StatusCode.ERROR)
+        elif span.is_recording() and status:
+            span.set_status(
+                Status(
+                    http_status_to_status_code(status)
                 )
+            )
 
-            self.span.record_exception(
-                str(response.error)
+            span.set_attribute(
+                SpanAttributes.HTTP_STATUS_CODE, status
             )
 
         if callable(self.response_hook):
-            self.response_hook(self.span, response)
-
-        self._end_trace()
-    
-    def _end_trace(self) -> None:
-        # context = context_api.get_current()
-
-        if self._context_active:
-            context_api.detach(self.token)
-            self._context_active = False
+            self.response_hook(span, response)
 
-            self.span.end()
+        span.end(end_time=span_record.end)
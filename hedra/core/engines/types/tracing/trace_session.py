@@ -1,5 +1,9 @@
+import random
+from collections import defaultdict
 from hedra.versioning.flags.types.unstable.flag import unstable
-from typing import Dict
+from typing import Any, Dict, Union
+from .span_exporter import SpanExporter
+from .span_record import SpanRecord
 from .trace import Trace
 from .tracing_types import (
     RequestHook,
@@ -16,11 +20,20 @@ __version__ = "0.7.12"
 @unstable
 class TraceSession:
 
+    '''
+    Decides, when each request starts, whether it is traced, and hands
+    the spans of traced requests to a batched exporter.
+
+    A `sample_every` above zero traces every Nth request of each action.
+    Otherwise each request is traced with probability `sample_rate`.
+    '''
+
     __slots__ = (
-        'url_filter',
-        'request_hook',
-        'response_hook',
-        'trace_signals'
+        'trace',
+        'exporter',
+        'sample_rate',
+        'sample_every',
+        'sample_counts'
     )
 
     def __init__(
@@ -28,22 +41,47 @@ class TraceSession:
         url_filter: UrlFilter = None,
         request_hook: RequestHook = None,
         response_hook: ResponseHook = None,
+        sample_rate: float = 1,
+        sample_every: int = 0,
+        batch_size: int = 512,
+        flush_interval: float = 1,
+        max_queue_size: int = 8192,
         **kwargs: Dict[str, TraceSignal]
     ) -> None:
-        self.url_filter: UrlFilter = url_filter
-        self.request_hook: RequestHook = request_hook
-        self.response_hook: ResponseHook = response_hook
-        self.trace_signals: Dict[str, TraceSignal] = kwargs
-
-    def create_trace(self) -> Trace:
-
-        return Trace(
-            url_filter=self.url_filter,
-            request_hook=self.request_hook,
-            response_hook=self.response_hook,
-            **self.trace_signals
+        self.trace = Trace(
+            url_filter=url_filter,
+            request_hook=request_hook,
+            response_hook=response_hook,
+            **kwargs
+        )
+
+        self.exporter = SpanExporter(
+            self.trace,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            max_queue_size=max_queue_size
         )
 
+        self.sample_rate = sample_rate
+        self.sample_every = sample_every
+        self.sample_counts: Dict[str, int] = defaultdict(int)
 
+    def create_trace(self, request: Any) -> Union[SpanRecord, None]:
 
+        if self.sample_every > 0:
+            request_count = self.sample_counts[request.name]
+            self.sample_counts[request.name] = request_count + 1
+
+            if request_count % self.sample_every != 0:
+                return None
+
+        elif self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return None
+
+        return SpanRecord(
+            request,
+            self.exporter
+        )
 
+    async def close(self):
+        await self.exporter.close()
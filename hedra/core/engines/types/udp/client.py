@@ -3,6 +3,7 @@ import time
 import uuid
 from typing import Dict, Coroutine, Any
 from hedra.core.engines.types.common.base_engine import BaseEngine
+from hedra.core.engines.types.common.concurrency import Semaphore
 from hedra.core.engines.types.common.ssl import get_default_ssl_context
 from hedra.core.engines.types.common.timeouts import Timeouts
 from .connection import UDPConnection
@@ -38,7 +39,7 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
         self._hosts = {}
         self.closed = False
 
-        self.sem = asyncio.Semaphore(value=concurrency)
+        self.sem = Semaphore(value=concurrency)
         self.pool = Pool(concurrency, reset_connections=reset_connections)
         self.pool.create_pool()
         self.active = 0
@@ -58,7 +59,7 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
         }
     
     async def set_pool(self, concurrency: int):
-        self.sem = asyncio.Semaphore(value=concurrency)
+        self.sem = Semaphore(value=concurrency)
         self.pool = Pool(concurrency, reset_connections=self.pool.reset_connections)
         self.pool.create_pool()
 
@@ -123,12 +124,12 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
                 UDPConnection(self.pool.reset_connections)
             )
         
-        self.sem = asyncio.Semaphore(self.pool.size)
+        self.sem.extend(increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
         self.pool.size -= decrease_capacity
         self.pool.connections = self.pool.connections[:self.pool.size]
-        self.sem = asyncio.Semaphore(self.pool.size)
+        self.sem.shrink(decrease_capacity)
 
     async def execute_prepared_request(self, action: UDPAction) -> Coroutine[Any, Any, UDPResult]:
  
@@ -152,10 +153,12 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
 
                 response.start = time.monotonic()
 
+                ip_addr, socket_config = action.url.select_address(connection)
+
                 await connection.make_connection(
-                    action.url.ip_addr,
+                    ip_addr,
                     action.url.port,
-                    action.url.socket_config,
+                    socket_config,
                     timeout=self.timeouts.connect_timeout
                 )
 
@@ -202,6 +205,9 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
                 self.pool.connections.append(UDPConnection(reset_connection=self.pool.reset_connections))
 
             self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(response)
+
             if self.waiter and self.active <= self.pool.size:
 
                 try:
@@ -6,7 +6,11 @@ from .utils import (
     pack_hostname,
     create_sec_websocket_key
 )
-from .constants import WEBSOCKETS_VERSION
+from .constants import (
+    WEBSOCKETS_VERSION,
+    OPCODE_BINARY,
+    OPCODE_TEXT
+)
 
 
 class WebsocketAction(HTTPAction):
@@ -39,6 +43,20 @@ class WebsocketAction(HTTPAction):
         self.type = RequestTypes.WEBSOCKET
         self.hooks: Hooks[WebsocketAction] = Hooks()
 
+    @property
+    def opcode(self) -> int:
+        if isinstance(self._data, (bytes, bytearray)):
+            return OPCODE_BINARY
+
+        return OPCODE_TEXT
+
+    def _setup_data(self):
+        if isinstance(self._data, (bytes, bytearray)):
+            self.encoded_data = bytes(self._data)
+
+        else:
+            super()._setup_data()
+
     def _setup_headers(self):
 
         for header_name, header_value in self._headers.items():
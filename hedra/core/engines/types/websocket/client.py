@@ -3,10 +3,12 @@ import asyncio
 import uuid
 from typing import Dict, Coroutine, Any
 from hedra.core.engines.types.common.timeouts import Timeouts
+from hedra.core.engines.types.common.concurrency import Semaphore
 from hedra.core.engines.types.common.base_engine import BaseEngine
 from hedra.core.engines.types.common.ssl import get_default_ssl_context
 from .connection import WebsocketConnection
 from .pool import Pool
+from .session import WebsocketSession
 from .action import WebsocketAction
 from .result import WebsocketResult
 from .utils import get_header_bits, get_message_buffer_size
@@ -28,7 +30,17 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
     )
 
 
-    def __init__(self, concurrency: int = 10 ** 3, timeouts: Timeouts = Timeouts(), reset_connections: bool=False) -> None:
+    def __init__(
+        self, 
+        concurrency: int = 10 ** 3, 
+        timeouts: Timeouts = Timeouts(), 
+        reset_connections: bool=False,
+        session_window: int=0
+    ) -> None:
+        super(
+            MercuryWebsocketClient,
+            self
+        ).__init__()
         
         self.session_id = str(uuid.uuid4())
         self.timeouts = timeouts
@@ -37,8 +49,12 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
         self._hosts = {}
         self.closed = False
 
-        self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = Pool(concurrency, reset_connections=reset_connections)
+        self.sem = Semaphore(value=concurrency)
+        self.pool = Pool(
+            concurrency, 
+            reset_connections=reset_connections,
+            session_window=session_window
+        )
         self.pool.create_pool()
         self.active = 0
         self.waiter = None
@@ -53,12 +69,17 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
                 'socket_read_timeout': self.timeouts.socket_read_timeout,
                 'total_timeout': self.timeouts.total_timeout
             },
-            'reset_connections': self.pool.reset_connections
+            'reset_connections': self.pool.reset_connections,
+            'session_window': self.pool.session_window
         }
     
     async def set_pool(self, concurrency: int):
-        self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = Pool(concurrency, reset_connections=self.pool.reset_connections)
+        self.sem = Semaphore(value=concurrency)
+        self.pool = Pool(
+            concurrency, 
+            reset_connections=self.pool.reset_connections,
+            session_window=self.pool.session_window
+        )
         self.pool.create_pool()
 
     
@@ -69,12 +90,12 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
                 WebsocketConnection(self.pool.reset_connections)
             )
         
-        self.sem = asyncio.Semaphore(self.pool.size)
+        self.sem.extend(increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
         self.pool.size -= decrease_capacity
         self.pool.connections = self.pool.connections[:self.pool.size]
-        self.sem = asyncio.Semaphore(self.pool.size)
+        self.sem.shrink(decrease_capacity)
         
     async def prepare(self, action: WebsocketAction) -> Coroutine[Any, Any, None]:
         try:
@@ -131,6 +152,8 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
             raise e
 
     async def execute_prepared_request(self, action: WebsocketAction) -> Coroutine[Any, Any, WebsocketResult]:
+        if self.pool.uses_sessions:
+            return await self.execute_session_request(action)
 
         response = WebsocketResult(action)
         response.wait_start = time.monotonic()
@@ -153,10 +176,13 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
 
                 response.start = time.monotonic()
 
+                ip_addr, socket_config = action.url.select_address(connection)
+
                 await connection.make_connection(
-                    action.name,
-                    action.url.ip_addr,
+                    action.url.hostname,
+                    ip_addr,
                     action.url.port,
+                    socket_config,
                     ssl=action.ssl_context,
                     timeout=self.timeouts.connect_timeout
                 )
@@ -220,6 +246,100 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
                 )
 
             self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(response)
+
+            if self.waiter and self.active <= self.pool.size:
+
+                try:
+                    self.waiter.set_result(None)
+                    self.waiter = None
+
+                except asyncio.InvalidStateError:
+                    self.waiter = None 
+
+            return response
+
+    async def execute_session_request(self, action: WebsocketAction) -> Coroutine[Any, Any, WebsocketResult]:
+
+        response = WebsocketResult(action)
+        response.wait_start = time.monotonic()
+        self.active += 1
+
+        async with self.sem:
+
+            session: WebsocketSession = self.pool.acquire_session(action.url.host_key)
+
+            try:
+
+                if action.hooks.listen:
+                    event = asyncio.Event()
+                    action.hooks.channel_events.append(event)
+                    await event.wait()
+
+                if action.hooks.before:
+                    action = await self.execute_before(action)
+                    action.setup()
+
+                response.start = time.monotonic()
+
+                await session.connect(action, self.timeouts)
+
+                response.connect_end = time.monotonic()
+
+                # Actions without data listen for the next message on
+                # the session.
+                if action.encoded_data is None:
+                    waiter = session.receive()
+
+                else:
+                    waiter = session.send(action)
+
+                response.write_end = time.monotonic()
+
+                try:
+                    response.body = await asyncio.wait_for(
+                        waiter,
+                        self.timeouts.total_timeout
+                    )
+
+                except asyncio.TimeoutError:
+                    session.cancel()
+                    raise Exception('Websocket message timed out.')
+
+                response.complete = time.monotonic()
+                response.response_code = session.handshake_status
+                response.headers = session.handshake_headers
+
+                if action.hooks.after:
+                    response = await self.execute_after(action, response)
+                    action.setup()
+
+                if action.hooks.notify:
+                    await asyncio.gather(*[
+                        asyncio.create_task(
+                            channel.call(response, action.hooks.listeners)
+                        ) for channel in action.hooks.channels
+                    ])
+
+                    for listener in action.hooks.listeners: 
+                        if len(listener.hooks.channel_events) > 0:
+                            listener.setup()
+                            event = listener.hooks.channel_events.pop()
+                            if not event.is_set():
+                                event.set()   
+
+            except Exception as e:
+                response.complete = time.monotonic()
+                response.error = str(e)
+
+            finally:
+                await self.pool.release_session(session)
+
+            self.active -= 1
+            if self.concurrency_controller:
+                self.update_concurrency(response)
+
             if self.waiter and self.active <= self.pool.size:
 
                 try:
@@ -8,4 +8,7 @@ class WebsocketConnection(HTTPConnection):
         super().__init__(reset_connection)
 
     def iter_headers(self):
-        return self.reader.iter_headers()
\ No newline at end of file
+        return self.reader.iter_headers()
+
+    def read_exactly(self, n_bytes: int):
+        return self.reader.read_exactly(n_bytes)
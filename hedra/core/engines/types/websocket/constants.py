@@ -1,2 +1,11 @@
 WEBSOCKETS_VERSION = 13
-HEADER_LENGTH_INDEX = 6
\ No newline at end of file
+HEADER_LENGTH_INDEX = 6
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+CLOSE_NORMAL = 1000
@@ -1,6 +1,8 @@
-
-from typing import List
+import math
+from collections import defaultdict
+from typing import Dict, List
 from .connection import WebsocketConnection
+from .session import WebsocketSession
 
 
 class Pool:
@@ -8,20 +10,92 @@ class Pool:
     __slots__ = (
         'size',
         'connections',
-        'reset_connections'
+        'reset_connections',
+        'session_window',
+        'sessions'
     )
 
-    def __init__(self, size: int, reset_connections: bool = False) -> None:
+    def __init__(
+        self,
+        size: int,
+        reset_connections: bool = False,
+        session_window: int = 0
+    ) -> None:
         self.size = size
         self.connections: List[WebsocketConnection] = []
         self.reset_connections = reset_connections
 
+        # When set, actions to each host share long-lived sessions with
+        # up to this many messages in flight each, instead of upgrading
+        # a new connection per action.
+        self.session_window = session_window
+        self.sessions: Dict[str, List[WebsocketSession]] = defaultdict(list)
+
+    @property
+    def uses_sessions(self) -> bool:
+        return self.session_window > 0
+
+    @property
+    def max_sessions(self) -> int:
+        return max(
+            math.ceil(self.size/self.session_window),
+            1
+        )
+
     def create_pool(self) -> None:
+
+        if self.uses_sessions:
+            # Sessions are opened on first use per host.
+            return
+
         for _ in range(self.size):
             self.connections.append(
                 WebsocketConnection(self.reset_connections)
             )
 
+    def acquire_session(self, host_key: str) -> WebsocketSession:
+        host_sessions = self.sessions[host_key]
+
+        available = [
+            session for session in host_sessions if session.available
+        ]
+
+        if len(available) > 0 and (
+            len(host_sessions) >= self.max_sessions or min(
+                session.pending for session in available
+            ) == 0
+        ):
+            session = min(
+                available,
+                key=lambda session: session.pending
+            )
+
+        else:
+            session = WebsocketSession(
+                host_key,
+                self.session_window,
+                reset_connection=self.reset_connections
+            )
+
+            host_sessions.append(session)
+
+        session.pending += 1
+
+        return session
+
+    async def release_session(self, session: WebsocketSession):
+        session.pending -= 1
+
+        host_sessions = self.sessions[session.host_key]
+
+        if session.failed and session.pending == 0 and session in host_sessions:
+            host_sessions.remove(session)
+            await session.close()
+
     async def close(self):
         for connection in self.connections:
             await connection.close()
+
+        for host_sessions in self.sessions.values():
+            for session in host_sessions:
+                await session.close()
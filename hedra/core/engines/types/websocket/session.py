@@ -0,0 +1,291 @@
+import asyncio
+import struct
+from collections import deque
+from typing import Deque, Dict, Union
+from hedra.core.engines.types.common.timeouts import Timeouts
+from .action import WebsocketAction
+from .connection import WebsocketConnection
+from .constants import (
+    OPCODE_CONTINUATION,
+    OPCODE_CLOSE,
+    OPCODE_PING,
+    OPCODE_PONG,
+    CLOSE_NORMAL
+)
+from .utils import WebsocketMask, encode_frame
+
+
+class WebsocketSession:
+
+    '''
+    A WebSocket connection upgraded once and kept open for many
+    messages. Up to `window` messages may be in flight at once. Each
+    send waits on the next message received, in the order they were
+    sent, so a session measures message throughput and per-message
+    latency rather than handshake cost.
+
+    All frames on a session are masked with one precomputed key and
+    encoded frames are cached per payload, so resending an action's
+    message is a single socket write.
+    '''
+
+    __slots__ = (
+        'connection',
+        'host_key',
+        'window',
+        'mask',
+        'frames',
+        'waiters',
+        'pending',
+        'messages',
+        'reader_task',
+        'handshake_status',
+        'handshake_headers',
+        'failed',
+        'lock'
+    )
+
+    max_cached_frames = 256
+    max_buffered_messages = 1024
+
+    def __init__(
+        self,
+        host_key: str,
+        window: int,
+        reset_connection: bool=False
+    ) -> None:
+        self.connection = WebsocketConnection(reset_connection=reset_connection)
+        self.host_key = host_key
+        self.window = window
+        self.mask = WebsocketMask()
+        self.frames: Dict[bytes, bytes] = {}
+        self.waiters: Deque[asyncio.Future] = deque()
+
+        # Actions holding a slot on this session, counted from the pool
+        # handing the session out rather than from the message being
+        # sent, so actions still waiting to connect are balanced too.
+        self.pending = 0
+        self.messages: Deque[bytes] = deque(maxlen=self.max_buffered_messages)
+        self.reader_task: Union[asyncio.Task, None] = None
+        self.handshake_status: Union[bytes, None] = None
+        self.handshake_headers: Dict[bytes, bytes] = {}
+        self.failed = False
+        self.lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self.handshake_status is not None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self.waiters)
+
+    @property
+    def available(self) -> bool:
+        return self.failed is False and self.pending < self.window
+
+    async def connect(
+        self,
+        action: WebsocketAction,
+        timeouts: Timeouts
+    ) -> bool:
+
+        async with self.lock:
+
+            if self.connected:
+                return False
+
+            try:
+                ip_addr, socket_config = action.url.select_address(self.connection)
+
+                await self.connection.make_connection(
+                    action.url.hostname,
+                    ip_addr,
+                    action.url.port,
+                    socket_config,
+                    ssl=action.ssl_context,
+                    timeout=timeouts.connect_timeout
+                )
+
+                self.connection.write(action.encoded_headers)
+
+                status = await asyncio.wait_for(
+                    self.connection.readuntil(),
+                    timeouts.socket_read_timeout
+                )
+
+                headers = await asyncio.wait_for(
+                    self.connection.read_headers(),
+                    timeouts.socket_read_timeout
+                )
+
+            except Exception as connection_error:
+                self.failed = True
+                raise connection_error
+
+            status_line = status.split()
+            if len(status_line) < 2 or status_line[1] != b'101':
+                self.failed = True
+                raise Exception(f'Websocket upgrade failed - {status.strip().decode(errors="ignore")}')
+
+            self.handshake_status = status.strip()
+            self.handshake_headers = headers
+            self.reader_task = asyncio.create_task(self._read_frames())
+
+            return True
+
+    def send(self, action: WebsocketAction) -> asyncio.Future:
+        waiter = self.receive()
+
+        payload = action.encoded_data
+        if isinstance(payload, list):
+            payload = b''.join(payload)
+
+        frame = self.frames.get(payload)
+        if frame is None:
+
+            if len(self.frames) >= self.max_cached_frames:
+                self.frames.clear()
+
+            frame = encode_frame(payload, action.opcode, self.mask)
+            self.frames[payload] = frame
+
+        self.connection.write(frame)
+
+        return waiter
+
+    def receive(self) -> asyncio.Future:
+        waiter = asyncio.get_event_loop().create_future()
+
+        if self.messages:
+            waiter.set_result(
+                self.messages.popleft()
+            )
+
+        else:
+            self.waiters.append(waiter)
+
+        return waiter
+
+    def cancel(self):
+        # Replies are matched to waiters in order, so once one is
+        # abandoned every later reply would be misattributed.
+        self._fail(Exception('Websocket session cancelled.'))
+
+    async def _read_frames(self):
+        connection = self.connection
+        fragments = bytearray()
+        fragmented = False
+
+        try:
+            while True:
+                header = await connection.read_exactly(2)
+
+                fin = header[0] & 0x80
+                opcode = header[0] & 0x0F
+                masked = header[1] & 0x80
+                payload_length = header[1] & 0x7F
+
+                if payload_length == 126:
+                    payload_length = struct.unpack(
+                        '!H',
+                        await connection.read_exactly(2)
+                    )[0]
+
+                elif payload_length == 127:
+                    payload_length = struct.unpack(
+                        '!Q',
+                        await connection.read_exactly(8)
+                    )[0]
+
+                mask = None
+                if masked:
+                    mask = WebsocketMask(
+                        await connection.read_exactly(4)
+                    )
+
+                payload = b''
+                if payload_length > 0:
+                    payload = await connection.read_exactly(payload_length)
+
+                if mask:
+                    payload = mask.apply(payload)
+
+                if opcode == OPCODE_PING:
+                    connection.write(
+                        encode_frame(payload, OPCODE_PONG, self.mask)
+                    )
+
+                elif opcode == OPCODE_PONG:
+                    continue
+
+                elif opcode == OPCODE_CLOSE:
+                    close_code = CLOSE_NORMAL
+                    if len(payload) >= 2:
+                        close_code = struct.unpack('!H', payload[:2])[0]
+
+                    raise Exception(f'Websocket closed by server - code {close_code}')
+
+                elif fin == 0 or (opcode == OPCODE_CONTINUATION and fragmented):
+                    fragments.extend(payload)
+                    fragmented = True
+
+                    if fin:
+                        self._deliver(bytes(fragments))
+                        fragments.clear()
+                        fragmented = False
+
+                else:
+                    self._deliver(payload)
+
+        except asyncio.CancelledError:
+            self._fail(Exception('Websocket session closed.'))
+
+        except Exception as error:
+            self._fail(error)
+
+    def _deliver(self, message: bytes):
+        while self.waiters:
+            waiter = self.waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(message)
+                return
+
+        self.messages.append(message)
+
+    def _fail(self, error: Exception):
+        self.failed = True
+
+        while self.waiters:
+            waiter = self.waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_exception(error)
+
+    async def close(self):
+        if self.connected and self.failed is False:
+            try:
+                self.connection.write(
+                    encode_frame(
+                        struct.pack('!H', CLOSE_NORMAL),
+                        OPCODE_CLOSE,
+                        self.mask
+                    )
+                )
+
+            except Exception:
+                pass
+
+        self.failed = True
+
+        if self.reader_task and not self.reader_task.done():
+            self.reader_task.cancel()
+
+            try:
+                await self.reader_task
+
+            except asyncio.CancelledError:
+                pass
+
+        await self.connection.close()
@@ -1,10 +1,75 @@
 import os
 import struct
-from typing import Tuple
+from typing import Dict, Tuple
 from base64 import encodebytes as base64encode
 from .connection import WebsocketConnection
 from .constants import HEADER_LENGTH_INDEX
 
+
+class WebsocketMask:
+
+    '''
+    A client masking key with the repeated key precomputed as an integer
+    per payload length, so masking a payload is a single integer XOR
+    instead of a Python loop over each byte.
+    '''
+
+    __slots__ = (
+        'key',
+        '_repeated_keys'
+    )
+
+    max_cached_lengths = 256
+
+    def __init__(self, key: bytes=None) -> None:
+        self.key = key or os.urandom(4)
+        self._repeated_keys: Dict[int, int] = {}
+
+    def apply(self, payload: bytes) -> bytes:
+        payload_length = len(payload)
+
+        if payload_length == 0:
+            return b''
+
+        repeated_key = self._repeated_keys.get(payload_length)
+        if repeated_key is None:
+
+            if len(self._repeated_keys) >= self.max_cached_lengths:
+                self._repeated_keys.clear()
+
+            repeated_key = int.from_bytes(
+                (self.key * (payload_length//4 + 1))[:payload_length],
+                'big'
+            )
+
+            self._repeated_keys[payload_length] = repeated_key
+
+        return (
+            int.from_bytes(payload, 'big') ^ repeated_key
+        ).to_bytes(payload_length, 'big')
+
+
+def encode_frame(payload: bytes, opcode: int, mask: WebsocketMask) -> bytes:
+    frame = bytearray([0x80 | opcode])
+
+    payload_length = len(payload)
+    if payload_length < 126:
+        frame.append(0x80 | payload_length)
+
+    elif payload_length < 65536:
+        frame.append(0x80 | 126)
+        frame.extend(struct.pack('!H', payload_length))
+
+    else:
+        frame.append(0x80 | 127)
+        frame.extend(struct.pack('!Q', payload_length))
+
+    frame.extend(mask.key)
+    frame.extend(mask.apply(payload))
+
+    return bytes(frame)
+
+
 def create_sec_websocket_key():
     randomness = os.urandom(16)
     return base64encode(randomness).decode('utf-8').strip()
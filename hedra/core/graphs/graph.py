@@ -14,6 +14,8 @@ from typing import (
     Union
 )
 from hedra.core.graphs.stages.base.exceptions.process_killed_error import ProcessKilledError
+from hedra.core.engines.types.common.shared_columnar_results import SharedColumnarResults
+from hedra.core.graphs.stages.base.parallel.batch_executor import BatchExecutor
 from hedra.core.graphs.stages.base.stage import Stage
 from hedra.core.graphs.stages.types.stage_types import StageTypes
 from hedra.core.graphs.transitions.transition_group import TransitionGroup
@@ -394,6 +396,9 @@ class Graph:
             for executor in transition_group._executors:
                 executor.close()
 
+        BatchExecutor.close_persistent_pools()
+        SharedColumnarResults.unlink_all()
+
     def _append_stage(self, stage_type: StageTypes):
 
         appended_stage = self.stage_types.get(stage_type)
@@ -12,6 +12,7 @@ from typing import Union, List, Dict, Any, Tuple
 from hedra.core.engines.client.config import Config
 from hedra.core.engines.types.common.base_result import BaseResult
 from hedra.core.engines.types.common.results_set import ResultsSet
+from hedra.core.engines.types.common.shared_columnar_results import SharedColumnarResults
 from hedra.core.graphs.stages.base.stage import Stage
 from hedra.core.graphs.stages.base.parallel.stage_priority import StagePriority
 from hedra.core.graphs.stages.types.stage_types import StageTypes
@@ -200,7 +201,11 @@ class Analyze(Stage):
             'analyze_stage_monitors'
         ]
 
-        all_results = list(analyze_stage_raw_results.items())
+        # Aggregated stages arrive already reduced, so only stages with
+        # raw results are partitioned across workers.
+        all_results = [
+            (stage_name, stage_results) for stage_name, stage_results in analyze_stage_raw_results.items() if stage_results.aggregates is None
+        ]
 
         total_group_results = 0
         for stage_results in analyze_stage_raw_results.values():
@@ -252,6 +257,9 @@ class Analyze(Stage):
 
         if analyze_stage_has_multiple_workers:
             for results_set_name, results_set in analyze_stage_raw_results.items():
+
+                if results_set.columnar_results or results_set.aggregates:
+                    continue
                 
                 results_set_copy = results_set.copy()
                 results_set_copy.results = await self._loop.run_in_executor(
@@ -308,6 +316,14 @@ class Analyze(Stage):
         stage_streamed_analytics: Dict[str, List[StreamAnalytics]] = {}
         analyze_stage_batch_configs = {}
         stage_personas = {}
+        stage_timing_sketches = {}
+
+        for stage_name, stage_results in analyze_stage_raw_results.items():
+            stage_total_times[stage_name] = stage_results.total_elapsed
+            stage_streamed_analytics[stage_name] = stage_results.stage_streamed_analytics
+            stage_batch_sizes[stage_name] = stage_results.stage_batch_size
+            stage_personas[stage_name] = stage_results.stage_persona_type
+            stage_timing_sketches[stage_name] = stage_results.stage_timing_sketches
 
         for stage_name, _, assigned_workers_count in analyze_stage_batches:
             
@@ -315,31 +331,31 @@ class Analyze(Stage):
 
             stage_results = analyze_stage_raw_results.get(stage_name)
             results = stage_results.results
-            stage_total_time = stage_results.total_elapsed
-            
-            stage_total_times[stage_name] = stage_total_time
-            stage_streamed_analytics[stage_name] = stage_results.stage_streamed_analytics
 
-            results_count = len(results)
-            
-            batch_size = int(results_count/assigned_workers_count)
-            
-            for worker_idx in range(assigned_workers_count):
+            if stage_results.columnar_results:
+                stage_batches.extend(
+                    stage_results.columnar_results.partition(assigned_workers_count)
+                )
 
-                batch_marker = worker_idx * batch_size
+            else:
+                results_count = len(results)
+                
+                batch_size = int(results_count/assigned_workers_count)
+                
+                for worker_idx in range(assigned_workers_count):
 
-                stage_batches.append(
-                    results[batch_marker:batch_marker + batch_size]
-                )
+                    batch_marker = worker_idx * batch_size
 
-            if results_count%assigned_workers_count > 0:
-                stage_batches[assigned_workers_count-1].extend(
-                    results[assigned_workers_count * batch_size:]
-                )
+                    stage_batches.append(
+                        results[batch_marker:batch_marker + batch_size]
+                    )
+
+                if results_count%assigned_workers_count > 0:
+                    stage_batches[assigned_workers_count-1].extend(
+                        results[assigned_workers_count * batch_size:]
+                    )
 
             analyze_stage_batch_configs[stage_name] = stage_batches
-            stage_batch_sizes[stage_name] = stage_results.stage_batch_size
-            stage_personas[stage_name] = stage_results.stage_persona_type
 
         return {
             'analyze_stage_target_stages': {},
@@ -347,7 +363,8 @@ class Analyze(Stage):
             'analyze_stage_total_times': stage_total_times,
             'analyze_stage_batch_sizes': stage_batch_sizes,
             'analyze_stage_personas': stage_personas,
-            'analyze_stage_streamed_analytics': stage_streamed_analytics
+            'analyze_stage_streamed_analytics': stage_streamed_analytics,
+            'analyze_stage_timing_sketches': stage_timing_sketches
         }
 
     @context('create_stage_batches')
@@ -356,7 +373,8 @@ class Analyze(Stage):
         analyze_stage_batches: List[Tuple[str, Any, int]]=[],
         analyze_stage_batch_configs: Dict[str, List[List[Any]]]=[],
         analyze_stage_metric_hook_names: List[str]=[],
-        analyze_stage_has_multiple_workers: bool=False
+        analyze_stage_has_multiple_workers: bool=False,
+        analyze_stage_timing_sketches: Dict[str, bool]={}
     ):
         if analyze_stage_has_multiple_workers:
             stage_configs = []
@@ -384,6 +402,7 @@ class Analyze(Stage):
                             'analyze_stage_name': stage_name,
                             'analyze_stage_metric_hooks': list(analyze_stage_metric_hook_names),
                             'analyze_stage_batched_results': batch,
+                            'analyze_stage_timing_sketches': analyze_stage_timing_sketches.get(stage_name, False),
                             'worker_id': worker_idx + 1
                         } for batch in analyze_stage_batch_configs[stage_name]
                     ]
@@ -433,6 +452,20 @@ class Analyze(Stage):
                 process_results_batch
             )
 
+            for results_set in analyze_stage_deserialized_results.values():
+                if results_set.aggregates:
+                    for events_group in results_set.aggregates.events.values():
+                        events_group.calculate_stats()
+
+                    stage_batch_results.append((
+                        results_set.stage,
+                        [
+                            {
+                                'events': results_set.aggregates.events
+                            }
+                        ]
+                    ))
+
             await self.logger.filesystem.aio['hedra.core'].debug(f'{self.metadata_string} - Completed parital results aggregation for - {analyze_stage_stages_count} - stages')
 
             return {
@@ -443,10 +476,38 @@ class Analyze(Stage):
             
 
             batch_results = []
-            events =  defaultdict(ProcessedResultsGroup)
 
             for results_set in analyze_stage_deserialized_results.values():
 
+                if results_set.aggregates:
+                    for events_group in results_set.aggregates.events.values():
+                        events_group.calculate_stats()
+
+                    batch_results.append(
+                        (results_set.stage, results_set.aggregates.events)
+                    )
+
+                    continue
+
+                events = defaultdict(
+                    functools.partial(
+                        ProcessedResultsGroup,
+                        timing_sketches=results_set.stage_timing_sketches
+                    )
+                )
+
+                columnar_results = results_set.columnar_results
+                if isinstance(columnar_results, SharedColumnarResults):
+                    columnar_results = columnar_results.load()
+
+                if columnar_results:
+                    for action_name in columnar_results.names:
+                        events[action_name].add_columnar_results(
+                            results_set.stage,
+                            columnar_results,
+                            action_name
+                        )
+
                 for stage_result in results_set.results:
                     events[stage_result.name].add(
                             results_set.stage,
@@ -483,21 +544,39 @@ class Analyze(Stage):
             stage_memory_monitor.stage_type = StageTypes.ANALYZE
 
             for stage_name, stage_results in analyze_stage_batch_results:
-                results = stage_results.pop()
 
-                worker_id = results.get('worker_id')
-                stage_events_set[stage_name] = results.get('events')
+                stage_events: Dict[str, ProcessedResultsGroup] = {}
 
-                monitors: Dict[str, MonitorResults] = results.get('monitoring', {})
-                cpu_monitor = monitors.get('cpu', {})
-                memory_monitor = monitors.get('memory', {})
-                
-                for monitor_name, collection_stats in cpu_monitor.items():
-                    stage_cpu_monitor.worker_metrics[worker_id][monitor_name] = collection_stats
-                    stage_cpu_monitor.collected[monitor_name].extend(collection_stats)
+                for results in stage_results:
+
+                    worker_id = results.get('worker_id')
+
+                    # Worker groups merge by summing counts and either
+                    # concatenating timings or merging sketch buckets.
+                    worker_events: Dict[str, ProcessedResultsGroup] = results.get('events', {})
+                    for events_group_name, events_group in worker_events.items():
+                        if events_group_name in stage_events:
+                            stage_events[events_group_name].merge(events_group)
+
+                        else:
+                            stage_events[events_group_name] = events_group
+
+                    monitors: Dict[str, MonitorResults] = results.get('monitoring', {})
+                    cpu_monitor = monitors.get('cpu', {})
+                    memory_monitor = monitors.get('memory', {})
+                    
+                    for monitor_name, collection_stats in cpu_monitor.items():
+                        stage_cpu_monitor.worker_metrics[worker_id][monitor_name] = collection_stats
+                        stage_cpu_monitor.collected[monitor_name].extend(collection_stats)
+
+                    for monitor_name, collection_stats in memory_monitor.items():
+                        stage_memory_monitor.worker_metrics[worker_id][monitor_name] = collection_stats
+
+                if len(stage_results) > 1:
+                    for events_group in stage_events.values():
+                        events_group.calculate_stats()
 
-                for monitor_name, collection_stats in memory_monitor.items():
-                    stage_memory_monitor.worker_metrics[worker_id][monitor_name] = collection_stats
+                stage_events_set[stage_name] = stage_events
 
             stage_cpu_monitor.aggregate_worker_stats()
             stage_memory_monitor.aggregate_worker_stats()
@@ -1,11 +1,14 @@
 
+import functools
 import time
 import threading
 import os
 import dill
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 from hedra.core.engines.types.common.base_result import BaseResult
+from hedra.core.engines.types.common.columnar_results import ColumnarResults
+from hedra.core.engines.types.common.shared_columnar_results import SharedColumnarResults
 from hedra.logging import (
     HedraLogger,
     LoggerTypes
@@ -66,11 +69,16 @@ def process_results_batch(config: Dict[str, Any]):
     metadata_string = f'Graph - {graph_name}:{graph_id} - thread:{thread_id} - process:{process_id} - Stage: {source_stage_name}:{source_stage_id} - '
 
     stage_name = config.get('analyze_stage_name')
-    results_batch: List[BaseResult] = config.get('analyze_stage_batched_results', [])
+    results_batch: Union[List[BaseResult], ColumnarResults, SharedColumnarResults] = config.get('analyze_stage_batched_results', [])
 
     try:
 
-        events =  defaultdict(ProcessedResultsGroup)
+        events =  defaultdict(
+            functools.partial(
+                ProcessedResultsGroup,
+                timing_sketches=config.get('analyze_stage_timing_sketches', False)
+            )
+        )
 
         logger = HedraLogger()
         logger.initialize()
@@ -81,13 +89,25 @@ def process_results_batch(config: Dict[str, Any]):
 
         start = time.monotonic()
 
-        for result in results_batch:
-            stage_result: BaseResult = dill.loads(result)
-            events[stage_result.name].add(
+        if isinstance(results_batch, SharedColumnarResults):
+            results_batch = results_batch.load()
+
+        if isinstance(results_batch, ColumnarResults):
+            for action_name in results_batch.names:
+                events[action_name].add_columnar_results(
                     stage_name,
-                    stage_result,
+                    results_batch,
+                    action_name
                 )
 
+        else:
+            for result in results_batch:
+                stage_result: BaseResult = dill.loads(result)
+                events[stage_result.name].add(
+                        stage_name,
+                        stage_result,
+                    )
+
         for events_stage_name, events_group in events.items():  
 
             logger.filesystem.sync['hedra.reporting'].debug(
@@ -1,3 +1,4 @@
+import hashlib
 import importlib
 import ntpath
 import sys
@@ -5,7 +6,7 @@ import asyncio
 import inspect
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple, Type
 from hedra.logging import HedraLogger
 from hedra.core.hooks.types.event.event import Event, EventHook
 from hedra.core.hooks.types.base.registrar import registrar
@@ -15,6 +16,17 @@ from hedra.plugins.types.common.plugin import Plugin
 from .stage import Stage
 
 
+LoadedGraph = Tuple[
+    Dict[str, Type[Stage]],
+    Dict[PluginType, Dict[str, Type[Plugin]]]
+]
+
+
+# Graphs imported by this process, keyed by path and then by a hash of
+# the graph file so an edited graph is imported again.
+_loaded_graphs: Dict[str, Tuple[str, LoadedGraph]] = {}
+
+
 def import_from_path(path: str) -> Any:
     package_dir = Path(path).resolve().parent
     package_dir_path = str(package_dir)
@@ -36,41 +48,68 @@ def import_from_path(path: str) -> Any:
     return module
 
 
-def import_stages(path: str) -> Dict[str, Stage]:
-    
+def _discover(path: str) -> LoadedGraph:
     module = import_from_path(path)
-    direct_decendants = list({cls.__name__: cls for cls in Stage.__subclasses__()}.values())
+
+    stage_decendants = list({cls.__name__: cls for cls in Stage.__subclasses__()}.values())
+    plugin_decendants = list({cls.__name__: cls for cls in Plugin.__subclasses__()}.values())
 
     discovered = {}
-    for name, stage_candidate in inspect.getmembers(module):
-        if inspect.isclass(
-            stage_candidate
-        ) and issubclass(
-            stage_candidate, 
-            Stage
-        ) and stage_candidate not in direct_decendants:
-            discovered[name] = stage_candidate
+    plugins_by_type = defaultdict(dict)
+
+    for name, candidate in inspect.getmembers(module):
+        if inspect.isclass(candidate) is False:
+            continue
+
+        if issubclass(candidate, Stage) and candidate not in stage_decendants:
+            discovered[name] = candidate
+
+        elif issubclass(candidate, Plugin) and candidate not in plugin_decendants:
+            plugins_by_type[candidate.type][candidate.name] = candidate
+
+    return discovered, plugins_by_type
+
+
+def import_stages(path: str) -> Dict[str, Stage]:
+    discovered, _ = _discover(path)
 
     return discovered
 
 
 def import_plugins(path: str) -> Dict[PluginType, Dict[str, Plugin]]:
-    module = import_from_path(path)
-    direct_decendants = list({cls.__name__: cls for cls in Plugin.__subclasses__()}.values())
-
-    plugins_by_type = defaultdict(dict)
-    for name, plugin_candidate in inspect.getmembers(module):
-        if inspect.isclass(
-            plugin_candidate
-        ) and issubclass(
-            plugin_candidate, 
-            Plugin
-        ) and plugin_candidate not in direct_decendants:
-            plugins_by_type[plugin_candidate.type][plugin_candidate.name] = plugin_candidate
+    _, plugins_by_type = _discover(path)
 
     return plugins_by_type
 
 
+def hash_graph(path: str) -> str:
+    with open(path, 'rb') as graph_file:
+        return hashlib.blake2b(
+            graph_file.read(),
+            digest_size=16
+        ).hexdigest()
+
+
+def load_graph(path: str) -> LoadedGraph:
+
+    # Importing a graph module registers its hooks again, so long-lived
+    # workers import each graph once and reuse the discovered classes.
+    graph_hash = hash_graph(path)
+    loaded_graph = _loaded_graphs.get(path)
+
+    if loaded_graph and loaded_graph[0] == graph_hash:
+        return loaded_graph[1]
+
+    discovered, plugins_by_type = _discover(path)
+
+    _loaded_graphs[path] = (
+        graph_hash,
+        (discovered, plugins_by_type)
+    )
+
+    return discovered, plugins_by_type
+
+
 def set_stage_hooks(stage: Stage, generated_hooks: Dict[str, Hook]) -> Stage:
     methods = inspect.getmembers(stage, predicate=inspect.ismethod) 
 
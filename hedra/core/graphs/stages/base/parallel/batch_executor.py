@@ -8,22 +8,34 @@ from types import FunctionType
 from concurrent.futures.process import BrokenProcessPool
 from concurrent.futures import ProcessPoolExecutor
 from hedra.core.graphs.stages.base.exceptions.process_killed_error import ProcessKilledError
+from functools import partial
 from typing import (
     Any, 
     List, 
+    Optional,
     Tuple, 
     Dict
 )
 from .synchronization import BatchedSemaphore
 from .stage_priority import StagePriority
+from .run_on_worker import run_on_worker
+from .warm_worker import warm_worker
 
 
 class BatchExecutor:
 
+    # Pools shared by every persistent executor, keyed by start method
+    # and graph path. Their workers outlive the stage that started them,
+    # so a graph is only imported once per worker process.
+    persistent_pools: Dict[Tuple[str, str], ProcessPoolExecutor] = {}
+
     def __init__(
         self, 
         max_workers: int = psutil.cpu_count(logical=False),
-        start_method: str='spawn'
+        start_method: str='spawn',
+        persistent: bool=False,
+        pool_size: Optional[int]=None,
+        graph_path: Optional[str]=None
     ) -> None:
         
         cpu_cores = psutil.cpu_count(logical=False)
@@ -33,13 +45,65 @@ class BatchExecutor:
         self.max_workers = max_workers
         self.loop = asyncio.get_event_loop()
         self.start_method = start_method
+        self.persistent = persistent
 
         self.context = multiprocessing.get_context(start_method)
         self.sem = BatchedSemaphore(max_workers)
-        self.pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=self.context)
+
+        if persistent:
+            self.pool = self.get_persistent_pool(
+                start_method,
+                pool_size or max_workers,
+                graph_path
+            )
+
+        else:
+            self.pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=self.context)
+
         self.shutdown_task = None
         self.batch_by_stages = False
 
+    @classmethod
+    def get_persistent_pool(
+        cls,
+        start_method: str,
+        pool_size: int,
+        graph_path: Optional[str]
+    ) -> ProcessPoolExecutor:
+
+        pool_key = (start_method, graph_path)
+        pool = cls.persistent_pools.get(pool_key)
+
+        if pool is None:
+            cpu_cores = psutil.cpu_count(logical=False)
+
+            pool = ProcessPoolExecutor(
+                max_workers=min(pool_size, cpu_cores),
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=warm_worker,
+                initargs=(graph_path,)
+            )
+
+            cls.persistent_pools[pool_key] = pool
+
+        return pool
+
+    @classmethod
+    def persistent_pids(cls) -> List[int]:
+        return [
+            pid for pool in cls.persistent_pools.values() for pid in (pool._processes or {})
+        ]
+
+    @classmethod
+    def close_persistent_pools(cls):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+
+            for pool in cls.persistent_pools.values():
+                pool.shutdown(cancel_futures=True)
+
+            cls.persistent_pools.clear()
+
     async def execute_batches(self, batched_stages: List[Tuple[int, List[Any]]], execution_task: FunctionType) -> List[Tuple[str, Any]]:
 
         return await asyncio.gather(*[
@@ -94,6 +158,30 @@ class BatchExecutor:
         except KeyboardInterrupt:
             raise ProcessKilledError()
 
+    async def execute_on_workers(
+        self,
+        execution_task: FunctionType,
+        config: Any,
+        timeout: float=10
+    ) -> List[Any]:
+
+        # Runs the task once in each of the pool's worker processes, for
+        # work like teardown that has to reach state every worker holds.
+        workers_count = self.pool._max_workers
+
+        with self.context.Manager() as manager:
+            barrier = manager.Barrier(workers_count)
+
+            return await self.execute_stage_batch(
+                partial(
+                    run_on_worker,
+                    barrier,
+                    execution_task,
+                    timeout=timeout
+                ),
+                [config for _ in range(workers_count)]
+            )
+
     def partion_stage_batches(self, stages: List[Any], ) -> List[Tuple[str, Any, int]]:
 
         # How many batches do we have? For example -> 5 stages over 4
@@ -313,20 +401,21 @@ class BatchExecutor:
         return batches
 
     async def shutdown(self):
+        self.close()
 
+    def close(self):
+
+        # Persistent pools are shared with other stages and are only
+        # shut down by close_persistent_pools().
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
-            self.pool.shutdown(cancel_futures=True)
 
-            child_processes = active_children()
-            for child in child_processes:
-                child.kill()
+            if self.persistent is False:
+                self.pool.shutdown(cancel_futures=True)
 
-    def close(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore')
-            self.pool.shutdown(cancel_futures=True)
+            persistent_pids = self.persistent_pids()
 
             child_processes = active_children()
             for child in child_processes:
-                child.kill()
\ No newline at end of file
+                if child.pid not in persistent_pids:
+                    child.kill()
\ No newline at end of file
@@ -0,0 +1,22 @@
+from threading import BrokenBarrierError
+from types import FunctionType
+from typing import Any
+
+
+def run_on_worker(
+    barrier: Any,
+    execution_task: FunctionType,
+    config: Any,
+    timeout: float
+):
+
+    # Holding each worker at the barrier until every worker has a copy
+    # of the task keeps one process from taking two copies. If the pool
+    # cannot fill the barrier in time, run anyway rather than block it.
+    try:
+        barrier.wait(timeout=timeout)
+
+    except BrokenBarrierError:
+        pass
+
+    return execution_task(config)
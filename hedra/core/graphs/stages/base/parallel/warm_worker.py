@@ -0,0 +1,10 @@
+from typing import Optional
+
+
+def warm_worker(graph_path: Optional[str]=None):
+
+    # Runs once when a persistent worker process starts. Importing here
+    # rather than at module level avoids a circular import with Stage.
+    if graph_path:
+        from hedra.core.graphs.stages.base.import_tools import load_graph
+        load_graph(graph_path)
@@ -15,6 +15,8 @@ from typing import (
 from typing_extensions import TypeVarTuple, Unpack
 from hedra.core.engines.client import Client
 from hedra.core.engines.client.config import Config
+from hedra.core.engines.types.common.columnar_results import ColumnarResults
+from hedra.core.engines.types.common.shared_columnar_results import SharedColumnarResults
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common.results_set import ResultsSet
 from hedra.core.engines.types.playwright import (
@@ -48,6 +50,7 @@ from hedra.monitoring import (
 from hedra.plugins.types.plugin_types import PluginType
 from hedra.plugins.types.extension.types import ExtensionType
 from hedra.plugins.types.extension.extension_plugin import ExtensionPlugin
+from hedra.reporting.processed_result.results_aggregate import ResultsAggregate
 from hedra.reporting.reporter import ReporterConfig
 from hedra.versioning.flags.types.base.active import active_flags
 from hedra.versioning.flags.types.base.flag_type import FlagTypes
@@ -326,6 +329,7 @@ class Execute(Stage, Generic[Unpack[T]]):
                         'graph_path': self.graph_path,
                         'graph_id': self.graph_id,
                         'enable_unstable_features': active_flags[FlagTypes.UNSTABLE_FEATURE],
+                        'persistent_workers': self.core_config.get('persistent_workers', False),
                         'source_stage_name': self.name,
                         'logfiles_directory': logging_manager.logfiles_directory,
                         'log_level': logging_manager.log_level_name,
@@ -364,6 +368,8 @@ class Execute(Stage, Generic[Unpack[T]]):
         if execute_stage_has_multiple_workers:
             execute_stage_streamed_analytics: List[StreamAnalytics] = []
             aggregate_results = []
+            aggregate_columnar_results: Optional[Union[ColumnarResults, SharedColumnarResults]] = None
+            stage_aggregates: Optional[ResultsAggregate] = None
             elapsed_times = []
             stage_contexts = defaultdict(list)
 
@@ -373,6 +379,21 @@ class Execute(Stage, Generic[Unpack[T]]):
             for result_set in execute_stage_results:
 
                 aggregate_results.extend(result_set.get('results'))
+
+                columnar_results: Optional[Union[ColumnarResults, SharedColumnarResults]] = result_set.get('columnar_results')
+                if columnar_results and aggregate_columnar_results is None:
+                    aggregate_columnar_results = columnar_results
+
+                elif columnar_results:
+                    aggregate_columnar_results.merge(columnar_results)
+
+                aggregates: Optional[ResultsAggregate] = result_set.get('aggregates')
+                if aggregates and stage_aggregates is None:
+                    stage_aggregates = aggregates
+
+                elif aggregates:
+                    stage_aggregates.merge(aggregates)
+
                 elapsed_times.append(result_set.get('total_elapsed'))
                 worker_id = result_set.get('worker_id')
                 
@@ -416,6 +437,12 @@ class Execute(Stage, Generic[Unpack[T]]):
             stage_memory_monitor.stage_metrics[main_monitor_name] = stage_memory_monitor.collected[main_monitor_name]
 
             total_results = len(aggregate_results)
+            if aggregate_columnar_results:
+                total_results = len(aggregate_columnar_results)
+
+            elif stage_aggregates:
+                total_results = len(stage_aggregates)
+
             total_elapsed = statistics.mean(elapsed_times)
 
             await self.logger.filesystem.aio['hedra.core'].info( f'{self.metadata_string} - Completed - {total_results} actions at  {round(total_results/total_elapsed)} actions/second over {round(total_elapsed)} seconds')
@@ -431,9 +458,12 @@ class Execute(Stage, Generic[Unpack[T]]):
                     'streamed_analytics': execute_stage_streamed_analytics,
                     'stage_batch_size': execute_stage_setup_config.batch_size,
                     'stage_persona_type': execute_stage_setup_config.persona_type,
+                    'stage_timing_sketches': execute_stage_setup_config.timing_sketches,
                     'stage_workers': self.workers,
                     'stage_optimized': self.optimized,
                     'stage_results': aggregate_results,
+                    'stage_columnar_results': aggregate_columnar_results,
+                    'stage_aggregates': stage_aggregates,
                     'total_results': total_results,
                     'total_elapsed': total_elapsed,
                     'experiment': execute_stage_experiment
@@ -559,7 +589,29 @@ class Execute(Stage, Generic[Unpack[T]]):
                 f'{self.metadata_string} - Execution complete - Time (including addtional setup) took: {round(elapsed, 2)} seconds'
             )  
 
+            columnar_results: Optional[ColumnarResults] = None
+            stage_aggregates: Optional[ResultsAggregate] = None
+            if isinstance(results, ResultsAggregate):
+                stage_aggregates = results
+                results = []
+
+            elif isinstance(results, ColumnarResults):
+                columnar_results = results
+                results = []
+
+            elif execute_stage_setup_config.columnar_results:
+                columnar_results = ColumnarResults()
+                columnar_results.extend(results)
+
+                results = []
+
             total_results = len(results)
+            if columnar_results:
+                total_results = len(columnar_results)
+
+            elif stage_aggregates:
+                total_results = len(stage_aggregates)
+
             total_elapsed = execute_stage_persona.total_elapsed
 
             await stage_cpu_monitor.stop_background_monitor(main_monitor_name)
@@ -597,9 +649,12 @@ class Execute(Stage, Generic[Unpack[T]]):
                     ],
                     'stage_batch_size': execute_stage_setup_config.batch_size,
                     'stage_persona_type': execute_stage_setup_config.persona_type,
+                    'stage_timing_sketches': execute_stage_setup_config.timing_sketches,
                     'stage_workers': self.workers,
                     'stage_optimized': self.optimized,
                     'stage_results': results,
+                    'stage_columnar_results': columnar_results,
+                    'stage_aggregates': stage_aggregates,
                     'total_results': total_results,
                     'total_elapsed': total_elapsed,
                     'experiment': execute_stage_experiment
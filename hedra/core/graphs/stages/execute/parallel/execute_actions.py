@@ -16,6 +16,8 @@ from typing import (
     Type
 )
 from hedra.core.engines.client.config import Config
+from hedra.core.engines.types.common.columnar_results import ColumnarResults
+from hedra.core.engines.types.common.shared_columnar_results import SharedColumnarResults
 from hedra.core.engines.types.playwright import MercuryPlaywrightClient, ContextConfig
 from hedra.core.engines.types.registry import RequestTypes
 from hedra.core.engines.types.registry import registered_engines
@@ -35,6 +37,7 @@ from hedra.core.graphs.stages.base.exceptions.process_killed_error import Proces
 from hedra.core.graphs.stages.base.import_tools import (
     import_stages, 
     import_plugins, 
+    load_graph,
     set_stage_hooks
 )
 from hedra.core.graphs.stages.setup.setup import Setup
@@ -50,6 +53,7 @@ from hedra.plugins.types.plugin_types import PluginType
 from hedra.plugins.types.engine.engine_plugin import EnginePlugin
 from hedra.plugins.types.extension.extension_plugin import ExtensionPlugin
 from hedra.plugins.types.persona.persona_plugin import PersonaPlugin
+from hedra.reporting.processed_result.results_aggregate import ResultsAggregate
 from hedra.reporting.reporter import ReporterConfig
 from hedra.versioning.flags.types.base.active import active_flags
 from hedra.versioning.flags.types.base.flag_type import FlagTypes
@@ -204,15 +208,43 @@ async def start_execution(
             context_key: context_value for context_key, context_value in serializable_context
         }) 
 
-    for idx, result in enumerate(results):
-        results[idx] = dill.dumps(result)  
+    columnar_results = None
+    aggregates = None
+    if isinstance(results, ResultsAggregate):
+        aggregates = results
 
+        total_results = len(aggregates)
+        results = []
+
+    elif isinstance(results, ColumnarResults):
+        columnar_results = results
+
+        total_results = len(columnar_results)
+        results = []
+
+    elif persona_config.columnar_results:
+        columnar_results = ColumnarResults()
+        columnar_results.extend(results)
+
+        total_results = len(columnar_results)
+        results = []
+
+    else:
+        for idx, result in enumerate(results):
+            results[idx] = dill.dumps(result)
+
+        total_results = len(results)
+
+    if columnar_results is not None and persona_config.shared_memory_results:
+        columnar_results = SharedColumnarResults.create(columnar_results)
 
     results_dict =  {
         'worker_idx': worker_id,
         'streamed_analytics': persona.streamed_analytics,
         'results': results,
-        'total_results': len(results),
+        'columnar_results': columnar_results,
+        'aggregates': aggregates,
+        'total_results': total_results,
         'total_elapsed': persona.total_elapsed,
         'context': context,
         'monitoring': {
@@ -249,6 +281,11 @@ def execute_actions(parallel_config: str):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
+    # Persistent workers run many stages, and each run closes its loop.
+    if loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
     def handle_loop_stop(signame):
         try:
             pending_events = asyncio.all_tasks()
@@ -284,6 +321,7 @@ def execute_actions(parallel_config: str):
         graph_path: str= parallel_config.get('graph_path') 
         graph_id = parallel_config.get('graph_id')
         enable_unstable_features = parallel_config.get('enable_unstable_features', False)
+        persistent_workers = parallel_config.get('persistent_workers', False)
     
         logfiles_directory = parallel_config.get('logfiles_directory')
         log_level = parallel_config.get('log_level')
@@ -316,8 +354,12 @@ def execute_actions(parallel_config: str):
         metadata_string = f'Graph - {graph_name}:{graph_id} - thread:{thread_id} - process:{process_id} - Stage: {source_stage_name}:{source_stage_id} - '
 
 
-        discovered: Dict[str, Stage] = import_stages(graph_path)
-        plugins_by_type = import_plugins(graph_path)
+        if persistent_workers:
+            discovered, plugins_by_type = load_graph(graph_path)
+
+        else:
+            discovered: Dict[str, Stage] = import_stages(graph_path)
+            plugins_by_type = import_plugins(graph_path)
 
         initialized_stages = {}
         hooks_by_type = defaultdict(dict)
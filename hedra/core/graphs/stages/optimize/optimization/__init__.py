@@ -1,2 +1,3 @@
 from .optimizer import Optimizer
-from .distribution_fit_optimizer import DistributionFitOptimizer
\ No newline at end of file
+from .distribution_fit_optimizer import DistributionFitOptimizer
+from .population_optimizer import PopulationOptimizer
\ No newline at end of file
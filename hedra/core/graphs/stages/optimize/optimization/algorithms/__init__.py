@@ -6,6 +6,7 @@ from typing import (
     Optional
 )
 from .types import (
+    BayesianOptimizer,
     SHGOptimizer,
     DualAnnealingOptimizer,
     DifferentialEvolutionOptimizer
@@ -15,7 +16,8 @@ from .types import (
 registered_algorithms = {
         'shg': SHGOptimizer,
         'dual-annealing': DualAnnealingOptimizer,
-        'diff-evolution': DifferentialEvolutionOptimizer
+        'diff-evolution': DifferentialEvolutionOptimizer,
+        'bayesian': BayesianOptimizer
 }
 
 
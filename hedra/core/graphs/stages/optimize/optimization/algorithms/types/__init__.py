@@ -1,3 +1,4 @@
+from .bayesian_optimizer import BayesianOptimizer
 from .differential_evolution_optimizer import DifferentialEvolutionOptimizer
 from .dual_annealing_optimizer import DualAnnealingOptimizer
 from .point_optimizer import PointOptimizer
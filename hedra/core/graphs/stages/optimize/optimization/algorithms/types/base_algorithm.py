@@ -1,5 +1,5 @@
 import math
-import asyncio
+import numpy
 import psutil
 from hedra.core.personas.types.default_persona.default_persona import DefaultPersona
 from hedra.core.personas.batching.param_type import ParamType
@@ -102,6 +102,7 @@ class BaseAlgorithm:
             
         self.fixed_iters = False
         self.iters = 0
+        self.stopped_early = False
 
     def get_params(self):
         return self.batch.to_params()
@@ -130,10 +131,7 @@ class BaseAlgorithm:
             if batch_size <= psutil.cpu_count():
                 batch_size = 1000
 
-            hook.session.pool.size = batch_size
-            hook.session.sem = asyncio.Semaphore(batch_size)
-            hook.session.pool.connections = []
-            hook.session.pool.create_pool()
+            hook.session.resize_pool(batch_size)
 
         persona.batch.size = batch_size
         persona.batch.interval = batch_interval
@@ -141,6 +139,17 @@ class BaseAlgorithm:
 
         return persona
 
+    def create_population(self, population_size: int) -> numpy.ndarray:
+        population = numpy.empty((population_size, len(self.bounds)))
+
+        # Latin hypercube sampling, so that even a handful of samples
+        # spans the full range of every parameter.
+        for idx, (min_range, max_range) in enumerate(self.bounds):
+            strata = numpy.random.permutation(population_size) + numpy.random.random(population_size)
+            population[:, idx] = min_range + strata/population_size * (max_range - min_range)
+
+        return population
+
     def optimize(self, func):
         raise NotImplementedError(
             'Err. - Base Algorithm is an abstract class and its optimize method should be overridden.'
@@ -0,0 +1,228 @@
+import math
+import time
+import numpy
+from scipy.linalg import (
+    cho_solve,
+    cholesky,
+    solve_triangular
+)
+from scipy.optimize import OptimizeResult
+from scipy.stats import norm
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Optional
+)
+from .base_algorithm import BaseAlgorithm
+
+
+class BayesianOptimizer(BaseAlgorithm):
+
+    '''
+    Fits a Gaussian process to the log inverse APS of each probe, and
+    probes next wherever expected improvement is highest. Because scores
+    are in log space, expected improvement is roughly the fraction by
+    which the next probe is predicted to raise the max APS. Optimization
+    stops once that falls below `min_improvement` for `patience` probes
+    in a row.
+    '''
+
+    min_improvement = 0.01
+    patience = 2
+    noise = 0.05
+    length_scales = (0.1, 0.2, 0.4, 0.8)
+    candidates_count = 1024
+
+    def __init__(
+        self,
+        config: Dict[str, Union[List[Tuple[Union[int, float]]], int]],
+        distribution_idx: Optional[int]=None
+    ) -> None:
+        super().__init__(
+            config,
+            distribution_idx=distribution_idx
+        )
+
+        self.lower_bounds = numpy.array([
+            min_range for min_range, _ in self.bounds
+        ], dtype=float)
+
+        self.bounds_range = numpy.array([
+            max_range - min_range for min_range, max_range in self.bounds
+        ], dtype=float)
+
+        self.bounds_range[self.bounds_range <= 0] = 1
+
+        self.initial_probes = min(
+            max(len(self.bounds) + 1, 3),
+            self.max_iter
+        )
+
+    def optimize(self, func):
+
+        start = time.time()
+
+        samples: List[numpy.ndarray] = list(
+            self._normalize(
+                self.create_population(self.initial_probes)
+            )
+        )
+
+        scores: List[float] = []
+        stalled_probes = 0
+
+        while len(scores) < self.max_iter and time.time() - start < self.time_limit:
+
+            sample = samples[len(scores)]
+            scores.append(
+                func(list(self._denormalize(sample)))
+            )
+
+            if len(scores) < len(samples):
+                continue
+
+            next_sample, expected_improvement = self._next_sample(
+                numpy.array(samples),
+                self._log_scores(scores)
+            )
+
+            if expected_improvement < self.min_improvement:
+                stalled_probes += 1
+
+            else:
+                stalled_probes = 0
+
+            if stalled_probes >= self.patience:
+                self.stopped_early = True
+                break
+
+            samples.append(next_sample)
+
+        best_idx = int(numpy.argmin(scores))
+
+        return OptimizeResult(
+            x=self._denormalize(samples[best_idx]),
+            fun=scores[best_idx],
+            nfev=len(scores),
+            nit=len(scores),
+            success=True,
+            message='Stopped early on plateau' if self.stopped_early else 'Maximum probes reached'
+        )
+
+    def _next_sample(
+        self,
+        samples: numpy.ndarray,
+        scores: numpy.ndarray
+    ) -> Tuple[numpy.ndarray, float]:
+
+        score_mean = scores.mean()
+        score_std = scores.std()
+        if score_std <= 0:
+            score_std = 1
+
+        targets = (scores - score_mean)/score_std
+
+        length_scale, factor, weights = self._fit(samples, targets)
+
+        best_sample = samples[numpy.argmin(targets)]
+
+        # Random candidates explore the whole space, and perturbations of
+        # the best sample refine the region around it.
+        candidates = numpy.vstack([
+            numpy.random.random((self.candidates_count, samples.shape[1])),
+            numpy.clip(
+                best_sample + numpy.random.normal(
+                    scale=length_scale/2,
+                    size=(self.candidates_count//4, samples.shape[1])
+                ),
+                0,
+                1
+            )
+        ])
+
+        candidates_kernel = self._kernel(candidates, samples, length_scale)
+        mean = candidates_kernel @ weights
+
+        variance_reduction = solve_triangular(
+            factor,
+            candidates_kernel.T,
+            lower=True
+        )
+
+        std = numpy.sqrt(
+            numpy.clip(1 - numpy.sum(variance_reduction**2, axis=0), 1e-12, None)
+        )
+
+        improvement = targets.min() - mean
+        z = improvement/std
+        expected_improvement = (improvement * norm.cdf(z) + std * norm.pdf(z)) * score_std
+
+        best_candidate = int(numpy.argmax(expected_improvement))
+
+        return candidates[best_candidate], float(expected_improvement[best_candidate])
+
+    def _fit(
+        self,
+        samples: numpy.ndarray,
+        targets: numpy.ndarray
+    ) -> Tuple[float, numpy.ndarray, numpy.ndarray]:
+
+        fitted = None
+        max_likelihood = -math.inf
+
+        for length_scale in self.length_scales:
+
+            covariance = self._kernel(samples, samples, length_scale)
+            covariance[numpy.diag_indices_from(covariance)] += self.noise
+
+            try:
+                factor = cholesky(covariance, lower=True)
+
+            except numpy.linalg.LinAlgError:
+                continue
+
+            weights = cho_solve((factor, True), targets)
+            likelihood = -0.5 * targets @ weights - numpy.log(numpy.diag(factor)).sum()
+
+            if likelihood > max_likelihood:
+                max_likelihood = likelihood
+                fitted = (length_scale, factor, weights)
+
+        return fitted
+
+    def _kernel(
+        self,
+        samples: numpy.ndarray,
+        other_samples: numpy.ndarray,
+        length_scale: float
+    ) -> numpy.ndarray:
+        distances = numpy.sum(
+            (samples[:, None, :] - other_samples[None, :, :])**2,
+            axis=2
+        )
+
+        return numpy.exp(-0.5 * distances/length_scale**2)
+
+    def _log_scores(self, scores: List[float]) -> numpy.ndarray:
+        log_scores = numpy.log(
+            numpy.clip(numpy.array(scores, dtype=float), 1e-12, None)
+        )
+
+        # Probes too short to score return infinity. Rank them just
+        # above the worst finite score so the surrogate stays finite.
+        finite = numpy.isfinite(log_scores)
+        if finite.any():
+            log_scores[~finite] = log_scores[finite].max() + 1
+
+        else:
+            log_scores[:] = 0
+
+        return log_scores
+
+    def _normalize(self, samples: numpy.ndarray) -> numpy.ndarray:
+        return (samples - self.lower_bounds)/self.bounds_range
+
+    def _denormalize(self, sample: numpy.ndarray) -> numpy.ndarray:
+        return self.lower_bounds + sample * self.bounds_range
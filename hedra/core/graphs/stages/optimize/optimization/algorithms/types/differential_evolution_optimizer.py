@@ -1,4 +1,5 @@
 from typing import (
+    Callable,
     Dict, 
     List, 
     Tuple, 
@@ -9,8 +10,16 @@ from scipy.optimize import differential_evolution
 from .base_algorithm import BaseAlgorithm
 
 
+PopulationEvaluator = Callable[
+    [Callable[[List[float]], float], List[List[float]]],
+    List[float]
+]
+
+
 class DifferentialEvolutionOptimizer(BaseAlgorithm):
 
+    min_population = 5
+
     def __init__(
         self, 
         config: Dict[str, Union[List[Tuple[Union[int, float]]], int]],
@@ -27,3 +36,24 @@ class DifferentialEvolutionOptimizer(BaseAlgorithm):
             self.bounds,
             maxiter=self.max_iter
         )
+
+    def optimize_population(
+        self,
+        func,
+        evaluate_population: PopulationEvaluator,
+        population_size: int,
+        generations: int,
+        callback: Optional[Callable[[List[float], float], bool]]=None
+    ):
+        # Deferred updating scores a whole generation before selection,
+        # so `evaluate_population` receives every trial vector at once.
+        return differential_evolution(
+            func,
+            self.bounds,
+            maxiter=generations,
+            init=self.create_population(population_size),
+            updating='deferred',
+            workers=evaluate_population,
+            callback=callback,
+            polish=False
+        )
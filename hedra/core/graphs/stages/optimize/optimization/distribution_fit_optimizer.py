@@ -55,6 +55,7 @@ class DistributionFitOptimizer(Optimizer):
 
     def _setup_persona(self, stage_config: Config) -> DefaultPersona:
         persona = DefaultPersona(stage_config)
+        persona.optimization_active = True
         persona.setup(self.stage_hooks, self.metadata_string)
 
         return persona
@@ -87,6 +88,10 @@ class DistributionFitOptimizer(Optimizer):
             self._optimize_async()
         )
 
+        self._event_loop.run_until_complete(
+            self._close_sessions()
+        )
+
         self._event_loop.close()
 
         return optimization_results
@@ -175,7 +180,6 @@ class DistributionFitOptimizer(Optimizer):
 
         persona.total_time = self.algorithm.batch_time
         persona = self.algorithm.update_params(persona)
-        await persona.set_concurrency(persona.batch.size)
 
         await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter}')
 
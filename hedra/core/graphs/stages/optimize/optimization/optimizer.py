@@ -6,6 +6,7 @@ import os
 import signal
 from typing import Any, Dict, List, Union
 from hedra.core.engines.client.config import Config
+from hedra.core.hooks.types.base.hook_type import HookType
 from hedra.core.personas.batching.param_type import ParamType
 from hedra.core.personas import get_persona
 from hedra.core.personas.types.default_persona import DefaultPersona
@@ -104,9 +105,15 @@ class Optimizer:
             'optimization_iters': self.algorithm.max_iter,
             'optimization_iter_duation': self.algorithm.batch_time,
             'optimization_total_time': self.total_optimization_time,
-            'optimization_max_aps': self._max_aps
+            'optimization_max_aps': self._max_aps,
+            'optimization_probes': self._current_iter,
+            'optimization_stopped_early': self.algorithm.stopped_early
         }
 
+        self._event_loop.run_until_complete(
+            self._close_sessions()
+        )
+
         self._event_loop.close()
 
         return self.optimized_results
@@ -121,68 +128,107 @@ class Optimizer:
     def _handle_async_exception(self, loop, ctx) -> None:
         pass
 
+    async def close(self):
+        await self._close_sessions()
+
+    async def _close_sessions(self):
+        for hook in [
+            *self.stage_hooks.get(HookType.ACTION, []),
+            *self.stage_hooks.get(HookType.TASK, [])
+        ]:
+            await hook.session.close()
+
     async def _optimize(self, xargs: List[Union[int, float]]) -> float:
 
         if self._current_iter < self.algorithm.max_iter and self.elapsed < self.algorithm.time_limit:
+            return await self._score(xargs)
 
-            persona = self._setup_persona(self.stage_config)
+        return self.base_batch_size
 
-            for idx, param in enumerate(xargs):
-                param_name = self.algorithm.param_names[idx]
-                param = self.algorithm.param_values.get(param_name, {})
-                param_type = param.get('type')
+    async def _score(self, xargs: List[Union[int, float]]) -> float:
 
-                if param_type == ParamType.INTEGER:
-                    xargs[idx] = int(xargs[idx])
+        persona = self._setup_persona(self.stage_config)
 
-                else:
-                    xargs[idx] = float(xargs[idx])
+        for idx, param in enumerate(xargs):
+            param_name = self.algorithm.param_names[idx]
+            param = self.algorithm.param_values.get(param_name, {})
+            param_type = param.get('type')
 
-                param['value'] = xargs[idx]
+            if param_type == ParamType.INTEGER:
+                xargs[idx] = int(xargs[idx])
 
-                self.current_params[param_name] = xargs[idx]
-                self.algorithm.current_params[param_name] = xargs[idx]
-            
-            persona = self.algorithm.update_params(persona)
-            await persona.set_concurrency(persona.batch.size)
+            else:
+                xargs[idx] = float(xargs[idx])
 
-            await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter}')
+            param['value'] = xargs[idx]
 
-            await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter} - Batch Size - {persona.batch.size}')
-            await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter} - Batch Interval - {persona.batch.interval}')
-            await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter} - Batch Gradient - {persona.batch.gradient}')
+            self.current_params[param_name] = xargs[idx]
+            self.algorithm.current_params[param_name] = xargs[idx]
+        
+        persona = self.algorithm.update_params(persona)
 
-            completed_count = 0
-            try:
-                results = await persona.execute()
-                completed_count = len([result for result in results if result.error is None])
+        await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter}')
 
-            except RuntimeError as e:
-                raise e
-            
-            except KeyboardInterrupt as e:
-                raise e
+        await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter} - Batch Size - {persona.batch.size}')
+        await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter} - Batch Interval - {persona.batch.interval}')
+        await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter} - Batch Gradient - {persona.batch.gradient}')
 
-            except Exception:
-                pass
+        completed_count = 0
+        try:
+            results = await persona.execute()
+            completed_count = len([result for result in results if result.error is None])
 
-            elapsed = persona.end - persona.start
+        except RuntimeError as e:
+            raise e
+        
+        except KeyboardInterrupt as e:
+            raise e
 
-            await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter} - took - {round(elapsed, 2)} - seconds')
-       
-            if completed_count < 1:
-                completed_count = 1
+        except Exception:
+            pass
 
-            if elapsed < 1:
-                elapsed = float('inf')
+        elapsed = persona.end - persona.start
 
-            await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter} - Inverted APS score- {elapsed/completed_count}')
-            
-            return elapsed/completed_count
+        await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter} - took - {round(elapsed, 2)} - seconds')
+   
+        if completed_count < 1:
+            completed_count = 1
 
-        return self.base_batch_size
+        if elapsed < 1:
+            elapsed = float('inf')
 
-    def _run_optimize(self, xargs: List[Union[int, float]]) -> float:
+        elif completed_count/elapsed > self._max_aps:
+            self._max_aps = completed_count/elapsed
+
+        await self.logger.filesystem.aio['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer iteration - {self._current_iter} - Inverted APS score- {elapsed/completed_count}')
+        
+        return elapsed/completed_count
+
+    def evaluate(self, candidates: List[List[Union[int, float]]]) -> List[float]:
+        '''
+        Scores each candidate in turn and returns their inverse APS. The
+        caller owns the iteration and time budget, so neither is checked.
+        Sessions stay open so later calls reuse them until `close()`.
+        '''
+
+        self.start = time.time()
+        self._get_event_loop()
+
+        scores: List[float] = []
+        for candidate in candidates:
+            scores.append(
+                self._event_loop.run_until_complete(
+                    self._score(list(candidate))
+                )
+            )
+
+            self._current_iter += 1
+
+        self.elapsed = time.time() - self.start
+
+        return scores
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
 
         try:
             self._event_loop = asyncio.get_event_loop()
@@ -215,6 +261,12 @@ class Optimizer:
                     lambda signame=signame: handle_loop_stop(signame)
                 )
 
+        return self._event_loop
+
+    def _run_optimize(self, xargs: List[Union[int, float]]) -> float:
+
+        self._get_event_loop()
+
         inverse_actions_per_second = self._event_loop.run_until_complete(
             self._optimize(xargs)
         )
@@ -0,0 +1,181 @@
+import math
+import uuid
+import time
+import threading
+import os
+from typing import Any, Callable, Dict, List, Union
+from hedra.core.engines.client.config import Config
+from hedra.core.personas.batching.param_type import ParamType
+from hedra.logging import HedraLogger
+from .algorithms.types.differential_evolution_optimizer import DifferentialEvolutionOptimizer
+
+
+CandidateEvaluator = Callable[
+    [List[List[Union[int, float]]]],
+    List[float]
+]
+
+
+class PopulationOptimizer:
+
+    '''
+    Differential evolution over whole populations of candidates. Each
+    generation is passed to `evaluate`, which scores the candidates in
+    parallel, one per worker, and returns their inverse APS in order.
+
+    The iteration limit counts rounds of parallel evaluation rather than
+    single candidates. The time limit therefore bounds wall time as it
+    does for the serial optimizer, while each round scores as many
+    candidates as there are workers. Once the time limit passes, the
+    remaining generations are skipped and the best candidate so far wins.
+    '''
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        evaluate: CandidateEvaluator
+    ) -> None:
+
+        self.logger = HedraLogger()
+        self.logger.initialize()
+
+        self.optimizer_id = str(uuid.uuid4())
+        self.thread_id = threading.current_thread().ident
+        self.process_id = os.getpid()
+
+        self.graph_name = config.get('graph_name')
+        self.graph_id = config.get('graph_id')
+        self.target_stage_name = config.get('stage_name')
+        self.source_stage_name = config.get('source_stage_name')
+        self.source_stage_id = config.get('source_stage_id')
+        self.stage_config: Config = config.get('stage_config')
+
+        self.metadata_string = f'Graph - {self.graph_name}:{self.graph_id} - thread:{self.thread_id} - process:{self.process_id} - Stage: {self.source_stage_name}:{self.source_stage_id} - Optimizer: {self.optimizer_id} - '
+
+        self.workers = max(config.get('workers', 1), 1)
+        self.evaluate = evaluate
+
+        self.algorithm = DifferentialEvolutionOptimizer({
+            **config,
+            'stage_config': self.stage_config
+        })
+
+        self.population_size = self.workers * math.ceil(
+            self.algorithm.min_population/self.workers
+        )
+
+        rounds_per_generation = self.population_size//self.workers
+
+        # The initial population takes a generation's worth of rounds.
+        self.generations = max(
+            int(self.algorithm.max_iter/rounds_per_generation) - 1,
+            1
+        )
+
+        self.optimized_results = {}
+        self.candidates_evaluated = 0
+        self._current_generation = 0
+        self._max_aps = 0
+
+        self.time_limit = self.algorithm.time_limit
+        self.stopped_early = False
+
+        self.start = 0
+        self.elapsed = 0
+        self.total_optimization_time = 0
+
+    def optimize(self) -> Dict[str, Union[int, float]]:
+
+        self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Starting population optimization')
+        self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Optimization config: Workers - {self.workers}')
+        self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Optimization config: Population Size - {self.population_size}')
+        self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Optimization config: Generations - {self.generations}')
+        self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Optimization config: Time Limit - {self.time_limit}')
+        self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Optimization config: Batch Time - {self.algorithm.batch_time}')
+
+        self.start = time.time()
+
+        results = self.algorithm.optimize_population(
+            self._run_optimize,
+            self._evaluate_population,
+            self.population_size,
+            self.generations,
+            callback=self._check_time_limit
+        )
+
+        optimized_params = {}
+        for idx in range(len(results.x)):
+            param_name = self.algorithm.param_names[idx]
+            optimiazed_param_name = f'optimized_{param_name}'
+            param = self.algorithm.param_values.get(param_name, {})
+            param_type = param.get('type')
+
+            if param_type == ParamType.INTEGER:
+                optimized_params[optimiazed_param_name] = int(results.x[idx])
+
+            else:
+                optimized_params[optimiazed_param_name] = float(results.x[idx])
+
+        self.total_optimization_time = time.time() - self.start
+
+        self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Optimization took - {round(self.total_optimization_time, 2)} - seconds')
+        self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Optimization - evaluated - {self.candidates_evaluated} - candidates')
+        self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Optimization - max actions per second - {self._max_aps}')
+
+        for optimized_param_name, optimized_value in optimized_params.items():
+            param_log_name = optimized_param_name.replace('_', ' ')
+            self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Optimization - {param_log_name} - {optimized_value}')
+
+        self.optimized_results = {
+            **optimized_params,
+            'optimize_target_stage': self.target_stage_name,
+            'optimization_iters': self.algorithm.max_iter,
+            'optimization_iter_duation': self.algorithm.batch_time,
+            'optimization_total_time': self.total_optimization_time,
+            'optimization_max_aps': self._max_aps,
+            'optimization_candidates_evaluated': self.candidates_evaluated,
+            'optimization_stopped_early': self.stopped_early
+        }
+
+        return self.optimized_results
+
+    def _evaluate_population(
+        self,
+        func: Callable[[List[float]], float],
+        population: List[List[float]]
+    ) -> List[float]:
+
+        candidates = [
+            [float(value) for value in candidate] for candidate in population
+        ]
+
+        # A generation already scored gives the best candidate so far, so
+        # past the time limit any further trials are rejected unscored.
+        if self.candidates_evaluated > 0 and self.elapsed >= self.time_limit:
+            self.stopped_early = True
+            return [float('inf')]*len(candidates)
+
+        self.logger.filesystem.sync['hedra.optimize'].debug(f'{self.metadata_string} - Optimizer generation - {self._current_generation} - Evaluating - {len(candidates)} - candidates')
+
+        scores = self.evaluate(candidates)
+
+        for score in scores:
+            if 0 < score < float('inf'):
+                self._max_aps = max(self._max_aps, 1/score)
+
+        self.candidates_evaluated += len(candidates)
+        self._current_generation += 1
+        self.elapsed = time.time() - self.start
+
+        return scores
+
+    def _check_time_limit(self, xk: List[float], convergence: float) -> bool:
+
+        if self.elapsed >= self.time_limit:
+            self.logger.filesystem.sync['hedra.optimize'].info(f'{self.metadata_string} - Optimization reached time limit - {self.time_limit} - after - {self._current_generation} - generations')
+            self.stopped_early = True
+
+        return self.stopped_early
+
+    def _run_optimize(self, xargs: List[Union[int, float]]) -> float:
+        return self._evaluate_population(None, [xargs])[0]
@@ -7,6 +7,7 @@ from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from hedra.core.engines.client.config import Config
 from hedra.core.engines.client.time_parser import TimeParser
+from hedra.core.engines.types.common.concurrency import Semaphore
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.playwright import (
     MercuryPlaywrightClient,
@@ -49,7 +50,10 @@ from typing import (
     Type
 )
 from .optimization.parameters import Parameter
-from .parallel import optimize_stage
+from .parallel import (
+    optimize_stage,
+    optimize_population
+)
 
 
 BatchedOptimzationCandidates = List[Tuple[str, Execute, int]] 
@@ -95,6 +99,7 @@ class Optimize(Stage):
     ]
     priority: Optional[str]=None
     retries: int=0
+    parallel_evaluation: bool=False
     
     def __init__(self) -> None:
         super().__init__()
@@ -120,6 +125,7 @@ class Optimize(Stage):
         self.algorithm = self.algorithm
         self.time_limit = self.time_limit
         self.optimize_params = self.optimize_params
+        self.parallel_evaluation = self.parallel_evaluation
 
         self._loop: Union[asyncio.AbstractEventLoop, None] = None
         self._thread_executor: Union[ThreadPoolExecutor, None] = None
@@ -329,6 +335,7 @@ class Optimize(Stage):
                         'graph_path': self.graph_path,
                         'graph_id': self.graph_id,
                         'enable_unstable_features': active_flags[FlagTypes.UNSTABLE_FEATURE],
+                        'persistent_workers': self.core_config.get('persistent_workers', False),
                         'logfiles_directory': logging_manager.logfiles_directory,
                         'log_level': logging_manager.log_level_name,
                         'worker_id': worker_id,
@@ -385,18 +392,38 @@ class Optimize(Stage):
             optimization_results = []
             await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Starting optimizaiton for - {optimize_stage_stages_count} - stages')
 
-            results = await self.executor.execute_batches(
-                optimize_stage_batched_configs,
-                optimize_stage
-            )
+            if self.parallel_evaluation:
+                loop = asyncio.get_event_loop()
+
+                results = await asyncio.gather(*[
+                    loop.run_in_executor(
+                        None,
+                        optimize_population,
+                        self.executor,
+                        loop,
+                        stage_name,
+                        assigned_workers_count,
+                        configs
+                    ) for stage_name, assigned_workers_count, configs in optimize_stage_batched_configs
+                ])
 
+                await self.logger.filesystem.aio['hedra.core'].debug(f'{self.metadata_string} - Completed optimizaiton for - {optimize_stage_stages_count} - stages')
 
-            await self.logger.filesystem.aio['hedra.core'].debug(f'{self.metadata_string} - Completed optimizaiton for - {optimize_stage_stages_count} - stages')
+                for result_batch in results:
+                    optimization_results.extend(result_batch)
 
-            for _, result_batch in results:
-                optimization_results.extend([
-                    dill.loads(results_set) for results_set in result_batch
-                ])
+            else:
+                results = await self.executor.execute_batches(
+                    optimize_stage_batched_configs,
+                    optimize_stage
+                )
+
+                await self.logger.filesystem.aio['hedra.core'].debug(f'{self.metadata_string} - Completed optimizaiton for - {optimize_stage_stages_count} - stages')
+
+                for _, result_batch in results:
+                    optimization_results.extend([
+                        dill.loads(results_set) for results_set in result_batch
+                    ])
 
             return {
                 'optimize_stage_results': optimization_results
@@ -654,7 +681,7 @@ class Optimize(Stage):
             for hook in stage.dispatcher.actions_and_tasks.values():
                 if hook.source.session:
                     hook.source.session.pool.size = optimize_stage_batch_size
-                    hook.source.session.sem = asyncio.Semaphore(optimize_stage_batch_size)
+                    hook.source.session.sem = Semaphore(optimize_stage_batch_size)
                     hook.source.session.pool.connections = []
                     hook.source.session.pool.create_pool()
 
@@ -1 +1,2 @@
-from .optimize_stage import optimize_stage
\ No newline at end of file
+from .optimize_stage import optimize_stage
+from .optimize_population import optimize_population
\ No newline at end of file
@@ -0,0 +1,141 @@
+import asyncio
+import dill
+from collections import defaultdict
+from typing import Any, Dict, List, Union
+from hedra.core.engines.client.config import Config
+from hedra.core.graphs.stages.base.parallel.batch_executor import BatchExecutor
+from hedra.core.graphs.stages.optimize.optimization import PopulationOptimizer
+from .optimize_stage import (
+    optimize_stage,
+    close_optimize_stage
+)
+
+
+def optimize_population(
+    executor: BatchExecutor,
+    loop: asyncio.AbstractEventLoop,
+    stage_name: str,
+    assigned_workers_count: int,
+    configs: List[bytes]
+) -> List[Dict[str, Any]]:
+    '''
+    Optimizes a stage by evaluating whole populations of candidates, spread
+    over the stage's assigned workers. Runs in a thread, submitting each
+    generation to the executor on the stage's event loop, and returns one
+    result per worker in the same form `optimize_stage` does.
+    '''
+
+    worker_configs: List[Dict[str, Any]] = [
+        dill.loads(config) for config in configs
+    ]
+
+    base_config = worker_configs[0]
+    stage_config: Config = base_config.get('execute_stage_config')
+
+    if stage_config.experiment and stage_config.experiment.get('distribution'):
+        # Distribution fits optimize each interval in turn, so each
+        # worker fits its own share as usual.
+        stage_results = asyncio.run_coroutine_threadsafe(
+            executor.execute_batches(
+                [(stage_name, assigned_workers_count, configs)],
+                optimize_stage
+            ),
+            loop
+        ).result()
+
+        return [
+            dill.loads(results_set) for _, result_batch in stage_results for results_set in result_batch
+        ]
+
+    stage_config.batch_size = base_config.get('execute_stage_batch_size')
+
+    worker_monitoring: Dict[int, Dict[str, Dict[str, List[Any]]]] = defaultdict(
+        lambda: defaultdict(lambda: defaultdict(list))
+    )
+    worker_context: Dict[int, Dict[str, Any]] = {}
+
+    def evaluate(candidates: List[List[Union[int, float]]]) -> List[float]:
+
+        workers_count = min(assigned_workers_count, len(candidates))
+
+        candidate_configs = [
+            dill.dumps({
+                **worker_configs[worker_id],
+                'optimizer_candidates': candidates[worker_id::workers_count]
+            }) for worker_id in range(workers_count)
+        ]
+
+        stage_results = asyncio.run_coroutine_threadsafe(
+            executor.execute_batches(
+                [(stage_name, workers_count, candidate_configs)],
+                optimize_stage
+            ),
+            loop
+        ).result()
+
+        scores: List[float] = [0] * len(candidates)
+
+        for _, result_batch in stage_results:
+            for worker_id, results_set in enumerate(result_batch):
+                result: Dict[str, Any] = dill.loads(results_set)
+
+                scores[worker_id::workers_count] = result.get('scores')
+                worker_context[worker_id] = result.get('context', {})
+
+                monitoring: Dict[str, Dict[str, List[Any]]] = result.get('monitoring', {})
+                for monitor_type, monitors in monitoring.items():
+                    for monitor_name, collection_stats in monitors.items():
+                        worker_monitoring[worker_id][monitor_type][monitor_name].extend(collection_stats)
+
+        return scores
+
+    optimizer = PopulationOptimizer(
+        {
+            'graph_name': base_config.get('graph_name'),
+            'graph_id': base_config.get('graph_id'),
+            'source_stage_name': base_config.get('source_stage_name'),
+            'source_stage_id': base_config.get('source_stage_id'),
+            'params': base_config.get('optimizer_params'),
+            'stage_name': stage_name,
+            'stage_config': stage_config,
+            'iterations': base_config.get('optimizer_iterations'),
+            'time_limit': base_config.get('time_limit'),
+            'workers': assigned_workers_count
+        },
+        evaluate
+    )
+
+    try:
+        results = optimizer.optimize()
+
+    finally:
+        # Workers keep their evaluations prepared between generations, so
+        # close them everywhere once the last generation has been scored.
+        asyncio.run_coroutine_threadsafe(
+            executor.execute_on_workers(
+                close_optimize_stage,
+                dill.dumps(base_config)
+            ),
+            loop
+        ).result()
+
+    optimization_results = []
+    for worker_id, worker_config in enumerate(worker_configs):
+
+        execute_stage_config: Config = worker_config.get('execute_stage_config')
+        execute_stage_config.batch_size = results.get('optimized_batch_size', stage_config.batch_size)
+        execute_stage_config.batch_interval = results.get('optimized_batch_interval', execute_stage_config.batch_interval)
+        execute_stage_config.batch_gradient = results.get('optimized_batch_gradient', execute_stage_config.batch_gradient)
+
+        optimization_results.append({
+            'worker_id': worker_id,
+            'stage': stage_name,
+            'config': execute_stage_config,
+            'params': results,
+            'context': worker_context.get(worker_id, {}),
+            'monitoring': {
+                monitor_type: dict(monitors) for monitor_type, monitors in worker_monitoring[worker_id].items()
+            }
+        })
+
+    return optimization_results
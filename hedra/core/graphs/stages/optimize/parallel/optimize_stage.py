@@ -1,9 +1,10 @@
+import asyncio
 import dill
 import threading
 import os
 import pickle
 from collections import defaultdict
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from hedra.core.engines.client.config import Config
 from hedra.core.engines.types.playwright import (
     MercuryPlaywrightClient, 
@@ -17,6 +18,7 @@ from hedra.core.graphs.stages.base.exceptions.process_killed_error import Proces
 from hedra.core.graphs.stages.base.import_tools import (
     import_stages, 
     import_plugins,
+    load_graph,
     set_stage_hooks
 )
 from hedra.core.graphs.stages.base.stage import Stage
@@ -54,6 +56,41 @@ from hedra.versioning.flags.types.base.flag_type import FlagTypes
 
 
 HooksByType = Dict[HookType, Union[List[ActionHook], List[TaskHook]]]
+PreparedEvaluation = Tuple[asyncio.AbstractEventLoop, Stage, Execute, Optimizer]
+
+
+# Population optimization scores a generation per call, so each worker
+# keeps the stage, sessions, and loop it set up for the first generation
+# of an optimization until that optimization closes them.
+prepared_evaluations: Dict[Tuple[str, str, str, int], PreparedEvaluation] = {}
+
+
+def close_prepared_evaluations(optimization_key: Optional[Tuple[str, str, str]]=None):
+    # Closes the prepared evaluations of the given optimization, or of
+    # every optimization when no key is given.
+    for evaluation_key in list(prepared_evaluations.keys()):
+
+        if optimization_key and evaluation_key[:3] != optimization_key:
+            continue
+
+        loop, _, _, optimizer = prepared_evaluations.pop(evaluation_key)
+
+        if loop.is_closed() is False:
+            loop.run_until_complete(
+                optimizer.close()
+            )
+
+            loop.close()
+
+
+def close_optimize_stage(serialized_config: str):
+    optimization_config: Dict[str, Any] = dill.loads(serialized_config)
+
+    close_prepared_evaluations((
+        optimization_config.get('graph_id'),
+        optimization_config.get('source_stage_id'),
+        optimization_config.get('execute_stage_name')
+    ))
 
 
 async def setup_action_channels_and_playwright(
@@ -162,6 +199,11 @@ def optimize_stage(serialized_config: str):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
+    # Persistent workers run many stages, and each run closes its loop.
+    if loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
     from hedra.logging import (
         logging_manager
     )
@@ -179,6 +221,7 @@ def optimize_stage(serialized_config: str):
         logfiles_directory = optimization_config.get('logfiles_directory')
         log_level = optimization_config.get('log_level')
         enable_unstable_features = optimization_config.get('enable_unstable_features', False)
+        persistent_workers = optimization_config.get('persistent_workers', False)
         source_stage_name: str = optimization_config.get('source_stage_name')
         worker_id = optimization_config.get('worker_id')
 
@@ -240,140 +283,213 @@ def optimize_stage(serialized_config: str):
         time_limit: int = optimization_config.get('time_limit')
         batch_size: int = optimization_config.get('execute_stage_batch_size')
         execute_stage_loaded_actions = optimization_config.get('execute_stage_loaded_actions')
+        optimizer_candidates: List[List[float]] = optimization_config.get('optimizer_candidates')
 
         metadata_string = f'Graph - {graph_name}:{graph_id} - thread:{thread_id} - process:{process_id} - Stage: {source_stage_name}:{source_stage_id} - '
-        discovered: Dict[str, Stage] = import_stages(graph_path)
-        plugins_by_type = import_plugins(graph_path)
-
-        initialized_stages = {}
-        hooks_by_type = defaultdict(dict)
-        hooks_by_name = {}
-        hooks_by_shortname = defaultdict(dict)
-
-        execute_stage_config.batch_size = batch_size
-
-        generated_hooks = {}
-        for stage in discovered.values():
-            stage: Stage = stage()
-            stage.context = SimpleContext()
-            stage.graph_name = graph_name
-            stage.graph_path = graph_path
-            stage.graph_id = graph_id
-
-            for hook_shortname, hook in registrar.reserved[stage.name].items():
-                hook._call = hook._call.__get__(stage, stage.__class__)
-                setattr(stage, hook_shortname, hook._call)
-
-            initialized_stage = set_stage_hooks(
-                stage, 
-                generated_hooks
-            )
+        evaluation_key = (graph_id, source_stage_id, execute_stage_name, worker_id)
+        prepared_evaluation = None
+        if optimizer_candidates:
+            prepared_evaluation = prepared_evaluations.get(evaluation_key)
+
+        if prepared_evaluation:
+            # Later generations reuse the stage, sessions, and loop set up
+            # for this worker's first generation.
+            prepared_loop, execute_stage, setup_execute_stage, optimizer = prepared_evaluation
+            if loop is not prepared_loop:
+                loop.close()
+
+            loop = prepared_loop
+            asyncio.set_event_loop(loop)
+
+            execute_stage_config = optimizer.stage_config
+            execute_stage_config.batch_size = batch_size
+
+            pipeline_stages = {
+                setup_execute_stage.name: setup_execute_stage
+            }
 
-            for hook_type in initialized_stage.hooks:
+        else:
+            # A worker only evaluates one optimization at a time, so anything
+            # prepared for another optimization is stale.
+            stale_optimizations = set([
+                prepared_key[:3] for prepared_key in prepared_evaluations.keys() if prepared_key[:3] != evaluation_key[:3]
+            ])
+
+            for stale_optimization in stale_optimizations:
+                close_prepared_evaluations(stale_optimization)
+
+            if loop.is_closed():
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+
+            if persistent_workers:
+                discovered, plugins_by_type = load_graph(graph_path)
+
+            else:
+                discovered: Dict[str, Stage] = import_stages(graph_path)
+                plugins_by_type = import_plugins(graph_path)
+
+            initialized_stages = {}
+            hooks_by_type = defaultdict(dict)
+            hooks_by_name = {}
+            hooks_by_shortname = defaultdict(dict)
+
+            execute_stage_config.batch_size = batch_size
+
+            generated_hooks = {}
+            for stage in discovered.values():
+                stage: Stage = stage()
+                stage.context = SimpleContext()
+                stage.graph_name = graph_name
+                stage.graph_path = graph_path
+                stage.graph_id = graph_id
+
+                for hook_shortname, hook in registrar.reserved[stage.name].items():
+                    hook._call = hook._call.__get__(stage, stage.__class__)
+                    setattr(stage, hook_shortname, hook._call)
+
+                initialized_stage = set_stage_hooks(
+                    stage, 
+                    generated_hooks
+                )
 
-                for hook in initialized_stage.hooks[hook_type]:
-                    hooks_by_type[hook_type][hook.name] = hook
-                    hooks_by_name[hook.name] = hook
-                    hooks_by_shortname[hook_type][hook.shortname] = hook
+                for hook_type in initialized_stage.hooks:
 
-            initialized_stages[initialized_stage.name] = initialized_stage
+                    for hook in initialized_stage.hooks[hook_type]:
+                        hooks_by_type[hook_type][hook.name] = hook
+                        hooks_by_name[hook.name] = hook
+                        hooks_by_shortname[hook_type][hook.shortname] = hook
 
-        execute_stage: Stage = initialized_stages.get(execute_stage_name)
-        execute_stage.context.update(source_stage_context)
+                initialized_stages[initialized_stage.name] = initialized_stage
 
-        setup_stage: Setup = initialized_stages.get(execute_setup_stage_name)
-        setup_stage.context.update(source_stage_context)
+            execute_stage: Stage = initialized_stages.get(execute_stage_name)
+            execute_stage.context.update(source_stage_context)
 
-        stage_persona_plugins: List[str] = execute_stage_plugins[PluginType.PERSONA]
-        persona_plugins: Dict[str, PersonaPlugin] = plugins_by_type[PluginType.PERSONA]
+            setup_stage: Setup = initialized_stages.get(execute_setup_stage_name)
+            setup_stage.context.update(source_stage_context)
 
-        stage_engine_plugins: List[str] = execute_stage_plugins[PluginType.ENGINE]
-        engine_plugins: Dict[str, EnginePlugin] = plugins_by_type[PluginType.ENGINE]
+            stage_persona_plugins: List[str] = execute_stage_plugins[PluginType.PERSONA]
+            persona_plugins: Dict[str, PersonaPlugin] = plugins_by_type[PluginType.PERSONA]
 
-        for plugin_name in stage_persona_plugins:
-            plugin = persona_plugins.get(plugin_name)
-            plugin.name = plugin_name
-            registered_personas[plugin_name] = lambda config: plugin(config)
+            stage_engine_plugins: List[str] = execute_stage_plugins[PluginType.ENGINE]
+            engine_plugins: Dict[str, EnginePlugin] = plugins_by_type[PluginType.ENGINE]
+
+            for plugin_name in stage_persona_plugins:
+                plugin = persona_plugins.get(plugin_name)
+                plugin.name = plugin_name
+                registered_personas[plugin_name] = lambda config: plugin(config)
         
-        for plugin_name in stage_engine_plugins:
-            plugin = engine_plugins.get(plugin_name)
-            plugin.name = plugin_name
-            registered_engines[plugin_name] = lambda config: plugin(config)
+            for plugin_name in stage_engine_plugins:
+                plugin = engine_plugins.get(plugin_name)
+                plugin.name = plugin_name
+                registered_engines[plugin_name] = lambda config: plugin(config)
 
-        for plugin_name, plugin in plugins_by_type[PluginType.OPTIMIZER].items():
-            registered_algorithms[plugin_name] = plugin
+            for plugin_name, plugin in plugins_by_type[PluginType.OPTIMIZER].items():
+                registered_algorithms[plugin_name] = plugin
 
-        events_graph = EventGraph(hooks_by_type)
-        events_graph.hooks_to_events().assemble_graph().apply_graph_to_events()
+            events_graph = EventGraph(hooks_by_type)
+            events_graph.hooks_to_events().assemble_graph().apply_graph_to_events()
 
-        for stage in initialized_stages.values():
-            stage.dispatcher.assemble_action_and_task_subgraphs()
+            for stage in initialized_stages.values():
+                stage.dispatcher.assemble_action_and_task_subgraphs()
 
-        setup_stage: Setup = initialized_stages.get(execute_setup_stage_name)
+            setup_stage: Setup = initialized_stages.get(execute_setup_stage_name)
 
-        setup_execute_stage: Execute = loop.run_until_complete(setup_action_channels_and_playwright(
-            setup_stage=setup_stage,
-            logger=logger,
-            metadata_string=metadata_string,
-            persona_config=execute_stage_config,
-            execute_stage=execute_stage,
-            loaded_actions=execute_stage_loaded_actions
-        ))
+            setup_execute_stage: Execute = loop.run_until_complete(setup_action_channels_and_playwright(
+                setup_stage=setup_stage,
+                logger=logger,
+                metadata_string=metadata_string,
+                persona_config=execute_stage_config,
+                execute_stage=execute_stage,
+                loaded_actions=execute_stage_loaded_actions
+            ))
 
-        pipeline_stages = {
-            setup_execute_stage.name: setup_execute_stage
-        }
+            pipeline_stages = {
+                setup_execute_stage.name: setup_execute_stage
+            }
 
-        logger.filesystem.sync['hedra.optimize'].info(f'{metadata_string} - Setting up Optimization')
+            logger.filesystem.sync['hedra.optimize'].info(f'{metadata_string} - Setting up Optimization')
+
+            if optimizer_candidates:
+                optimizer = Optimizer({
+                    'graph_name': graph_name,
+                    'graph_id': graph_id,
+                    'source_stage_name': source_stage_name,
+                    'source_stage_id': source_stage_id,
+                    'params': optimizer_params,
+                    'stage_name': execute_stage_name,
+                    'stage_config': execute_stage_config,
+                    'stage_hooks': setup_execute_stage.hooks,
+                    'iterations': optimizer_iterations,
+                    'algorithm': optimizer_algorithm,
+                    'time_limit': time_limit,
+                    'stream_analytics': execute_stage_streamed_analytics
+                })
+
+            elif execute_stage_config.experiment and execute_stage_config.experiment.get('distribution'):
+
+                execute_stage_config.experiment['distribution'] = [
+                    int(distribution_value/optimize_stage_workers) for distribution_value in execute_stage_config.experiment.get('distribution')
+                ]
+
+                optimizer = DistributionFitOptimizer({
+                    'graph_name': graph_name,
+                    'graph_id': graph_id,
+                    'source_stage_name': source_stage_name,
+                    'source_stage_id': source_stage_id,
+                    'params': optimizer_params,
+                    'stage_name': execute_stage_name,
+                    'stage_config': execute_stage_config,
+                    'stage_hooks': setup_execute_stage.hooks,
+                    'iterations': optimizer_iterations,
+                    'algorithm': optimizer_algorithm,
+                    'time_limit': time_limit,
+                    'stream_analytics': execute_stage_streamed_analytics
+                })
+
+            else:
+                optimizer = Optimizer({
+                    'graph_name': graph_name,
+                    'graph_id': graph_id,
+                    'source_stage_name': source_stage_name,
+                    'source_stage_id': source_stage_id,
+                    'params': optimizer_params,
+                    'stage_name': execute_stage_name,
+                    'stage_config': execute_stage_config,
+                    'stage_hooks': setup_execute_stage.hooks,
+                    'iterations': optimizer_iterations,
+                    'algorithm': optimizer_algorithm,
+                    'time_limit': time_limit,
+                    'stream_analytics': execute_stage_streamed_analytics
+                })
+
+            if optimizer_candidates:
+                prepared_evaluations[evaluation_key] = (
+                    loop,
+                    execute_stage,
+                    setup_execute_stage,
+                    optimizer
+                )
 
-        if execute_stage_config.experiment and execute_stage_config.experiment.get('distribution'):
+        scores: List[float] = []
+        results = {}
 
-            execute_stage_config.experiment['distribution'] = [
-                int(distribution_value/optimize_stage_workers) for distribution_value in execute_stage_config.experiment.get('distribution')
-            ]
+        if optimizer_candidates:
+            scores = optimizer.evaluate(optimizer_candidates)
 
-            optimizer = DistributionFitOptimizer({
-                'graph_name': graph_name,
-                'graph_id': graph_id,
-                'source_stage_name': source_stage_name,
-                'source_stage_id': source_stage_id,
-                'params': optimizer_params,
-                'stage_name': execute_stage_name,
-                'stage_config': execute_stage_config,
-                'stage_hooks': setup_execute_stage.hooks,
-                'iterations': optimizer_iterations,
-                'algorithm': optimizer_algorithm,
-                'time_limit': time_limit,
-                'stream_analytics': execute_stage_streamed_analytics
-            })
+            logger.filesystem.sync['hedra.optimize'].info(f'{optimizer.metadata_string} - Evaluated - {len(scores)} - candidates')
 
         else:
-            optimizer = Optimizer({
-                'graph_name': graph_name,
-                'graph_id': graph_id,
-                'source_stage_name': source_stage_name,
-                'source_stage_id': source_stage_id,
-                'params': optimizer_params,
-                'stage_name': execute_stage_name,
-                'stage_config': execute_stage_config,
-                'stage_hooks': setup_execute_stage.hooks,
-                'iterations': optimizer_iterations,
-                'algorithm': optimizer_algorithm,
-                'time_limit': time_limit,
-                'stream_analytics': execute_stage_streamed_analytics
-            })
-
+            results = optimizer.optimize()
 
-        results = optimizer.optimize()
+            if execute_stage_config.experiment and results.get('optimized_distribution'):
+                execute_stage_config.experiment['distribution'] = results.get('optimized_distribution')
 
-        if execute_stage_config.experiment and results.get('optimized_distribution'):
-            execute_stage_config.experiment['distribution'] = results.get('optimized_distribution')
+            execute_stage_config.batch_size = results.get('optimized_batch_size', execute_stage_config.batch_size)
+            execute_stage_config.batch_interval = results.get('optimized_batch_interval', execute_stage_config.batch_gradient)
+            execute_stage_config.batch_gradient = results.get('optimized_batch_gradient', execute_stage_config.batch_gradient)
 
-        execute_stage_config.batch_size = results.get('optimized_batch_size', execute_stage_config.batch_size)
-        execute_stage_config.batch_interval = results.get('optimized_batch_interval', execute_stage_config.batch_gradient)
-        execute_stage_config.batch_gradient = results.get('optimized_batch_gradient', execute_stage_config.batch_gradient)
-
-        logger.filesystem.sync['hedra.optimize'].info(f'{optimizer.metadata_string} - Optimization complete')
+            logger.filesystem.sync['hedra.optimize'].info(f'{optimizer.metadata_string} - Optimization complete')
 
         context = {}
         for stage in pipeline_stages.values():
@@ -407,13 +523,20 @@ def optimize_stage(serialized_config: str):
         cpu_monitor.close()
         memory_monitor.close()
         
-        loop.close()
+        if optimizer_candidates is None:
+            loop.close()
+
+        else:
+            # The prepared loop belongs to the evaluation cache, so detach it
+            # to keep later stages on this worker from reusing or closing it.
+            asyncio.set_event_loop(None)
         
         return dill.dumps({
             'worker_id': worker_id,
             'stage': execute_stage.name,
             'config': execute_stage_config,
             'params': results,
+            'scores': scores,
             'context': context,
             'monitoring': {
                 'cpu': cpu_monitor.collected,
@@ -14,12 +14,14 @@ from typing import (
 from hedra.core.experiments.experiment import Experiment
 from hedra.core.engines.client.client import Client
 from hedra.core.engines.client.config import Config
+from hedra.core.engines.client.concurrency_control_config import ConcurrencyControlConfig
 from hedra.core.engines.client.tracing_config import TracingConfig
 from hedra.core.hooks.types.condition.decorator import condition
 from hedra.core.hooks.types.context.decorator import context
 from hedra.core.hooks.types.event.decorator import event
 from hedra.core.hooks.types.transform.decorator import transform
 from hedra.core.engines.types.common.action_registry import actions_registry
+from hedra.core.engines.types.common.dns_cache import dns_cache
 from hedra.core.hooks.types.base.hook import Hook
 from hedra.core.hooks.types.base.hook_type import HookType
 from hedra.core.hooks.types.internal.decorator import Internal
@@ -105,6 +107,17 @@ class Setup(Stage, Generic[Unpack[T]]):
     connect_timeout=10
     request_timeout=60
     reset_connections=False
+    prewarm_connections=1
+    pipeline_depth=1
+    multiplexed_connections=0
+    websocket_session_window=0
+    dns_strategy='first'
+    quic_early_data=False
+    columnar_results=False
+    shared_memory_results=False
+    stream_results=False
+    timing_sketches=False
+    aggregate_results=False
     apply_to_stages=[]
     browser_type: str='chromium'
     device_type: str=None
@@ -113,6 +126,7 @@ class Setup(Stage, Generic[Unpack[T]]):
     permissions: List[str]=[]
     playwright_options: Dict[str, Any]={}
     tracing: TracingConfig=None
+    concurrency_control: ConcurrencyControlConfig=None
     priority: Optional[str]=None
     actions_filepaths: Optional[Dict[str, str]]=None
     retries: int=0
@@ -144,6 +158,17 @@ class Setup(Stage, Generic[Unpack[T]]):
             request_timeout=self.request_timeout,
             graceful_stop=self.graceful_stop,
             reset_connections=self.reset_connections,
+            prewarm_connections=self.prewarm_connections,
+            pipeline_depth=self.pipeline_depth,
+            multiplexed_connections=self.multiplexed_connections,
+            websocket_session_window=self.websocket_session_window,
+            dns_strategy=self.dns_strategy,
+            quic_early_data=self.quic_early_data,
+            columnar_results=self.columnar_results,
+            shared_memory_results=self.shared_memory_results,
+            stream_results=self.stream_results,
+            timing_sketches=self.timing_sketches,
+            aggregate_results=self.aggregate_results,
             browser_type=self.browser_type,
             device_type=self.device_type,
             locale=self.locale,
@@ -151,6 +176,7 @@ class Setup(Stage, Generic[Unpack[T]]):
             permissions=self.permissions,
             playwright_options=self.playwright_options,
             tracing=self.tracing,
+            concurrency_control=self.concurrency_control,
             actions_filepaths=self.actions_filepaths
         )
 
@@ -270,6 +296,12 @@ class Setup(Stage, Generic[Unpack[T]]):
 
         setup_stage_configs = {}
 
+        # The DNS cache is shared by every engine in the process, so this
+        # runs in each worker's setup as well.
+        dns_cache.configure(
+            strategy=setup_stage_target_config.dns_strategy
+        )
+
         await self.logger.spinner.append_message(f'Setting up - {execute_stage_names}')
 
         execute_stage_id = 1
@@ -150,6 +150,7 @@ class TransitionAssembler:
 
             generation_transitions = TransitionGroup()
             generation_transitions.cpu_pool_size = self.cpus
+            generation_transitions.persistent_workers = self.core_config.get('persistent_workers', False)
 
             stage_pool_size = self.cpus
 
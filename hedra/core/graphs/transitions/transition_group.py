@@ -31,6 +31,7 @@ class TransitionGroup:
         self.adjacency_list: Dict[str, List[Transition]] = []
         self.transition_idx = 0
         self.cpu_pool_size = 0
+        self.persistent_workers = False
         self._batched_transitions: List[List[Transition]] = []
         self._transition_configs: Dict[Tuple[str, str, str, int], int] = {}
         self._executors: List[BatchExecutor] = []
@@ -154,7 +155,12 @@ class TransitionGroup:
     
         if workers > 0:
             transition.edge.source.workers = workers
-            executor = BatchExecutor(max_workers=workers)
+            executor = BatchExecutor(
+                max_workers=workers,
+                persistent=self.persistent_workers,
+                pool_size=self.cpu_pool_size,
+                graph_path=transition.edge.source.graph_path
+            )
             transition.edge.source.executor = executor
             self._executors.append(executor)
         
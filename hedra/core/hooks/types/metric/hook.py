@@ -16,6 +16,7 @@ from typing import (
 from hedra.core.hooks.types.base.hook import Hook
 from hedra.core.hooks.types.base.hook_type import HookType
 from hedra.core.engines.types.common.base_result import BaseResult
+from hedra.core.engines.types.common.shared_columnar_results import SharedColumnarResults
 from hedra.core.engines.types.common.results_set import ResultsSet
 from hedra.reporting.metric.custom_metric import CustomMetric
 
@@ -170,6 +171,17 @@ class MetricHook(Hook):
         stage_results: Dict[str, List[BaseResult]] = defaultdict(list)
 
         for results_set in results.values():
+
+            columnar_results = results_set.columnar_results
+            if isinstance(columnar_results, SharedColumnarResults):
+                columnar_results = columnar_results.load()
+
+            if columnar_results:
+                for action_name in columnar_results.names:
+                    stage_results[action_name].extend(
+                        columnar_results.to_results(action_name)
+                    )
+
             for result in results_set.results:
                 stage_result: BaseResult = dill.loads(result)
                 stage_results[stage_result.name].append(stage_result)
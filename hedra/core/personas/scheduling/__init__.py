@@ -0,0 +1 @@
+from .arrival_scheduler import ArrivalScheduler
\ No newline at end of file
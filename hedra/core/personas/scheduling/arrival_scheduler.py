@@ -0,0 +1,114 @@
+import asyncio
+import heapq
+import time
+from typing import AsyncIterator, Callable, List, Tuple, Union
+
+
+ArrivalRate = Union[float, Callable[[float], float]]
+
+
+class ArrivalScheduler:
+
+    '''
+    Open-model arrival schedule. Each action has a timer in a heap of
+    intended start times. A timer advances from its previous intended
+    start, not from when it actually fired. Arrivals that fall behind
+    fire at once to catch up and never shift the schedule, and no
+    arrival waits on the response to an earlier one.
+
+    The intended start of the most recent arrival is kept in the engines'
+    monotonic clock, so it can be set beside a result's actual start.
+
+    `rate` is the total arrivals per second across all actions. It can be
+    a number or a function of the seconds elapsed since the schedule
+    started.
+    '''
+
+    __slots__ = (
+        'rate',
+        'actions_count',
+        'intended_start',
+        'arrivals_count',
+        'late_arrivals',
+        'max_lag'
+    )
+
+    min_rate = 0.001
+    late_threshold = 0.001
+    max_catch_up = 64
+
+    def __init__(
+        self,
+        rate: ArrivalRate,
+        actions_count: int
+    ) -> None:
+        self.rate = rate
+        self.actions_count = max(actions_count, 1)
+        self.intended_start = 0
+        self.arrivals_count = 0
+        self.late_arrivals = 0
+        self.max_lag = 0
+
+    def rate_at(self, elapsed: float) -> float:
+        rate = self.rate
+        if callable(rate):
+            rate = rate(elapsed)
+
+        return max(rate, self.min_rate)
+
+    async def arrivals(self, total_time: float) -> AsyncIterator[int]:
+        start = time.monotonic()
+        end = start + total_time
+
+        # Actions start staggered by one arrival interval, so the
+        # schedule interleaves actions rather than firing them in bursts.
+        first_interval = 1/self.rate_at(0)
+        timers: List[Tuple[float, int]] = [
+            (
+                start + action_idx * first_interval,
+                action_idx
+            ) for action_idx in range(self.actions_count)
+        ]
+
+        heapq.heapify(timers)
+        overdue = 0
+
+        while timers:
+            intended_start, action_idx = timers[0]
+            if intended_start >= end:
+                break
+
+            delay = intended_start - time.monotonic()
+
+            if delay > 0:
+                overdue = 0
+                await asyncio.sleep(delay)
+
+            else:
+                # Catching up must still let issued requests run.
+                overdue += 1
+                if overdue >= self.max_catch_up:
+                    overdue = 0
+                    await asyncio.sleep(0)
+
+            lag = time.monotonic() - intended_start
+            if lag > self.late_threshold:
+                self.late_arrivals += 1
+
+                if lag > self.max_lag:
+                    self.max_lag = lag
+
+            self.intended_start = intended_start
+            self.arrivals_count += 1
+
+            rate = self.rate_at(intended_start - start)
+
+            heapq.heapreplace(
+                timers,
+                (
+                    intended_start + self.actions_count/rate,
+                    action_idx
+                )
+            )
+
+            yield action_idx
@@ -1,2 +1,3 @@
 from .stream_analytics import StreamAnalytics
-from .stream import Stream
\ No newline at end of file
+from .stream import Stream
+from .interval_accumulator import IntervalAccumulator
\ No newline at end of file
@@ -0,0 +1,164 @@
+import math
+from typing import Any, Dict, List, Union
+
+
+TimingStats = Dict[str, Union[int, float]]
+
+
+class IntervalTimings:
+
+    '''
+    Running stats for one timing group over a streaming interval. Each
+    timing is counted in a fixed-size, log-spaced histogram, so adding a
+    timing is O(1) and the median is read from the histogram in a fixed
+    number of steps regardless of how many timings were added.
+    '''
+
+    __slots__ = (
+        'count',
+        'total',
+        'total_squares',
+        'minimum',
+        'maximum',
+        'buckets'
+    )
+
+    min_timing = 1e-6
+    growth = 1.05
+    log_growth = math.log(growth)
+    buckets_count = 512
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.buckets: List[int] = [0] * self.buckets_count
+
+    def add(self, timing: float):
+        self.count += 1
+        self.total += timing
+        self.total_squares += timing * timing
+
+        if timing < self.minimum:
+            self.minimum = timing
+
+        if timing > self.maximum:
+            self.maximum = timing
+
+        bucket_idx = 0
+        if timing > self.min_timing:
+            bucket_idx = min(
+                int(math.log(timing/self.min_timing)/self.log_growth),
+                self.buckets_count - 1
+            )
+
+        self.buckets[bucket_idx] += 1
+
+    def median(self) -> float:
+        midpoint = (self.count - 1)/2
+        seen = 0
+
+        for bucket_idx, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+
+            if seen > midpoint:
+                # Geometric center of the bucket's range.
+                estimate = self.min_timing * self.growth ** (bucket_idx + 0.5)
+                return min(
+                    max(estimate, self.minimum),
+                    self.maximum
+                )
+
+        return 0
+
+    def to_dict(self) -> TimingStats:
+
+        if self.count == 0:
+            return {
+                'maximum': 0,
+                'minimum': 0,
+                'median': 0,
+                'mean': 0,
+                'stdev': 0,
+                'variance': 0
+            }
+
+        mean = self.total/self.count
+        variance = max(self.total_squares/self.count - mean * mean, 0)
+
+        return {
+            'maximum': self.maximum,
+            'minimum': self.minimum,
+            'median': self.median(),
+            'mean': mean,
+            'stdev': math.sqrt(variance),
+            'variance': variance
+        }
+
+
+class IntervalAccumulator:
+
+    __slots__ = (
+        'completed',
+        'succeeded',
+        'failed',
+        'timings'
+    )
+
+    timing_groups = (
+        'total',
+        'waiting',
+        'connecting',
+        'writing',
+        'reading'
+    )
+
+    def __init__(self) -> None:
+        self.completed = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.timings: Dict[str, IntervalTimings] = {
+            timing_group: IntervalTimings() for timing_group in self.timing_groups
+        }
+
+    def add(self, result: Any):
+        self.completed += 1
+
+        # Runtime errors raised by the engine are recorded as failures
+        # with no timings.
+        error = getattr(result, 'error', result)
+        if error is not None:
+            self.failed += 1
+
+        else:
+            self.succeeded += 1
+
+        if not hasattr(result, 'complete'):
+            return
+
+        timings = self.timings
+        timings['total'].add(result.complete - result.start)
+        timings['waiting'].add(result.start - result.wait_start)
+        timings['connecting'].add(result.connect_end - result.start)
+        timings['writing'].add(result.write_end - result.connect_end)
+        timings['reading'].add(result.complete - result.write_end)
+
+    def snapshot(self) -> Dict[str, Union[int, Dict[str, TimingStats]]]:
+        return {
+            'completed': self.completed,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'timings': {
+                timing_group: timings.to_dict() for timing_group, timings in self.timings.items()
+            }
+        }
+
+    def reset(self):
+        self.completed = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.timings = {
+            timing_group: IntervalTimings() for timing_group in self.timing_groups
+        }
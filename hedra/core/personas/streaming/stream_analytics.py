@@ -27,16 +27,15 @@ class StreamAnalytics:
             batch_elapsed: float
         ):
 
-        completed_count = len(stream.completed)
+        interval = stream.accumulator.snapshot()
+
+        completed_count = interval['completed']
         self.interval_completion_rates.append(
             completed_count/batch_elapsed
         )
 
         self.interval_completed_counts.append(completed_count)
-        self.interval_succeeded_counts.append(stream.succeeded)
-        self.interval_failed_counts.append(stream.failed)
-        self.interval_timings.append(stream.timings)
+        self.interval_succeeded_counts.append(interval['succeeded'])
+        self.interval_failed_counts.append(interval['failed'])
+        self.interval_timings.append(interval['timings'])
         self.interval_batch_timings.append(batch_elapsed)
-
-    
-
@@ -4,8 +4,13 @@ import psutil
 import uuid
 import math
 from typing import (
+    Any,
+    Awaitable,
+    Callable,
     Dict, 
     List, 
+    Set,
+    Tuple,
     Union,
     Optional
 )
@@ -16,7 +21,10 @@ from hedra.core.personas.batching.batch import Batch
 from hedra.core.hooks.types.action.hook import ActionHook
 from hedra.core.hooks.types.task.hook import TaskHook
 from hedra.core.engines.client.config import Config
+from hedra.core.engines.types.common.base_result import BaseResult
+from hedra.core.engines.types.common.columnar_results import ColumnarResults
 from hedra.core.personas.types.types import PersonaTypes
+from hedra.core.personas.scheduling import ArrivalScheduler
 from hedra.core.personas.streaming import (
     Stream,
     StreamAnalytics
@@ -26,6 +34,7 @@ from hedra.monitoring import (
     MemoryMonitor
 )
 from hedra.reporting.processed_result.results import results_types
+from hedra.reporting.processed_result.results_aggregate import ResultsAggregate
 from hedra.reporting.reporter import (
     Reporter,
     ReporterConfig
@@ -98,7 +107,13 @@ class DefaultPersona:
         'collection_interval',
         'bypass_cleanup',
         'cpu_monitor',
-        'memory_monitor'
+        'memory_monitor',
+        'stream_results',
+        'aggregate_results',
+        'results_reducer',
+        'results_buffer',
+        'active_tasks',
+        'scheduler'
     )    
 
     def __init__(self, config: Config):
@@ -148,6 +163,13 @@ class DefaultPersona:
         self.cpu_monitor = CPUMonitor()
         self.memory_monitor = MemoryMonitor()
 
+        self.stream_results: bool = config.stream_results
+        self.aggregate_results: bool = config.aggregate_results
+        self.results_reducer: Optional[Callable[[BaseResult], Any]] = None
+        self.results_buffer: Optional[Union[ColumnarResults, ResultsAggregate]] = None
+        self.active_tasks: Set[asyncio.Task] = set()
+        self.scheduler: Optional[ArrivalScheduler] = None
+
     def setup(
             self, 
             hooks: Dict[HookType, List[Union[ActionHook, TaskHook]]], 
@@ -189,12 +211,43 @@ class DefaultPersona:
         self._stream = len(self.stream_reporters) > 0 and self.optimization_active is False
 
         if self._stream or self.collect_analytics:
-            self.stream = Stream()
+            self.stream = Stream(retain_completed=self._stream)
+
+        self.aggregate_results = self.aggregate_results and self.optimization_active is False
+        self.stream_results = (
+            self.stream_results or self.aggregate_results
+        ) and self.optimization_active is False
+
+        if self.aggregate_results and self.results_reducer is None:
+            self.results_buffer = ResultsAggregate(self.stage_name)
+            self.results_reducer = self.results_buffer.add
+
+        elif self.stream_results and self.results_reducer is None:
+            self.results_buffer = ColumnarResults()
+            self.results_reducer = self.results_buffer.append
 
     async def set_concurrency(self, concurrency: int):
         for hook in self._hooks:
             await hook.session.set_pool(concurrency)
 
+    async def _close_sessions(self, hooks: List[Union[ActionHook, TaskHook]]):
+
+        # Optimizer iterations share sessions, so the optimizer closes
+        # them once it is done rather than after every iteration.
+        if self.optimization_active:
+            return
+
+        for hook in hooks:
+
+            session_closed_start = time.monotonic()
+
+            await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Closing session - {hook.session.session_id} - for Hook - {hook.name}:{hook.hook_id}')
+            await hook.session.close()
+
+            session_closed_elapsed = time.monotonic() - session_closed_start
+
+            await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Closed session - {hook.session.session_id} - for Hook - {hook.name}:{hook.hook_id}. Took: {round(session_closed_elapsed, 2)} seconds')
+
     async def execute(self):
         hooks = self._hooks
         hook_names = ', '.join([
@@ -208,7 +261,6 @@ class DefaultPersona:
         monitor_name = f'{self.stage_name}.persona'
 
         await self.logger.filesystem.aio['hedra.core'].debug(f'{self.metadata_string} - Executing for a total of - {total_time} - seconds')
-        loop = asyncio.get_running_loop()
         if self._stream or self.collect_analytics:
 
             for reporter in self.stream_reporters:
@@ -223,13 +275,12 @@ class DefaultPersona:
             await self.start_stream()
 
             self.start = time.monotonic()
-            completed, pending = await asyncio.wait([
-                loop.create_task(
-                    self.stream.execute_action(
-                        hooks[action_idx]
-                    )
-                ) async for action_idx in self.generator(total_time)
-            ], timeout=self.graceful_stop)
+            completed, pending = await self._run_actions(
+                total_time,
+                lambda action_idx: self.stream.execute_action(
+                    hooks[action_idx]
+                )
+            )
 
             self.end = time.monotonic()
 
@@ -247,13 +298,12 @@ class DefaultPersona:
             await self.memory_monitor.start_background_monitor(monitor_name)
 
             self.start = time.monotonic()
-            completed, pending = await asyncio.wait([
-                loop.create_task(
-                    hooks[action_idx].session.execute_prepared_request(
-                        hooks[action_idx].action
-                    )
-                ) async for action_idx in self.generator(total_time)
-            ], timeout=self.graceful_stop)
+            completed, pending = await self._run_actions(
+                total_time,
+                lambda action_idx: hooks[action_idx].session.execute_prepared_request(
+                    hooks[action_idx].action
+                )
+            )
 
             self.end = time.monotonic()
 
@@ -295,25 +345,105 @@ class DefaultPersona:
             f'{self.metadata_string} - Cleanup completed - Resolved {self.pending_actions} pending actions in {round(cleanup_elapsed, 2)} seconds'
         )
 
-        for hook in hooks:
-
-            session_closed_start = time.monotonic()
-
-            await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Closing session - {hook.session.session_id} - for Hook - {hook.name}:{hook.hook_id}')
-            await hook.session.close()
-
-            session_closed_elapsed = time.monotonic() - session_closed_start
+        await self._close_sessions(hooks)
 
-            await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Closed session - {hook.session.session_id} - for Hook - {hook.name}:{hook.hook_id}. Took: {round(session_closed_elapsed, 2)} seconds')
-        
         self.total_actions = len(set(results))
         self.total_elapsed = self.end - self.start
         self.optimized_params = None
 
         await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Completed execution')
 
+        if self.stream_results:
+            self.total_actions = self.completed_actions
+            return self.results_buffer
+
         return results
 
+    async def _run_actions(
+        self,
+        total_time: float,
+        execute_action: Callable[[int], Awaitable[BaseResult]]
+    ) -> Tuple[Set[asyncio.Task], Set[asyncio.Task]]:
+        loop = asyncio.get_running_loop()
+
+        self.scheduler = self.create_scheduler()
+        if self.scheduler:
+            execute_action = self._with_intended_start(execute_action)
+
+        if self.stream_results is False:
+            return await asyncio.wait([
+                loop.create_task(
+                    execute_action(action_idx)
+                ) async for action_idx in self.generator(total_time)
+            ], timeout=self.graceful_stop)
+
+        # Completed tasks are dropped as soon as their result has been
+        # handed to the reducer, so only in-flight actions are held.
+        async for action_idx in self.generator(total_time):
+            task = loop.create_task(
+                execute_action(action_idx)
+            )
+
+            self.active_tasks.add(task)
+            task.add_done_callback(self._drain_completed)
+
+        if len(self.active_tasks) < 1:
+            return set(), set()
+
+        _, pending = await asyncio.wait(
+            list(self.active_tasks),
+            timeout=self.graceful_stop
+        )
+
+        return set(), pending
+
+    def create_scheduler(self) -> Optional[ArrivalScheduler]:
+        return None
+
+    def _with_intended_start(
+        self,
+        execute_action: Callable[[int], Awaitable[BaseResult]]
+    ) -> Callable[[int], Awaitable[BaseResult]]:
+        scheduler = self.scheduler
+
+        # The intended start is read when the action is issued, before
+        # the scheduler moves on to the next arrival.
+        return lambda action_idx: self._execute_scheduled(
+            execute_action(action_idx),
+            scheduler.intended_start
+        )
+
+    async def _execute_scheduled(
+        self,
+        action: Awaitable[BaseResult],
+        intended_start: float
+    ) -> BaseResult:
+        result = await action
+
+        if isinstance(result, BaseResult):
+            result.intended_start = intended_start
+
+        return result
+
+    async def _log_arrivals(self):
+        scheduler = self.scheduler
+
+        if scheduler and scheduler.late_arrivals > 0:
+            await self.logger.filesystem.aio['hedra.core'].info(
+                f'{self.metadata_string} - {scheduler.late_arrivals} of {scheduler.arrivals_count} arrivals started late - Max lag {round(scheduler.max_lag, 4)} seconds'
+            )
+
+    def _drain_completed(self, task: asyncio.Task):
+        self.active_tasks.discard(task)
+
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        result = task.result()
+        if isinstance(result, BaseResult):
+            self.results_reducer(result)
+            self.completed_actions += 1
+
     async def generator(self, total_time):
         elapsed = 0
         max_pool_size = math.ceil(self.batch.size * (psutil.cpu_count(logical=False)**2)/self.workers)
@@ -389,9 +519,9 @@ class DefaultPersona:
                     )
 
             batch_start = time.time()
-            self.stream.completed = []
+            self.stream.reset_interval()
 
-        self.stream.completed = []
+        self.stream.reset_interval()
 
         if self._stream:
             await asyncio.gather(*stream_submission_tasks)
@@ -1,5 +1,6 @@
 import dill
 import traceback
+from hedra.core.engines.types.common.concurrency import ConcurrencyController
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.graphql.action import GraphQLAction
 from hedra.core.engines.types.graphql.result import GraphQLResult
@@ -130,10 +131,15 @@ class Serializer:
         serializable_hook = hook.to_dict()
         serializable_client_config = hook.session.config_to_dict()
 
+        serializable_concurrency_control = None
+        if hook.session.concurrency_controller:
+            serializable_concurrency_control = hook.session.concurrency_controller.to_dict()
+
         return dill.dumps({
             'hook': serializable_hook,
             'action': serializable_action,
-            'client_config': serializable_client_config
+            'client_config': serializable_client_config,
+            'concurrency_control': serializable_concurrency_control
         })
     
     def deserialize_action(
@@ -193,6 +199,13 @@ class Serializer:
         action_hook.action = action
 
         session = serializer.deserialize_client_config(deserialized_client_config)
+
+        deserialized_concurrency_control = deserialized_hook.get('concurrency_control')
+        if deserialized_concurrency_control:
+            session.concurrency_controller = ConcurrencyController(
+                **deserialized_concurrency_control
+            )
+
         action_hook.session = session
 
         return action_hook
@@ -37,6 +37,7 @@ class BaseSerializer:
             'user': result.user,
             'tags': result.tags,
             'type': result.type,
+            'intended_start': float(result.intended_start),
             'wait_start': float(result.wait_start),
             'start': float(result.start),
             'connect_end': float(result.connect_end),
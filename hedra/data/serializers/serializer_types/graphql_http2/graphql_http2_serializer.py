@@ -67,7 +67,8 @@ class GraphQLHTTP2Serializer(BaseSerializer):
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
             ),
-            reset_connections=client_config.get('reset_sessions')
+            reset_connections=client_config.get('reset_sessions'),
+            multiplexed_connections=client_config.get('multiplexed_connections', 0)
         )
     
     def result_to_serializable(
@@ -128,6 +129,7 @@ class GraphQLHTTP2Serializer(BaseSerializer):
         deserialized_result.reason = result.get('reason')
         deserialized_result.params = result.get('params')
         deserialized_result.query = result.get('query')
+        deserialized_result.intended_start = result.get('intended_start', 0)
         deserialized_result.wait_start = result.get('wait_start')
         deserialized_result.start = result.get('start')
         deserialized_result.connect_end = result.get('connect_end')
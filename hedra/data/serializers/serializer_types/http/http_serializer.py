@@ -37,6 +37,7 @@ class HTTPSerializer(BaseSerializer):
             'redirects': action.redirects,
             'is_setup': action.is_setup,
             'action_args': action.action_args,
+            'body_retention': action.body_retention.to_dict()
         }
     
     def deserialize_action(
@@ -54,7 +55,8 @@ class HTTPSerializer(BaseSerializer):
             data=action.get('data'),
             user=metadata.get('user'),
             tags=metadata.get('tags', []),
-            redirects=action.get('redirects', 3)
+            redirects=action.get('redirects', 3),
+            body_retention=action.get('body_retention')
         )
 
         http_action.url.ip_addr = url_config.get('ip_addr')
@@ -71,7 +73,9 @@ class HTTPSerializer(BaseSerializer):
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
             ),
-            reset_connections=client_config.get('reset_sessions')
+            reset_connections=client_config.get('reset_sessions'),
+            prewarm_connections=client_config.get('prewarm_connections', 1),
+            pipeline_depth=client_config.get('pipeline_depth', 1)
         )
     
     def result_to_serializable(
@@ -99,6 +103,9 @@ class HTTPSerializer(BaseSerializer):
             'type': result.type,
             'headers': encoded_headers,
             'body': body,
+            'body_size': result.body_size,
+            'body_checksum': result.body_checksum,
+            'body_retention': result.body_retention,
             'tags': result.tags,
             'user': result.user,
             'error': str(result.error),
@@ -128,10 +135,17 @@ class HTTPSerializer(BaseSerializer):
             body = body.encode()
 
         deserialized_result.body = body
+        deserialized_result.body_size = result.get('body_size', 0)
+        deserialized_result.body_checksum = result.get('body_checksum')
+        deserialized_result.body_retention = result.get(
+            'body_retention',
+            deserialized_result.body_retention
+        )
         deserialized_result.status = result.get('status')
         deserialized_result.reason = result.get('reason')
         deserialized_result.params = result.get('params')
         deserialized_result.query = result.get('query')
+        deserialized_result.intended_start = result.get('intended_start', 0)
         deserialized_result.wait_start = result.get('wait_start')
         deserialized_result.start = result.get('start')
         deserialized_result.connect_end = result.get('connect_end')
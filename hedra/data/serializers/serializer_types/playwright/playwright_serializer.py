@@ -213,6 +213,7 @@ class PlaywrightSerializer(BaseSerializer):
         )
 
         playwright_result.checks = result.get('checks')
+        playwright_result.intended_start = result.get('intended_start', 0)
         playwright_result.wait_start = result.get('wait_start')
         playwright_result.start = result.get('start')
         playwright_result.connect_end = result.get('connect_end')
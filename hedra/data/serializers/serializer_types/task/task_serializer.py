@@ -83,6 +83,7 @@ class TaskSerializer(BaseSerializer):
      
   
         task_result.checks = result.get('checks')
+        task_result.intended_start = result.get('intended_start', 0)
         task_result.wait_start = result.get('wait_start')
         task_result.start = result.get('start')
         task_result.connect_end = result.get('connect_end')
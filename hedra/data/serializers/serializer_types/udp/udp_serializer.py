@@ -119,6 +119,7 @@ class UDPSerializer(BaseSerializer):
         deserialized_result.body = body
         deserialized_result.status = result.get('status')
         deserialized_result.checks = result.get('checks')
+        deserialized_result.intended_start = result.get('intended_start', 0)
         deserialized_result.wait_start = result.get('wait_start')
         deserialized_result.start = result.get('start')
         deserialized_result.connect_end = result.get('connect_end')
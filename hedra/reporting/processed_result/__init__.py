@@ -1,2 +1,3 @@
 from .results import results_types
-from .processed_results_group import ProcessedResultsGroup
\ No newline at end of file
+from .processed_results_group import ProcessedResultsGroup
+from .results_aggregate import ResultsAggregate
\ No newline at end of file
@@ -3,11 +3,14 @@ import uuid
 import numpy
 from collections import defaultdict
 from typing import Any, Dict, Union
+from hedra.core.engines.types.common.columnar_results import ColumnarResults
+from hedra.core.engines.types.common.types import RequestTypes
 from hedra.reporting.stats import (
     Median,
     Mean,
     Variance,
-    StandardDeviation
+    StandardDeviation,
+    TimingSketch
 )
 from .results import results_types
 from .types.task_processed_result import TaskProcessedResult
@@ -31,18 +34,22 @@ class ProcessedResultsGroup:
         'succeeded',
         'failed',
         'errors',
+        'timing_sketches',
+        'sketches',
         '_streaming_mean',
         '_streaming_variance',
         '_streaming_stdev',
         '_streaming_median'
     )
 
-    def __init__(self) -> None:
+    def __init__(self, timing_sketches: bool=False) -> None:
 
         self.events_group_id = str(uuid.uuid4())
 
         self.groups: Dict[Dict[str, Union[int, float]]] = {}
         self.timings = defaultdict(list)
+        self.timing_sketches = timing_sketches
+        self.sketches: Dict[str, TimingSketch] = defaultdict(TimingSketch)
         self.source = None
         self.tags = {}
         self.total = 0
@@ -78,14 +85,109 @@ class ProcessedResultsGroup:
             self.errors[processed_result.error] += 1
             self.failed += 1
 
-        for timing_group, timing in processed_result.timings.items():
-            if timing > 0:
-                self.timings[timing_group].append(timing)
+        if self.timing_sketches:
+            for timing_group, timing in processed_result.timings.items():
+                if timing > 0:
+                    self.sketches[timing_group].add(timing)
+
+        else:
+            for timing_group, timing in processed_result.timings.items():
+                if timing > 0:
+                    self.timings[timing_group].append(timing)
+
+    def add_columnar_results(
+        self,
+        stage_name: str,
+        columnar_results: ColumnarResults,
+        name: str
+    ):
+        name_idx = columnar_results.name_index(name)
+        rows = numpy.frombuffer(columnar_results.name_idxs, dtype=numpy.intc) == name_idx
+
+        action_metadata = columnar_results.actions.get(name, {})
+
+        if self.source is None:
+            self.source = action_metadata.get('source')
+
+        self.tags.update({
+            tag.get('name'): tag.get('value') for tag in action_metadata.get('tags', [])
+        })
+
+        error_idxs = numpy.frombuffer(columnar_results.error_idxs, dtype=numpy.intc)[rows]
+        failed_idxs = error_idxs[error_idxs > 0]
+
+        failed_count = len(failed_idxs)
+        self.failed += failed_count
+        self.succeeded += len(error_idxs) - failed_count
+
+        for error_idx, error_count in zip(*numpy.unique(failed_idxs, return_counts=True)):
+            self.errors[columnar_results.errors[error_idx]] += int(error_count)
+
+        intended_start = numpy.frombuffer(columnar_results.intended_start, dtype=numpy.float64)[rows]
+        wait_start = numpy.frombuffer(columnar_results.wait_start, dtype=numpy.float64)[rows]
+        start = numpy.frombuffer(columnar_results.start, dtype=numpy.float64)[rows]
+        connect_end = numpy.frombuffer(columnar_results.connect_end, dtype=numpy.float64)[rows]
+        write_end = numpy.frombuffer(columnar_results.write_end, dtype=numpy.float64)[rows]
+        complete = numpy.frombuffer(columnar_results.complete, dtype=numpy.float64)[rows]
+
+        if action_metadata.get('type') == RequestTypes.TASK:
+            timings = {
+                'total': complete - start,
+                'waiting': start - wait_start,
+                'reading': complete - write_end
+            }
+
+        else:
+            timings = {
+                'total': complete - start,
+                'waiting': start - wait_start,
+                'connecting': connect_end - start,
+                'writing': write_end - connect_end,
+                'reading': complete - write_end
+            }
+
+        scheduled = intended_start > 0
+        if scheduled.any():
+            timings['corrected'] = (complete - intended_start)[scheduled]
+
+        for timing_group, group_timings in timings.items():
+            if self.timing_sketches:
+                self.sketches[timing_group].add_many(
+                    group_timings[group_timings > 0]
+                )
+
+            else:
+                self.timings[timing_group].extend(
+                    group_timings[group_timings > 0].tolist()
+                )
+
+    def merge(self, other: ProcessedResultsGroup):
+
+        if self.source is None:
+            self.source = other.source
+
+        self.tags.update(other.tags)
+        self.succeeded += other.succeeded
+        self.failed += other.failed
+        self.total = self.succeeded + self.failed
+
+        for error_message, error_count in other.errors.items():
+            self.errors[error_message] += error_count
+
+        for timing_group, group_timings in other.timings.items():
+            self.timings[timing_group].extend(group_timings)
+
+        for timing_group, sketch in other.sketches.items():
+            self.sketches[timing_group].merge(sketch)
 
     def calculate_stats(self):
 
         self.total = self.succeeded + self.failed
 
+        if self.timing_sketches:
+            self._calculate_sketch_stats()
+            return
+
         for group_name, group_timings in self.timings.items():
 
             if len(group_timings) == 0:
@@ -113,6 +215,36 @@ class ProcessedResultsGroup:
 
             }
 
+    def _calculate_sketch_stats(self):
+
+        for group_name, sketch in self.sketches.items():
+            sketch.flush()
+
+            median = sketch.median()
+            mean = sketch.mean
+            variance = sketch.variance()
+            stdev = sketch.stdev()
+
+            self._streaming_median[group_name].update(median)
+            self._streaming_mean[group_name].update(mean)
+            self._streaming_variance[group_name].update(variance)
+            self._streaming_stdev[group_name].update(stdev)
+
+            minimum = sketch.minimum if sketch.count > 0 else 0
+            maximum = sketch.maximum if sketch.count > 0 else 0
+
+            self.groups[group_name] = {
+                group_name: {
+                    'median': median,
+                    'mean': mean,
+                    'variance': variance,
+                    'stdev': stdev,
+                    'minimum': minimum,
+                    'maximum': maximum
+                }
+
+            }
+
     def calculate_quantiles(self):
 
         quantile_ranges = [ 
@@ -131,6 +263,17 @@ class ProcessedResultsGroup:
             .99 
         ]
 
+        if self.timing_sketches:
+            for group_name, sketch in self.sketches.items():
+                self.groups[group_name]['quantiles'] = {
+                    f'quantile_{int(quantile_range * 100)}th': quantile for quantile, quantile_range in zip(
+                        sketch.quantiles(quantile_ranges),
+                        quantile_ranges
+                    )
+                }
+
+            return
+
         for group_name, group_timings in self.timings.items():
 
             if len(group_timings) == 0:
@@ -0,0 +1,52 @@
+from __future__ import annotations
+from typing import Dict, Optional
+from hedra.core.engines.types.common.base_result import BaseResult
+from .processed_results_group import ProcessedResultsGroup
+
+
+class ResultsAggregate:
+
+    '''
+    Per-action aggregates of a stage's results: success and failure
+    counts, error tallies and timing sketches. Results are folded in as
+    they complete and then dropped, and aggregates from separate workers
+    merge without revisiting a single result.
+    '''
+
+    __slots__ = (
+        'stage_name',
+        'events',
+        'total'
+    )
+
+    def __init__(self, stage_name: Optional[str]=None) -> None:
+        self.stage_name = stage_name
+        self.events: Dict[str, ProcessedResultsGroup] = {}
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self.total
+
+    def add(self, result: BaseResult):
+        events_group = self.events.get(result.name)
+        if events_group is None:
+            events_group = ProcessedResultsGroup(timing_sketches=True)
+            self.events[result.name] = events_group
+
+        events_group.add(
+            self.stage_name,
+            result
+        )
+
+        self.total += 1
+
+    def merge(self, other: ResultsAggregate):
+
+        for events_group_name, events_group in other.events.items():
+            if events_group_name in self.events:
+                self.events[events_group_name].merge(events_group)
+
+            else:
+                self.events[events_group_name] = events_group
+
+        self.total += other.total
@@ -18,6 +18,8 @@ class HTTPProcessedResult(BaseProcessedResult):
         'status',
         'headers',
         'data',
+        'body_size',
+        'body_checksum',
         'timings'
     )
 
@@ -40,6 +42,8 @@ class HTTPProcessedResult(BaseProcessedResult):
         self.status = result.status
         self.headers: Dict[bytes, bytes] = result.headers
         self.data = result.data
+        self.body_size = result.size
+        self.body_checksum = result.body_checksum
 
         self.time = result.complete - result.start
 
@@ -51,6 +55,9 @@ class HTTPProcessedResult(BaseProcessedResult):
             'reading': result.complete - result.write_end
         }
 
+        if result.intended_start > 0:
+            self.timings['corrected'] = result.complete - result.intended_start
+
     def to_dict(self) -> Dict[str, Union[str, int, float]]:
 
         data = self.data
@@ -79,6 +86,8 @@ class HTTPProcessedResult(BaseProcessedResult):
             'status': self.status,
             'headers': serializable_headers,
             'data': data,
+            'body_size': self.body_size,
+            'body_checksum': self.body_checksum,
             **self.timings
         }
 
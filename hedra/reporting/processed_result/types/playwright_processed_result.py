@@ -50,6 +50,9 @@ class PlaywrightProcessedResult(BaseProcessedResult):
             'reading': result.complete - result.write_end
         }
 
+        if result.intended_start > 0:
+            self.timings['corrected'] = result.complete - result.intended_start
+
     def to_dict(self) -> Dict[str, Union[str, int, float]]:
 
         return {
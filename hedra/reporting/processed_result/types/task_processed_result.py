@@ -26,6 +26,9 @@ class TaskProcessedResult(BaseProcessedResult):
             'reading': result.complete - result.write_end
         }
 
+        if result.intended_start > 0:
+            self.timings['corrected'] = result.complete - result.intended_start
+
         self.data = result.data
 
     def to_dict(self) -> Dict[str, Union[str, int, float]]:
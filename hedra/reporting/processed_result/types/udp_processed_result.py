@@ -52,6 +52,9 @@ class UDPProcessedResult(BaseProcessedResult):
             'reading': result.complete - result.write_end
         }
 
+        if result.intended_start > 0:
+            self.timings['corrected'] = result.complete - result.intended_start
+
     def to_dict(self) -> Dict[str, Union[str, int, float]]:
 
         data = self.data
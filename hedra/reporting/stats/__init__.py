@@ -2,4 +2,5 @@ from .mean import Mean
 from .median_absolute_deviation import MedianAbsoluteDeviation
 from .standard_deviation import StandardDeviation
 from .variance import Variance
-from .median import Median
\ No newline at end of file
+from .median import Median
+from .timing_sketch import TimingSketch
\ No newline at end of file
@@ -0,0 +1,205 @@
+from __future__ import annotations
+import math
+import numpy
+from typing import List, Union
+
+
+class TimingSketch:
+
+    '''
+    Mergeable, log-bucketed quantile sketch for positive timings. Each
+    value is counted in the bucket `ceil(log(value)/log(gamma))`, so any
+    quantile is estimated within `relative_accuracy` of the true value
+    regardless of how many samples were added, and two sketches merge by
+    summing bucket counts. Count, mean, variance, minimum and maximum are
+    tracked exactly.
+    '''
+
+    __slots__ = (
+        'relative_accuracy',
+        'gamma',
+        'log_gamma',
+        'min_value',
+        'offset',
+        'counts',
+        'count',
+        'mean',
+        'm2',
+        'minimum',
+        'maximum',
+        'pending',
+        'pending_limit'
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float=0.01,
+        min_value: float=1e-9,
+        pending_limit: int=4096
+    ) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy)/(1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+
+        self.offset = 0
+        self.counts = numpy.zeros(0, dtype=numpy.int64)
+
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+        # Single values are buffered and added as one vectorised batch.
+        self.pending: List[float] = []
+        self.pending_limit = pending_limit
+
+    def __len__(self) -> int:
+        return self.count + len(self.pending)
+
+    def add(self, value: Union[int, float]):
+        self.pending.append(value)
+
+        if len(self.pending) >= self.pending_limit:
+            self.flush()
+
+    def add_many(self, values: numpy.ndarray):
+        values = numpy.asarray(values, dtype=numpy.float64)
+        values_count = len(values)
+
+        if values_count == 0:
+            return
+
+        bucket_idxs = numpy.ceil(
+            numpy.log(
+                numpy.maximum(values, self.min_value)
+            )/self.log_gamma
+        ).astype(numpy.int64)
+
+        self._add_bucket_counts(
+            int(bucket_idxs.min()),
+            numpy.bincount(bucket_idxs - bucket_idxs.min())
+        )
+
+        # Chan et al. parallel update of the running mean and M2.
+        values_mean = float(values.mean())
+        values_m2 = float(((values - values_mean)**2).sum())
+
+        self._combine_moments(
+            values_count,
+            values_mean,
+            values_m2
+        )
+
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+
+    def flush(self):
+        if self.pending:
+            pending = self.pending
+            self.pending = []
+
+            self.add_many(
+                numpy.array(pending, dtype=numpy.float64)
+            )
+
+    def merge(self, other: TimingSketch):
+        self.flush()
+        other.flush()
+
+        if other.count == 0:
+            return
+
+        self._add_bucket_counts(other.offset, other.counts)
+        self._combine_moments(
+            other.count,
+            other.mean,
+            other.m2
+        )
+
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def quantiles(self, quantile_ranges: List[float]) -> List[float]:
+        self.flush()
+
+        if self.count == 0:
+            return [0 for _ in quantile_ranges]
+
+        cumulative_counts = numpy.cumsum(self.counts)
+        ranks = numpy.asarray(quantile_ranges, dtype=numpy.float64) * (self.count - 1)
+
+        bucket_positions = numpy.searchsorted(
+            cumulative_counts,
+            ranks,
+            side='right'
+        )
+
+        # The midpoint of bucket i, 2*gamma^i/(gamma + 1), is within the
+        # relative accuracy of every value counted in it.
+        estimates = 2 * numpy.power(
+            self.gamma,
+            bucket_positions + self.offset
+        )/(self.gamma + 1)
+
+        return [
+            min(
+                max(float(estimate), self.minimum),
+                self.maximum
+            ) for estimate in estimates
+        ]
+
+    def median(self) -> float:
+        return self.quantiles([0.5])[0]
+
+    def variance(self) -> float:
+        self.flush()
+
+        if self.count < 2:
+            return 0.0
+
+        return self.m2/(self.count - 1)
+
+    def stdev(self) -> float:
+        self.flush()
+
+        if self.count == 0:
+            return 0.0
+
+        return math.sqrt(self.m2/self.count)
+
+    def _add_bucket_counts(self, offset: int, counts: numpy.ndarray):
+
+        if len(self.counts) == 0:
+            self.offset = offset
+            self.counts = numpy.array(counts, dtype=numpy.int64)
+            return
+
+        start = min(self.offset, offset)
+        end = max(
+            self.offset + len(self.counts),
+            offset + len(counts)
+        )
+
+        if start != self.offset or end != self.offset + len(self.counts):
+            resized = numpy.zeros(end - start, dtype=numpy.int64)
+            resized[self.offset - start:self.offset - start + len(self.counts)] = self.counts
+
+            self.counts = resized
+            self.offset = start
+
+        self.counts[offset - self.offset:offset - self.offset + len(counts)] += counts
+
+    def _combine_moments(
+        self,
+        count: int,
+        mean: float,
+        m2: float
+    ):
+        total_count = self.count + count
+        delta = mean - self.mean
+
+        self.mean += delta * count/total_count
+        self.m2 += m2 + delta**2 * self.count * count/total_count
+        self.count = total_count
@@ -1,6 +1,7 @@
+import asyncio
 import warnings
 import uuid
-from typing import List, Dict
+from typing import Any, List, Dict
 from hedra.logging import HedraLogger
 from hedra.reporting.experiment.experiments_collection import ExperimentMetricsCollectionSet
 from hedra.reporting.processed_result.types.base_processed_result import BaseProcessedResult
@@ -64,6 +65,9 @@ class MySQL:
         self.session_system_metrics_table_name = f'{config.system_metrics_table}_session'
         self.stage_system_metrics_table_name = f'{config.system_metrics_table}_stage'
 
+        self.insert_chunk_size = max(config.insert_chunk_size, 1)
+        self.insert_concurrency = max(config.insert_concurrency, 1)
+
         self._events_table = None
         self._metrics_table = None
         self._streams_table = None
@@ -422,36 +426,32 @@ class MySQL:
     async def submit_events(self, events: List[BaseProcessedResult]):
 
         await self.logger.filesystem.aio['hedra.reporting'].info(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name}')
-        
-        async with self._connection.begin() as transaction:
-            await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name} - Initiating transaction')
-        
-            for event in events:
 
-                if self._events_table is None:
-                    await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Creating Events table - {self.events_table_name} - if not exists')
+        if self._events_table is None:
+            async with self._connection.begin() as transaction:
+                await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Creating Events table - {self.events_table_name} - if not exists')
 
-                    events_table = sa.Table(
-                        self.events_table_name,
-                        self.metadata,
-                        sa.Column('id', sa.Integer, primary_key=True),
-                        sa.Column('name', sa.VARCHAR(255)),
-                        sa.Column('stage', sa.VARCHAR(255)),
-                        sa.Column('time', sa.Float),
-                        sa.Column('succeeded', sa.Boolean),
-                    )
+                events_table = sa.Table(
+                    self.events_table_name,
+                    self.metadata,
+                    sa.Column('id', sa.Integer, primary_key=True),
+                    sa.Column('name', sa.VARCHAR(255)),
+                    sa.Column('stage', sa.VARCHAR(255)),
+                    sa.Column('time', sa.Float),
+                    sa.Column('succeeded', sa.Boolean),
+                )
 
-                    
-                    await self._connection.execute(CreateTable(events_table, if_not_exists=True))
+                await self._connection.execute(CreateTable(events_table, if_not_exists=True))
+                await transaction.commit()
 
-                    self._events_table = events_table
+                self._events_table = events_table
 
-                    await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Created or set Events table - {self.events_table_name}')
-                
-                await self._connection.execute(self._events_table.insert().values(**event.record))
-                    
-            await transaction.commit()
-            await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name} - Transaction committed')
+                await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Created or set Events table - {self.events_table_name}')
+
+        await self._insert_chunks(
+            self._events_table,
+            [event.record for event in events]
+        )
 
         await self.logger.filesystem.aio['hedra.reporting'].info(f'{self.metadata_string} - Submitted Events to Table - {self.events_table_name}')
 
@@ -655,6 +655,36 @@ class MySQL:
 
         await self.logger.filesystem.aio['hedra.reporting'].info(f'{self.metadata_string} - Submitted Error Metrics to Table - {self.errors_table_name}')
 
+    async def _insert_chunks(self, table, rows: List[Dict[str, Any]]):
+
+        # aiomysql rewrites an executemany insert into multi-row INSERT
+        # statements. Pipelines each hold a pooled connection, so chunks
+        # are written concurrently.
+        chunks = [
+            rows[idx:idx + self.insert_chunk_size] for idx in range(0, len(rows), self.insert_chunk_size)
+        ]
+
+        pipelines_count = min(self.insert_concurrency, len(chunks))
+
+        await asyncio.gather(*[
+            self._insert_pipeline(
+                table,
+                chunks[pipeline_idx::pipelines_count]
+            ) for pipeline_idx in range(pipelines_count)
+        ])
+
+    async def _insert_pipeline(self, table, chunks: List[List[Dict[str, Any]]]):
+
+        async with self._engine.acquire() as connection:
+            connection: SAConnection = connection
+
+            for chunk in chunks:
+                async with connection.begin() as transaction:
+                    await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Submitting - {len(chunk)} - rows to Table - {table.name}')
+
+                    await connection.execute(table.insert(), chunk)
+                    await transaction.commit()
+
     async def close(self):
         await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Closing session - {self.session_uuid}')
         await self.logger.filesystem.aio['hedra.reporting'].info(f'{self.metadata_string} - Closing connectiion to MySQL at - {self.host}')
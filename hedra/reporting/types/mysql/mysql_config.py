@@ -13,6 +13,8 @@ class MySQLConfig(BaseModel):
     experiments_table: str='experiments'
     streams_table: str='streams'
     system_metrics_table: str='system_metrics'
+    insert_chunk_size: int=1000
+    insert_concurrency: int=4
     reporter_type: ReporterTypes=ReporterTypes.MySQL
 
     class Config:
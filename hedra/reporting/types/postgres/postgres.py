@@ -5,8 +5,9 @@
 #     selectors._BaseSelectorImpl.modify  # type: ignore
 # )
 
+import asyncio
 import uuid
-from typing import List, Dict
+from typing import Any, List, Dict
 from hedra.logging import HedraLogger
 from hedra.reporting.experiment.experiments_collection import ExperimentMetricsCollectionSet
 from hedra.reporting.processed_result.types.base_processed_result import BaseProcessedResult
@@ -64,6 +65,9 @@ class Postgres:
 
         self.session_system_metrics_table_name = f'{config.system_metrics_table}_session'
         self.stage_system_metrics_table_name = f'{config.system_metrics_table}_stage'
+
+        self.insert_chunk_size = max(config.insert_chunk_size, 1)
+        self.insert_concurrency = max(config.insert_concurrency, 1)
         
         self._engine = None
         self.metadata = sqlalchemy.MetaData()
@@ -474,40 +478,36 @@ class Postgres:
         
         await self.logger.filesystem.aio['hedra.reporting'].info(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name}')
 
-        async with self._engine.connect() as connection:
-            connection: AsyncConnection = connection
+        if self._events_table is None:
+            async with self._engine.connect() as connection:
+                connection: AsyncConnection = connection
 
-            async with connection.begin() as transaction:
-                transaction: AsyncTransaction = transaction
+                async with connection.begin() as transaction:
+                    transaction: AsyncTransaction = transaction
 
-                await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name} - Initiating transaction')
+                    await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Creating Events table - {self.events_table_name} - if not exists')
 
-                for event in events:
+                    events_table = sqlalchemy.Table(
+                        self.events_table_name,
+                        self.metadata,
+                        sqlalchemy.Column('id', UUID(as_uuid=True), primary_key=True, default=uuid.uuid4),
+                        sqlalchemy.Column('name', sqlalchemy.VARCHAR(255)),
+                        sqlalchemy.Column('stage', sqlalchemy.VARCHAR(255)),
+                        sqlalchemy.Column('time', sqlalchemy.FLOAT),
+                        sqlalchemy.Column('succeeded', sqlalchemy.Boolean),
+                    )
+                    
+                    await connection.execute(CreateTable(events_table, if_not_exists=True))
+                    await transaction.commit()
 
-                    if self._events_table is None:
-                        await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Creating Events table - {self.events_table_name} - if not exists')
+                    self._events_table = events_table
 
-                        events_table = sqlalchemy.Table(
-                            self.events_table_name,
-                            self.metadata,
-                            sqlalchemy.Column('id', UUID(as_uuid=True), primary_key=True, default=uuid.uuid4),
-                            sqlalchemy.Column('name', sqlalchemy.VARCHAR(255)),
-                            sqlalchemy.Column('stage', sqlalchemy.VARCHAR(255)),
-                            sqlalchemy.Column('time', sqlalchemy.FLOAT),
-                            sqlalchemy.Column('succeeded', sqlalchemy.Boolean),
-                        )
-                        
-                        await connection.execute(CreateTable(events_table, if_not_exists=True))
-                        self._events_table = events_table
+                    await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Created or set Events table - {self.events_table_name}')
 
-                        await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Created or set Events table - {self.events_table_name}')
-                    
-                    await connection.execute(self._events_table.insert(
-                        values=event.record
-                    ))
-                
-                await transaction.commit()
-                await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name} - Transaction committed')
+        await self._insert_chunks(
+            self._events_table,
+            [event.record for event in events]
+        )
 
         await self.logger.filesystem.aio['hedra.reporting'].info(f'{self.metadata_string} - Submitted Events to Table - {self.events_table_name}')
 
@@ -732,6 +732,39 @@ class Postgres:
 
         await self.logger.filesystem.aio['hedra.reporting'].info(f'{self.metadata_string} - Submitted Error Metrics to Table - {self.errors_table_name}')
         
+    async def _insert_chunks(self, table, rows: List[Dict[str, Any]]):
+
+        # Each chunk is a single executemany in its own transaction. Chunks
+        # are spread over concurrent pipelines, each with its own pooled
+        # connection, so the driver can batch rows instead of round-tripping
+        # one insert per row.
+        chunks = [
+            rows[idx:idx + self.insert_chunk_size] for idx in range(0, len(rows), self.insert_chunk_size)
+        ]
+
+        pipelines_count = min(self.insert_concurrency, len(chunks))
+
+        await asyncio.gather(*[
+            self._insert_pipeline(
+                table,
+                chunks[pipeline_idx::pipelines_count]
+            ) for pipeline_idx in range(pipelines_count)
+        ])
+
+    async def _insert_pipeline(self, table, chunks: List[List[Dict[str, Any]]]):
+
+        async with self._engine.connect() as connection:
+            connection: AsyncConnection = connection
+
+            for chunk in chunks:
+                async with connection.begin() as transaction:
+                    transaction: AsyncTransaction = transaction
+
+                    await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Submitting - {len(chunk)} - rows to Table - {table.name}')
+
+                    await connection.execute(table.insert(), chunk)
+                    await transaction.commit()
+
     async def close(self):
         await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Session Closed - {self.session_uuid}')
         await self.logger.filesystem.aio['hedra.reporting'].info(f'{self.metadata_string} - Closed connectiion to {self.sql_type} at - {self.host}')
@@ -12,6 +12,8 @@ class PostgresConfig(BaseModel):
     experiments_table: str='experiments'
     streams_table: str='streams'
     system_metrics_table: str='system_metrics'
+    insert_chunk_size: int=1000
+    insert_concurrency: int=4
     reporter_type: ReporterTypes=ReporterTypes.Postgres
 
     class Config:
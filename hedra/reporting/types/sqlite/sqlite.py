@@ -52,6 +52,8 @@ class SQLite:
         self.session_system_metrics_table_name = f'{config.system_metrics_table}_session'
         self.stage_system_metrics_table_name = f'{config.system_metrics_table}_stage'
 
+        self.insert_chunk_size = max(config.insert_chunk_size, 1)
+
         self.metadata = sqlalchemy.MetaData()
 
         self.database = None
@@ -422,28 +424,41 @@ class SQLite:
         async with self._engine.begin() as connection:
             await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name} - Initiating transaction')
 
-            for event in events:
+            if self._events_table is None:
+                await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Creating Events table - {self.events_table_name} - if not exists')
 
-                if self._events_table is None:
-                    await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Creating Events table - {self.events_table_name} - if not exists')
+                events_table = sqlalchemy.Table(
+                    self.events_table_name,
+                    self.metadata,
+                    sqlalchemy.Column('id', sqlalchemy.INTEGER, primary_key=True,),
+                    sqlalchemy.Column('name', sqlalchemy.TEXT),
+                    sqlalchemy.Column('stage', sqlalchemy.TEXT),
+                    sqlalchemy.Column('time', sqlalchemy.REAL),
+                    sqlalchemy.Column('succeeded', sqlalchemy.INTEGER)
+                )
 
-                    events_table = sqlalchemy.Table(
-                        self.events_table_name,
-                        self.metadata,
-                        sqlalchemy.Column('id', sqlalchemy.INTEGER, primary_key=True,),
-                        sqlalchemy.Column('name', sqlalchemy.TEXT),
-                        sqlalchemy.Column('stage', sqlalchemy.TEXT),
-                        sqlalchemy.Column('time', sqlalchemy.REAL),
-                        sqlalchemy.Column('succeeded', sqlalchemy.INTEGER)
-                    )
+                
+                await connection.execute(CreateTable(events_table, if_not_exists=True))
+                self._events_table = events_table
 
-                    
-                    await connection.execute(CreateTable(events_table, if_not_exists=True))
-                    self._events_table = events_table
+                await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Created or set Events table - {self.events_table_name}')
 
-                    await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Created or set Events table - {self.events_table_name}')
-            
-                await connection.execute(self._events_table.insert(values=event.record))
+            # SQLite allows a single writer, so chunks are written in turn
+            # within the one transaction rather than concurrently.
+            records = []
+            for event in events:
+                # Event ids are UUIDs, so SQLite assigns the integer
+                # row id instead.
+                record = event.record
+                del record['id']
+
+                records.append(record)
+
+            for idx in range(0, len(records), self.insert_chunk_size):
+                await connection.execute(
+                    self._events_table.insert(),
+                    records[idx:idx + self.insert_chunk_size]
+                )
             
             await connection.commit()
             await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name} - Transaction committed')
@@ -11,6 +11,7 @@ class SQLiteConfig(BaseModel):
     experiments_table: str='experiments'
     streams_table: str='streams'
     system_metrics_table: str='system_metrics'
+    insert_chunk_size: int=1000
     reporter_type: ReporterTypes=ReporterTypes.SQLite
 
     class Config:
@@ -387,12 +387,10 @@ class TimescaleDB(Postgres):
 
         await self.logger.filesystem.aio['hedra.reporting'].info(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name}')
 
-        async with self._connection.begin() as transaction:
-            await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name} - Initiating transaction')
-        
-            for event in events:
+        if self._events_table is None:
+            async with self._engine.connect() as connection:
 
-                if self._events_table is None:
+                async with connection.begin() as transaction:
                     await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Creating Events table - {self.events_table_name} - if not exists')
 
                     events_table = sqlalchemy.Table(
@@ -406,27 +404,34 @@ class TimescaleDB(Postgres):
                         sqlalchemy.Column('time', sqlalchemy.TIMESTAMP(timezone=False), nullable=False, default=datetime.now())
                     )
 
-                    await self._connection.execute(CreateTable(events_table, if_not_exists=True))
-                    await self._connection.execute(
-                        f"SELECT create_hypertable('{self.events_table_name}', 'time', migrate_data => true, if_not_exists => TRUE, create_default_indexes=>FALSE);"
+                    await connection.execute(CreateTable(events_table, if_not_exists=True))
+                    await connection.execute(
+                        sqlalchemy.text(
+                            f"SELECT create_hypertable('{self.events_table_name}', 'time', migrate_data => true, if_not_exists => TRUE, create_default_indexes=>FALSE);"
+                        )
                     )
 
-                    await self._connection.execute(f"CREATE INDEX ON {self.events_table_name} (name, time DESC);")
+                    await connection.execute(
+                        sqlalchemy.text(f"CREATE INDEX ON {self.events_table_name} (name, time DESC);")
+                    )
+                    await transaction.commit()
 
                     self._events_table = events_table
                     await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Created or set Events table - {self.events_table_name}')
-                
-                record = event.record
-                record['request_time'] = record['time']
-                del record['time']
-
-                await self._connection.execute(self._events_table.insert(values={
-                    **record,
-                    'time': datetime.now().timestamp()
-                }))
-                
-            await transaction.commit()
-            await self.logger.filesystem.aio['hedra.reporting'].debug(f'{self.metadata_string} - Submitting Events to Table - {self.events_table_name} - Transaction committed')
+
+        records = []
+        submitted_at = datetime.now()
+        for event in events:
+            record = event.record
+            record['request_time'] = record['time']
+            del record['time']
+
+            records.append({
+                **record,
+                'time': submitted_at
+            })
+
+        await self._insert_chunks(self._events_table, records)
 
         await self.logger.filesystem.aio['hedra.reporting'].info(f'{self.metadata_string} - Submitted Events to Table - {self.events_table_name}')
 
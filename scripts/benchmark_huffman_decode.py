@@ -0,0 +1,103 @@
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import timeit
+
+
+# Load the hpack package on its own, so the benchmark doesn't need the
+# engine's network dependencies installed.
+HPACK_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'hedra',
+    'core',
+    'engines',
+    'types',
+    'common',
+    'hpack'
+)
+
+hpack_spec = importlib.util.spec_from_file_location(
+    'hpack',
+    os.path.join(HPACK_PATH, '__init__.py'),
+    submodule_search_locations=[HPACK_PATH]
+)
+
+hpack_module = importlib.util.module_from_spec(hpack_spec)
+sys.modules['hpack'] = hpack_module
+hpack_spec.loader.exec_module(hpack_module)
+
+from hpack.constants import REQUEST_CODES, REQUEST_CODES_LENGTH
+from hpack.huffman_encoder import HuffmanEncoder
+from hpack.huffman_table import (
+    decode_huffman,
+    decode_huffman_bytes,
+    decode_huffman_nibbles
+)
+
+
+HEADER_VALUES = [
+    b'nginx/1.25.3',
+    b'application/json; charset=utf-8',
+    b'Tue, 14 Nov 2023 18:02:11 GMT',
+    b'max-age=0, no-cache, no-store, must-revalidate',
+    b'gzip',
+    b'keep-alive',
+    b'W/"5e1-1Ng5a8dBX0Jm4mGhyK1Vl1Jxq4Y"',
+    b'text/html; charset=UTF-8',
+]
+
+
+def run_benchmark(iterations: int):
+    encoder = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+
+    random_values = [
+        bytes(random.randrange(256) for _ in range(random.randrange(1, 64))) for _ in range(256)
+    ]
+
+    encoded_values = [
+        encoder.encode(value) for value in HEADER_VALUES + random_values
+    ]
+
+    for value, encoded in zip(HEADER_VALUES + random_values, encoded_values):
+        assert decode_huffman_nibbles(encoded) == value
+        assert decode_huffman_bytes(encoded) == value
+        assert decode_huffman(encoded) == value
+
+    repeated_values = [
+        encoder.encode(value) for value in HEADER_VALUES
+    ]
+
+    decoders = [
+        ('nibble table', decode_huffman_nibbles, encoded_values),
+        ('byte table', decode_huffman_bytes, encoded_values),
+        ('nibble table (repeated values)', decode_huffman_nibbles, repeated_values),
+        ('byte table + cache (repeated values)', decode_huffman, repeated_values),
+    ]
+
+    for name, decoder, values in decoders:
+        elapsed = timeit.timeit(
+            lambda: [decoder(value) for value in values],
+            number=iterations
+        )
+
+        decoded_bytes = sum([len(value) for value in values]) * iterations
+
+        print(f'{name:<40}{elapsed:>10.4f}s{decoded_bytes/elapsed/1e6:>10.2f} MB/s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Compare HPACK Huffman decoders.'
+    )
+
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        default=200
+    )
+
+    args = parser.parse_args()
+
+    run_benchmark(args.iterations)
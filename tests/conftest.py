@@ -0,0 +1,20 @@
+import pytest
+from hedra.logging import (
+    LoggerTypes,
+    logging_manager
+)
+
+
+@pytest.fixture(autouse=True, scope='session')
+def logfiles_directory(tmp_path_factory: pytest.TempPathFactory):
+    logging_manager.disable(
+        LoggerTypes.DISTRIBUTED,
+        LoggerTypes.DISTRIBUTED_FILESYSTEM
+    )
+
+    logging_manager.update_log_level('error')
+    logging_manager.logfiles_directory = str(
+        tmp_path_factory.mktemp('logs')
+    )
+
+    yield logging_manager.logfiles_directory
@@ -0,0 +1,92 @@
+import asyncio
+import base64
+import hashlib
+import struct
+import pytest
+
+
+WEBSOCKET_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+async def read_websocket_frame(reader: asyncio.StreamReader):
+    header = await reader.readexactly(2)
+    opcode = header[0] & 0x0F
+    payload_length = header[1] & 0x7F
+
+    if payload_length == 126:
+        payload_length = struct.unpack('!H', await reader.readexactly(2))[0]
+
+    elif payload_length == 127:
+        payload_length = struct.unpack('!Q', await reader.readexactly(8))[0]
+
+    mask = await reader.readexactly(4)
+    payload = await reader.readexactly(payload_length)
+
+    return opcode, bytes(
+        payload_byte ^ mask[idx % 4] for idx, payload_byte in enumerate(payload)
+    )
+
+
+def encode_websocket_frame(opcode: int, payload: bytes) -> bytes:
+    frame = bytearray([0x80 | opcode])
+
+    if len(payload) < 126:
+        frame.append(len(payload))
+
+    else:
+        frame.append(126)
+        frame.extend(struct.pack('!H', len(payload)))
+
+    return bytes(frame + payload)
+
+
+async def start_websocket_server():
+    '''
+    Starts a websocket echo server on a free local port. Returns the
+    server, its port, and a list of the connections it has accepted.
+    '''
+    connections = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connections.append(writer)
+
+        request = await reader.readuntil(b'\r\n\r\n')
+        headers = dict([
+            [part.strip().lower() for part in line.split(b':', 1)] for line in request.split(b'\r\n')[1:] if b':' in line
+        ])
+
+        accept = base64.b64encode(
+            hashlib.sha1(headers[b'sec-websocket-key'] + WEBSOCKET_GUID).digest()
+        )
+
+        writer.write(b''.join([
+            b'HTTP/1.1 101 Switching Protocols\r\n',
+            b'Upgrade: websocket\r\n',
+            b'Connection: Upgrade\r\n',
+            b'Sec-WebSocket-Accept: ' + accept + b'\r\n',
+            b'\r\n'
+        ]))
+
+        try:
+            while True:
+                opcode, payload = await read_websocket_frame(reader)
+
+                if opcode == 0x8:
+                    break
+
+                writer.write(encode_websocket_frame(opcode, payload))
+                await writer.drain()
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+
+    return server, server.sockets[0].getsockname()[1], connections
+
+
+@pytest.fixture
+def websocket_server():
+    return start_websocket_server
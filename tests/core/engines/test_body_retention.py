@@ -0,0 +1,108 @@
+import asyncio
+import hashlib
+import pytest
+from hedra.core.engines.types.common.body_retention import (
+    BodyRetention,
+    BodyRetentionPolicy
+)
+from hedra.core.engines.types.http.action import HTTPAction
+from hedra.core.engines.types.http.client import MercuryHTTPClient
+
+
+BODY = b'{"message": "hello world"}'
+
+
+async def start_server():
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.readuntil(b'\r\n\r\n')
+
+        writer.write(b''.join([
+            b'HTTP/1.1 200 OK\r\n',
+            b'Content-Type: application/json\r\n',
+            f'Content-Length: {len(BODY)}\r\n'.encode(),
+            b'\r\n',
+            BODY
+        ]))
+
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def execute_request(body_retention):
+    server, port = await start_server()
+    client = MercuryHTTPClient(concurrency=1)
+
+    action = HTTPAction(
+        'retained',
+        f'http://127.0.0.1:{port}/',
+        body_retention=body_retention
+    )
+
+    await client.prepare(action)
+    result = await client.execute_prepared_request(action)
+
+    await client.close()
+    server.close()
+
+    return result
+
+
+def test_body_retention_parse():
+    assert BodyRetention.parse(None).policy == BodyRetentionPolicy.KEEP
+    assert BodyRetention.parse('discard').discard_body is True
+
+    head = BodyRetention.parse(16)
+    assert head.policy == BodyRetentionPolicy.HEAD
+    assert head.max_size == 16
+
+    checksum = BodyRetention.parse({'policy': 'checksum'})
+    assert checksum.discard_body is True
+    assert checksum.create_checksum() is not None
+
+    with pytest.raises(ValueError):
+        BodyRetention.parse('unknown')
+
+    with pytest.raises(ValueError):
+        BodyRetention(policy=BodyRetentionPolicy.HEAD)
+
+
+def test_http_result_keeps_body():
+    result = asyncio.run(execute_request(None))
+
+    assert result.error is None
+    assert result.body == BODY
+    assert result.size == len(BODY)
+    assert result.data == {'message': 'hello world'}
+
+
+def test_http_result_keeps_body_head():
+    result = asyncio.run(execute_request(5))
+
+    assert result.body == BODY[:5]
+    assert result.size == len(BODY)
+    assert result.data == BODY[:5].decode()
+
+
+def test_http_result_checksums_body():
+    result = asyncio.run(execute_request('checksum'))
+
+    assert result.body == b''
+    assert result.size == len(BODY)
+    assert result.data is None
+    assert result.body_checksum == hashlib.blake2b(
+        BODY,
+        digest_size=16
+    ).hexdigest()
+
+
+def test_http_result_discards_body():
+    result = asyncio.run(execute_request('discard'))
+
+    assert result.body == b''
+    assert result.body_checksum is None
+    assert result.size == len(BODY)
+    assert result.data is None
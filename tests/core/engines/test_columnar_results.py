@@ -0,0 +1,99 @@
+import dill
+from hedra.core.engines.types.common.base_result import BaseResult
+from hedra.core.engines.types.common.columnar_results import ColumnarResults
+from hedra.core.engines.types.common.types import RequestTypes
+
+
+def create_result(name: str, start: float, complete: float, error: str=None) -> BaseResult:
+    result = BaseResult(
+        'action-id',
+        name,
+        'localhost',
+        None,
+        [{'name': 'env', 'value': 'test'}],
+        RequestTypes.HTTP,
+        error
+    )
+
+    result.start = start
+    result.complete = complete
+
+    return result
+
+
+def test_columnar_results_round_trip():
+    columnar_results = ColumnarResults()
+    columnar_results.extend([
+        create_result('login', 0, 1),
+        create_result('logout', 1, 3, error='timed out'),
+        create_result('login', 2, 5)
+    ])
+
+    loaded = ColumnarResults.from_bytes(
+        columnar_results.to_bytes()
+    )
+
+    assert len(loaded) == 3
+    assert loaded.names == ['login', 'logout']
+    assert list(loaded.complete) == [1, 3, 5]
+
+    unpickled: ColumnarResults = dill.loads(
+        dill.dumps(columnar_results)
+    )
+
+    assert list(unpickled.start) == [0, 1, 2]
+
+
+def test_columnar_results_merge_remaps_tables():
+    first = ColumnarResults()
+    first.extend([
+        create_result('login', 0, 1)
+    ])
+
+    second = ColumnarResults()
+    second.extend([
+        create_result('logout', 0, 2, error='timed out'),
+        create_result('login', 0, 3)
+    ])
+
+    first.merge(second)
+
+    assert len(first) == 3
+    assert len(first.select('login')) == 2
+
+    logout_results = first.to_results('logout')
+    assert len(logout_results) == 1
+    assert logout_results[0].error == 'timed out'
+
+
+def test_columnar_results_materializes_rows():
+    columnar_results = ColumnarResults()
+    columnar_results.extend([
+        create_result('login', 0, 1),
+        create_result('logout', 1, 3, error='timed out'),
+        create_result('login', 2, 5)
+    ])
+
+    login_results = columnar_results.to_results('login')
+
+    assert [result.name for result in login_results] == ['login', 'login']
+    assert [result.complete - result.start for result in login_results] == [1, 3]
+    assert login_results[0].type == RequestTypes.HTTP
+    assert login_results[0].source == 'localhost'
+    assert login_results[0].error is None
+
+    assert len(columnar_results.to_results()) == 3
+
+
+def test_columnar_results_partitions_cover_all_rows():
+    columnar_results = ColumnarResults()
+    columnar_results.extend([
+        create_result('login', idx, idx + 1) for idx in range(10)
+    ])
+
+    partitions = columnar_results.partition(3)
+
+    assert [len(partition) for partition in partitions] == [3, 3, 4]
+    assert sum(
+        [list(partition.start) for partition in partitions], []
+    ) == list(range(10))
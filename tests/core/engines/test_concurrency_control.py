@@ -0,0 +1,162 @@
+import asyncio
+from hedra.core.engines.types.common.concurrency import (
+    ConcurrencyController,
+    Semaphore
+)
+from hedra.core.engines.types.task.runner import MercuryTaskRunner
+from hedra.core.engines.types.websocket.action import WebsocketAction
+from hedra.core.engines.types.websocket.client import MercuryWebsocketClient
+
+
+async def hold_permits(sem: Semaphore, held: asyncio.Event, release: asyncio.Event):
+    async with sem:
+        held.set()
+        await release.wait()
+
+
+def test_semaphore_shrinks_while_permits_are_held():
+
+    async def shrink_held():
+        sem = Semaphore(2)
+        release = asyncio.Event()
+
+        held = [asyncio.Event(), asyncio.Event()]
+        holders = [
+            asyncio.create_task(hold_permits(sem, held_event, release)) for held_event in held
+        ]
+
+        await asyncio.gather(*[held_event.wait() for held_event in held])
+
+        sem.shrink(1)
+        assert sem.locked()
+
+        release.set()
+        await asyncio.gather(*holders)
+
+        # Only one permit is left once the held permits are returned.
+        await sem.acquire()
+        assert sem.locked()
+
+        sem.release()
+        assert sem._value == 1
+
+    asyncio.run(shrink_held())
+
+
+def test_semaphore_extend_wakes_waiters():
+
+    async def extend_waiting():
+        sem = Semaphore(0)
+
+        waiters = [
+            asyncio.create_task(sem.acquire()) for _ in range(2)
+        ]
+
+        await asyncio.sleep(0)
+        assert not any([waiter.done() for waiter in waiters])
+
+        sem.extend(2)
+        await asyncio.wait_for(asyncio.gather(*waiters), 1)
+
+        assert sem.locked()
+
+    asyncio.run(extend_waiting())
+
+
+def test_resize_pool_keeps_limiter_in_place():
+
+    async def resize_pool():
+        runner = MercuryTaskRunner(concurrency=4)
+        sem = runner.sem
+
+        runner.resize_pool(8)
+        assert runner.sem is sem
+        assert runner.pool.size == 8
+        assert sem._value == 8
+
+        runner.resize_pool(2)
+        assert runner.sem is sem
+        assert runner.pool.size == 2
+        assert sem._value == 2
+
+    asyncio.run(resize_pool())
+
+
+def test_websocket_client_runs_without_concurrency_controller(websocket_server):
+
+    async def execute_without_controller():
+        server, port, _ = await websocket_server()
+
+        client = MercuryWebsocketClient(concurrency=2, session_window=2)
+        assert client.concurrency_controller is None
+
+        action = WebsocketAction(
+            'echo',
+            f'ws://127.0.0.1:{port}/',
+            data='hello'
+        )
+
+        await client.prepare(action)
+        result = await client.execute_prepared_request(action)
+
+        await client.close()
+        server.close()
+
+        return result
+
+    result = asyncio.run(execute_without_controller())
+
+    assert result.error is None
+    assert result.body == b'hello'
+
+
+def record_window(
+    controller: ConcurrencyController,
+    latency: float,
+    in_flight: int,
+    failed: bool=False
+):
+    for _ in range(controller.min_samples):
+        controller.record(latency, failed, in_flight)
+
+    controller.window_start -= controller.interval
+
+
+def test_concurrency_controller_aimd():
+    controller = ConcurrencyController(
+        target_latency=0.1,
+        max_concurrency=20
+    )
+
+    record_window(controller, 0.05, 10)
+    assert controller.update(10) == 11
+
+    # Windows using under half the limit don't grow it.
+    record_window(controller, 0.05, 2)
+    assert controller.update(11) is None
+
+    record_window(controller, 0.5, 11)
+    assert controller.update(11) == 8
+
+    record_window(controller, 0.05, 8, failed=True)
+    assert controller.update(8) == 6
+
+
+def test_concurrency_controller_gradient_backs_off_as_latency_grows():
+    controller = ConcurrencyController()
+
+    record_window(controller, 0.01, 10)
+    assert controller.update(10) is None
+    assert controller.max_concurrency == 10
+
+    record_window(controller, 0.1, 10)
+    assert controller.update(10) < 10
+
+
+def test_concurrency_controller_waits_for_full_window():
+    controller = ConcurrencyController(target_latency=0.1)
+
+    for _ in range(controller.min_samples):
+        controller.record(0.05, False, 10)
+
+    assert controller.update(10) is None
@@ -0,0 +1,202 @@
+import asyncio
+import socket
+import pytest
+from hedra.core.engines.types.common.dns_cache import (
+    DNSCache,
+    DNSEntry,
+    DNSStrategy,
+    dns_cache
+)
+from hedra.core.engines.types.common.url import URL
+
+
+class Connection:
+
+    def __init__(self) -> None:
+        self.dns_address = None
+
+
+class CountingDNSCache(DNSCache):
+
+    __slots__ = (
+        'queries',
+        'addresses',
+        'ttl'
+    )
+
+    def __init__(self, addresses, ttl: float) -> None:
+        super().__init__()
+        self.queries = 0
+        self.addresses = addresses
+        self.ttl = ttl
+
+    async def _query(self, hostname: str, family: int):
+        self.queries += 1
+        await asyncio.sleep(0.01)
+
+        if len(self.addresses) < 1:
+            raise Exception(f'Could not resolve - {hostname}')
+
+        return list(self.addresses), max(self.ttl, self.min_ttl)
+
+
+def create_entry(addresses):
+    return DNSEntry({
+        address: [(
+            socket.AF_INET,
+            socket.SOCK_STREAM,
+            6,
+            '',
+            (address, 80)
+        )] for address in addresses
+    }, 60)
+
+
+@pytest.fixture
+def hosts():
+    addresses = [
+        '10.0.0.1',
+        '10.0.0.2',
+        '10.0.0.3',
+        '10.0.0.4'
+    ]
+
+    dns_cache.entries[('example.com', 80, socket.AF_INET)] = create_entry(addresses)
+
+    yield addresses
+
+    dns_cache.configure(DNSStrategy.FIRST)
+    dns_cache.clear()
+
+
+def test_dns_cache_shares_concurrent_lookups():
+
+    async def resolve():
+        cache = CountingDNSCache(['127.0.0.1'], 60)
+
+        results = await asyncio.gather(*[
+            cache.resolve('localhost', 80, socket.AF_INET) for _ in range(5)
+        ])
+
+        assert cache.queries == 1
+        assert list(results[0].keys()) == ['127.0.0.1']
+
+        await cache.resolve('localhost', 80, socket.AF_INET)
+        assert cache.queries == 1
+
+    asyncio.run(resolve())
+
+
+def test_dns_cache_refreshes_expired_entries_in_background():
+
+    async def refresh():
+        cache = CountingDNSCache(['127.0.0.1'], 0)
+        cache.min_ttl = 0
+
+        await cache.resolve('localhost', 80, socket.AF_INET)
+
+        cache.addresses = ['127.0.0.2']
+        entry = cache.get_entry('localhost', 80, socket.AF_INET)
+
+        # The stale entry keeps serving while the refresh runs.
+        assert entry.addresses == ['127.0.0.1']
+
+        await cache.pending[('localhost', 80, socket.AF_INET)]
+
+        assert cache.queries == 2
+        assert cache.entries[('localhost', 80, socket.AF_INET)].addresses == ['127.0.0.2']
+
+    asyncio.run(refresh())
+
+
+def test_dns_cache_resolve_waits_for_background_refresh():
+
+    async def resolve_during_refresh():
+        cache = CountingDNSCache(['127.0.0.1'], 0)
+        cache.min_ttl = 0
+
+        await cache.resolve('localhost', 80, socket.AF_INET)
+
+        cache.addresses = ['127.0.0.2']
+        cache.get_entry('localhost', 80, socket.AF_INET)
+
+        resolved = await cache.resolve('localhost', 80, socket.AF_INET)
+
+        assert cache.queries == 2
+        assert list(resolved.keys()) == ['127.0.0.2']
+
+    asyncio.run(resolve_during_refresh())
+
+
+def test_dns_cache_serves_stale_entry_when_refresh_fails():
+
+    async def resolve_failed_refresh():
+        cache = CountingDNSCache(['127.0.0.1'], 0)
+        cache.min_ttl = 0
+
+        await cache.resolve('localhost', 80, socket.AF_INET)
+
+        cache.addresses = []
+        cache.min_ttl = 60
+
+        cache.get_entry('localhost', 80, socket.AF_INET)
+        resolved = await cache.resolve('localhost', 80, socket.AF_INET)
+
+        assert list(resolved.keys()) == ['127.0.0.1']
+        assert cache.entries[('localhost', 80, socket.AF_INET)].expired is False
+
+        with pytest.raises(Exception):
+            await cache.resolve('example.com', 80, socket.AF_INET)
+
+    asyncio.run(resolve_failed_refresh())
+
+
+def test_select_address_round_robin(hosts):
+    dns_cache.configure(DNSStrategy.ROUND_ROBIN)
+    url = URL('http://example.com/')
+
+    selected = [
+        url.select_address(Connection())[0] for _ in range(8)
+    ]
+
+    assert selected == hosts * 2
+
+
+def test_select_address_hash_spreads_connections(hosts):
+    dns_cache.configure(DNSStrategy.HASH)
+    url = URL('http://example.com/')
+
+    for addresses_count in (2, 4):
+        dns_cache.entries[('example.com', 80, socket.AF_INET)] = create_entry(
+            hosts[:addresses_count]
+        )
+
+        connections = [Connection() for _ in range(8)]
+        selected = [
+            url.select_address(connection)[0] for connection in connections
+        ]
+
+        assert sorted(set(selected)) == hosts[:addresses_count]
+
+        # Each connection keeps mapping to the same address.
+        assert selected == [
+            url.select_address(connection)[0] for connection in connections
+        ]
+
+
+def test_select_address_keeps_connected_address(hosts):
+    dns_cache.configure(DNSStrategy.ROUND_ROBIN)
+    url = URL('http://example.com/')
+
+    connection = Connection()
+    connection.dns_address = hosts[2]
+
+    assert url.select_address(connection)[0] == hosts[2]
+
+    connection.dns_address = '10.0.0.9'
+    assert url.select_address(connection)[0] in hosts
+
+
+def test_dns_cache_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        DNSCache().configure('random')
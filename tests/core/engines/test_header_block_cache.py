@@ -0,0 +1,79 @@
+from hedra.core.engines.types.common.decoder import Decoder
+from hedra.core.engines.types.common.hpack.header_block_cache import HeaderBlockCache
+from hedra.core.engines.types.common.hpack.table import HeaderTable
+
+
+HEADERS = (
+    (b':method', b'GET'),
+    (b':authority', b'example.com'),
+    (b':scheme', b'https'),
+    (b':path', b'/api/users'),
+    (b'accept', b'application/json'),
+    (b'x-request-source', b'hedra')
+)
+
+
+def create_decoder() -> Decoder:
+    decoder = Decoder()
+    decoder.header_table = HeaderTable()
+    return decoder
+
+
+def decode(decoder: Decoder, header_blocks):
+    return [
+        (bytes(name), bytes(value)) for name, value in decoder.decode(b''.join(header_blocks))
+    ]
+
+
+def test_header_block_cache_reuses_encoded_blocks():
+    cache = HeaderBlockCache()
+
+    header_blocks = cache.get(HEADERS, 16384)
+
+    assert cache.get(HEADERS, 16384) is header_blocks
+    assert cache.get(HEADERS, 8) is not header_blocks
+    assert len(cache.blocks) == 2
+
+
+def test_header_block_cache_blocks_decode_on_any_connection():
+    cache = HeaderBlockCache()
+    header_blocks = cache.get(HEADERS, 16384)
+
+    decoder = create_decoder()
+
+    # Unindexed blocks never add dynamic table entries, so the same block
+    # decodes identically however many times a connection has seen it.
+    assert decode(decoder, header_blocks) == list(HEADERS)
+    assert decode(decoder, header_blocks) == list(HEADERS)
+    assert len(decoder.header_table.dynamic_entries) == 0
+
+    assert decode(create_decoder(), header_blocks) == list(HEADERS)
+
+
+def test_header_block_cache_splits_blocks_by_frame_size():
+    cache = HeaderBlockCache()
+
+    header_blocks = cache.get(HEADERS, 8)
+
+    assert all([
+        len(header_block) <= 8 for header_block in header_blocks
+    ])
+    assert b''.join(header_blocks) == b''.join(cache.get(HEADERS, 16384))
+
+
+def test_header_block_cache_evicts_least_recently_used():
+    cache = HeaderBlockCache(max_size=2)
+
+    first = ((b':path', b'/first'),)
+    second = ((b':path', b'/second'),)
+    third = ((b':path', b'/third'),)
+
+    cache.get(first, 16384)
+    cache.get(second, 16384)
+    cache.get(first, 16384)
+    cache.get(third, 16384)
+
+    assert list(cache.blocks.keys()) == [
+        (first, 16384),
+        (third, 16384)
+    ]
@@ -0,0 +1,92 @@
+import asyncio
+from hedra.core.engines.types.common.encoder import Encoder
+from hedra.core.engines.types.common.timeouts import Timeouts
+from hedra.core.engines.types.http2.frames import FrameBuffer
+from hedra.core.engines.types.http2.frames.types.base_frame import Frame
+from hedra.core.engines.types.http2.multiplexed_connection import (
+    HTTP2MultiplexedConnection,
+    MultiplexedStream
+)
+
+
+RESPONSE_HEADERS = [
+    (b':status', b'200'),
+    (b'content-type', b'application/json'),
+    (b'x-request-id', b'0f3c9b2e-8a61-4d7e-b5a4-92c1d8e7f605')
+]
+
+
+class Response:
+
+    def __init__(self) -> None:
+        self.body = bytearray()
+        self.headers = {}
+        self.deferred_headers = None
+        self._status = None
+
+
+def split_header_frames(stream_id: int, header_block: bytes, split_size: int) -> bytes:
+    fragments = [
+        header_block[idx:idx + split_size] for idx in range(0, len(header_block), split_size)
+    ]
+
+    frames_data = bytearray()
+    for fragment_idx, fragment in enumerate(fragments):
+        frame = Frame(stream_id, 0x01 if fragment_idx == 0 else 0x09)
+        frame.data = fragment
+
+        if fragment_idx == len(fragments) - 1:
+            frame.flags.add('END_HEADERS')
+
+        frames_data.extend(frame.serialize())
+
+    return bytes(frames_data)
+
+
+def test_multiplexed_connection_decodes_continued_header_blocks():
+
+    async def decode_continued_header_blocks():
+        connection = HTTP2MultiplexedConnection(
+            'a.com:443',
+            Timeouts(),
+            10
+        )
+
+        encoder = Encoder()
+        frame_buffer = FrameBuffer()
+        frame_buffer.max_frame_size = connection.max_frame_size
+
+        responses = {}
+        for stream_id in (1, 3):
+            responses[stream_id] = Response()
+            connection.streams[stream_id] = MultiplexedStream(
+                stream_id,
+                responses[stream_id],
+                65535,
+                65535
+            )
+
+            # The second block indexes headers the first one added to
+            # the shared dynamic table.
+            frame_buffer.data.extend(
+                split_header_frames(
+                    stream_id,
+                    encoder.encode(RESPONSE_HEADERS),
+                    8
+                )
+            )
+
+        write_data = bytearray()
+        frames = list(frame_buffer)
+
+        for frame in frames:
+            connection._process_frame(frame, write_data)
+
+        assert [frame.type for frame in frames] == [0x01, 0x01]
+
+        for response in responses.values():
+            assert response._status == 200
+            assert response.headers[b'content-type'] == b'application/json'
+            assert response.headers[b'x-request-id'] == RESPONSE_HEADERS[2][1]
+
+    asyncio.run(decode_continued_header_blocks())
@@ -0,0 +1,108 @@
+import asyncio
+from hedra.core.engines.types.common.timeouts import Timeouts
+from hedra.core.engines.types.http2.pool import HTTP2Pool
+
+
+def acquire(pool: HTTP2Pool, host_key: str, count: int):
+    return [
+        pool.acquire_multiplexed(host_key) for _ in range(count)
+    ]
+
+
+def test_http2_pool_spreads_streams_over_multiplexed_connections():
+
+    async def spread_streams():
+        pool = HTTP2Pool(8, Timeouts(), multiplexed_connections=2)
+        pool.create_pool()
+
+        assert pool.is_multiplexed
+        assert pool.connections == []
+        assert pool.streams_per_connection == 4
+
+        first = pool.acquire_multiplexed('a.com:443')
+        second = pool.acquire_multiplexed('a.com:443')
+        assert second is not first
+
+        acquire(pool, 'a.com:443', 6)
+        assert [first.pending, second.pending] == [4, 4]
+        assert first.available is False
+        assert second.available is False
+
+        third = pool.acquire_multiplexed('a.com:443')
+        assert third not in (first, second)
+
+        await pool.release_multiplexed(second)
+        await pool.release_multiplexed(second)
+        assert second.pending == 2
+        assert pool.acquire_multiplexed('a.com:443') is third
+        assert pool.acquire_multiplexed('a.com:443') is second
+
+        assert pool.acquire_multiplexed('b.com:443') not in pool.multiplexed['a.com:443']
+
+    asyncio.run(spread_streams())
+
+
+def test_http2_pool_reserves_streams_for_concurrent_acquires():
+
+    async def reserve_streams():
+        pool = HTTP2Pool(100, Timeouts(), multiplexed_connections=4)
+
+        async def acquire_and_connect():
+            connection = pool.acquire_multiplexed('a.com:443')
+
+            # Streams open only once the connection is made, so every
+            # acquire happens before any stream is counted.
+            await asyncio.sleep(0)
+
+            return connection
+
+        connections = await asyncio.gather(*[
+            acquire_and_connect() for _ in range(100)
+        ])
+
+        host_connections = pool.multiplexed['a.com:443']
+
+        assert len(host_connections) == 4
+        assert all([connection.active == 0 for connection in host_connections])
+        assert [
+            connection.pending for connection in host_connections
+        ] == [pool.streams_per_connection]*4
+        assert all([
+            connections.count(connection) == 25 for connection in host_connections
+        ])
+
+        for connection in connections:
+            await pool.release_multiplexed(connection)
+
+        assert [connection.pending for connection in host_connections] == [0]*4
+
+    asyncio.run(reserve_streams())
+
+
+def test_http2_pool_drops_failed_multiplexed_connections():
+
+    async def drop_failed():
+        pool = HTTP2Pool(4, Timeouts(), multiplexed_connections=1)
+
+        connection = pool.acquire_multiplexed('a.com:443')
+        connection.failed = True
+
+        await pool.release_multiplexed(connection)
+
+        assert pool.multiplexed['a.com:443'] == []
+        assert pool.acquire_multiplexed('a.com:443') is not connection
+
+    asyncio.run(drop_failed())
+
+
+def test_http2_pool_without_multiplexing_creates_connection_per_slot():
+
+    async def create_connections():
+        pool = HTTP2Pool(4, Timeouts())
+        pool.create_pool()
+
+        assert pool.is_multiplexed is False
+        assert len(pool.connections) == 4
+        assert len(pool.pipes) == 4
+
+    asyncio.run(create_connections())
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from hedra.core.engines.types.common.protocols.udp.session_tickets import SessionTicketStore
+from hedra.core.engines.types.http3.pool import Pool
+
+
+class Ticket:
+
+    def __init__(self, server_name: str, not_valid_after: datetime) -> None:
+        self.server_name = server_name
+        self.not_valid_after = not_valid_after
+
+
+class ClosedProtocol:
+
+    is_closed = True
+
+    def close(self):
+        pass
+
+
+def test_session_ticket_store_keeps_latest_valid_ticket():
+    store = SessionTicketStore()
+    now = datetime.now(timezone.utc)
+
+    first = Ticket('example.com', now + timedelta(hours=1))
+    second = Ticket('example.com', now + timedelta(hours=2))
+
+    store.add(first)
+    store.add(second)
+    store.add(Ticket(None, now + timedelta(hours=1)))
+
+    assert store.get('example.com') is second
+    assert store.get('other.com') is None
+    assert len(store.tickets) == 1
+
+
+def test_session_ticket_store_drops_expired_tickets():
+    store = SessionTicketStore()
+
+    store.add(
+        Ticket('example.com', datetime.now(timezone.utc) - timedelta(seconds=1))
+    )
+
+    # Naive expiry times are compared against naive UTC.
+    store.add(
+        Ticket('naive.com', datetime.utcnow() + timedelta(hours=1))
+    )
+
+    assert store.get('example.com') is None
+    assert 'example.com' not in store.tickets
+    assert store.get('naive.com') is not None
+
+
+def test_http3_pool_shares_multiplexed_connections():
+
+    async def share_connections():
+        pool = Pool(4, early_data=True, multiplexed_connections=2)
+        pool.create_pool()
+
+        assert pool.connections == []
+        assert pool.streams_per_connection == 2
+
+        first = pool.acquire('a.com:443')
+        second = pool.acquire('a.com:443')
+        assert second is not first
+
+        assert pool.acquire('a.com:443') in (first, second)
+        assert pool.acquire('a.com:443') in (first, second)
+        assert first.pending == 2
+        assert second.pending == 2
+        assert first.early_data is True
+
+        first.protocol = ClosedProtocol()
+        await pool.release('a.com:443', first)
+        assert first in pool.multiplexed['a.com:443']
+
+        await pool.release('a.com:443', first)
+        assert pool.multiplexed['a.com:443'] == [second]
+
+    asyncio.run(share_connections())
+
+
+def test_http3_pool_replaces_failed_connections():
+
+    async def replace_connection():
+        pool = Pool(2)
+        pool.create_pool()
+
+        connection = pool.acquire('a.com:443')
+        await pool.release('a.com:443', connection, failed=True)
+
+        assert len(pool.connections) == 2
+        assert connection not in pool.connections
+
+    asyncio.run(replace_connection())
@@ -0,0 +1,102 @@
+import asyncio
+from hedra.core.engines.types.http.action import HTTPAction
+from hedra.core.engines.types.http.client import MercuryHTTPClient
+from hedra.core.engines.types.http.connection import HTTPConnection
+from hedra.core.engines.types.http.pipeline import HTTPPipeline
+
+
+RESPONSE = b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\nContent-Type: text/plain\r\n\r\nok'
+
+
+async def start_server():
+    connections = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connections.append(writer)
+        buffer = b''
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+
+            buffer += data
+            while b'\r\n\r\n' in buffer:
+                _, buffer = buffer.split(b'\r\n\r\n', 1)
+                writer.write(RESPONSE)
+
+            await writer.drain()
+
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    return server, port, connections
+
+
+async def execute_requests(pipeline_depth: int, requests: int):
+    server, port, connections = await start_server()
+
+    client = MercuryHTTPClient(
+        concurrency=4,
+        pipeline_depth=pipeline_depth
+    )
+
+    action = HTTPAction('pipelined', f'http://127.0.0.1:{port}/')
+    await client.prepare(action)
+
+    results = await asyncio.gather(*[
+        client.execute_prepared_request(action) for _ in range(requests)
+    ])
+
+    await client.close()
+    server.close()
+
+    return client, results, connections
+
+
+def test_http_client_pipelines_requests_on_one_connection():
+    client, results, connections = asyncio.run(
+        execute_requests(pipeline_depth=4, requests=4)
+    )
+
+    assert [result.error for result in results] == [None]*4
+    assert [result.status for result in results] == [200]*4
+    assert [result.body for result in results] == [b'ok']*4
+    assert len(connections) == 1
+    assert all([
+        len(host_pipelines) == 0 for host_pipelines in client.pipelines.values()
+    ])
+
+
+def test_http_client_without_pipelining_uses_connection_per_request():
+    client, results, connections = asyncio.run(
+        execute_requests(pipeline_depth=1, requests=4)
+    )
+
+    assert [result.status for result in results] == [200]*4
+    assert client.can_pipeline(client.registered['pipelined']) is False
+    assert len(connections) > 1
+
+
+def test_http_pipeline_orders_turns():
+
+    async def enqueue_turns():
+        pipeline = HTTPPipeline(HTTPConnection(), '127.0.0.1:80', 2)
+
+        first_previous, first = pipeline.enqueue()
+        second_previous, second = pipeline.enqueue()
+
+        assert first_previous is None
+        assert second_previous is first
+        assert pipeline.available is False
+
+        pipeline.complete(first)
+        assert second_previous.done()
+
+        pipeline.complete(second)
+        assert pipeline.idle
+        assert pipeline.tail is None
+
+    asyncio.run(enqueue_turns())
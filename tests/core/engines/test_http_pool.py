@@ -0,0 +1,147 @@
+import asyncio
+import time
+from hedra.core.engines.types.http.client import MercuryHTTPClient
+from hedra.core.engines.types.http.connection import HTTPConnection
+from hedra.core.engines.types.http.pool import Pool
+
+
+def open_connection(connection: HTTPConnection) -> HTTPConnection:
+    connection.connected = True
+    connection.last_used = time.monotonic()
+    return connection
+
+
+def create_pool(size: int) -> Pool:
+    pool = Pool(size)
+    pool.create_pool()
+    return pool
+
+
+def test_pool_reuses_idle_connection_for_host():
+
+    async def reuses_idle_connection_for_host():
+        pool = create_pool(2)
+
+        connection = open_connection(pool.acquire('a.com:443'))
+        pool.release(connection, 'a.com:443')
+
+        assert pool.acquire('a.com:443') is connection
+        assert pool.metrics['reused'] == 1
+        assert pool.metrics['requests'] == 2
+
+    asyncio.run(reuses_idle_connection_for_host())
+
+
+def test_pool_takes_idle_connection_from_other_host():
+
+    async def takes_idle_connection_from_other_host():
+        pool = create_pool(1)
+
+        connection = open_connection(pool.acquire('a.com:443'))
+        pool.release(connection, 'a.com:443')
+
+        assert pool.acquire('b.com:443') is connection
+        assert connection.connected is False
+        assert pool.idle['a.com:443'] == []
+
+    asyncio.run(takes_idle_connection_from_other_host())
+
+
+def test_pool_acquire_creates_connection_when_all_checked_out():
+
+    async def acquire_creates_connection_when_all_checked_out():
+        pool = create_pool(1)
+
+        first = pool.acquire('a.com:443')
+        second = pool.acquire('a.com:443')
+
+        assert isinstance(second, HTTPConnection)
+        assert second is not first
+        assert pool.held == 2
+
+        pool.release(open_connection(first), 'a.com:443')
+        pool.release(open_connection(second), 'a.com:443')
+
+        assert pool.held == 1
+
+    asyncio.run(acquire_creates_connection_when_all_checked_out())
+
+
+def test_pool_release_drops_connections_over_size():
+
+    async def release_drops_connections_over_size():
+        pool = create_pool(4)
+
+        connections = [
+            open_connection(pool.acquire('a.com:443')) for _ in range(4)
+        ]
+
+        pool.trim(2)
+        pool.size = 2
+
+        for connection in connections:
+            pool.release(connection, 'a.com:443')
+
+        assert pool.held == 2
+        assert len(pool.idle['a.com:443']) == 2
+        assert connections[0].connected is False
+
+    asyncio.run(release_drops_connections_over_size())
+
+
+def test_pool_replace_keeps_size():
+
+    async def replace_keeps_size():
+        pool = create_pool(2)
+
+        connection = pool.acquire('a.com:443')
+        pool.replace(connection)
+
+        assert pool.held == 2
+        assert connection not in pool.connections
+
+    asyncio.run(replace_keeps_size())
+
+
+def test_pool_add_warm_keeps_size():
+
+    async def add_warm_keeps_size():
+        pool = create_pool(1)
+
+        pool.add_warm(open_connection(HTTPConnection()), 'a.com:443')
+        extra = open_connection(HTTPConnection())
+        pool.add_warm(extra, 'a.com:443')
+
+        assert pool.held == 1
+        assert extra.connected is False
+
+    asyncio.run(add_warm_keeps_size())
+
+
+def test_client_shrinks_pool_with_connections_checked_out():
+
+    async def shrinks_pool_with_connections_checked_out():
+        client = MercuryHTTPClient(concurrency=4)
+
+        connections = [
+            open_connection(client.pool.acquire('a.com:443')) for _ in range(3)
+        ]
+
+        client.resize_pool(2)
+
+        assert client.pool.size == 2
+        assert client.pool.held == 3
+        assert client.sem._value == 2
+
+        for connection in connections:
+            client.pool.release(connection, 'a.com:443')
+
+        assert client.pool.held == 2
+        assert len(client.pool.idle['a.com:443']) == 2
+
+        client.resize_pool(4)
+
+        assert client.pool.held == 4
+        assert client.sem._value == 4
+
+    asyncio.run(shrinks_pool_with_connections_checked_out())
@@ -0,0 +1,60 @@
+import random
+import pytest
+from hedra.core.engines.types.common.hpack.constants import (
+    REQUEST_CODES,
+    REQUEST_CODES_LENGTH
+)
+from hedra.core.engines.types.common.hpack.exceptions import HPACKDecodingError
+from hedra.core.engines.types.common.hpack.huffman_encoder import HuffmanEncoder
+from hedra.core.engines.types.common.hpack.huffman_table import (
+    decode_huffman,
+    decode_huffman_bytes,
+    decode_huffman_nibbles
+)
+
+
+def test_huffman_byte_decoder_matches_nibble_decoder():
+    encoder = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+    generator = random.Random(13)
+
+    values = [
+        b'nginx/1.25.3',
+        b'application/json; charset=utf-8',
+        b'Tue, 14 Nov 2023 18:02:11 GMT',
+        bytes(range(256))
+    ] + [
+        bytes(
+            generator.randrange(256) for _ in range(generator.randrange(1, 64))
+        ) for _ in range(500)
+    ]
+
+    for value in values:
+        encoded = encoder.encode(value)
+
+        assert decode_huffman_nibbles(encoded) == value
+        assert decode_huffman_bytes(encoded) == value
+        assert decode_huffman(encoded) == value
+        assert decode_huffman(memoryview(encoded)) == value
+
+
+def test_huffman_byte_decoder_rejects_invalid_strings():
+    encoder = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+    encoded = encoder.encode(b'application/json')
+
+    # A full byte of padding is invalid, as is the EOS symbol.
+    invalid_strings = [
+        encoded + b'\xff',
+        b'\xff\xff\xff\xff'
+    ]
+
+    for invalid_string in invalid_strings:
+        with pytest.raises(HPACKDecodingError):
+            decode_huffman_nibbles(invalid_string)
+
+        with pytest.raises(HPACKDecodingError):
+            decode_huffman_bytes(invalid_string)
+
+
+def test_huffman_decoders_handle_empty_strings():
+    assert decode_huffman(b'') == b''
+    assert decode_huffman_bytes(b'') == b''
@@ -0,0 +1,103 @@
+import asyncio
+import hashlib
+from hedra.core.engines.types.common.protocols.shared.reader import Reader
+
+
+CONTENT_LENGTH_RESPONSE = b''.join([
+    b'HTTP/1.1 200 OK\r\n',
+    b'Content-Type: text/plain\r\n',
+    b'Content-Length: 11\r\n',
+    b'\r\n',
+    b'hello world'
+])
+
+CHUNKED_RESPONSE = b''.join([
+    b'HTTP/1.1 200 OK\r\n',
+    b'Transfer-Encoding: chunked\r\n',
+    b'\r\n',
+    b'5;ext=1\r\nhello\r\n',
+    b'6\r\n world\r\n',
+    b'0\r\n',
+    b'X-Trailer: done\r\n',
+    b'\r\n'
+])
+
+
+async def read_fed_response(data: bytes, feed_size: int, **kwargs):
+    reader = Reader()
+
+    async def feed():
+        for idx in range(0, len(data), feed_size):
+            reader.feed_data(data[idx:idx + feed_size])
+            await asyncio.sleep(0)
+
+    feeder = asyncio.create_task(feed())
+    response = await reader.read_response(**kwargs)
+    await feeder
+
+    return reader, response
+
+
+def test_reader_parses_content_length_response():
+    reader, (status, headers, body, body_size) = asyncio.run(
+        read_fed_response(CONTENT_LENGTH_RESPONSE, 1024)
+    )
+
+    assert status == b'HTTP/1.1 200 OK\r\n'
+    assert headers == {
+        b'content-type': b'text/plain',
+        b'content-length': b'11'
+    }
+    assert body == b'hello world'
+    assert body_size == 11
+    assert len(reader._buffer) == 0
+
+
+def test_reader_parses_chunked_response_fed_byte_by_byte():
+    reader, (_, headers, body, body_size) = asyncio.run(
+        read_fed_response(CHUNKED_RESPONSE, 1)
+    )
+
+    assert headers[b'transfer-encoding'] == b'chunked'
+    assert body == b'hello world'
+    assert body_size == 11
+    assert len(reader._buffer) == 0
+
+
+def test_reader_leaves_next_response_in_buffer():
+    reader, (_, _, body, _) = asyncio.run(
+        read_fed_response(CONTENT_LENGTH_RESPONSE*2, 1024)
+    )
+
+    assert body == b'hello world'
+    assert bytes(reader._buffer) == CONTENT_LENGTH_RESPONSE
+
+
+def test_reader_truncates_and_checksums_body():
+    checksum = hashlib.blake2b(digest_size=16)
+
+    _, (_, _, body, body_size) = asyncio.run(
+        read_fed_response(
+            CHUNKED_RESPONSE,
+            3,
+            max_body_size=4,
+            checksum=checksum
+        )
+    )
+
+    assert body == b'hell'
+    assert body_size == 11
+    assert checksum.hexdigest() == hashlib.blake2b(
+        b'hello world',
+        digest_size=16
+    ).hexdigest()
+
+
+def test_reader_discards_body():
+    reader, (_, _, body, body_size) = asyncio.run(
+        read_fed_response(CONTENT_LENGTH_RESPONSE, 4, discard_body=True)
+    )
+
+    assert body == b''
+    assert body_size == 11
+    assert len(reader._buffer) == 0
@@ -0,0 +1,82 @@
+import json
+import pytest
+from hedra.core.engines.types.http.action import HTTPAction
+from hedra.core.engines.types.http.request_template import RequestTemplate
+
+
+def create_action(**kwargs) -> HTTPAction:
+    action = HTTPAction(
+        'create_user',
+        'https://example.com/api/users',
+        method='POST',
+        **kwargs
+    )
+
+    action.setup()
+
+    return action
+
+
+def test_request_template_renders_slots():
+    template = RequestTemplate()
+    template.append(b'GET ')
+    template.add_slot('path', b'/')
+    template.append(b' HTTP/1.1')
+
+    assert template.render() == b'GET / HTTP/1.1'
+    assert template.set('path', b'/users') is True
+    assert template.set('missing', b'') is False
+    assert template.get('path') == b'/users'
+    assert template.render() == b'GET /users HTTP/1.1'
+
+
+def test_http_action_mutations_match_full_encoding():
+    action = create_action(
+        headers={'Authorization': 'Bearer first'},
+        data={'id': 1, 'name': 'first'}
+    )
+
+    action.set_header('Authorization', 'Bearer second')
+    action.set_path('/api/users/2')
+    action.set_data_field('id', 20)
+    action.set_data_field('name', 'a much longer name')
+
+    expected = HTTPAction(
+        'create_user',
+        'https://example.com/api/users/2',
+        method='POST',
+        headers={'Authorization': 'Bearer second'},
+        data={'id': 20, 'name': 'a much longer name'}
+    )
+
+    expected.setup()
+
+    assert action.encoded_headers == expected.encoded_headers
+    assert action.encoded_data == expected.encoded_data
+    assert json.loads(action.encoded_data) == {'id': 20, 'name': 'a much longer name'}
+    assert f'Content-Length: {len(action.encoded_data)}'.encode() in action.encoded_headers
+
+
+def test_http_action_adds_new_data_fields():
+    action = create_action(data={'id': 1})
+
+    action.set_data_field('role', 'admin')
+
+    assert json.loads(action.encoded_data) == {'id': 1, 'role': 'admin'}
+    assert f'Content-Length: {len(action.encoded_data)}'.encode() in action.encoded_headers
+
+
+def test_http_action_rejects_data_fields_on_non_dict_data():
+
+    for data in ['raw body', b'raw body', ('a', 'b')]:
+        action = HTTPAction(
+            'create_user',
+            'https://example.com/api/users',
+            method='POST',
+            data=data
+        )
+
+        with pytest.raises(TypeError):
+            action.set_data_field('id', 1)
+
+        assert action.data == data
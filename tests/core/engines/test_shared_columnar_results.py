@@ -0,0 +1,81 @@
+import pickle
+from hedra.core.engines.types.common.base_result import BaseResult
+from hedra.core.engines.types.common.columnar_results import ColumnarResults
+from hedra.core.engines.types.common.shared_columnar_results import SharedColumnarResults
+from hedra.core.engines.types.common.types import RequestTypes
+
+
+def create_columnar_results(name: str, starts: range) -> ColumnarResults:
+    columnar_results = ColumnarResults()
+
+    for start in starts:
+        result = BaseResult(
+            'action-id',
+            name,
+            'localhost',
+            None,
+            [],
+            RequestTypes.HTTP,
+            None
+        )
+
+        result.start = start
+        result.complete = start + 1
+
+        columnar_results.append(result)
+
+    return columnar_results
+
+
+def test_shared_columnar_results_round_trip():
+    try:
+        shared_results = SharedColumnarResults.create(
+            create_columnar_results('login', range(5))
+        )
+
+        shared_results.merge(
+            SharedColumnarResults.create(
+                create_columnar_results('logout', range(5, 8))
+            )
+        )
+
+        # Only segment names and row ranges cross process boundaries.
+        unpickled: SharedColumnarResults = pickle.loads(
+            pickle.dumps(shared_results)
+        )
+
+        assert len(unpickled) == 8
+        assert unpickled.names == ['login', 'logout']
+
+        loaded = unpickled.load()
+        assert list(loaded.start) == list(range(8))
+        assert len(unpickled.select('logout')) == 3
+
+    finally:
+        SharedColumnarResults.unlink_all()
+
+
+def test_shared_columnar_results_partitions_span_segments():
+    try:
+        shared_results = SharedColumnarResults.create(
+            create_columnar_results('login', range(4))
+        )
+
+        shared_results.merge(
+            SharedColumnarResults.create(
+                create_columnar_results('login', range(4, 10))
+            )
+        )
+
+        partitions = shared_results.partition(3)
+
+        assert [len(partition) for partition in partitions] == [3, 3, 4]
+        assert len(partitions[1].blocks) == 2
+        assert sum([
+            list(partition.load().start) for partition in partitions
+        ], []) == list(range(10))
+
+    finally:
+        SharedColumnarResults.unlink_all()
+
+    assert len(SharedColumnarResults.segments) == 0
@@ -0,0 +1,108 @@
+import asyncio
+import pytest
+from hedra.core.engines.types.tracing.span_exporter import SpanExporter
+from hedra.core.engines.types.tracing.span_record import SpanRecord
+from hedra.core.engines.types.tracing.trace_session import TraceSession
+from hedra.versioning.flags.types.base.active import active_flags
+from hedra.versioning.flags.types.base.flag_type import FlagTypes
+
+
+class Request:
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class RecordingTrace:
+
+    def __init__(self, fail_on: int=-1) -> None:
+        self.exported = []
+        self.fail_on = fail_on
+
+    async def export(self, span_record: SpanRecord):
+        if len(self.exported) == self.fail_on:
+            self.fail_on = -1
+            raise Exception('Exporter unavailable.')
+
+        self.exported.append(span_record)
+
+
+@pytest.fixture
+def unstable_features(monkeypatch):
+    monkeypatch.setitem(active_flags, FlagTypes.UNSTABLE_FEATURE, True)
+
+
+def test_trace_session_samples_every_nth_request(unstable_features):
+    session = TraceSession(sample_every=3)
+
+    sampled = [
+        session.create_trace(Request(name)) for name in ['login'] * 6 + ['logout'] * 2
+    ]
+
+    assert [isinstance(span_record, SpanRecord) for span_record in sampled] == [
+        True, False, False, True, False, False, True, False
+    ]
+
+
+def test_trace_session_samples_by_rate(unstable_features):
+    never = TraceSession(sample_rate=0)
+    always = TraceSession()
+
+    assert never.create_trace(Request('login')) is None
+    assert isinstance(always.create_trace(Request('login')), SpanRecord)
+
+
+def test_span_exporter_exports_in_batches():
+
+    async def export_spans():
+        trace = RecordingTrace(fail_on=2)
+        exporter = SpanExporter(trace, batch_size=4, flush_interval=10)
+
+        for idx in range(10):
+            span_record = SpanRecord(Request(f'request_{idx}'), exporter)
+            span_record.record('on_request_headers_sent')
+            span_record.on_request_end(None)
+
+            # Ending a span twice doesn't export it twice.
+            span_record.on_request_end(None)
+
+        # A full batch wakes the exporter without waiting for the
+        # flush interval.
+        await asyncio.sleep(0.01)
+        assert exporter.exported >= 4
+
+        await exporter.close()
+
+        return trace, exporter
+
+    trace, exporter = asyncio.run(export_spans())
+
+    assert exporter.exported == 9
+    assert exporter.dropped == 1
+    assert len(trace.exported) == 9
+    assert trace.exported[0].events[0][0] == 'on_request_headers_sent'
+
+
+def test_span_exporter_drops_records_when_queue_is_full():
+
+    async def overflow():
+        exporter = SpanExporter(
+            RecordingTrace(),
+            batch_size=100,
+            flush_interval=10,
+            max_queue_size=5
+        )
+
+        for idx in range(8):
+            exporter.submit(SpanRecord(Request(f'request_{idx}'), exporter))
+
+        assert len(exporter.records) == 5
+        assert exporter.dropped == 3
+
+        await exporter.close()
+
+        return exporter
+
+    exporter = asyncio.run(overflow())
+
+    assert exporter.exported == 5
@@ -0,0 +1,137 @@
+import asyncio
+from hedra.core.engines.types.websocket.action import WebsocketAction
+from hedra.core.engines.types.websocket.client import MercuryWebsocketClient
+from hedra.core.engines.types.websocket.pool import Pool
+from hedra.core.engines.types.websocket.utils import (
+    WebsocketMask,
+    encode_frame
+)
+
+
+def test_websocket_mask_round_trips():
+    mask = WebsocketMask(b'\x01\x02\x03\x04')
+    payload = b'hello websocket'
+
+    masked = mask.apply(payload)
+
+    assert masked == bytes(
+        payload_byte ^ mask.key[idx % 4] for idx, payload_byte in enumerate(payload)
+    )
+    assert mask.apply(masked) == payload
+    assert mask.apply(b'') == b''
+
+
+def test_websocket_encode_frame_lengths():
+    mask = WebsocketMask(b'\x00\x00\x00\x00')
+
+    short_frame = encode_frame(b'a' * 10, 0x1, mask)
+    assert short_frame[:2] == bytes([0x81, 0x80 | 10])
+
+    medium_frame = encode_frame(b'a' * 300, 0x2, mask)
+    assert medium_frame[:4] == bytes([0x82, 0x80 | 126, 0x01, 0x2C])
+
+    long_frame = encode_frame(b'a' * 70000, 0x2, mask)
+    assert long_frame[1] == 0x80 | 127
+    assert len(long_frame) == 2 + 8 + 4 + 70000
+
+
+def test_websocket_pool_opens_sessions_up_to_limit():
+
+    async def acquire_sessions():
+        pool = Pool(4, session_window=2)
+        pool.create_pool()
+
+        assert pool.connections == []
+        assert pool.max_sessions == 2
+
+        first = pool.acquire_session('a.com:443')
+        second = pool.acquire_session('a.com:443')
+        assert second is not first
+
+        assert pool.acquire_session('a.com:443') is first
+        assert pool.acquire_session('a.com:443') is second
+        assert first.available is False
+        assert second.available is False
+
+        await pool.release_session(first)
+        assert first.pending == 1
+        assert pool.acquire_session('a.com:443') is first
+
+    asyncio.run(acquire_sessions())
+
+
+def test_websocket_pool_reserves_sessions_for_concurrent_acquires():
+
+    async def reserve_sessions():
+        pool = Pool(100, session_window=10)
+
+        async def acquire_and_connect():
+            session = pool.acquire_session('a.com:443')
+
+            # Messages are only sent once the session connects, so every
+            # acquire happens before any message is in flight.
+            await asyncio.sleep(0)
+
+            return session
+
+        sessions = await asyncio.gather(*[
+            acquire_and_connect() for _ in range(100)
+        ])
+
+        host_sessions = pool.sessions['a.com:443']
+
+        assert len(host_sessions) == pool.max_sessions == 10
+        assert all([session.in_flight == 0 for session in host_sessions])
+        assert [session.pending for session in host_sessions] == [10]*10
+        assert all([
+            sessions.count(session) == 10 for session in host_sessions
+        ])
+
+        for session in sessions:
+            await pool.release_session(session)
+
+        assert [session.pending for session in host_sessions] == [0]*10
+
+    asyncio.run(reserve_sessions())
+
+
+def test_websocket_session_sends_many_messages_on_one_connection(websocket_server):
+
+    async def send_messages():
+        server, port, connections = await websocket_server()
+
+        client = MercuryWebsocketClient(concurrency=4, session_window=4)
+
+        actions = [
+            WebsocketAction(
+                f'echo_{idx}',
+                f'ws://127.0.0.1:{port}/',
+                data=f'message {idx}'
+            ) for idx in range(4)
+        ]
+
+        for action in actions:
+            await client.prepare(action)
+
+        results = []
+        for _ in range(3):
+            results.extend(
+                await asyncio.gather(*[
+                    client.execute_prepared_request(action) for action in actions
+                ])
+            )
+
+        await client.close()
+        server.close()
+
+        return results, connections
+
+    results, connections = asyncio.run(send_messages())
+
+    assert [result.error for result in results] == [None] * 12
+    assert [result.body for result in results] == [
+        f'message {idx % 4}'.encode() for idx in range(12)
+    ]
+
+    # Prepare opens its own connection to find the host's address.
+    assert len(connections) == 2
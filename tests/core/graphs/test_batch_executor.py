@@ -0,0 +1,95 @@
+import asyncio
+import os
+from hedra.core.graphs.stages.base.import_tools import load_graph
+from hedra.core.graphs.stages.base.parallel.batch_executor import BatchExecutor
+
+
+def worker_pid(_: int) -> int:
+    return os.getpid()
+
+
+async def execute_in_executor(persistent: bool):
+    executor = BatchExecutor(
+        max_workers=1,
+        persistent=persistent
+    )
+
+    worker_pids = await executor.execute_stage_batch(
+        worker_pid,
+        [0, 1]
+    )
+
+    executor.close()
+
+    return executor, worker_pids
+
+
+def test_persistent_batch_executors_share_worker_pool():
+
+    async def share_worker_pool():
+        first_executor, first_pids = await execute_in_executor(True)
+        second_executor, second_pids = await execute_in_executor(True)
+
+        assert first_executor.pool is second_executor.pool
+        assert set(first_pids) == set(second_pids)
+        assert set(first_pids).issubset(BatchExecutor.persistent_pids())
+
+    try:
+        asyncio.run(share_worker_pool())
+
+    finally:
+        BatchExecutor.close_persistent_pools()
+
+    assert BatchExecutor.persistent_pools == {}
+
+
+def test_batch_executor_pools_are_per_stage_by_default():
+
+    async def create_pools():
+        first_executor, _ = await execute_in_executor(False)
+        second_executor, _ = await execute_in_executor(False)
+
+        assert first_executor.pool is not second_executor.pool
+        assert BatchExecutor.persistent_pools == {}
+
+    asyncio.run(create_pools())
+
+
+def test_load_graph_imports_graph_once(tmp_path):
+    graph_path = tmp_path.joinpath('graph.py')
+    graph_path.write_text('\n'.join([
+        'from hedra.core.graphs.stages import Idle',
+        '',
+        '',
+        'class Start(Idle):',
+        '    pass',
+        ''
+    ]))
+
+    discovered, _ = load_graph(str(graph_path))
+    assert list(discovered.keys()) == ['Start']
+    assert load_graph(str(graph_path))[0] is discovered
+
+    graph_path.write_text(
+        graph_path.read_text() + '\n\nclass Wait(Idle):\n    pass\n'
+    )
+
+    assert sorted(load_graph(str(graph_path))[0].keys()) == ['Start', 'Wait']
+
+
+def test_execute_on_workers_reaches_every_worker():
+
+    async def execute_on_workers():
+        executor = BatchExecutor(max_workers=2)
+
+        worker_pids = await executor.execute_on_workers(
+            worker_pid,
+            0
+        )
+
+        executor.close()
+
+        assert len(worker_pids) == executor.pool._max_workers
+        assert len(set(worker_pids)) == executor.pool._max_workers
+
+    asyncio.run(execute_on_workers())
@@ -0,0 +1,69 @@
+import numpy
+from typing import List
+from hedra.core.engines.client.config import Config
+from hedra.core.graphs.stages.optimize.optimization.algorithms import get_algorithm
+from hedra.core.graphs.stages.optimize.optimization.algorithms.types import BayesianOptimizer
+from hedra.core.graphs.stages.optimize.optimization.parameters.parameter import Parameter
+
+
+TARGET_BATCH_SIZE = 600
+
+
+def create_optimizer(iterations: int) -> BayesianOptimizer:
+    return get_algorithm(
+        'bayesian',
+        {
+            'params': [
+                Parameter(
+                    'batch_size',
+                    minimum=100,
+                    maximum=1000
+                )
+            ],
+            'stage_config': Config(
+                batch_size=500,
+                total_time='10s'
+            ),
+            'iterations': iterations,
+            'time_limit': 60
+        }
+    )
+
+
+def test_bayesian_optimizer_finds_synthetic_optimum():
+    numpy.random.seed(0)
+
+    optimizer = create_optimizer(20)
+    probes: List[float] = []
+    scores: List[float] = []
+
+    def inverse_aps(xargs: List[float]) -> float:
+        probes.append(xargs[0])
+        scores.append(1 + ((xargs[0] - TARGET_BATCH_SIZE)/TARGET_BATCH_SIZE)**2)
+
+        return scores[-1]
+
+    results = optimizer.optimize(inverse_aps)
+
+    assert isinstance(optimizer, BayesianOptimizer)
+    assert results.nfev == len(probes) <= 20
+    assert all([100 <= probe <= 1000 for probe in probes])
+    assert abs(results.x[0] - TARGET_BATCH_SIZE) < TARGET_BATCH_SIZE * 0.1
+    assert results.fun == min(scores)
+
+
+def test_bayesian_optimizer_stops_early_on_plateau():
+    numpy.random.seed(0)
+
+    optimizer = create_optimizer(20)
+    probes: List[float] = []
+
+    def inverse_aps(xargs: List[float]) -> float:
+        probes.append(xargs[0])
+        return 1 + xargs[0] * 1e-7
+
+    results = optimizer.optimize(inverse_aps)
+
+    assert optimizer.stopped_early is True
+    assert len(probes) < 20
+    assert results.message == 'Stopped early on plateau'
@@ -0,0 +1,77 @@
+import asyncio
+import time
+from typing import List
+from hedra.core.engines.client.config import Config
+from hedra.core.graphs.stages.optimize.optimization import PopulationOptimizer
+from hedra.core.graphs.stages.optimize.optimization.parameters.parameter import Parameter
+
+
+TARGET_BATCH_SIZE = 600
+
+
+class SyntheticEvaluator:
+
+    def __init__(self, delay: float=0) -> None:
+        self.delay = delay
+        self.generations: List[int] = []
+
+    def __call__(self, candidates: List[List[float]]) -> List[float]:
+        time.sleep(self.delay)
+        self.generations.append(len(candidates))
+
+        return [
+            1 + abs(batch_size - TARGET_BATCH_SIZE)/TARGET_BATCH_SIZE for batch_size, in candidates
+        ]
+
+
+def run_optimizer(evaluate: SyntheticEvaluator, iterations: int, time_limit: float):
+
+    async def optimize():
+        optimizer = create_optimizer(evaluate, iterations, time_limit)
+        return optimizer, optimizer.optimize()
+
+    return asyncio.run(optimize())
+
+
+def create_optimizer(evaluate: SyntheticEvaluator, iterations: int, time_limit: float) -> PopulationOptimizer:
+    return PopulationOptimizer(
+        {
+            'params': [
+                Parameter(
+                    'batch_size',
+                    minimum=100,
+                    maximum=1000
+                )
+            ],
+            'stage_name': 'execute',
+            'stage_config': Config(
+                batch_size=500,
+                total_time='10s'
+            ),
+            'iterations': iterations,
+            'time_limit': time_limit,
+            'workers': 2
+        },
+        evaluate
+    )
+
+
+def test_population_optimizer_evaluates_whole_generations():
+    evaluate = SyntheticEvaluator()
+    optimizer, results = run_optimizer(evaluate, iterations=30, time_limit=60)
+
+    assert optimizer.population_size == 6
+    assert set(evaluate.generations) == {6}
+    assert results['optimization_candidates_evaluated'] == sum(evaluate.generations)
+    assert results['optimization_stopped_early'] is False
+    assert 100 <= results['optimized_batch_size'] <= 1000
+
+
+def test_population_optimizer_stops_at_time_limit():
+    evaluate = SyntheticEvaluator(delay=0.2)
+    optimizer, results = run_optimizer(evaluate, iterations=1000, time_limit=0.5)
+
+    assert optimizer.generations > 100
+    assert len(evaluate.generations) <= 4
+    assert results['optimization_stopped_early'] is True
+    assert results['optimization_total_time'] < 2
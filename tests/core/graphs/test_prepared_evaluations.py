@@ -0,0 +1,56 @@
+import asyncio
+from hedra.core.graphs.stages.optimize.parallel.optimize_stage import (
+    close_prepared_evaluations,
+    prepared_evaluations
+)
+
+
+class ClosingOptimizer:
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def prepare_evaluation(evaluation_key):
+    optimizer = ClosingOptimizer()
+    loop = asyncio.new_event_loop()
+
+    prepared_evaluations[evaluation_key] = (
+        loop,
+        None,
+        None,
+        optimizer
+    )
+
+    return loop, optimizer
+
+
+def test_close_prepared_evaluations_closes_only_the_given_optimization():
+
+    first_worker = prepare_evaluation(('graph', 'optimize', 'execute', 0))
+    second_worker = prepare_evaluation(('graph', 'optimize', 'execute', 1))
+    other_optimization = prepare_evaluation(('graph', 'optimize', 'other', 0))
+
+    try:
+        close_prepared_evaluations(('graph', 'optimize', 'execute'))
+
+        for loop, optimizer in [first_worker, second_worker]:
+            assert loop.is_closed()
+            assert optimizer.closed
+
+        other_loop, other_optimizer = other_optimization
+        assert other_loop.is_closed() is False
+        assert other_optimizer.closed is False
+
+        assert list(prepared_evaluations.keys()) == [
+            ('graph', 'optimize', 'other', 0)
+        ]
+
+    finally:
+        close_prepared_evaluations()
+
+    assert prepared_evaluations == {}
+    assert other_optimization[0].is_closed()
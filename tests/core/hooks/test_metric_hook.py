@@ -0,0 +1,72 @@
+import dill
+from hedra.core.engines.types.common.base_result import BaseResult
+from hedra.core.engines.types.common.columnar_results import ColumnarResults
+from hedra.core.engines.types.common.results_set import ResultsSet
+from hedra.core.engines.types.common.types import RequestTypes
+from hedra.core.hooks.types.metric.hook import MetricHook
+
+
+def create_result(name: str, start: float, complete: float) -> BaseResult:
+    result = BaseResult(
+        'action-id',
+        name,
+        'localhost',
+        None,
+        [],
+        RequestTypes.HTTP,
+        None
+    )
+
+    result.start = start
+    result.complete = complete
+
+    return result
+
+
+async def metric(results=None):
+    return len(results)
+
+
+def test_metric_hook_combines_results_across_sets():
+    first_columnar_results = ColumnarResults()
+    first_columnar_results.extend([
+        create_result('login', 0, 1),
+        create_result('logout', 0, 1)
+    ])
+
+    second_columnar_results = ColumnarResults()
+    second_columnar_results.extend([
+        create_result('login', 0, 2),
+        create_result('login', 0, 3)
+    ])
+
+    raw_results = {
+        'first': ResultsSet({
+            'stage': 'first',
+            'stage_columnar_results': first_columnar_results
+        }),
+        'second': ResultsSet({
+            'stage': 'second',
+            'stage_columnar_results': second_columnar_results,
+            'stage_results': [
+                dill.dumps(create_result('login', 0, 4))
+            ]
+        })
+    }
+
+    hook = MetricHook(
+        'metric',
+        'metric',
+        metric,
+        'COUNT'
+    )
+
+    stage_results = hook._generate_deserialized_results(raw_results)
+    hook.executor.shutdown()
+
+    login_results = stage_results['login']
+
+    assert len(login_results) == 4
+    assert all(isinstance(result, BaseResult) for result in login_results)
+    assert sorted(result.complete for result in login_results) == [1, 2, 3, 4]
+    assert len(stage_results['logout']) == 1
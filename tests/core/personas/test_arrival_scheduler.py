@@ -0,0 +1,69 @@
+import asyncio
+import time
+from hedra.core.personas.scheduling import ArrivalScheduler
+
+
+async def collect_arrivals(scheduler: ArrivalScheduler, total_time: float, stall: float=0):
+    arrivals = []
+    intended_starts = []
+
+    async for action_idx in scheduler.arrivals(total_time):
+        arrivals.append(action_idx)
+        intended_starts.append(scheduler.intended_start)
+
+        if stall and len(arrivals) == 5:
+            # Blocks the loop, as a slow response handler would.
+            time.sleep(stall)
+
+    return arrivals, intended_starts
+
+
+def test_arrival_scheduler_interleaves_actions_at_rate():
+    scheduler = ArrivalScheduler(200, 2)
+
+    arrivals, intended_starts = asyncio.run(
+        collect_arrivals(scheduler, 0.2475)
+    )
+
+    assert len(arrivals) == 50
+    assert arrivals[:6] == [0, 1, 0, 1, 0, 1]
+    assert scheduler.arrivals_count == 50
+
+    intervals = [
+        next_start - start for start, next_start in zip(intended_starts, intended_starts[1:])
+    ]
+
+    assert all([
+        abs(interval - 0.005) < 1e-9 for interval in intervals
+    ])
+
+
+def test_arrival_scheduler_catches_up_without_shifting_schedule():
+    scheduler = ArrivalScheduler(200, 1)
+
+    arrivals, intended_starts = asyncio.run(
+        collect_arrivals(scheduler, 0.2475, stall=0.05)
+    )
+
+    # Arrivals missed during the stall fire late rather than being
+    # dropped or pushing the rest of the schedule back.
+    assert len(arrivals) == 50
+    assert scheduler.late_arrivals >= 9
+    assert scheduler.max_lag >= 0.04
+    assert abs(intended_starts[-1] - intended_starts[0] - 49 * 0.005) < 1e-9
+
+
+def test_arrival_scheduler_follows_rate_function():
+    scheduler = ArrivalScheduler(
+        lambda elapsed: 100 if elapsed < 0.1 else 400,
+        1
+    )
+
+    arrivals, _ = asyncio.run(
+        collect_arrivals(scheduler, 0.2)
+    )
+
+    # 10 arrivals in the first 100ms, then 40 in the next.
+    assert 49 <= len(arrivals) <= 51
+    assert scheduler.rate_at(0) == 100
+    assert scheduler.rate_at(0.15) == 400
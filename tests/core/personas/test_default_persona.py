@@ -0,0 +1,92 @@
+import asyncio
+from hedra.core.engines.client.config import Config
+from hedra.core.engines.types.common.columnar_results import ColumnarResults
+from hedra.core.engines.types.task import (
+    MercuryTaskRunner,
+    Task,
+    TaskResult
+)
+from hedra.core.hooks.types.base.hook_type import HookType
+from hedra.core.personas.types.default_persona.default_persona import DefaultPersona
+from hedra.reporting.processed_result import ResultsAggregate
+
+
+class Hook:
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.hook_id = name
+        self.stage = 'Execute'
+        self.skip = False
+        self.executed = 0
+
+        async def run():
+            self.executed += 1
+            await asyncio.sleep(0.001)
+
+            return TaskResult(self.action)
+
+        self.action = Task(
+            name,
+            run,
+            source='test'
+        )
+
+        self.session = MercuryTaskRunner(concurrency=10)
+
+
+async def execute_persona(**config_options):
+    hooks = [
+        Hook('login'),
+        Hook('logout')
+    ]
+
+    persona = DefaultPersona(Config(
+        total_time='1s',
+        graceful_stop=1,
+        batch_size=10,
+        **config_options
+    ))
+
+    persona.setup({
+        HookType.ACTION: hooks
+    }, 'Test -')
+
+    results = await persona.execute()
+
+    return persona, hooks, results
+
+
+def run_persona(**config_options):
+    return asyncio.run(
+        execute_persona(**config_options)
+    )
+
+
+def test_default_persona_returns_results():
+    persona, hooks, results = run_persona()
+
+    assert isinstance(results, list)
+    assert len(results) == sum(hook.executed for hook in hooks)
+    assert all(isinstance(result, TaskResult) for result in results)
+
+
+def test_default_persona_streams_results_into_columns():
+    persona, hooks, results = run_persona(stream_results=True)
+
+    assert isinstance(results, ColumnarResults)
+    assert len(results) == persona.completed_actions
+    assert len(results) == sum(hook.executed for hook in hooks)
+    assert sorted(results.names) == ['login', 'logout']
+    assert len(persona.active_tasks) == 0
+
+
+
+
+def test_default_persona_aggregates_results():
+    persona, hooks, results = run_persona(aggregate_results=True)
+
+    assert isinstance(results, ResultsAggregate)
+    assert len(results) == sum(hook.executed for hook in hooks)
+    assert sorted(results.events.keys()) == ['login', 'logout']
+    assert results.events['login'].succeeded == hooks[0].executed
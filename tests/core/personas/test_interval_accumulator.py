@@ -0,0 +1,66 @@
+import math
+import statistics
+from hedra.core.personas.streaming.interval_accumulator import (
+    IntervalAccumulator,
+    IntervalTimings
+)
+
+
+class Result:
+
+    def __init__(self, total: float, error: str=None) -> None:
+        self.error = error
+        self.wait_start = 0
+        self.start = 0.001
+        self.connect_end = 0.002
+        self.write_end = 0.003
+        self.complete = self.start + total
+
+
+def test_interval_timings_stats():
+    timings = [0.01 * idx for idx in range(1, 101)]
+
+    interval_timings = IntervalTimings()
+    for timing in timings:
+        interval_timings.add(timing)
+
+    stats = interval_timings.to_dict()
+
+    assert stats['minimum'] == 0.01
+    assert stats['maximum'] == 1.0
+    assert math.isclose(stats['mean'], statistics.mean(timings))
+    assert math.isclose(stats['variance'], statistics.pvariance(timings))
+    assert abs(stats['median'] - statistics.median(timings))/statistics.median(timings) <= 0.05
+
+
+def test_interval_timings_empty():
+    assert IntervalTimings().to_dict() == {
+        'maximum': 0,
+        'minimum': 0,
+        'median': 0,
+        'mean': 0,
+        'stdev': 0,
+        'variance': 0
+    }
+
+
+def test_interval_accumulator_counts_results():
+    accumulator = IntervalAccumulator()
+
+    accumulator.add(Result(0.1))
+    accumulator.add(Result(0.2))
+    accumulator.add(Result(0.3, error='Timed out.'))
+    accumulator.add(RuntimeError('Session closed.'))
+
+    snapshot = accumulator.snapshot()
+
+    assert snapshot['completed'] == 4
+    assert snapshot['succeeded'] == 2
+    assert snapshot['failed'] == 2
+    assert math.isclose(snapshot['timings']['total']['mean'], 0.2)
+    assert math.isclose(snapshot['timings']['total']['maximum'], 0.3)
+
+    accumulator.reset()
+
+    assert accumulator.snapshot()['completed'] == 0
+    assert accumulator.snapshot()['timings']['total']['mean'] == 0
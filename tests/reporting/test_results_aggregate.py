@@ -0,0 +1,80 @@
+import asyncio
+from typing import Optional
+from hedra.core.engines.types.task import (
+    Task,
+    TaskResult
+)
+from hedra.reporting.processed_result import ResultsAggregate
+
+
+async def run():
+    return None
+
+
+def create_result(name: str, total: float, error: Optional[str]=None) -> TaskResult:
+    result = TaskResult(Task(
+        name,
+        run,
+        source='test'
+    ))
+
+    result.wait_start = 1
+    result.start = 1
+    result.write_end = 1
+    result.complete = 1 + total
+    result.error = error
+
+    return result
+
+
+def create_aggregate(*results: TaskResult) -> ResultsAggregate:
+    aggregate = ResultsAggregate('Execute')
+    for result in results:
+        aggregate.add(result)
+
+    return aggregate
+
+
+def test_results_aggregate_counts_results_by_event():
+
+    async def counts_results_by_event():
+        aggregate = create_aggregate(
+            create_result('login', 0.1),
+            create_result('login', 0.2, error='timeout'),
+            create_result('logout', 0.3)
+        )
+
+        assert len(aggregate) == 3
+        assert aggregate.events['login'].succeeded == 1
+        assert aggregate.events['login'].failed == 1
+        assert aggregate.events['login'].errors['timeout'] == 1
+        assert aggregate.events['logout'].succeeded == 1
+        assert len(aggregate.events['login'].sketches['total']) == 2
+
+    asyncio.run(counts_results_by_event())
+
+
+def test_results_aggregate_merges_worker_aggregates():
+
+    async def merges_worker_aggregates():
+        first = create_aggregate(
+            create_result('login', 0.1),
+            create_result('login', 0.2, error='timeout')
+        )
+
+        second = create_aggregate(
+            create_result('login', 0.3, error='timeout'),
+            create_result('logout', 0.4)
+        )
+
+        first.merge(second)
+
+        assert len(first) == 4
+        assert sorted(first.events.keys()) == ['login', 'logout']
+        assert first.events['login'].succeeded == 1
+        assert first.events['login'].failed == 2
+        assert first.events['login'].errors['timeout'] == 2
+        assert len(first.events['login'].sketches['total']) == 3
+        assert first.events['logout'].succeeded == 1
+
+    asyncio.run(merges_worker_aggregates())
@@ -0,0 +1,63 @@
+import asyncio
+import sqlalchemy
+from typing import Optional
+from hedra.core.engines.types.task import (
+    Task,
+    TaskResult
+)
+from hedra.reporting.processed_result.types.task_processed_result import TaskProcessedResult
+from hedra.reporting.types.sqlite import (
+    SQLite,
+    SQLiteConfig
+)
+
+
+async def run():
+    return None
+
+
+def create_event(name: str, error: Optional[str]=None) -> TaskProcessedResult:
+    result = TaskResult(Task(
+        name,
+        run,
+        source='test'
+    ))
+
+    result.start = 1
+    result.complete = 1.5
+    result.error = error
+
+    return TaskProcessedResult('Execute', result)
+
+
+def test_sqlite_reporter_inserts_events_in_chunks(tmp_path):
+
+    async def inserts_events_in_chunks():
+        reporter = SQLite(SQLiteConfig(
+            path=str(tmp_path/'results.db'),
+            insert_chunk_size=2
+        ))
+
+        await reporter.connect()
+        await reporter.submit_events([
+            create_event('login'),
+            create_event('login', error='timeout'),
+            create_event('logout'),
+            create_event('logout'),
+            create_event('logout')
+        ])
+
+        async with reporter._engine.connect() as connection:
+            rows = (await connection.execute(
+                sqlalchemy.text('SELECT name, time, succeeded FROM events ORDER BY id')
+            )).fetchall()
+
+        await reporter._engine.dispose()
+
+        return rows
+
+    rows = asyncio.run(inserts_events_in_chunks())
+
+    assert [name for name, _, _ in rows] == ['login', 'login', 'logout', 'logout', 'logout']
+    assert [succeeded for _, _, succeeded in rows] == [1, 0, 1, 1, 1]
+    assert all([time == 0.5 for _, time, _ in rows])
@@ -0,0 +1,77 @@
+import numpy
+from hedra.reporting.stats import TimingSketch
+
+
+def create_timings(seed: int, count: int) -> numpy.ndarray:
+    return numpy.random.default_rng(seed).lognormal(
+        mean=-3,
+        sigma=0.75,
+        size=count
+    )
+
+
+def test_timing_sketch_quantiles_within_relative_accuracy():
+    timings = create_timings(1, 20000)
+
+    sketch = TimingSketch(relative_accuracy=0.01)
+    sketch.add_many(timings)
+
+    quantile_ranges = [0.1, 0.5, 0.9, 0.99]
+    expected = numpy.quantile(timings, quantile_ranges, method='lower')
+
+    for estimate, actual in zip(sketch.quantiles(quantile_ranges), expected):
+        assert abs(estimate - actual)/actual <= 0.02
+
+
+def test_timing_sketch_tracks_exact_moments():
+    timings = create_timings(2, 5000)
+
+    sketch = TimingSketch()
+    for timing in timings:
+        sketch.add(float(timing))
+
+    assert len(sketch) == 5000
+
+    sketch.flush()
+    assert sketch.count == 5000
+    assert numpy.isclose(sketch.mean, timings.mean())
+    assert numpy.isclose(sketch.variance(), timings.var(ddof=1))
+    assert numpy.isclose(sketch.stdev(), timings.std())
+    assert sketch.minimum == timings.min()
+    assert sketch.maximum == timings.max()
+
+
+def test_timing_sketch_merge_matches_single_sketch():
+    first_timings = create_timings(3, 3000)
+    second_timings = create_timings(4, 7000)*4
+
+    first = TimingSketch()
+    first.add_many(first_timings)
+
+    second = TimingSketch()
+    second.add_many(second_timings)
+
+    combined = TimingSketch()
+    combined.add_many(
+        numpy.concatenate([first_timings, second_timings])
+    )
+
+    first.merge(second)
+
+    assert first.count == combined.count
+    assert numpy.array_equal(first.counts, combined.counts)
+    assert first.offset == combined.offset
+    assert numpy.isclose(first.mean, combined.mean)
+    assert numpy.isclose(first.variance(), combined.variance())
+    assert first.quantiles([0.25, 0.75]) == combined.quantiles([0.25, 0.75])
+
+
+def test_empty_timing_sketch():
+    sketch = TimingSketch()
+
+    assert sketch.quantiles([0.5, 0.99]) == [0, 0]
+    assert sketch.variance() == 0.0
+    assert sketch.stdev() == 0.0
+
+    sketch.merge(TimingSketch())
+    assert len(sketch) == 0